@@ -124,6 +124,22 @@ class IPluginAdapter(ABC):
         """
         pass
 
+    @property
+    def canDeleteShapes(self) -> bool:
+        """
+        Optional.  An incremental Python import removes the shapes of the deleted classes;  So
+        it is only done when this is 'True'.  Otherwise, every Python import is a full one.
+
+        An adapter that returns 'True' must also implement:
+
+            deleteShape(self, shape: OglObjectType)
+
+        which removes an Ogl shape and its links from the currently displayed frame
+
+        Returns:  'False' unless the adapter overrides it
+        """
+        return False
+
     @abstractmethod
     def loadProject(self, pluginProject: PluginProject):
         """
@@ -35,34 +35,64 @@ from pyutplugins.plugintypes.PluginDataTypes import OutputPluginMap
 from pyutplugins.plugintypes.PluginDataTypes import PluginList
 from pyutplugins.plugintypes.PluginDataTypes import PluginIDMap
 
-from pyutplugins.ioplugins.IODTD import IODTD
-from pyutplugins.ioplugins.IOGML import IOGML
-from pyutplugins.ioplugins.IOJava import IOJava
-from pyutplugins.ioplugins.IOPdf import IOPdf
-from pyutplugins.ioplugins.IOPython import IOPython
-from pyutplugins.ioplugins.IOWxImage import IOWxImage
-from pyutplugins.ioplugins.IOXml import IOXml
-from pyutplugins.ioplugins.IOMermaid import IOMermaid
-from pyutplugins.ioplugins.IOAscii import IOAscii
-
-from pyutplugins.toolplugins.ToolForceDirectedLayout import ToolForceDirectedLayout
-from pyutplugins.toolplugins.ToolArrangeLinks import ToolArrangeLinks
-from pyutplugins.toolplugins.ToolLoadLayout import ToolLoadLayout
-from pyutplugins.toolplugins.ToolOrthogonalLayoutV2 import ToolOrthogonalLayoutV2
-from pyutplugins.toolplugins.ToolOrthogonalRouting import ToolOrthogonalRouting
-from pyutplugins.toolplugins.ToolSaveLayout import ToolSaveLayout
-from pyutplugins.toolplugins.ToolSugiyama import ToolSugiyama
-from pyutplugins.toolplugins.ToolTransforms import ToolTransforms
+from pyutplugins.PluginRegistration import PluginRegistration
+from pyutplugins.PluginRegistration import PluginRegistrations
+
 
 
 TOOL_PLUGIN_NAME_PREFIX: str = 'Tool'
 IO_PLUGIN_NAME_PREFIX:   str = 'IO'
 
-IO_PLUGINS: PluginList = PluginList([IOMermaid, IODTD, IOGML, IOJava, IOPdf, IOPython, IOWxImage, IOXml, IOAscii])
+IO_PLUGINS_PACKAGE:   str = 'pyutplugins.ioplugins'
+TOOL_PLUGINS_PACKAGE: str = 'pyutplugins.toolplugins'
+
+
+def ioPlugin(className: str) -> PluginRegistration:
+    """
+    Syntactic sugar
+
+    Returns:  The registration for a plugin in the I/O plugins package
+    """
+    return PluginRegistration(moduleName=f'{IO_PLUGINS_PACKAGE}.{className}', className=className)
+
+
+def toolPlugin(className: str) -> PluginRegistration:
+    """
+    Syntactic sugar
 
-TOOL_PLUGINS: PluginList = PluginList(
+    Returns:  The registration for a plugin in the tool plugins package
+    """
+    return PluginRegistration(moduleName=f'{TOOL_PLUGINS_PACKAGE}.{className}', className=className)
+
+
+#
+# Where the plugins are;  Their names, formats and menu titles are class attributes of the plugins
+#
+IO_PLUGINS: PluginRegistrations = PluginRegistrations(
+    [
+        ioPlugin('IOMermaid'),
+        ioPlugin('IODTD'),
+        ioPlugin('IOGML'),
+        ioPlugin('IOJava'),
+        ioPlugin('IOPdf'),
+        ioPlugin('IOPython'),
+        ioPlugin('IOWxImage'),
+        ioPlugin('IOXml'),
+        ioPlugin('IOAscii'),
+    ]
+)
+
+TOOL_PLUGINS: PluginRegistrations = PluginRegistrations(
     [
-        ToolOrthogonalRouting, ToolForceDirectedLayout, ToolArrangeLinks, ToolOrthogonalLayoutV2, ToolSugiyama, ToolTransforms, ToolSaveLayout, ToolLoadLayout
+        toolPlugin('ToolOrthogonalRouting'),
+        toolPlugin('ToolForceDirectedLayout'),
+        toolPlugin('ToolArrangeLinks'),
+        toolPlugin('ToolOrthogonalLayoutV2'),
+        toolPlugin('ToolSugiyama'),
+        toolPlugin('ToolTransforms'),
+        toolPlugin('ToolSaveLayout'),
+        toolPlugin('ToolLoadLayout'),
+        toolPlugin('ToolShowNeighbors'),
     ]
 )
 
@@ -143,35 +173,24 @@ class PluginManager(metaclass=SingletonV3):
     @property
     def inputPlugins(self) -> PluginList:
         """
-        Get the input Plugins.
+        Get the input Plugins.  Imports the I/O plugin modules to read their formats;  No plugin is created
 
-        Returns:  A copy of the list of classes (the PyutPlugin classes).
+        Returns:  A copy of the list of plugin registrations
         """
         if self._inputPluginClasses is None:
+            self._inputPluginClasses = PluginList([registration for registration in IO_PLUGINS if registration.inputFormat is not None])
 
-            self._inputPluginClasses = PluginList([])
-            for plugin in IO_PLUGINS:
-                pluginClass = cast(type, plugin)
-                classInstance = pluginClass(None)
-                if classInstance.inputFormat is not None:
-                    self._inputPluginClasses.append(plugin)
         return PluginList(self._inputPluginClasses[:])
 
     @property
     def outputPlugins(self) -> PluginList:
         """
-        Get the output Plugins.
+        Get the output Plugins.  Imports the I/O plugin modules to read their formats;  No plugin is created
 
-        Returns:  A copy of the list of classes (the PyutPlugin classes).
+        Returns:  A copy of the list of plugin registrations
         """
         if self._outputPluginClasses is None:
-
-            self._outputPluginClasses = PluginList([])
-            for plugin in IO_PLUGINS:
-                pluginClass = cast(type, plugin)
-                classInstance = pluginClass(None)
-                if classInstance.outputFormat is not None:
-                    self._outputPluginClasses.append(plugin)
+            self._outputPluginClasses = PluginList([registration for registration in IO_PLUGINS if registration.outputFormat is not None])
 
         return PluginList(self._outputPluginClasses[:])
 
@@ -180,14 +199,14 @@ class PluginManager(metaclass=SingletonV3):
         """
         Get the tool Plugins.
 
-        Returns:    A copy of the list of classes (the PyutPlugin classes).
+        Returns:    A copy of the list of plugin registrations
         """
-        return PluginList(TOOL_PLUGINS[:])
+        return PluginList([registration for registration in TOOL_PLUGINS])
 
     @property
     def toolPluginsMap(self) -> ToolsPluginMap:
         if len(self._toolPluginsMap.pluginIdMap) == 0:
-            self._toolPluginsMap.pluginIdMap = self.__mapWxIdsToPlugins(TOOL_PLUGINS)
+            self._toolPluginsMap.pluginIdMap = self.__mapWxIdsToPlugins(self.toolPlugins)
         return self._toolPluginsMap
 
     @property
@@ -209,10 +228,8 @@ class PluginManager(metaclass=SingletonV3):
         """
         pluginMap: PluginIDMap = self.toolPluginsMap.pluginIdMap
 
-        # TODO: Fix this later for mypy
-        clazz: type = pluginMap[wxId]
-        # Create a plugin instance
-        pluginInstance: ToolPluginInterface = clazz(pluginAdapter=self._pluginAdapter)
+        registration:   PluginRegistration  = pluginMap[wxId]
+        pluginInstance: ToolPluginInterface = cast(ToolPluginInterface, registration.createPlugin(pluginAdapter=self._pluginAdapter))
 
         # Do plugin functionality
         try:
@@ -233,9 +250,9 @@ class PluginManager(metaclass=SingletonV3):
         Args:
             wxId:       The ID ref of the menu item
         """
-        idMap:          PluginIDMap       = self.inputPluginsMap.pluginIdMap
-        clazz:          type              = idMap[wxId]
-        pluginInstance: IOPluginInterface = clazz(pluginAdapter=self._pluginAdapter)
+        idMap:          PluginIDMap        = self.inputPluginsMap.pluginIdMap
+        registration:   PluginRegistration = idMap[wxId]
+        pluginInstance: IOPluginInterface  = cast(IOPluginInterface, registration.createPlugin(pluginAdapter=self._pluginAdapter))
         self._doIOAction(methodToCall=pluginInstance.executeImport)
         return PluginDetails(name=pluginInstance.name, version=pluginInstance.version, author=pluginInstance.version)
 
@@ -244,9 +261,9 @@ class PluginManager(metaclass=SingletonV3):
         Args:
             wxId:       The ID ref of the menu item
         """
-        idMap:          PluginIDMap       = self.outputPluginsMap.pluginIdMap
-        clazz:          type              = idMap[wxId]
-        pluginInstance: IOPluginInterface = clazz(pluginAdapter=self._pluginAdapter)
+        idMap:          PluginIDMap        = self.outputPluginsMap.pluginIdMap
+        registration:   PluginRegistration = idMap[wxId]
+        pluginInstance: IOPluginInterface  = cast(IOPluginInterface, registration.createPlugin(pluginAdapter=self._pluginAdapter))
         self._doIOAction(methodToCall=pluginInstance.executeExport)
 
         return PluginDetails(name=pluginInstance.name, version=pluginInstance.version, author=pluginInstance.version)
@@ -0,0 +1,82 @@
+
+from typing import List
+from typing import NewType
+from typing import Type
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from importlib import import_module
+
+from pyutplugins.IPluginAdapter import IPluginAdapter
+
+from pyutplugins.plugininterfaces.BasePluginInterface import BasePluginInterface
+
+from pyutplugins.plugintypes.InputFormat import InputFormat
+from pyutplugins.plugintypes.OutputFormat import OutputFormat
+from pyutplugins.plugintypes.PluginDataTypes import PluginName
+
+NO_PLUGIN_CLASS: Type[BasePluginInterface] = cast(Type[BasePluginInterface], None)
+
+
+@dataclass
+class PluginRegistration:
+    """
+    Where to find a plugin.  The plugin class declares its own metadata as class attributes;
+    See BasePluginInterface.PLUGIN_NAME.  The metadata properties import the plugin module
+    the first time one of them is asked for, so no plugin is instantiated merely to build
+    the menus
+    """
+    moduleName: str
+    className:  str
+
+    _pluginClass: Type[BasePluginInterface] = field(default=NO_PLUGIN_CLASS, init=False, repr=False, compare=False)
+
+    @property
+    def pluginClass(self) -> Type[BasePluginInterface]:
+        """
+        Imports the plugin module on first use
+
+        Returns:  The plugin class
+        """
+        if self._pluginClass is NO_PLUGIN_CLASS:
+            logger: Logger = getLogger(__name__)
+            logger.info(f'Loading plugin: {self.moduleName}')
+            self._pluginClass = getattr(import_module(self.moduleName), self.className)
+
+        return self._pluginClass
+
+    @property
+    def name(self) -> PluginName:
+        return self.pluginClass.PLUGIN_NAME
+
+    @property
+    def menuTitle(self) -> str:
+        """
+        Returns:  The empty string for an I/O plugin
+        """
+        return getattr(self.pluginClass, 'MENU_TITLE', '')
+
+    @property
+    def inputFormat(self) -> InputFormat:
+        """
+        Returns:  None if the plugin does not import
+        """
+        return self.pluginClass.INPUT_FORMAT
+
+    @property
+    def outputFormat(self) -> OutputFormat:
+        """
+        Returns:  None if the plugin does not export
+        """
+        return self.pluginClass.OUTPUT_FORMAT
+
+    def createPlugin(self, pluginAdapter: IPluginAdapter) -> BasePluginInterface:
+        return self.pluginClass(pluginAdapter=pluginAdapter)
+
+
+PluginRegistrations = NewType('PluginRegistrations', List[PluginRegistration])
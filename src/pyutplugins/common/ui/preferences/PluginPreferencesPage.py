@@ -8,6 +8,7 @@ from logging import getLogger
 from wx import EVT_BUTTON
 from wx import EVT_CHECKBOX
 from wx import EVT_CHOICE
+from wx import EVT_SPINCTRL
 from wx import EVT_SPINCTRLDOUBLE
 from wx import EVT_TEXT
 from wx import ID_ANY
@@ -20,6 +21,7 @@ from wx import DirSelector
 from wx import CommandEvent
 from wx import Notebook
 from wx import Size
+from wx import SpinCtrl
 from wx import SpinCtrlDouble
 from wx import StaticText
 from wx import TextCtrl
@@ -38,6 +40,8 @@ from codeallyadvanced.ui.widgets.DimensionsControl import DimensionsControl
 
 from pyutplugins.ioplugins.mermaid.MermaidDirection import MermaidDirection
 
+from pyutplugins.ioplugins.python.PythonBackend import PythonBackend
+
 from pyutplugins.preferences.PluginPreferences import PluginPreferences
 
 from pyutplugins.toolplugins.orthogonal.LayoutAreaSize import LayoutAreaSize
@@ -51,12 +55,38 @@ ANNOTATION_MAX_WIDTH:  float = 600.0
 ANNOTATION_MIN_HEIGHT: float = 25.0
 ANNOTATION_MAX_HEIGHT: float = 100.0
 
+PARSE_TREE_CACHE_MIN_SIZE: int = 16
+PARSE_TREE_CACHE_MAX_SIZE: int = 8192
+
+IMPORT_WORKERS_MIN: int = 0
+IMPORT_WORKERS_MAX: int = 64
+
+IMPORT_CACHE_MIN_SIZE: int = 16
+IMPORT_CACHE_MAX_SIZE: int = 8192
+
+NEIGHBORHOOD_HOPS_MIN: int = 0
+NEIGHBORHOOD_HOPS_MAX: int = 16
+
 PDF_FILENAME_TOOLTIP:         str = 'The default pdf output file name'
 PDF_TITLE_TOOLTIP:            str = 'Used as the annotation title and the pdf metadata title'
 PDF_AUTHOR_TOOLTIP:           str = 'Used as the pdf metadata author'
 PDF_SUBJECT_TOOLTIP:          str = 'Used as the pdf metadata subject'
 PDF_ANNOTATION_WIDTH_TOOLTIP: str = 'The max width of the title '
 
+PARSE_ONCE_TOOLTIP:            str = 'Keep the parse trees from the first import pass so that modules are only parsed once'
+PARSE_TREE_CACHE_SIZE_TOOLTIP: str = 'Estimated memory (MB) for kept parse trees;  Modules that do not fit are parsed again'
+STREAMING_PARSE_TOOLTIP:       str = 'Extract classes while parsing so that a whole module tree is never kept;  Modules are parsed twice'
+SKIM_IMPORT_TOOLTIP:           str = 'Only import the classes, their parents and their member names;  Much faster for large code bases'
+COMPACT_SOURCE_CODE_TOOLTIP:   str = 'Keep where each method is in its module instead of a copy of its code;  The code is read when it is needed'
+PARALLEL_IMPORT_TOOLTIP:       str = 'Parse modules with a pool of worker processes'
+IMPORT_WORKERS_TOOLTIP:        str = 'The number of worker processes;  0 uses every core'
+IMPORT_CACHE_TOOLTIP:          str = 'Remember what was extracted from each module so that unchanged modules are not parsed again'
+IMPORT_CACHE_SIZE_TOOLTIP:     str = 'Disk space (MB) for remembered modules;  The least recently used are discarded first'
+PYTHON_BACKEND_TOOLTIP:        str = 'The Antlr PEG parser is the reference;  Python ast is much faster'
+INCREMENTAL_IMPORT_TOOLTIP:    str = 'Importing the same modules again only updates the classes and links that changed'
+SKIP_ON_ERROR_TOOLTIP:         str = 'Skip modules that cannot be parsed and list them when the import finishes;  Otherwise the first one stops the import'
+NEIGHBORHOOD_HOPS_TOOLTIP:     str = 'How many links away the classes shown by Show Neighbors and the import dialog can be'
+
 
 class PluginPreferencesPage(SizedPanel):
 
@@ -76,13 +106,27 @@ class PluginPreferencesPage(SizedPanel):
         self._pdfAnnotationWidthWxId:  int = wxNewIdRef()
         self._pdfAnnotationHeightWxId: int = wxNewIdRef()
 
+        self._parseTreeCacheSizeWxId:  int = wxNewIdRef()
+        self._importWorkerCountWxId:   int = wxNewIdRef()
+        self._importCacheSizeWxId:     int = wxNewIdRef()
+        self._neighborhoodHopsWxId:    int = wxNewIdRef()
+
         self._directorySelectBtn:     Button            = cast(Button, None)
         self._selectedDirectory:      TextCtrl          = cast(TextCtrl, None)
         self._layoutSizeControls:     DimensionsControl = cast(DimensionsControl, None)
         self._stepSugiyama:           CheckBox          = cast(CheckBox, None)
         self._mermaidLayoutDirection: Choice            = cast(Choice, None)
+        self._pythonBackend:          Choice            = cast(Choice, None)
 
         self._diagnoseOrthogonalRouting: CheckBox       = cast(CheckBox, None)
+        self._parseOnce:                 CheckBox       = cast(CheckBox, None)
+        self._streamingParse:            CheckBox       = cast(CheckBox, None)
+        self._skimImport:                CheckBox       = cast(CheckBox, None)
+        self._compactSourceCode:         CheckBox       = cast(CheckBox, None)
+        self._parallelImport:            CheckBox       = cast(CheckBox, None)
+        self._importCache:               CheckBox       = cast(CheckBox, None)
+        self._incrementalImport:         CheckBox       = cast(CheckBox, None)
+        self._skipOnError:               CheckBox       = cast(CheckBox, None)
 
         self.SetSizerProps(expand=True, proportion=1)
         self._layoutTopLevel(self)
@@ -97,10 +141,23 @@ class PluginPreferencesPage(SizedPanel):
 
         parent.Bind(EVT_CHECKBOX, self._onSugiyamaValueChanged,   self._stepSugiyama)
         parent.Bind(EVT_CHECKBOX, self._onDiagnoseRoutingChanged, self._diagnoseOrthogonalRouting)
+        parent.Bind(EVT_CHECKBOX, self._onParseOnceChanged,       self._parseOnce)
+        parent.Bind(EVT_CHECKBOX, self._onStreamingParseChanged,  self._streamingParse)
+        parent.Bind(EVT_CHECKBOX, self._onSkimImportChanged,      self._skimImport)
+        parent.Bind(EVT_CHECKBOX, self._onCompactSourceCodeChanged, self._compactSourceCode)
+        parent.Bind(EVT_CHECKBOX, self._onParallelImportChanged,  self._parallelImport)
+        parent.Bind(EVT_CHECKBOX, self._onImportCacheChanged,     self._importCache)
+        parent.Bind(EVT_CHECKBOX, self._onIncrementalImportChanged, self._incrementalImport)
+        parent.Bind(EVT_CHECKBOX, self._onSkipOnErrorChanged,     self._skipOnError)
         parent.Bind(EVT_CHOICE,   self._onLayoutDirectionChanged, self._mermaidLayoutDirection)
+        parent.Bind(EVT_CHOICE,   self._onPythonBackendChanged,   self._pythonBackend)
 
         parent.Bind(EVT_SPINCTRLDOUBLE, self._onDoubleSpinnerChanged, id=self._pdfAnnotationWidthWxId)
         parent.Bind(EVT_SPINCTRLDOUBLE, self._onDoubleSpinnerChanged, id=self._pdfAnnotationHeightWxId)
+        parent.Bind(EVT_SPINCTRL,       self._onSpinnerChanged,       id=self._parseTreeCacheSizeWxId)
+        parent.Bind(EVT_SPINCTRL,       self._onSpinnerChanged,       id=self._importWorkerCountWxId)
+        parent.Bind(EVT_SPINCTRL,       self._onSpinnerChanged,       id=self._importCacheSizeWxId)
+        parent.Bind(EVT_SPINCTRL,       self._onSpinnerChanged,       id=self._neighborhoodHopsWxId)
 
         self.Bind(EVT_BUTTON, self._onDirectorySelectClick,   self._directorySelectBtn)
 
@@ -121,14 +178,17 @@ class PluginPreferencesPage(SizedPanel):
 
         generalSizedPanel: SizedPanel = SizedPanel(book)
         pdfOptionsPanel:   SizedPanel = SizedPanel(book)
+        pythonPanel:       SizedPanel = SizedPanel(book)
         featuresPanel:     SizedPanel = SizedPanel(book)
 
         self._layoutGeneralPage(generalSizedPanel=generalSizedPanel)
         self._layoutPdfOptions(pdfOptionsPanel=pdfOptionsPanel)
+        self._layoutPythonOptions(pythonPanel=pythonPanel)
         self._layoutFeatureFlags(featuresPanel=featuresPanel)
 
         book.AddPage(generalSizedPanel, text='General',       select=True)
         book.AddPage(pdfOptionsPanel,   text='Pdf Options',   select=False)
+        book.AddPage(pythonPanel,       text='Python',        select=False)
         book.AddPage(featuresPanel,     text='Feature Flags', select=False)
 
     def _layoutGeneralPage(self, generalSizedPanel: SizedPanel):
@@ -182,6 +242,74 @@ class PluginPreferencesPage(SizedPanel):
                        value=str(self._preferences.annotationHeight),
                        inc=1.0)
 
+    def _layoutPythonOptions(self, pythonPanel: SizedPanel):
+
+        self._parseOnce = CheckBox(pythonPanel, id=ID_ANY, label='Parse Modules Once')
+        self._parseOnce.SetToolTip(PARSE_ONCE_TOOLTIP)
+
+        self._streamingParse = CheckBox(pythonPanel, id=ID_ANY, label='Streaming Parse')
+        self._streamingParse.SetToolTip(STREAMING_PARSE_TOOLTIP)
+
+        self._skimImport = CheckBox(pythonPanel, id=ID_ANY, label='Skim Import')
+        self._skimImport.SetToolTip(SKIM_IMPORT_TOOLTIP)
+
+        self._compactSourceCode = CheckBox(pythonPanel, id=ID_ANY, label='Compact Source Code')
+        self._compactSourceCode.SetToolTip(COMPACT_SOURCE_CODE_TOOLTIP)
+
+        self._parallelImport = CheckBox(pythonPanel, id=ID_ANY, label='Parallel Import')
+        self._parallelImport.SetToolTip(PARALLEL_IMPORT_TOOLTIP)
+
+        self._importCache = CheckBox(pythonPanel, id=ID_ANY, label='Cache Import Results')
+        self._importCache.SetToolTip(IMPORT_CACHE_TOOLTIP)
+
+        self._incrementalImport = CheckBox(pythonPanel, id=ID_ANY, label='Incremental Import')
+        self._incrementalImport.SetToolTip(INCREMENTAL_IMPORT_TOOLTIP)
+
+        self._skipOnError = CheckBox(pythonPanel, id=ID_ANY, label='Skip Modules With Errors')
+        self._skipOnError.SetToolTip(SKIP_ON_ERROR_TOOLTIP)
+
+        sizedForm: SizedPanel = SizedPanel(pythonPanel)
+        sizedForm.SetSizerType('form')
+        sizedForm.SetSizerProps(proportion=1, expand=True)
+
+        st: StaticText = StaticText(sizedForm, ID_ANY, 'Parse Tree Memory (MB):')
+        st.SetSizerProps(valign='center')
+        cacheSize: SpinCtrl = SpinCtrl(sizedForm,
+                                       id=self._parseTreeCacheSizeWxId,
+                                       min=PARSE_TREE_CACHE_MIN_SIZE,
+                                       max=PARSE_TREE_CACHE_MAX_SIZE,
+                                       initial=self._preferences.parseTreeCacheSize)
+        cacheSize.SetToolTip(PARSE_TREE_CACHE_SIZE_TOOLTIP)
+
+        st = StaticText(sizedForm, ID_ANY, 'Import Workers:')
+        st.SetSizerProps(valign='center')
+        workerCount: SpinCtrl = SpinCtrl(sizedForm,
+                                         id=self._importWorkerCountWxId,
+                                         min=IMPORT_WORKERS_MIN,
+                                         max=IMPORT_WORKERS_MAX,
+                                         initial=self._preferences.importWorkerCount)
+        workerCount.SetToolTip(IMPORT_WORKERS_TOOLTIP)
+
+        st = StaticText(sizedForm, ID_ANY, 'Import Cache Size (MB):')
+        st.SetSizerProps(valign='center')
+        importCacheSize: SpinCtrl = SpinCtrl(sizedForm,
+                                             id=self._importCacheSizeWxId,
+                                             min=IMPORT_CACHE_MIN_SIZE,
+                                             max=IMPORT_CACHE_MAX_SIZE,
+                                             initial=self._preferences.importCacheSize)
+        importCacheSize.SetToolTip(IMPORT_CACHE_SIZE_TOOLTIP)
+
+        st = StaticText(sizedForm, ID_ANY, 'Neighborhood Hops:')
+        st.SetSizerProps(valign='center')
+        neighborhoodHops: SpinCtrl = SpinCtrl(sizedForm,
+                                              id=self._neighborhoodHopsWxId,
+                                              min=NEIGHBORHOOD_HOPS_MIN,
+                                              max=NEIGHBORHOOD_HOPS_MAX,
+                                              initial=self._preferences.neighborhoodHops)
+        neighborhoodHops.SetToolTip(NEIGHBORHOOD_HOPS_TOOLTIP)
+
+        self._layoutPythonBackend(pythonPanel)
+
     def _layoutFeatureFlags(self, featuresPanel: SizedPanel):
 
         toolTip: str = 'Enable this feature to allow diagnosing failed orthogonal routing.'
@@ -197,6 +325,16 @@ class PluginPreferencesPage(SizedPanel):
 
         self._mermaidLayoutDirection = Choice(ssb, choices=directions)
 
+    def _layoutPythonBackend(self, parent: SizedPanel):
+
+        backends: List[str] = [s.value for s in PythonBackend]
+
+        ssb: SizedStaticBox = SizedStaticBox(parent, label='Reverse Engineering Backend')
+        ssb.SetSizerProps(expand=False)
+
+        self._pythonBackend = Choice(ssb, choices=backends)
+        self._pythonBackend.SetToolTip(PYTHON_BACKEND_TOOLTIP)
+
     def _layoutImageNamePreference(self, parent: SizedPanel):
 
         sizedForm: SizedPanel = SizedPanel(parent)
@@ -230,6 +368,15 @@ class PluginPreferencesPage(SizedPanel):
 
         self._stepSugiyama.SetValue(self._preferences.sugiyamaStepByStep)
         self._diagnoseOrthogonalRouting.SetValue(self._preferences.diagnoseOrthogonalRouter)
+        self._parseOnce.SetValue(self._preferences.parseOnce)
+        self._streamingParse.SetValue(self._preferences.streamingParse)
+        self._skimImport.SetValue(self._preferences.skimImport)
+        self._compactSourceCode.SetValue(self._preferences.compactSourceCode)
+        self._parallelImport.SetValue(self._preferences.parallelImport)
+        self._importCache.SetValue(self._preferences.importCache)
+        self._incrementalImport.SetValue(self._preferences.incrementalImport)
+        self._skipOnError.SetValue(self._preferences.skipOnError)
+        self._pythonBackend.SetSelection(self._pythonBackend.FindString(self._preferences.pythonBackend.value))
 
     def _onDoubleSpinnerChanged(self, event: CommandEvent):
 
@@ -245,6 +392,23 @@ class PluginPreferencesPage(SizedPanel):
             case _:
                 self.logger.error(f'Unknown spinner event id')
 
+    def _onSpinnerChanged(self, event: CommandEvent):
+
+        eventID:  int = event.GetId()
+        newValue: int = event.GetInt()
+
+        match eventID:
+            case self._parseTreeCacheSizeWxId:
+                self._preferences.parseTreeCacheSize = newValue
+            case self._importWorkerCountWxId:
+                self._preferences.importWorkerCount = newValue
+            case self._importCacheSizeWxId:
+                self._preferences.importCacheSize = newValue
+            case self._neighborhoodHopsWxId:
+                self._preferences.neighborhoodHops = newValue
+            case _:
+                self.logger.error(f'Unknown spinner event id')
+
     def _onTextValueChange(self, event: CommandEvent):
         """
         Generic handler for any text controls
@@ -282,6 +446,30 @@ class PluginPreferencesPage(SizedPanel):
     def _onDiagnoseRoutingChanged(self, event: CommandEvent):
         self._preferences.diagnoseOrthogonalRouter = event.IsChecked()
 
+    def _onParseOnceChanged(self, event: CommandEvent):
+        self._preferences.parseOnce = event.IsChecked()
+
+    def _onStreamingParseChanged(self, event: CommandEvent):
+        self._preferences.streamingParse = event.IsChecked()
+
+    def _onSkimImportChanged(self, event: CommandEvent):
+        self._preferences.skimImport = event.IsChecked()
+
+    def _onCompactSourceCodeChanged(self, event: CommandEvent):
+        self._preferences.compactSourceCode = event.IsChecked()
+
+    def _onParallelImportChanged(self, event: CommandEvent):
+        self._preferences.parallelImport = event.IsChecked()
+
+    def _onImportCacheChanged(self, event: CommandEvent):
+        self._preferences.importCache = event.IsChecked()
+
+    def _onIncrementalImportChanged(self, event: CommandEvent):
+        self._preferences.incrementalImport = event.IsChecked()
+
+    def _onSkipOnErrorChanged(self, event: CommandEvent):
+        self._preferences.skipOnError = event.IsChecked()
+
     # noinspection PyUnusedLocal
     def _onLayoutDirectionChanged(self, event: CommandEvent):
         idx:     int = self._mermaidLayoutDirection.GetSelection()
@@ -291,6 +479,13 @@ class PluginPreferencesPage(SizedPanel):
 
         self._preferences.mermaidLayoutDirection = prefValue
 
+    # noinspection PyUnusedLocal
+    def _onPythonBackendChanged(self, event: CommandEvent):
+        idx:     int = self._pythonBackend.GetSelection()
+        enumStr: str = self._pythonBackend.GetString(idx)
+
+        self._preferences.pythonBackend = PythonBackend.toEnum(enumStr=enumStr)
+
     # noinspection PyUnusedLocal
     def _onDirectorySelectClick(self, event: CommandEvent):
 
@@ -41,6 +41,9 @@ class IOAscii(IOPluginInterface):
     Write ASCII and can read ASCII
     This just the skeleton.  Not sure if I want to do this
     """
+    PLUGIN_NAME:   PluginName   = PluginName('ASCII Class Export')
+    INPUT_FORMAT:  InputFormat  = cast(InputFormat, None)
+    OUTPUT_FORMAT: OutputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
 
     def __init__(self, pluginAdapter: IPluginAdapter):
         """
@@ -52,13 +55,9 @@ class IOAscii(IOPluginInterface):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name    = PluginName('ASCII Class Export')
         self._author  = 'Philippe Waelti & Humberto A. Sanchez II>'
         self._version = '2.0'
 
-        self._inputFormat  = cast(InputFormat, None)
-        self._outputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-
         self._exportDirectory: str = ''
 
     def setImportOptions(self) -> bool:
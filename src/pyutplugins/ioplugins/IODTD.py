@@ -26,16 +26,16 @@ PLUGIN_DESCRIPTION: PluginDescription = PluginDescription('W3C DTD 1.0 file form
 
 
 class IODTD(IOPluginInterface):
+    PLUGIN_NAME:   PluginName   = PluginName('IoDTD')
+    INPUT_FORMAT:  InputFormat  = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
+    OUTPUT_FORMAT: OutputFormat = cast(OutputFormat, None)
 
     def __init__(self, pluginAdapter: IPluginAdapter):
         super().__init__(pluginAdapter)
 
         # from super class
-        self._name    = PluginName('IoDTD')
         self._author  = 'C.Dutoit <dutoitc@hotmail.com>'
         self._version = '1.0'
-        self._inputFormat  = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-        self._outputFormat = cast(OutputFormat, None)
 
         self._fileToImport: str = ''
 
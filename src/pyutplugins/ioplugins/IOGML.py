@@ -28,6 +28,10 @@ PLUGIN_DESCRIPTION: PluginDescription = PluginDescription('Graph Modeling Langua
 class IOGML(IOPluginInterface):
     """
     """
+    PLUGIN_NAME:   PluginName   = PluginName('Output GML')
+    INPUT_FORMAT:  InputFormat  = cast(InputFormat, None)
+    OUTPUT_FORMAT: OutputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
+
     def __init__(self, pluginAdapter: IPluginAdapter):
         """
 
@@ -38,15 +42,11 @@ class IOGML(IOPluginInterface):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name    = PluginName('Output GML')
         self._author  = "Humberto A. Sanchez II"
         self._version = GMLExporter.VERSION
 
         self._exportResponse: SingleFileRequestResponse = cast(SingleFileRequestResponse, None)
 
-        self._inputFormat  = cast(InputFormat, None)
-        self._outputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-
         self._autoSelectAll = False      # Temp until we have plugin preferences
 
     def setImportOptions(self) -> bool:
@@ -44,6 +44,9 @@ class IOJava(IOPluginInterface):
 
     In the original implementation these were two different I/O Plugins
     """
+    PLUGIN_NAME:   PluginName   = PluginName('Java Code Reader and Writer')
+    INPUT_FORMAT:  InputFormat  = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
+    OUTPUT_FORMAT: OutputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
 
     def __init__(self, pluginAdapter: IPluginAdapter):
 
@@ -52,11 +55,8 @@ class IOJava(IOPluginInterface):
         super().__init__(pluginAdapter)
 
         # from super class
-        self._name    = PluginName('Java Code Reader and Writer')
         self._author  = "C.Dutoit <dutoitc@hotmail.com> and N. Dubois <nicdub@gmx.ch"
         self._version = '1.0'
-        self._inputFormat  = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-        self._outputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
 
         self._exportDirectoryName: str         = ''
         self._importDirectoryName: str         = ''
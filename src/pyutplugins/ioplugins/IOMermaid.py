@@ -33,6 +33,9 @@ PLUGIN_DESCRIPTION: PluginDescription = PluginDescription('Export Ogl to Mermaid
 
 
 class IOMermaid(IOPluginInterface):
+    PLUGIN_NAME:   PluginName   = PluginName('Mermaid Writer')
+    INPUT_FORMAT:  InputFormat  = cast(InputFormat, None)
+    OUTPUT_FORMAT: OutputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
 
     def __init__(self, pluginAdapter: IPluginAdapter):
 
@@ -43,11 +46,8 @@ class IOMermaid(IOPluginInterface):
         self._requireSelection = False      # Override base class
         self._autoSelectAll    = True
         # from super class
-        self._name    = PluginName('Mermaid Writer')
         self._author  = 'Humberto A. Sanchez II'
         self._version = MermaidWriter.VERSION
-        self._inputFormat  = cast(InputFormat, None)
-        self._outputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
 
         self._exportResponse: SingleFileRequestResponse = cast(SingleFileRequestResponse, None)
         self._oglObjects:     OglObjects                = cast(OglObjects, None)
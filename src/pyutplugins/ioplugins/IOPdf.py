@@ -52,6 +52,10 @@ class IOPdf(IOPluginInterface):
     png images;  Waiting on pyumldiagrams to be images to support
     Notes and lollipop interfaces
     """
+    PLUGIN_NAME:   PluginName   = PluginName('Output PDF')
+    INPUT_FORMAT:  InputFormat  = cast(InputFormat, None)
+    OUTPUT_FORMAT: OutputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
+
     def __init__(self, pluginAdapter: IPluginAdapter):
         """
 
@@ -62,15 +66,11 @@ class IOPdf(IOPluginInterface):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name    = PluginName('Output PDF')
         self._author  = "Humberto A. Sanchez II"
         self._version = PLUGIN_VERSION
 
         self._exportResponse: SingleFileRequestResponse = cast(SingleFileRequestResponse, None)
 
-        self._inputFormat  = cast(InputFormat, None)
-        self._outputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-
         self._exportFileName: Path = cast(Path, None)
 
         self._autoSelectAll = True     # we are taking a picture of the entire diagram
@@ -1,21 +1,34 @@
 
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
 from typing import cast
 from typing import Dict
 from typing import List
+from typing import NewType
+from typing import Tuple
 
 from logging import Logger
 from logging import getLogger
 
 from os import sep as osSep
 
+from functools import partial
+
+from threading import Thread
+
 from wx import ICON_ERROR
+from wx import ICON_INFORMATION
+from wx import ICON_WARNING
 from wx import OK
 from wx import PD_APP_MODAL
+from wx import PD_CAN_ABORT
 from wx import PD_ELAPSED_TIME
 
 from wx import MessageBox
 from wx import BeginBusyCursor
 from wx import EndBusyCursor
+from wx import CallAfter
 from wx import ProgressDialog
 
 from wx import Yield as wxYield
@@ -32,6 +45,7 @@ from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
 
 from pyutplugins.plugininterfaces.IOPluginInterface import IOPluginInterface
 
+from pyutplugins.ExternalTypes import FrameInformation
 from pyutplugins.ExternalTypes import OglClasses
 from pyutplugins.ExternalTypes import OglObjects
 
@@ -44,27 +58,64 @@ from pyutplugins.plugintypes.ExportDirectoryResponse import ExportDirectoryRespo
 from pyutplugins.plugintypes.InputFormat import InputFormat
 from pyutplugins.plugintypes.OutputFormat import OutputFormat
 
+from pyutplugins.ioplugins.python.CancellationToken import CancellationToken
+from pyutplugins.ioplugins.python.ClassSubset import ClassNames
+from pyutplugins.ioplugins.python.ClassSubset import ClassSubset
+from pyutplugins.ioplugins.python.ClassSubset import NO_CLASS_SUBSET
+from pyutplugins.ioplugins.python.DeferredClasses import DeferredClasses
+from pyutplugins.ioplugins.python.DeferredClasses import FrameName
+from pyutplugins.ioplugins.python.ImportCancelledException import ImportCancelledException
+from pyutplugins.ioplugins.python.ImportErrorReport import ImportErrorReport
+from pyutplugins.ioplugins.python.IncrementalDiagramUpdater import IncrementalDiagramUpdater
+from pyutplugins.ioplugins.python.IncrementalImport import FileChanges
+from pyutplugins.ioplugins.python.IncrementalImport import ImportDelta
+from pyutplugins.ioplugins.python.IncrementalImport import ImportSnapshot
+from pyutplugins.ioplugins.python.IncrementalImport import ImportedModules
+from pyutplugins.ioplugins.python.IncrementalImport import IncrementalImport
+from pyutplugins.ioplugins.python.IncrementalImport import NO_IMPORT_SNAPSHOT
 from pyutplugins.ioplugins.python.PythonParseException import PythonParseException
 
 from pyutplugins.ioplugins.python.PyutToPython import MethodsCodeType
 from pyutplugins.ioplugins.python.PyutToPython import PyutToPython
 
-from pyutplugins.ioplugins.python.ReverseEngineerPythonV3 import ReverseEngineerPythonV3
-from pyutplugins.ioplugins.python.ReverseEngineerPythonV3 import OglClassesDict
-
 from pyutplugins.ioplugins.python.DlgSelectMultiplePackages import DlgSelectMultiplePackages
 from pyutplugins.ioplugins.python.DlgSelectMultiplePackages import ImportPackages
 from pyutplugins.ioplugins.python.DlgSelectMultiplePackages import Package
 
+from pyutplugins.ioplugins.python.PythonBackend import PythonBackend
+
+if TYPE_CHECKING:
+    # Importing the Python parser is slow;  Pyut imports this module to build its menus
+    from pyutplugins.ioplugins.python.ReverseEngineerPythonV3 import ReverseEngineerPythonV3
+    from pyutplugins.ioplugins.python.ReverseEngineerPythonV3 import OglClassesDict
+
 
 FORMAT_NAME:        FormatName        = FormatName("Python File(s)")
 PLUGIN_EXTENSION:   PluginExtension   = PluginExtension('py')
 PLUGIN_DESCRIPTION: PluginDescription = PluginDescription('Python code generation and reverse engineering')
 
+ADDED_CLASSES_GAP: int = 40
+
+IMPORT_THREAD_NAME: str = 'IOPythonImport'
+
+NO_PROGRESS_DIALOG: ProgressDialog = cast(ProgressDialog, None)
+
+ChangedPackages = Dict[str, List[str]]
+ImportChanges   = Tuple[ImportedModules, ImportDelta]
+ImportSnapshots = NewType('ImportSnapshots', Dict[FrameName, ImportSnapshot])
+
 
 class IOPython(IOPluginInterface):
+    PLUGIN_NAME:   PluginName   = PluginName('IOPython')
+    INPUT_FORMAT:  InputFormat  = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
+    OUTPUT_FORMAT: OutputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
 
     PLUGIN_VERSION: str = '2.0'
+    #
+    # Pyut creates a new plugin instance for every import;  So the previous import into each frame is remembered here
+    #
+    importSnapshots: ImportSnapshots = ImportSnapshots({})
+    parserWarmedUp:  bool            = False
 
     def __init__(self, pluginAdapter: IPluginAdapter):
 
@@ -73,19 +124,19 @@ class IOPython(IOPluginInterface):
         self.logger: Logger = getLogger(__name__)
 
         # from super class
-        self._name    = PluginName('IOPython')
         self._author  = 'Humberto A. Sanchez II'
         self._version = IOPython.PLUGIN_VERSION
-        self._inputFormat  = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-        self._outputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
 
         self._exportDirectoryName: str            = ''
 
         self._importPackages: ImportPackages = ImportPackages([])
+        self._classSubset:    ClassSubset    = NO_CLASS_SUBSET
         self._packageCount:   int = 0
         self._moduleCount:    int = 0
 
-        self._readProgressDlg:     ProgressDialog = cast(ProgressDialog, None)
+        self._readProgressDlg:   ProgressDialog    = NO_PROGRESS_DIALOG
+        self._cancellationToken: CancellationToken = CancellationToken()
+        self._errorReport:       ImportErrorReport = ImportErrorReport()
 
     def setImportOptions(self) -> bool:
         """
@@ -93,17 +144,30 @@ class IOPython(IOPluginInterface):
 
         Returns:  'True', we support import
         """
+        self._warmUpParser()
         # TODO: update startDirectory when this is done: https://github.com/hasii2011/pyutplugins/issues/106
         with DlgSelectMultiplePackages(startDirectory='/Users/humberto.a.sanchez.ii/pyut-diagrams', inputFormat=self.inputFormat) as dlg:
             if dlg.ShowModal() == OK:
                 self._packageCount   = dlg.packageCount
                 self._moduleCount    = dlg.moduleCount
                 self._importPackages = dlg.importPackages
+                self._classSubset    = dlg.classSubset
 
                 return True
             else:
                 return False
 
+    def _warmUpParser(self):
+        """
+        The user takes a while to pick the packages;  Meanwhile, load the Python parser and
+        build its tables on a background thread.  Only the first import does this
+        """
+        if IOPython.parserWarmedUp is False and self._pluginPreferences.pythonBackend == PythonBackend.PEG:
+            from pyutplugins.ioplugins.python.ParserWarmUp import ParserWarmUp
+
+            ParserWarmUp().start()
+            IOPython.parserWarmedUp = True
+
     def setExportOptions(self) -> bool:
         response: ExportDirectoryResponse = self.askForExportDirectoryName(preferredDefaultPath=None)
         if response.cancelled is True:
@@ -114,40 +178,110 @@ class IOPython(IOPluginInterface):
 
     def read(self) -> bool:
         """
+        The modules are reverse engineered on a worker thread so that the import can be
+        cancelled;  The Ogl shapes are created on the UI thread when it finishes.
+
+        An incremental import needs the classes on the frame;  So it continues in ._incrementalRead.
+        A skim import is always a full one;  So is an import into a host that cannot delete shapes
 
-        Returns:
+        Returns:  'True' once the import is started
         """
-        BeginBusyCursor()
-        wxYield()
-        status: bool = True
-        try:
-            self._readProgressDlg = ProgressDialog('Parsing Files', 'Starting', parent=None, style=PD_APP_MODAL | PD_ELAPSED_TIME)
-            reverseEngineer: ReverseEngineerPythonV3 = ReverseEngineerPythonV3()
+        DeferredClasses().forget(frameName=self._frameName())
+
+        if self._canImportIncrementally() is True:
+            self._pluginAdapter.selectAllOglObjects()
+            self._pluginAdapter.getFrameInformation(callback=self._incrementalRead)
+            return True
+
+        return self._fullRead()
+
+    def _canImportIncrementally(self) -> bool:
+
+        if self._pluginPreferences.incrementalImport is False or self._pluginPreferences.skimImport is True or self._importSnapshot() is NO_IMPORT_SNAPSHOT:
+            return False
+        if self._pluginAdapter.canDeleteShapes is False:
+            self.logger.info('The host cannot delete shapes;  Doing a full import')
+            return False
+
+        return True
+
+    def _fullRead(self) -> bool:
+        """
+        The diagram is created in ._createDiagram
+
+        Returns:  'True' once the import is started
+        """
+        reverseEngineer: ReverseEngineerPythonV3 = self._makeReverseEngineer()
 
-            self._readProgressDlg.SetRange(self._moduleCount)
+        self._startImport(title='Parsing Files',
+                          reverseEngineering=partial(self._reverseEngineerAll, reverseEngineer),
+                          onFinished=partial(self._createDiagram, reverseEngineer))
+        return True
 
+    def _reverseEngineerAll(self, reverseEngineer: 'ReverseEngineerPythonV3') -> PyutClasses:
+        """
+        Runs on the worker thread
+
+        Args:
+            reverseEngineer:
+
+        Returns:  The fully reverse engineered classes;  See ReverseEngineerPythonV3.pyutClasses
+        """
+        if self._pluginPreferences.skimImport is True:
+            self._skimPyutClasses(reverseEngineer=reverseEngineer)
+        elif self._pluginPreferences.parallelImport is True:
+            self._parallelReverseEngineer(reverseEngineer=reverseEngineer)
+        else:
             pyutClasses: PyutClasses = self._collectPyutClassesInPass1(reverseEngineer=reverseEngineer)
-            pyutClasses              = self._enhancePyutClassesInPass2(reverseEngineer=reverseEngineer, pyutClasses=pyutClasses)
+            self._enhancePyutClassesInPass2(reverseEngineer=reverseEngineer, pyutClasses=pyutClasses)
 
-            oglClassesDict: OglClassesDict = reverseEngineer.generateOglClasses(pyutClasses)
+        return reverseEngineer.pyutClasses
+
+    def _createDiagram(self, reverseEngineer: 'ReverseEngineerPythonV3', pyutClasses: PyutClasses):
+        """
+        Runs on the UI thread once the modules are reverse engineered
+
+        Only the chosen classes get shapes when the import dialog asked for some;  The
+        rest are remembered so that they can be shown later
+
+        Args:
+            reverseEngineer:    Has the parents and associations
+            pyutClasses:        The fully reverse engineered classes
+        """
+        BeginBusyCursor()
+        wxYield()
+        try:
+            classNames: ClassNames | None = None
+            if self._classSubset is not NO_CLASS_SUBSET:
+                classNames = reverseEngineer.selectClasses(classSubset=self._classSubset)
+
+            oglClassesDict: OglClassesDict = reverseEngineer.generateOglClasses(pyutClasses, classNames=classNames)
             reverseEngineer.generateLinks(oglClassesDict)
 
             self._layoutUmlClasses(oglClasses=OglClasses(list(oglClassesDict.values())))
             self._layoutLinks(oglLinks=reverseEngineer.oglLinks)
-        except (ValueError, Exception, PythonParseException) as e:
-            self._readProgressDlg.Destroy()
+        except (ValueError, Exception) as e:
             MessageBox(f'{e}', 'Error', OK | ICON_ERROR)
-            status = False
         else:
-            self._readProgressDlg.Destroy()
+            if len(pyutClasses) == 0:
+                MessageBox('No classes processed', 'Warning', OK | ICON_WARNING)
+
             self._pluginAdapter.indicatePluginModifiedProject()
+            deferredCount: int = self._rememberDeferredClasses(reverseEngineer=reverseEngineer)
+            if self._pluginPreferences.skimImport is True:
+                self._rememberImportSnapshot(NO_IMPORT_SNAPSHOT)        # Skimmed modules are not a base for an incremental import
+            elif deferredCount > 0:
+                self._rememberImportSnapshot(NO_IMPORT_SNAPSHOT)        # Neither is a diagram of only some of the classes
+            elif self._pluginPreferences.incrementalImport is True:
+                self._rememberImportSnapshot(IncrementalImport(importSnapshot=ImportSnapshot()).takeSnapshot(fqFileNames=self._fqFileNames(),
+                                                                                                             importedModules=reverseEngineer.importedModules))
+            else:
+                self._rememberImportSnapshot(NO_IMPORT_SNAPSHOT)
         finally:
             EndBusyCursor()
             self._pluginAdapter.refreshFrame()
             wxYield()
 
-        return status
-
     def write(self, oglObjects: OglObjects):
 
         directoryName: str = self._exportDirectoryName
@@ -192,21 +326,270 @@ class IOPython(IOPluginInterface):
 
         self.logger.info("IoPython done !")
 
-    def _collectPyutClassesInPass1(self, reverseEngineer: ReverseEngineerPythonV3) -> PyutClasses:
+    def _incrementalRead(self, frameInformation: FrameInformation):
+        """
+        Only the modules that changed since the previous import are reverse engineered
+        again;  Only the difference is applied to the frame so existing classes keep
+        their positions.  Falls back to a full import when the frame does not show the
+        previous import
+
+        Args:
+            frameInformation:
+        """
+        self._pluginAdapter.deselectAllOglObjects()
+
+        importSnapshot: ImportSnapshot            = self._importSnapshot()
+        updater:        IncrementalDiagramUpdater = IncrementalDiagramUpdater(pluginAdapter=self._pluginAdapter, oglObjects=frameInformation.selectedOglObjects)
+
+        if updater.isDiagramOf(classNames=list(importSnapshot.classNames())) is False:
+            self.logger.info('The frame does not show the previous import')
+            self._fullRead()
+            return
+
+        incrementalImport: IncrementalImport = IncrementalImport(importSnapshot=importSnapshot)
+        fqFileNames:       List[str]         = self._fqFileNames()
+        fileChanges:       FileChanges       = incrementalImport.classifyFiles(fqFileNames=fqFileNames)
+        if fileChanges.hasChanges is False:
+            MessageBox('No modules changed since the previous import', 'Incremental Import', OK | ICON_INFORMATION)
+            return
+
+        self._startImport(title='Parsing Changed Files',
+                          reverseEngineering=partial(self._reverseEngineerDelta, incrementalImport, fileChanges),
+                          onFinished=partial(self._applyDelta, updater, incrementalImport, fqFileNames))
+
+    def _reverseEngineerDelta(self, incrementalImport: IncrementalImport, fileChanges: FileChanges) -> ImportChanges:
+        """
+        Runs on the worker thread
+
+        Args:
+            incrementalImport:  Knows the previous import
+            fileChanges:        From incrementalImport.classifyFiles
+
+        Returns:  The results of all the selected modules and what has to change on the frame
+        """
+        importedModules: ImportedModules = self._reverseEngineerChanges(incrementalImport=incrementalImport, fileChanges=fileChanges)
+        importDelta:     ImportDelta     = incrementalImport.computeDelta(importedModules=importedModules)
+
+        return importedModules, importDelta
+
+    def _applyDelta(self, updater: IncrementalDiagramUpdater, incrementalImport: IncrementalImport, fqFileNames: List[str], importChanges: ImportChanges):
+        """
+        Runs on the UI thread once the changed modules are reverse engineered
+
+        Args:
+            updater:            Knows the classes on the frame
+            incrementalImport:  Knows the previous import
+            fqFileNames:        The modules selected for this import
+            importChanges:      From ._reverseEngineerDelta
+        """
+        importedModules, importDelta = importChanges
+
+        BeginBusyCursor()
+        wxYield()
+        try:
+            diagramBottom: int = updater.diagramBottom
+            updater.applyDelta(importDelta=importDelta)
+
+            self._layoutUmlClasses(oglClasses=updater.addedOglClasses, startY=diagramBottom + ADDED_CLASSES_GAP)
+            self._layoutLinks(oglLinks=updater.addedOglLinks)
+
+            self._rememberImportSnapshot(incrementalImport.takeSnapshot(fqFileNames=fqFileNames, importedModules=importedModules))
+        except (ValueError, Exception) as e:
+            MessageBox(f'{e}', 'Error', OK | ICON_ERROR)
+        else:
+            if importDelta.isEmpty is False:
+                self._pluginAdapter.indicatePluginModifiedProject()
+        finally:
+            EndBusyCursor()
+            self._pluginAdapter.refreshFrame()
+            wxYield()
+
+    def _reverseEngineerChanges(self, incrementalImport: IncrementalImport, fileChanges: FileChanges) -> ImportedModules:
+        """
+        Pass 1 runs on the changed modules.  Pass 2 also only runs on them unless they define
+        new classes;  Associations are only created for known classes, so then any module could
+        have new associations and every module is reverse engineered again
+
+        Args:
+            incrementalImport:  Knows the previous import
+            fileChanges:        From incrementalImport.classifyFiles
+
+        Returns:  The results of all the selected modules
+        """
+        unchangedModules: ImportedModules         = incrementalImport.unchangedModules(fileChanges=fileChanges)
+        changedPackages:  ChangedPackages         = self._changedPackages(fqFileNames=fileChanges.filesToParse)
+        reverseEngineer:  ReverseEngineerPythonV3 = self._makeReverseEngineer()
+
+        changedClasses: PyutClasses = PyutClasses({})
+        for directoryName, files in changedPackages.items():
+            changedClasses.update(reverseEngineer.doPass1(directoryName=directoryName, files=files, progressCallback=self._readProgressCallback))
+
+        if set(changedClasses.keys()).issubset(self._importSnapshot().classNames()) is False:
+            self.logger.info('New classes were found;  Reverse engineering all the modules')
+            self._errorReport.clear()
+            reverseEngineer = self._makeReverseEngineer()
+            self._reverseEngineerAll(reverseEngineer=reverseEngineer)
 
-        cumulativePyutClasses: PyutClasses = PyutClasses({})
+            return reverseEngineer.importedModules
+
+        allClasses: PyutClasses = PyutClasses({})
+        for moduleResult in unchangedModules.values():
+            allClasses.update(moduleResult.pyutClasses)
+        allClasses.update(changedClasses)
+
+        self.logger.info(f'Reverse engineering {len(fileChanges.filesToParse)} changed modules;  {len(unchangedModules)} are unchanged')
+        for directoryName, files in changedPackages.items():
+            reverseEngineer.doPass2(directoryName=directoryName, files=files, pyutClasses=allClasses, progressCallback=self._readProgressCallback)
+
+        return ImportedModules(unchangedModules | reverseEngineer.importedModules)
+
+    def _makeReverseEngineer(self) -> 'ReverseEngineerPythonV3':
+
+        from pyutplugins.ioplugins.python.ReverseEngineerPythonV3 import ReverseEngineerPythonV3
+
+        reverseEngineer: ReverseEngineerPythonV3 = ReverseEngineerPythonV3()
+        reverseEngineer.cancellationToken = self._cancellationToken
+        reverseEngineer.errorReport       = self._errorReport
+
+        return reverseEngineer
+
+    def _startImport(self, title: str, reverseEngineering: Callable[[], Any], onFinished: Callable[[Any], None]):
+        """
+        Starts the worker thread;  The user can cancel from the progress dialog
+
+        Args:
+            title:              The progress dialog title
+            reverseEngineering: Runs on the worker thread
+            onFinished:         Runs on the UI thread with what reverseEngineering returns
+        """
+        self._errorReport.clear()
+
+        self._readProgressDlg = ProgressDialog(title, 'Starting', parent=None, style=PD_APP_MODAL | PD_ELAPSED_TIME | PD_CAN_ABORT)
+        self._readProgressDlg.SetRange(self._moduleCount)
+
+        worker: Thread = Thread(target=self._runImport, args=(reverseEngineering, onFinished), name=IMPORT_THREAD_NAME, daemon=True)
+        worker.start()
+
+    def _runImport(self, reverseEngineering: Callable[[], Any], onFinished: Callable[[Any], None]):
+        """
+        The worker thread;  Everything it reports goes through wx.CallAfter.  The modules that
+        failed are reported once the results are on the frame
+
+        Args:
+            reverseEngineering: What to run
+            onFinished:         What to call on the UI thread with the results
+        """
+        try:
+            results: Any = reverseEngineering()
+        except ImportCancelledException:
+            self.logger.warning('The import was cancelled')
+            CallAfter(self._importEnded)
+        except (ValueError, Exception, PythonParseException) as e:
+            self.logger.error(f'The import failed: {e}')
+            CallAfter(self._importFailed, e)
+        else:
+            CallAfter(self._importEnded)
+            CallAfter(onFinished, results)
+            CallAfter(self._reportImportErrors)
+
+    def _importEnded(self):
+
+        if self._readProgressDlg is not NO_PROGRESS_DIALOG:
+            self._readProgressDlg.Destroy()
+            self._readProgressDlg = NO_PROGRESS_DIALOG
+
+    def _importFailed(self, e: Exception):
+
+        self._importEnded()
+        MessageBox(f'{e}', 'Error', OK | ICON_ERROR)
+
+    def _reportImportErrors(self):
+
+        if self._errorReport.hasErrors is True:
+            MessageBox(self._errorReport.summary(), 'Import Errors', OK | ICON_WARNING)
+
+    def _rememberDeferredClasses(self, reverseEngineer: 'ReverseEngineerPythonV3') -> int:
+        """
+        Args:
+            reverseEngineer:  The finished import
+
+        Returns:  The number of classes without a shape
+        """
+        deferredCount: int = len(reverseEngineer.deferredClassNames)
+        if deferredCount > 0:
+            DeferredClasses().remember(frameName=self._frameName(), reverseEngineer=reverseEngineer)
+            self.logger.info(f'{deferredCount} classes were not shown;  Select classes and use Show Neighbors to show them')
+
+        return deferredCount
+
+    def _importSnapshot(self) -> ImportSnapshot:
+        """
+        Returns:  The previous import into this frame or NO_IMPORT_SNAPSHOT
+        """
+        return IOPython.importSnapshots.get(self._frameName(), NO_IMPORT_SNAPSHOT)
+
+    def _rememberImportSnapshot(self, importSnapshot: ImportSnapshot):
+        """
+        Args:
+            importSnapshot:  The base for the next incremental import into this frame;  NO_IMPORT_SNAPSHOT forgets it
+        """
+        if importSnapshot is NO_IMPORT_SNAPSHOT:
+            IOPython.importSnapshots.pop(self._frameName(), None)
+        else:
+            IOPython.importSnapshots[self._frameName()] = importSnapshot
+
+    def _frameName(self) -> FrameName:
+        """
+        Returns:  The frame that is being imported into
+        """
+        return FrameName(self._frameInformation.diagramTitle)
+
+    def _fqFileNames(self) -> List[str]:
+
+        fqFileNames: List[str] = []
         for directory in self._importPackages:
             importPackage: Package = cast(Package, directory)
+            for fileName in importPackage.moduleToImport:
+                fqFileNames.append(f'{importPackage.packageName}{osSep}{fileName}')
+
+        return fqFileNames
+
+    def _changedPackages(self, fqFileNames: List[str]) -> ChangedPackages:
+        """
+        Args:
+            fqFileNames:  The modules to reverse engineer again
 
-            currentPyutClasses: PyutClasses = reverseEngineer.doPass1(directoryName=importPackage.packageName,
-                                                                      files=importPackage.moduleToImport,
-                                                                      progressCallback=self._readProgressCallback)
+        Returns:  The modules grouped by the package that they were selected from
+        """
+        changedPackages: ChangedPackages = {}
+        for directory in self._importPackages:
+            importPackage: Package = cast(Package, directory)
+            for fileName in importPackage.moduleToImport:
+                if f'{importPackage.packageName}{osSep}{fileName}' in fqFileNames:
+                    changedPackages.setdefault(importPackage.packageName, []).append(fileName)
 
-            cumulativePyutClasses = PyutClasses(cumulativePyutClasses | currentPyutClasses)
+        return changedPackages
 
-        return cumulativePyutClasses
+    def _collectPyutClassesInPass1(self, reverseEngineer: 'ReverseEngineerPythonV3') -> PyutClasses:
+        """
+        The reverse engineer's symbol table collects the classes of every package
 
-    def _enhancePyutClassesInPass2(self, reverseEngineer: ReverseEngineerPythonV3, pyutClasses: PyutClasses) -> PyutClasses:
+        Args:
+            reverseEngineer:
+
+        Returns:  The classes of all the packages by their bare names
+        """
+        pyutClasses: PyutClasses = PyutClasses({})
+        for directory in self._importPackages:
+            importPackage: Package = cast(Package, directory)
+
+            pyutClasses = reverseEngineer.doPass1(directoryName=importPackage.packageName,
+                                                  files=importPackage.moduleToImport,
+                                                  progressCallback=self._readProgressCallback)
+
+        return pyutClasses
+
+    def _enhancePyutClassesInPass2(self, reverseEngineer: 'ReverseEngineerPythonV3', pyutClasses: PyutClasses) -> PyutClasses:
 
         updatedPyutClasses: PyutClasses = PyutClasses({})
         for directory in self._importPackages:
@@ -219,6 +602,45 @@ class IOPython(IOPluginInterface):
 
         return updatedPyutClasses
 
+    def _skimPyutClasses(self, reverseEngineer: 'ReverseEngineerPythonV3') -> PyutClasses:
+        """
+        A single header only scan of each module replaces both passes
+
+        Args:
+            reverseEngineer:
+
+        Returns:  The skimmed classes
+        """
+        if self._pluginPreferences.parallelImport is True:
+            return reverseEngineer.doParallelSkim(fqFileNames=self._fqFileNames(), progressCallback=self._readProgressCallback)
+
+        pyutClasses: PyutClasses = PyutClasses({})
+        for directory in self._importPackages:
+            importPackage: Package = cast(Package, directory)
+
+            pyutClasses = reverseEngineer.doSkim(directoryName=importPackage.packageName,
+                                                 files=importPackage.moduleToImport,
+                                                 progressCallback=self._readProgressCallback)
+
+        return pyutClasses
+
+    def _parallelReverseEngineer(self, reverseEngineer: 'ReverseEngineerPythonV3') -> PyutClasses:
+        """
+        Both passes handle all the modules in all the packages at once so that the
+        worker processes stay busy
+
+        Args:
+            reverseEngineer:
+
+        Returns:  The fully reverse engineered classes
+        """
+        fqFileNames: List[str] = self._fqFileNames()
+
+        pyutClasses: PyutClasses = reverseEngineer.doParallelPass1(fqFileNames=fqFileNames, progressCallback=self._readProgressCallback)
+        pyutClasses = reverseEngineer.doParallelPass2(fqFileNames=fqFileNames, pyutClasses=pyutClasses, progressCallback=self._readProgressCallback)
+
+        return pyutClasses
+
     def _writeClassToFile(self, classCode, className, directory, generatedClassDoc):
 
         filename: str = f'{directory}{osSep}{str(className)}.py'
@@ -231,10 +653,26 @@ class IOPython(IOPluginInterface):
 
     def _readProgressCallback(self, currentFileCount: int, msg: str):
         """
+        Called on the worker thread
+
+        Args:
+            currentFileCount:   The current file # we are working pm
+            msg:    An updated message
+        """
+        CallAfter(self._updateReadProgress, currentFileCount, msg)
+
+    def _updateReadProgress(self, currentFileCount: int, msg: str):
+        """
+        Called on the UI thread;  Pressing the dialog's Cancel button makes .Update return False
 
         Args:
             currentFileCount:   The current file # we are working pm
             msg:    An updated message
         """
+        if self._readProgressDlg is NO_PROGRESS_DIALOG or self._cancellationToken.cancelled is True:
+            return
 
-        self._readProgressDlg.Update(currentFileCount, msg)
+        keepGoing, skip = self._readProgressDlg.Update(currentFileCount, msg)
+        if keepGoing is False:
+            self._cancellationToken.cancel()
+            self._readProgressDlg.Update(currentFileCount, 'Cancelling after the current module')
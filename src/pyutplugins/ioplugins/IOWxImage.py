@@ -38,6 +38,9 @@ PLUGIN_DESCRIPTION: PluginDescription = PluginDescription('png, bmp, tiff, or jp
 
 
 class IOWxImage(IOPluginInterface):
+    PLUGIN_NAME:   PluginName   = PluginName('Wx Image')
+    INPUT_FORMAT:  InputFormat  = cast(InputFormat, None)
+    OUTPUT_FORMAT: OutputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
 
     def __init__(self, pluginAdapter: IPluginAdapter):
         """
@@ -49,13 +52,9 @@ class IOWxImage(IOPluginInterface):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name    = PluginName('Wx Image')
         self._author  = 'Humberto A. Sanchez II'
         self._version = '0.90'
 
-        self._inputFormat  = cast(InputFormat, None)
-        self._outputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-
         self._autoSelectAll = True     # we are taking a picture of the entire diagram
 
         self._imageFormat:    WxImageFormat = cast(WxImageFormat, None)
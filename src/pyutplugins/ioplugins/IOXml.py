@@ -52,6 +52,9 @@ PLUGIN_DESCRIPTION: PluginDescription = PluginDescription('Pyut XML File')
 
 
 class IOXml(IOPluginInterface):
+    PLUGIN_NAME:   PluginName   = PluginName('IOXml')
+    INPUT_FORMAT:  InputFormat  = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
+    OUTPUT_FORMAT: OutputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
 
     def __init__(self, pluginAdapter: IPluginAdapter):
 
@@ -60,12 +63,9 @@ class IOXml(IOPluginInterface):
         super().__init__(pluginAdapter=pluginAdapter)
 
         # from super class
-        self._name    = PluginName('IOXml')
         # noinspection SpellCheckingInspection
         self._author  = "Humberto A. Sanchez II"
         self._version = '2.0'
-        self._inputFormat  = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-        self._outputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
 
         self._prettyPrint:  bool = True
         self._fileToExport: str  = ''
@@ -0,0 +1,28 @@
+
+from threading import Event
+
+from pyutplugins.ioplugins.python.ImportCancelledException import ImportCancelledException
+
+
+class CancellationToken:
+    """
+    Lets the UI thread ask the thread that reverse engineers to stop.  Reverse engineering
+    only checks it between modules;  So the module being parsed is finished first
+    """
+    def __init__(self):
+
+        self._cancelled: Event = Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def raiseIfCancelled(self):
+        """
+        Raises:  ImportCancelledException once .cancel has been called
+        """
+        if self._cancelled.is_set() is True:
+            raise ImportCancelledException('The import was cancelled')
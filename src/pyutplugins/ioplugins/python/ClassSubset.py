@@ -0,0 +1,89 @@
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NewType
+from typing import Set
+from typing import cast
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+
+ClassNames = NewType('ClassNames', Set[PyutClassName])
+
+DEFAULT_NEIGHBORHOOD_HOPS: int = 1
+
+
+@dataclass
+class ClassSubset:
+    """
+    The classes to create shapes for;  The classes of the shown packages and the classes
+    within .hops links of the shown classes.  A class name may be bare or qualified
+    """
+    packageNames: List[str] = field(default_factory=list)
+    classNames:   List[str] = field(default_factory=list)
+    hops:         int       = DEFAULT_NEIGHBORHOOD_HOPS
+
+
+#
+# Every class gets a shape
+#
+NO_CLASS_SUBSET: ClassSubset = cast(ClassSubset, None)
+
+
+class ClassGraph:
+    """
+    The classes as an undirected graph;  Parents, children, and associated classes are neighbors.
+    Build it once per import and ask it for as many neighborhoods as needed
+
+    This has no wx dependencies
+    """
+    def __init__(self, parents: Parents, associations: Associations):
+        """
+        Args:
+            parents:        Named like the classes;  See PythonReverseEngineer.parents
+            associations:   Named like the classes;  See PythonReverseEngineer.associations
+        """
+        self._neighbors: Dict[PyutClassName, Set[PyutClassName]] = {}
+
+        for parentName, children in parents.items():
+            for childName in children:
+                self._link(PyutClassName(parentName), PyutClassName(childName))
+
+        for className, associates in associations.items():
+            for associate in associates:
+                self._link(className, associate.associateName)
+
+    def neighbors(self, className: PyutClassName) -> ClassNames:
+        return ClassNames(self._neighbors.get(className, set()))
+
+    def neighborhood(self, classNames: Iterable[PyutClassName], hops: int) -> ClassNames:
+        """
+        Args:
+            classNames:     Where to start
+            hops:           How many links away to go;  0 is only the given classes
+
+        Returns:  The given classes and the classes at most hops links away from them
+        """
+        neighborhood: ClassNames          = ClassNames(set(classNames))
+        frontier:     Set[PyutClassName]  = set(neighborhood)
+        for _ in range(hops):
+            nextFrontier: Set[PyutClassName] = set()
+            for className in frontier:
+                nextFrontier.update(self._neighbors.get(className, set()))
+
+            frontier = nextFrontier - neighborhood
+            if len(frontier) == 0:
+                break
+            neighborhood.update(frontier)
+
+        return neighborhood
+
+    def _link(self, className: PyutClassName, otherName: PyutClassName):
+
+        self._neighbors.setdefault(className, set()).add(otherName)
+        self._neighbors.setdefault(otherName, set()).add(className)
@@ -0,0 +1,65 @@
+
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from codeallybasic.SingletonV3 import SingletonV3
+
+if TYPE_CHECKING:
+    # Keeps the Python parser out of the plugin menus;  See ToolShowNeighbors
+    from pyutplugins.ioplugins.python.ReverseEngineerPythonV3 import ReverseEngineerPythonV3
+
+NO_REVERSE_ENGINEER: 'ReverseEngineerPythonV3' = cast('ReverseEngineerPythonV3', None)
+
+FrameName        = NewType('FrameName',        str)
+ReverseEngineers = NewType('ReverseEngineers', Dict[FrameName, 'ReverseEngineerPythonV3'])
+
+
+class DeferredClasses(metaclass=SingletonV3):
+    """
+    By frame, the last Python import that created shapes for only some of its classes;  Its
+    model is kept so that the rest can be shown on demand.  Pyut creates a new plugin instance
+    for every use, so the imports are remembered here rather than by the plugin.  A new import
+    into a frame forgets the previous one.  See ToolShowNeighbors
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._reverseEngineers: ReverseEngineers = ReverseEngineers({})
+
+    def reverseEngineer(self, frameName: FrameName) -> 'ReverseEngineerPythonV3':
+        """
+        Args:
+            frameName:  The diagram title;  See FrameInformation
+
+        Returns:  The frame's import or NO_REVERSE_ENGINEER
+        """
+        return self._reverseEngineers.get(frameName, NO_REVERSE_ENGINEER)
+
+    def hasDeferredClasses(self, frameName: FrameName) -> bool:
+
+        reverseEngineer: ReverseEngineerPythonV3 = self.reverseEngineer(frameName=frameName)
+        if reverseEngineer is NO_REVERSE_ENGINEER:
+            return False
+
+        return len(reverseEngineer.deferredClassNames) > 0
+
+    def remember(self, frameName: FrameName, reverseEngineer: 'ReverseEngineerPythonV3'):
+        self._reverseEngineers[frameName] = reverseEngineer
+
+    def forget(self, frameName: FrameName):
+        """
+        Release the model of the frame's last import
+        """
+        self._reverseEngineers.pop(frameName, None)
+
+    def clear(self):
+        """
+        Release the models of every frame
+        """
+        self._reverseEngineers.clear()
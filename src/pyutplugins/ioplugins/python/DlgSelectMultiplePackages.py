@@ -2,19 +2,25 @@
 from logging import Logger
 from logging import getLogger
 
+from typing import Dict
 from typing import List
 from typing import NewType
 from typing import cast
 
+from os import path as osPath
+
 from dataclasses import dataclass
 from dataclasses import field
 
+from wx import DD_DIR_MUST_EXIST
 from wx import DEFAULT_DIALOG_STYLE
 from wx import FD_CHANGE_DIR
 from wx import FD_FILE_MUST_EXIST
 from wx import FD_MULTIPLE
 from wx import FD_OPEN
+from wx import DirDialog
 from wx import FileDialog
+from wx import ID_ANY
 from wx import RESIZE_BORDER
 from wx import STAY_ON_TOP
 from wx import ID_CANCEL
@@ -25,7 +31,15 @@ from wx import CANCEL
 from wx import EVT_BUTTON
 
 from wx import Button
+from wx import CheckBox
 from wx import CommandEvent
+from wx import SpinCtrl
+from wx import StaticText
+from wx import TextCtrl
+
+from wx import BeginBusyCursor
+from wx import EndBusyCursor
+
 from wx.grid import Grid
 
 from wx.lib.sized_controls import SizedDialog
@@ -33,6 +47,15 @@ from wx.lib.sized_controls import SizedPanel
 
 from pyutplugins.plugintypes.InputFormat import InputFormat
 
+from pyutplugins.preferences.PluginPreferences import PluginPreferences
+
+from pyutplugins.ioplugins.python.ClassSubset import ClassSubset
+from pyutplugins.ioplugins.python.ClassSubset import NO_CLASS_SUBSET
+from pyutplugins.ioplugins.python.ModuleDiscovery import DEFAULT_EXCLUDE_PATTERNS
+from pyutplugins.ioplugins.python.ModuleDiscovery import DEFAULT_INCLUDE_PATTERNS
+from pyutplugins.ioplugins.python.ModuleDiscovery import DiscoveredModules
+from pyutplugins.ioplugins.python.ModuleDiscovery import ModuleDiscovery
+
 
 ModulesToImport = NewType('ModulesToImport', List[str])
 
@@ -49,10 +72,25 @@ class Package:
 
 ImportPackages = NewType('ImportPackages', List[Package])
 
+PATTERNS_TOOLTIP:     str = "Separate patterns with spaces;  Patterns with a '/' match the path below the chosen directory"
+SHOW_CLASSES_TOOLTIP: str = 'Separate class names with spaces;  Only these classes, their neighbors and the classes of the shown packages get shapes'
+HOPS_TOOLTIP:         str = 'How many links away a neighbor can be'
+
+SHOW_COLUMN: int = 2
+
+HOPS_MIN: int = 0
+HOPS_MAX: int = 16
+
 
 class DlgSelectMultiplePackages(SizedDialog):
     """
     TODO:  This might be useful outside of importing Python files.
+
+    'More' adds modules picked from one directory;  'Directory' adds the modules in a whole
+    directory tree that match the include patterns and that are not excluded
+
+    Every module is imported;  But when some packages are not shown or classes are named, only
+    those classes get shapes.  See .classSubset
     """
 
     def __init__(self, startDirectory: str, inputFormat: InputFormat):
@@ -68,15 +106,24 @@ class DlgSelectMultiplePackages(SizedDialog):
         sizedPanel.SetSizerType('vertical')
         sizedPanel.SetSizerProps(expand=True, proportion=1)
 
-        self._btnMore:    Button = cast(Button, None)
-        self._btnCancel:  Button = cast(Button, None)
-        self._btnOk:      Button = cast(Button, None)
-        self._simpleGrid: Grid   = cast(Grid, None)
-
+        self._btnMore:      Button   = cast(Button, None)
+        self._btnDirectory: Button   = cast(Button, None)
+        self._btnCancel:    Button   = cast(Button, None)
+        self._btnOk:        Button   = cast(Button, None)
+        self._simpleGrid:   Grid     = cast(Grid, None)
+        self._include:      TextCtrl = cast(TextCtrl, None)
+        self._exclude:      TextCtrl = cast(TextCtrl, None)
+        self._useGitIgnore: CheckBox = cast(CheckBox, None)
+        self._showClasses:  TextCtrl = cast(TextCtrl, None)
+        self._hops:         SpinCtrl = cast(SpinCtrl, None)
+
+        self._layoutDirectoryOptions(parent=sizedPanel)
         self._layoutSimpleGrid(parent=sizedPanel)
+        self._layoutShowOptions(parent=sizedPanel)
         self._layoutCustomDialogButtonContainer(parent=sizedPanel)
 
         self._importPackages: ImportPackages = ImportPackages([])
+        self._classSubset:    ClassSubset    = NO_CLASS_SUBSET
         self._packageCount:   int            = 0
         self._moduleCount:    int            = 0
 
@@ -84,18 +131,54 @@ class DlgSelectMultiplePackages(SizedDialog):
 
         self._resizeDialog()
 
+    def _layoutDirectoryOptions(self, parent: SizedPanel):
+
+        sizedForm: SizedPanel = SizedPanel(parent)
+        sizedForm.SetSizerType('form')
+        sizedForm.SetSizerProps(expand=True)
+
+        StaticText(sizedForm, ID_ANY, 'Include:')
+        self._include = TextCtrl(sizedForm, ID_ANY, value=' '.join(DEFAULT_INCLUDE_PATTERNS))
+        self._include.SetSizerProps(expand=True)
+        self._include.SetToolTip(PATTERNS_TOOLTIP)
+
+        StaticText(sizedForm, ID_ANY, 'Exclude:')
+        self._exclude = TextCtrl(sizedForm, ID_ANY, value=' '.join(DEFAULT_EXCLUDE_PATTERNS))
+        self._exclude.SetSizerProps(expand=True)
+        self._exclude.SetToolTip(PATTERNS_TOOLTIP)
+
+        self._useGitIgnore = CheckBox(parent, ID_ANY, label='Skip what .gitignore files ignore')
+        self._useGitIgnore.SetValue(True)
+
     def _layoutSimpleGrid(self, parent: SizedPanel):
 
         simpleGrid: Grid = Grid(parent)
-        simpleGrid.CreateGrid(numRows=1, numCols=2)
+        simpleGrid.CreateGrid(numRows=1, numCols=3)
 
         simpleGrid.SetColLabelValue(0, 'Package Name')
         simpleGrid.SetColLabelValue(1, 'Module Count')
+        simpleGrid.SetColLabelValue(SHOW_COLUMN, 'Show')
+        simpleGrid.SetColFormatBool(SHOW_COLUMN)
 
         simpleGrid.AutoSizeColumns()
 
         self._simpleGrid = simpleGrid
 
+    def _layoutShowOptions(self, parent: SizedPanel):
+
+        sizedForm: SizedPanel = SizedPanel(parent)
+        sizedForm.SetSizerType('form')
+        sizedForm.SetSizerProps(expand=True)
+
+        StaticText(sizedForm, ID_ANY, 'Show Classes:')
+        self._showClasses = TextCtrl(sizedForm, ID_ANY, value='')
+        self._showClasses.SetSizerProps(expand=True)
+        self._showClasses.SetToolTip(SHOW_CLASSES_TOOLTIP)
+
+        StaticText(sizedForm, ID_ANY, 'Neighborhood Hops:')
+        self._hops = SpinCtrl(sizedForm, ID_ANY, min=HOPS_MIN, max=HOPS_MAX, initial=PluginPreferences().neighborhoodHops)
+        self._hops.SetToolTip(HOPS_TOOLTIP)
+
     def _layoutCustomDialogButtonContainer(self, parent: SizedPanel, ):
         """
         Create Ok and Cancel
@@ -113,13 +196,15 @@ class DlgSelectMultiplePackages(SizedDialog):
         #
         # Layout custom buttons here
         #
-        self._btnMore   = Button(buttonPanel, label='&More')
-        self._btnCancel = Button(buttonPanel, ID_CANCEL, '&Cancel')
-        self._btnOk     = Button(buttonPanel, ID_OK, '&Ok')
+        self._btnMore      = Button(buttonPanel, label='&More')
+        self._btnDirectory = Button(buttonPanel, label='&Directory')
+        self._btnCancel    = Button(buttonPanel, ID_CANCEL, '&Cancel')
+        self._btnOk        = Button(buttonPanel, ID_OK, '&Ok')
 
-        self.Bind(EVT_BUTTON, self._onMore,  self._btnMore)
-        self.Bind(EVT_BUTTON, self._onOk,    self._btnOk)
-        self.Bind(EVT_BUTTON, self._onClose, self._btnCancel)
+        self.Bind(EVT_BUTTON, self._onMore,      self._btnMore)
+        self.Bind(EVT_BUTTON, self._onDirectory, self._btnDirectory)
+        self.Bind(EVT_BUTTON, self._onOk,        self._btnOk)
+        self.Bind(EVT_BUTTON, self._onClose,     self._btnCancel)
 
         self._btnOk.SetDefault()
 
@@ -132,6 +217,15 @@ class DlgSelectMultiplePackages(SizedDialog):
         """
         return self._importPackages
 
+    @property
+    def classSubset(self) -> ClassSubset:
+        """
+        Only valid if user pressed 'ok'
+
+        Returns:  The classes to create shapes for;  NO_CLASS_SUBSET when every package is shown and no classes are named
+        """
+        return self._classSubset
+
     @property
     def packageCount(self) -> int:
         return self._packageCount
@@ -152,24 +246,65 @@ class DlgSelectMultiplePackages(SizedDialog):
                 importDirectory.packageName = dlg.GetDirectory()
                 importDirectory.moduleToImport = dlg.GetFilenames()
 
-                self._packageCount += 1
-                currentModuleCount: int = len(importDirectory.moduleToImport)
-                self._moduleCount  += currentModuleCount
-                self._importPackages.append(importDirectory)
-                self._simpleGrid.SetCellValue(self._currentGridRow, 0, importDirectory.packageName)
-                self._simpleGrid.SetCellValue(self._currentGridRow, 1, str(currentModuleCount))
-
-                self._simpleGrid.AppendRows(1)
-                self._currentGridRow += 1
-                self._simpleGrid.AutoSizeColumns()
+                self._addPackage(importDirectory=importDirectory)
                 self._resizeDialog()
             else:
                 self._importPackages = ImportPackages([])
 
+    # noinspection PyUnusedLocal
+    def _onDirectory(self, event: CommandEvent):
+
+        with DirDialog(None, 'Choose a directory tree to import', defaultPath=self._startDirectory, style=DD_DIR_MUST_EXIST) as dlg:
+            if dlg.ShowModal() != ID_OK:
+                return
+            rootDirectory: str = dlg.GetPath()
+
+        moduleDiscovery: ModuleDiscovery = ModuleDiscovery(includePatterns=self._include.GetValue().split(),
+                                                           excludePatterns=self._exclude.GetValue().split(),
+                                                           useGitIgnore=self._useGitIgnore.GetValue())
+        BeginBusyCursor()
+        try:
+            discoveredModules: DiscoveredModules = moduleDiscovery.discover(rootDirectory=rootDirectory)
+        finally:
+            EndBusyCursor()
+
+        for importDirectory in self._toPackages(discoveredModules=discoveredModules):
+            self._addPackage(importDirectory=importDirectory)
+        self._resizeDialog()
+
+    def _addPackage(self, importDirectory: Package):
+
+        self._packageCount += 1
+        currentModuleCount: int = len(importDirectory.moduleToImport)
+        self._moduleCount  += currentModuleCount
+        self._importPackages.append(importDirectory)
+        self._simpleGrid.SetCellValue(self._currentGridRow, 0, importDirectory.packageName)
+        self._simpleGrid.SetCellValue(self._currentGridRow, 1, str(currentModuleCount))
+        self._simpleGrid.SetCellValue(self._currentGridRow, SHOW_COLUMN, '1')
+
+        self._simpleGrid.AppendRows(1)
+        self._currentGridRow += 1
+        self._simpleGrid.AutoSizeColumns()
+
+    def _toPackages(self, discoveredModules: DiscoveredModules) -> ImportPackages:
+        """
+        Args:
+            discoveredModules:  Largest first
+
+        Returns:  The modules grouped by directory in directory name order;  Each directory's modules stay largest first
+        """
+        packages: Dict[str, Package] = {}
+        for discoveredModule in discoveredModules:
+            packageName, fileName = osPath.split(discoveredModule.fqFileName)
+            packages.setdefault(packageName, Package(packageName=packageName)).moduleToImport.append(fileName)
+
+        return ImportPackages([packages[packageName] for packageName in sorted(packages.keys())])
+
     # noinspection PyUnusedLocal
     def _onOk(self, event: CommandEvent):
         """
         """
+        self._classSubset = self._toClassSubset()
         self.EndModal(OK)
 
     # noinspection PyUnusedLocal
@@ -178,6 +313,19 @@ class DlgSelectMultiplePackages(SizedDialog):
         """
         self.EndModal(CANCEL)
 
+    def _toClassSubset(self) -> ClassSubset:
+
+        shownPackages: List[str] = []
+        for row, package in enumerate(self._importPackages):
+            if self._simpleGrid.GetCellValue(row, SHOW_COLUMN) == '1':
+                shownPackages.append(package.packageName)
+
+        classNames: List[str] = self._showClasses.GetValue().split()
+        if len(shownPackages) == len(self._importPackages) and len(classNames) == 0:
+            return NO_CLASS_SUBSET
+
+        return ClassSubset(packageNames=shownPackages, classNames=classNames, hops=self._hops.GetValue())
+
     def _composeWildCardSpecification(self) -> str:
 
         inputFormat: InputFormat = self._inputFormat
@@ -0,0 +1,3 @@
+
+class ImportCancelledException(Exception):
+    pass
@@ -0,0 +1,136 @@
+
+from typing import List
+from typing import Set
+from typing import NewType
+from typing import Tuple
+from typing import Type
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from os import linesep as osLineSep
+
+from dataclasses import dataclass
+
+from pyutplugins.ioplugins.python.PythonParseException import PythonParseException
+
+PASS_1_NAME: str = 'Pass 1'
+PASS_2_NAME: str = 'Pass 2'
+SKIM_NAME:   str = 'Skim'
+
+#
+# Why a single module fails;  e.g. Python 2 syntax or a module that is not utf-8.  Anything
+# else is a bug and stops the import
+#
+MODULE_EXCEPTIONS: Tuple[Type[Exception], ...] = (PythonParseException, UnicodeDecodeError)
+
+#
+# The number of modules listed in the summary;  The rest are only in the log
+#
+SUMMARY_ERROR_COUNT: int = 20
+
+
+@dataclass
+class ModuleError:
+    """
+    A module that could not be reverse engineered.  The line and column are 0 when
+    they are not known.  The elapsed time is how long the module took to fail, in seconds
+    """
+    fqFileName:  str   = ''
+    passName:    str   = ''
+    line:        int   = 0
+    column:      int   = 0
+    message:     str   = ''
+    elapsedTime: float = 0.0
+
+    def __str__(self) -> str:
+        return f'{self.fqFileName} line {self.line} column {self.column}: {self.message}'
+
+
+ModuleErrors = NewType('ModuleErrors', List[ModuleError])
+
+NO_MODULE_ERROR: ModuleError = cast(ModuleError, None)
+
+
+def makeModuleError(fqFileName: str, passName: str, e: Exception, elapsedTime: float) -> ModuleError:
+    """
+    Args:
+        fqFileName:     The module that failed
+        passName:       The pass that it failed in
+        e:              Why it failed;  Usually a PythonParseException
+        elapsedTime:    How long it took to fail
+
+    Returns:  The error to report
+    """
+    if isinstance(e, PythonParseException):
+        return ModuleError(fqFileName=fqFileName, passName=passName, line=e.line, column=e.column, message=e.message, elapsedTime=elapsedTime)
+
+    return ModuleError(fqFileName=fqFileName, passName=passName, message=f'{e}', elapsedTime=elapsedTime)
+
+
+class ImportErrorReport:
+    """
+    The modules that failed during an import;  They are collected while the import runs
+    and shown once when it finishes rather than as each one fails.  A module is only reported
+    once;  The first pass that it failed in is the one that is reported
+
+    This has no wx dependencies;  Errors are added on the import thread and read on the
+    UI thread after the import finishes
+    """
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+        self._moduleErrors:  ModuleErrors = ModuleErrors([])
+        self._failedModules: Set[str]     = set()
+
+    @property
+    def moduleErrors(self) -> ModuleErrors:
+        return self._moduleErrors
+
+    @property
+    def hasErrors(self) -> bool:
+        return len(self._moduleErrors) > 0
+
+    @property
+    def failedModules(self) -> Set[str]:
+        """
+        Returns:  The fully qualified names of the modules that failed
+        """
+        return self._failedModules
+
+    def addError(self, moduleError: ModuleError):
+
+        if moduleError.fqFileName in self._failedModules:
+            self.logger.debug(f'{moduleError.fqFileName} is already reported')
+            return
+
+        self._failedModules.add(moduleError.fqFileName)
+        self._moduleErrors.append(moduleError)
+
+    def addErrors(self, moduleErrors: ModuleErrors):
+        for moduleError in moduleErrors:
+            self.addError(moduleError)
+
+    def clear(self):
+        self._moduleErrors  = ModuleErrors([])
+        self._failedModules = set()
+
+    def summary(self, maximumErrors: int = SUMMARY_ERROR_COUNT) -> str:
+        """
+        Args:
+            maximumErrors:  The number of modules to list
+
+        Returns:  The failed modules in the order that they were imported
+        """
+        errorCount:  int   = len(self._moduleErrors)
+        elapsedTime: float = sum(moduleError.elapsedTime for moduleError in self._moduleErrors)
+
+        lines: List[str] = [f'{errorCount} module(s) could not be imported and were skipped ({elapsedTime:.2f} seconds)', '']
+        for moduleError in self._moduleErrors[:maximumErrors]:
+            lines.append(f'{moduleError.passName}: {moduleError}')
+
+        if errorCount > maximumErrors:
+            lines.append(f'... and {errorCount - maximumErrors} more;  See the log')
+
+        return osLineSep.join(lines)
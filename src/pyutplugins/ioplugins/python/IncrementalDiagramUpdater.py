@@ -0,0 +1,208 @@
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.enumerations.PyutLinkType import PyutLinkType
+
+from ogl.OglClass import OglClass
+from ogl.OglLink import OglLink
+
+from pyutplugins.ExternalTypes import OglClasses
+from pyutplugins.ExternalTypes import OglLinks
+from pyutplugins.ExternalTypes import OglObjects
+
+from pyutplugins.IPluginAdapter import IPluginAdapter
+
+from pyutplugins.common.LinkMakerMixin import LinkMakerMixin
+
+from pyutplugins.ioplugins.python.IncrementalImport import ImportDelta
+from pyutplugins.ioplugins.python.IncrementalImport import LinkKey
+from pyutplugins.ioplugins.python.IncrementalImport import LinkKeys
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import AssociationType
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+
+DiagramClasses = NewType('DiagramClasses', Dict[PyutClassName, OglClass])
+
+LINK_TYPES: Dict[AssociationType, PyutLinkType] = {
+    AssociationType.ASSOCIATION: PyutLinkType.ASSOCIATION,
+    AssociationType.AGGREGATION: PyutLinkType.AGGREGATION,
+    AssociationType.COMPOSITION: PyutLinkType.COMPOSITION,
+    AssociationType.INHERITANCE: PyutLinkType.INHERITANCE,
+}
+
+
+class IncrementalDiagramUpdater(LinkMakerMixin):
+    """
+    Applies an ImportDelta to the classes already on a frame.  Changed classes are
+    updated in place so that they keep their positions;  Removed classes and links
+    are deleted from the frame.
+
+    The new classes and links are created but not added to the frame;  The plugin lays them out
+    """
+    def __init__(self, pluginAdapter: IPluginAdapter, oglObjects: OglObjects):
+        """
+
+        Args:
+            pluginAdapter:  The adapter to the frame
+            oglObjects:     All the shapes on the frame
+        """
+        super().__init__()
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._pluginAdapter:  IPluginAdapter = pluginAdapter
+        self._diagramClasses: DiagramClasses = DiagramClasses({})
+
+        self._addedOglClasses: OglClasses = OglClasses([])
+        self._addedOglLinks:   OglLinks   = OglLinks([])
+
+        for oglObject in oglObjects:
+            if isinstance(oglObject, OglClass):
+                oglClass:  OglClass  = cast(OglClass, oglObject)
+                pyutClass: PyutClass = cast(PyutClass, oglClass.pyutObject)
+
+                self._diagramClasses[PyutClassName(pyutClass.name)] = oglClass
+
+    @property
+    def addedOglClasses(self) -> OglClasses:
+        return self._addedOglClasses
+
+    @property
+    def addedOglLinks(self) -> OglLinks:
+        return self._addedOglLinks
+
+    @property
+    def diagramBottom(self) -> int:
+        """
+        Returns:  The lowest y coordinate of the classes on the frame
+        """
+        bottom: int = 0
+        for oglClass in self._diagramClasses.values():
+            x, y          = oglClass.GetPosition()
+            width, height = oglClass.GetSize()
+            bottom = max(bottom, int(y + height))
+
+        return bottom
+
+    def isDiagramOf(self, classNames: List[PyutClassName]) -> bool:
+        """
+        Args:
+            classNames:  The classes from the previous import
+
+        Returns:  'True' if any of them are on the frame
+        """
+        for className in classNames:
+            if className in self._diagramClasses:
+                return True
+
+        return False
+
+    def applyDelta(self, importDelta: ImportDelta):
+
+        self._removeClasses(classNames=importDelta.removedClassNames)
+        self._removeLinks(linkKeys=importDelta.removedLinks, removedClassNames=importDelta.removedClassNames)
+        self._updateClasses(changedClasses=importDelta.changedClasses)
+        self._addClasses(addedClasses=importDelta.addedClasses)
+        self._addLinks(linkKeys=importDelta.addedLinks)
+
+    def _removeClasses(self, classNames: List[PyutClassName]):
+        """
+        The adapter must be able to delete shapes;  See IPluginAdapter.canDeleteShapes
+
+        Args:
+            classNames:  The classes to remove
+        """
+        assert self._pluginAdapter.canDeleteShapes is True, 'Developer error. The adapter cannot delete shapes'
+
+        deleteShape: Callable[[OglClass], None] = getattr(self._pluginAdapter, 'deleteShape')
+        for className in classNames:
+            oglClass: OglClass | None = self._diagramClasses.pop(className, None)
+            if oglClass is None:
+                self.logger.warning(f'{className} is no longer on the diagram')
+            else:
+                deleteShape(oglClass)
+
+    def _removeLinks(self, linkKeys: LinkKeys, removedClassNames: List[PyutClassName]):
+        """
+        The links of removed classes went with them.  The adapter may delete asynchronously;  So
+        keep track of the deleted links in case the same link is removed more than once
+
+        Args:
+            linkKeys:           The links to remove
+            removedClassNames:  The classes that were removed
+        """
+        deletedLinks: OglLinks = OglLinks([])
+        for linkKey in linkKeys:
+            if linkKey.sourceName in removedClassNames or linkKey.destinationName in removedClassNames:
+                continue
+            oglLink: OglLink | None = self._findLink(linkKey=linkKey, deletedLinks=deletedLinks)
+            if oglLink is not None:
+                self._pluginAdapter.deleteLink(oglLink)
+                deletedLinks.append(oglLink)
+
+    def _updateClasses(self, changedClasses: PyutClasses):
+        """
+        Swap in what reverse engineering found;  The description and the display options are left alone
+
+        Args:
+            changedClasses:  The new versions of the classes
+        """
+        for className, newClass in changedClasses.items():
+            oglClass: OglClass | None = self._diagramClasses.get(className, None)
+            if oglClass is None:
+                self._addClasses(addedClasses=PyutClasses({className: newClass}))
+            else:
+                pyutClass: PyutClass = cast(PyutClass, oglClass.pyutObject)
+
+                pyutClass.stereotype = newClass.stereotype
+                pyutClass.fields     = newClass.fields
+                pyutClass.methods    = newClass.methods
+
+                oglClass.autoResize()
+
+    def _addClasses(self, addedClasses: PyutClasses):
+
+        for className, pyutClass in addedClasses.items():
+            oglClass: OglClass = OglClass(pyutClass)
+
+            self._diagramClasses[className] = oglClass
+            self._addedOglClasses.append(oglClass)
+
+    def _addLinks(self, linkKeys: LinkKeys):
+
+        for linkKey in linkKeys:
+            try:
+                sourceClass:      OglClass = self._diagramClasses[linkKey.sourceName]
+                destinationClass: OglClass = self._diagramClasses[linkKey.destinationName]
+            except KeyError as ke:
+                self.logger.warning(f'Cannot link {linkKey.sourceName} to {linkKey.destinationName};  {ke} is not on the diagram')
+                continue
+
+            oglLink: OglLink = self.createLink(src=sourceClass, dst=destinationClass, linkType=LINK_TYPES[linkKey.associationType])
+
+            self._addedOglLinks.append(oglLink)
+
+    def _findLink(self, linkKey: LinkKey, deletedLinks: OglLinks) -> OglLink | None:
+
+        sourceClass: OglClass | None = self._diagramClasses.get(linkKey.sourceName, None)
+        if sourceClass is None:
+            return None
+
+        linkType: PyutLinkType = LINK_TYPES[linkKey.associationType]
+        for oglLink in sourceClass.links:
+            if oglLink in deletedLinks:
+                continue
+            destinationClass: PyutClass = cast(PyutClass, oglLink.destinationShape.pyutObject)
+            if oglLink.sourceShape is sourceClass and destinationClass.name == linkKey.destinationName and oglLink.pyutObject.linkType == linkType:
+                return oglLink
+
+        return None
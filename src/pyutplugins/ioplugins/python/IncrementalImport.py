@@ -0,0 +1,313 @@
+
+from typing import Counter as CounterType
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Set
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from collections import Counter
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from hashlib import sha256
+
+from os import stat_result
+
+from pathlib import Path
+
+from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.PyutField import PyutField
+from pyutmodelv2.PyutMethod import PyutMethod
+from pyutmodelv2.PyutParameter import PyutParameter
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import AssociationType
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ModuleResult
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+from pyutplugins.ioplugins.python.visitor.ParserTypes import pyutClassesFactory
+
+ClassSignature = Tuple
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """
+    The modification time and size are cheap to get;  The digest is only computed
+    again when one of them changes so that touching a file does not re-parse it
+    """
+    modificationTime: int = 0
+    size:             int = 0
+    digest:           str = ''
+
+
+@dataclass(frozen=True)
+class LinkKey:
+    """
+    Identifies a link by what it connects;  Inheritance links use AssociationType.INHERITANCE
+    """
+    sourceName:      PyutClassName   = PyutClassName('')
+    destinationName: PyutClassName   = PyutClassName('')
+    associationType: AssociationType = AssociationType.ASSOCIATION
+
+
+FileFingerprints = NewType('FileFingerprints', Dict[str, FileFingerprint])
+ImportedModules  = NewType('ImportedModules',  Dict[str, ModuleResult])
+LinkKeys         = NewType('LinkKeys',         List[LinkKey])
+ClassNameList    = NewType('ClassNameList',    List[PyutClassName])
+
+
+def fileFingerprintsFactory() -> FileFingerprints:
+    return FileFingerprints({})
+
+
+def importedModulesFactory() -> ImportedModules:
+    return ImportedModules({})
+
+
+def linkKeysFactory() -> LinkKeys:
+    return LinkKeys([])
+
+
+def classNameListFactory() -> ClassNameList:
+    return ClassNameList([])
+
+
+def fingerprintFile(fqFileName: str) -> FileFingerprint:
+
+    modulePath: Path        = Path(fqFileName)
+    fileStat:   stat_result = modulePath.stat()
+
+    return FileFingerprint(modificationTime=fileStat.st_mtime_ns, size=fileStat.st_size, digest=sha256(modulePath.read_bytes()).hexdigest())
+
+
+@dataclass
+class ImportSnapshot:
+    """
+    What the previous import saw;  The module results hold the classes that are on the diagram
+    """
+    fingerprints:    FileFingerprints = field(default_factory=fileFingerprintsFactory)
+    importedModules: ImportedModules  = field(default_factory=importedModulesFactory)
+
+    def classNames(self) -> Set[PyutClassName]:
+        return classNamesOf(self.importedModules)
+
+
+NO_IMPORT_SNAPSHOT: ImportSnapshot = cast(ImportSnapshot, None)
+
+
+@dataclass
+class FileChanges:
+    addedFiles:     List[str] = field(default_factory=list)
+    changedFiles:   List[str] = field(default_factory=list)
+    removedFiles:   List[str] = field(default_factory=list)
+    unchangedFiles: List[str] = field(default_factory=list)
+
+    @property
+    def hasChanges(self) -> bool:
+        return len(self.addedFiles) + len(self.changedFiles) + len(self.removedFiles) > 0
+
+    @property
+    def filesToParse(self) -> List[str]:
+        return self.addedFiles + self.changedFiles
+
+
+@dataclass
+class ImportDelta:
+    """
+    The changed classes are the newly reverse engineered versions;  Their old versions are
+    the ones on the diagram
+    """
+    addedClasses:      PyutClasses   = field(default_factory=pyutClassesFactory)
+    changedClasses:    PyutClasses   = field(default_factory=pyutClassesFactory)
+    removedClassNames: ClassNameList = field(default_factory=classNameListFactory)
+    addedLinks:        LinkKeys      = field(default_factory=linkKeysFactory)
+    removedLinks:      LinkKeys      = field(default_factory=linkKeysFactory)
+
+    @property
+    def isEmpty(self) -> bool:
+        return (len(self.addedClasses) + len(self.changedClasses) + len(self.removedClassNames) +
+                len(self.addedLinks) + len(self.removedLinks)) == 0
+
+
+def classNamesOf(importedModules: ImportedModules) -> Set[PyutClassName]:
+
+    classNames: Set[PyutClassName] = set()
+    for moduleResult in importedModules.values():
+        classNames.update(moduleResult.pyutClasses.keys())
+
+    return classNames
+
+
+class IncrementalImport:
+    """
+    Decides which modules have to be reverse engineered again and what has to
+    change on the diagram as a result.
+
+    Classes and links are matched by name;  So this has no wx or ogl dependencies
+    """
+    def __init__(self, importSnapshot: ImportSnapshot):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._importSnapshot: ImportSnapshot = importSnapshot
+
+    def classifyFiles(self, fqFileNames: List[str]) -> FileChanges:
+        """
+        Args:
+            fqFileNames:  The modules selected for this import
+
+        Returns:  The modules sorted by how they changed since the previous import
+        """
+        fileChanges:  FileChanges      = FileChanges()
+        fingerprints: FileFingerprints = self._importSnapshot.fingerprints
+
+        for fqFileName in fqFileNames:
+            if fqFileName not in fingerprints:
+                fileChanges.addedFiles.append(fqFileName)
+            elif self._hasChanged(fqFileName=fqFileName, fingerprint=fingerprints[fqFileName]) is True:
+                fileChanges.changedFiles.append(fqFileName)
+            else:
+                fileChanges.unchangedFiles.append(fqFileName)
+
+        selected: Set[str] = set(fqFileNames)
+        fileChanges.removedFiles = [fqFileName for fqFileName in fingerprints if fqFileName not in selected]
+
+        return fileChanges
+
+    def unchangedModules(self, fileChanges: FileChanges) -> ImportedModules:
+        """
+        Args:
+            fileChanges:  From .classifyFiles
+
+        Returns:  The previous results of the modules that do not have to be reverse engineered again
+        """
+        importedModules: ImportedModules = self._importSnapshot.importedModules
+
+        return ImportedModules({fqFileName: importedModules[fqFileName] for fqFileName in fileChanges.unchangedFiles if fqFileName in importedModules})
+
+    def computeDelta(self, importedModules: ImportedModules) -> ImportDelta:
+        """
+        Args:
+            importedModules:  The results of this import;  Includes the unchanged modules
+
+        Returns:  What has to change on the diagram
+        """
+        oldClasses: PyutClasses = self._mergedClasses(self._importSnapshot.importedModules)
+        newClasses: PyutClasses = self._mergedClasses(importedModules)
+
+        importDelta: ImportDelta = ImportDelta()
+        for className, newClass in newClasses.items():
+            if className not in oldClasses:
+                importDelta.addedClasses[className] = newClass
+            elif newClass is not oldClasses[className] and classSignature(newClass) != classSignature(oldClasses[className]):
+                importDelta.changedClasses[className] = newClass
+
+        importDelta.removedClassNames = ClassNameList([className for className in oldClasses if className not in newClasses])
+
+        oldLinks: CounterType[LinkKey] = Counter(self._linkKeys(self._importSnapshot.importedModules))
+        newLinks: CounterType[LinkKey] = Counter(self._linkKeys(importedModules))
+
+        importDelta.addedLinks   = LinkKeys(list((newLinks - oldLinks).elements()))
+        importDelta.removedLinks = LinkKeys(list((oldLinks - newLinks).elements()))
+
+        self.logger.info(f'Added classes: {len(importDelta.addedClasses)} changed: {len(importDelta.changedClasses)} '
+                         f'removed: {len(importDelta.removedClassNames)} '
+                         f'Added links: {len(importDelta.addedLinks)} removed: {len(importDelta.removedLinks)}')
+
+        return importDelta
+
+    def takeSnapshot(self, fqFileNames: List[str], importedModules: ImportedModules) -> ImportSnapshot:
+        """
+        Unchanged modules keep their fingerprints so that they are not read again
+
+        Args:
+            fqFileNames:        The modules selected for this import
+            importedModules:    The results of this import
+
+        Returns:  The snapshot for the next import
+        """
+        previous:     FileFingerprints = self._importSnapshot.fingerprints
+        fingerprints: FileFingerprints = FileFingerprints({})
+        for fqFileName in fqFileNames:
+            fingerprint: FileFingerprint = previous.get(fqFileName, FileFingerprint())
+            if self._hasChanged(fqFileName=fqFileName, fingerprint=fingerprint) is True:
+                fingerprint = fingerprintFile(fqFileName=fqFileName)
+            fingerprints[fqFileName] = fingerprint
+
+        return ImportSnapshot(fingerprints=fingerprints, importedModules=importedModules)
+
+    def _hasChanged(self, fqFileName: str, fingerprint: FileFingerprint) -> bool:
+
+        fileStat: stat_result = Path(fqFileName).stat()
+        if fileStat.st_mtime_ns == fingerprint.modificationTime and fileStat.st_size == fingerprint.size:
+            return False
+
+        return fingerprintFile(fqFileName=fqFileName).digest != fingerprint.digest
+
+    def _mergedClasses(self, importedModules: ImportedModules) -> PyutClasses:
+        """
+        A class name defined in more than one module resolves to the last one;  Same as the passes
+        """
+        pyutClasses: PyutClasses = PyutClasses({})
+        for moduleResult in importedModules.values():
+            pyutClasses.update(moduleResult.pyutClasses)
+
+        return pyutClasses
+
+    def _linkKeys(self, importedModules: ImportedModules) -> LinkKeys:
+        """
+        Only links between imported classes get drawn.  An unchanged module may still associate
+        with a class that was since removed;  Reverse engineering it again would not create that association
+
+        Args:
+            importedModules:
+
+        Returns:  A key for every link that an import of these modules creates
+        """
+        classNames: Set[PyutClassName] = classNamesOf(importedModules)
+        linkKeys:   LinkKeys           = LinkKeys([])
+        for moduleResult in importedModules.values():
+            for parentName, children in moduleResult.parents.items():
+                for childName in children:
+                    if PyutClassName(parentName) in classNames and childName in classNames:
+                        linkKeys.append(LinkKey(sourceName=PyutClassName(childName),
+                                                destinationName=PyutClassName(parentName),
+                                                associationType=AssociationType.INHERITANCE))
+            for className, associates in moduleResult.associations.items():
+                for associate in associates:
+                    if className not in classNames or associate.associateName not in classNames:
+                        continue
+                    linkKeys.append(LinkKey(sourceName=className, destinationName=associate.associateName, associationType=associate.associationType))
+
+        return linkKeys
+
+
+def classSignature(pyutClass: PyutClass) -> ClassSignature:
+    """
+    The description is not part of the signature;  It records the date of the import
+
+    Args:
+        pyutClass:
+
+    Returns:  Everything that reverse engineering extracts from a class
+    """
+    fields:  List[PyutField]  = pyutClass.fields
+    methods: List[PyutMethod] = pyutClass.methods
+
+    fieldsSignature:  List[Tuple] = [(f.name, f.type.value, f.defaultValue, f.visibility) for f in fields]
+    methodsSignature: List[Tuple] = []
+    for pyutMethod in methods:
+        parameters: List[PyutParameter] = pyutMethod.parameters
+        methodsSignature.append((pyutMethod.name,
+                                 pyutMethod.returnType.value,
+                                 pyutMethod.visibility,
+                                 tuple(pyutMethod.sourceCode),
+                                 tuple((p.name, p.type.value, p.defaultValue) for p in parameters)))
+
+    return pyutClass.stereotype, tuple(fieldsSignature), tuple(methodsSignature)
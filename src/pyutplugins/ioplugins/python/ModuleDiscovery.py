@@ -0,0 +1,318 @@
+
+from typing import List
+from typing import NewType
+from typing import Set
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from os import DirEntry
+from os import cpu_count
+from os import scandir
+
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from fnmatch import fnmatchcase
+
+from pathlib import Path
+from pathlib import PurePosixPath
+
+from re import Pattern
+from re import compile as regExCompile
+from re import escape as regExEscape
+
+GIT_IGNORE_FILE_NAME: str = '.gitignore'
+
+DEFAULT_INCLUDE_PATTERNS: List[str] = ['*.py']
+#
+# Never imported;  They are not part of the code base or are copies of it
+#
+DEFAULT_EXCLUDE_PATTERNS: List[str] = ['.git', '.hg', '.svn', '.tox', '.venv', '__pycache__']
+
+
+@dataclass
+class GitIgnoreRule:
+    """
+    One line of a .gitignore file.  The pattern is relative to the directory of the .gitignore
+    file that it is in
+    """
+    directory:     PurePosixPath = PurePosixPath('.')
+    pattern:       Pattern       = regExCompile('')
+    negated:       bool          = False
+    directoryOnly: bool          = False
+    anchored:      bool          = False
+
+
+GitIgnoreRules = NewType('GitIgnoreRules', Tuple[GitIgnoreRule, ...])
+
+NO_GIT_IGNORE_RULES: GitIgnoreRules = GitIgnoreRules(())
+
+
+def parseGitIgnore(directory: PurePosixPath, text: str) -> GitIgnoreRules:
+    """
+    Supports comments, negation, directory only patterns, anchored patterns, and '*', '?',
+    '[...]' and '**' wild cards
+
+    Args:
+        directory:  Where the .gitignore file is relative to the import directory
+        text:       The .gitignore file's contents
+
+    Returns:  The file's rules in order
+    """
+    rules: List[GitIgnoreRule] = []
+    for line in text.splitlines():
+
+        line = line.rstrip()
+        if line == '' or line.startswith('#'):
+            continue
+
+        negated: bool = line.startswith('!')
+        if negated is True:
+            line = line[1:]
+        elif line.startswith('\\'):
+            line = line[1:]
+
+        directoryOnly: bool = line.endswith('/')
+        line = line.rstrip('/')
+        anchored: bool = '/' in line
+        line = line.lstrip('/')
+        if line == '':
+            continue
+
+        rules.append(GitIgnoreRule(directory=directory,
+                                   pattern=regExCompile(_gitPatternToRegEx(pattern=line)),
+                                   negated=negated,
+                                   directoryOnly=directoryOnly,
+                                   anchored=anchored))
+
+    return GitIgnoreRules(tuple(rules))
+
+
+def isGitIgnored(rules: GitIgnoreRules, relativePath: PurePosixPath, isDirectory: bool) -> bool:
+    """
+    The last rule that matches decides;  Like git, this is called for each directory on the way
+    down so a file in an ignored directory is never asked about
+
+    Args:
+        rules:          The rules of every .gitignore file from the import directory down to the path's directory
+        relativePath:   Relative to the import directory
+        isDirectory:    Directory only rules do not match files
+
+    Returns:  True if the path is ignored
+    """
+    ignored: bool = False
+    for rule in rules:
+        if rule.directoryOnly is True and isDirectory is False:
+            continue
+        if rule.directory != PurePosixPath('.') and rule.directory not in relativePath.parents:
+            continue
+
+        rulePath: str = relativePath.relative_to(rule.directory).as_posix()
+        if rule.anchored is False:
+            rulePath = relativePath.name
+        if rule.pattern.fullmatch(rulePath) is not None:
+            ignored = not rule.negated
+
+    return ignored
+
+
+def _gitPatternToRegEx(pattern: str) -> str:
+
+    regEx:    List[str] = []
+    position: int       = 0
+    while position < len(pattern):
+        if pattern.startswith('**/', position):
+            regEx.append('(?:.*/)?')
+            position += 3
+        elif pattern.startswith('/**', position) and position + 3 == len(pattern):
+            regEx.append('/.*')
+            position += 3
+        elif pattern.startswith('**', position):
+            regEx.append('.*')
+            position += 2
+        elif pattern[position] == '*':
+            regEx.append('[^/]*')
+            position += 1
+        elif pattern[position] == '?':
+            regEx.append('[^/]')
+            position += 1
+        elif pattern[position] == '[' and pattern.find(']', position + 1) > position + 1:
+            closing:   int = pattern.find(']', position + 1)
+            charClass: str = pattern[position + 1:closing]
+            if charClass.startswith('!'):
+                charClass = f'^{charClass[1:]}'
+            regEx.append(f'[{charClass}]')
+            position = closing + 1
+        else:
+            regEx.append(regExEscape(pattern[position]))
+            position += 1
+
+    return ''.join(regEx)
+
+
+@dataclass
+class DiscoveredModule:
+    fqFileName: str = ''
+    size:       int = 0
+
+
+DiscoveredModules = NewType('DiscoveredModules', List[DiscoveredModule])
+#
+# A directory still to search and the .gitignore rules of the directories above it
+#
+Subdirectories = NewType('Subdirectories', List[Tuple[PurePosixPath, GitIgnoreRules]])
+
+
+def discoveredModulesFactory() -> DiscoveredModules:
+    return DiscoveredModules([])
+
+
+def subdirectoriesFactory() -> Subdirectories:
+    return Subdirectories([])
+
+
+@dataclass
+class DirectoryScan:
+    """
+    What one thread found in one directory
+    """
+    modules:        DiscoveredModules = field(default_factory=discoveredModulesFactory)
+    subdirectories: Subdirectories    = field(default_factory=subdirectoriesFactory)
+
+
+class ModuleDiscovery:
+    """
+    Finds the modules to import below a directory.  Each directory is listed by a pool of
+    threads;  Listing is mostly waiting on the file system so the threads overlap well even
+    with the GIL.  Linked directories are not followed.
+
+    Patterns with a '/' match the path relative to the import directory;  Others match
+    the file or directory name.  An excluded directory is not searched.  The .gitignore
+    files found on the way down are honored the way git does
+
+    The modules are returned largest first;  Parsing time grows with module size, so
+    handing the largest modules to the parallel import first keeps its workers busy
+    until the end
+    """
+    def __init__(self, includePatterns: List[str] | None = None, excludePatterns: List[str] | None = None, useGitIgnore: bool = True,
+                 maxWorkers: int = 0):
+        """
+
+        Args:
+            includePatterns:    The modules to import;  Defaults to DEFAULT_INCLUDE_PATTERNS
+            excludePatterns:    The files and directories to skip;  Defaults to DEFAULT_EXCLUDE_PATTERNS
+            useGitIgnore:       Skip what the .gitignore files ignore
+            maxWorkers:         The number of threads;  0 picks one based on the number of cores
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._includePatterns: List[str] = DEFAULT_INCLUDE_PATTERNS if includePatterns is None else includePatterns
+        self._excludePatterns: List[str] = DEFAULT_EXCLUDE_PATTERNS if excludePatterns is None else excludePatterns
+        self._useGitIgnore:    bool      = useGitIgnore
+
+        if maxWorkers == 0:
+            self._maxWorkers: int = min(32, (cpu_count() or 1) + 4)
+        else:
+            self._maxWorkers = maxWorkers
+
+        self._rootDirectory: Path = Path('.')
+
+    def discover(self, rootDirectory: str) -> DiscoveredModules:
+        """
+        Args:
+            rootDirectory:  The directory to search
+
+        Returns:  The modules below it, largest first;  Modules of the same size are in path order
+        """
+        self._rootDirectory = Path(rootDirectory)
+
+        discoveredModules: DiscoveredModules = DiscoveredModules([])
+        with ThreadPoolExecutor(max_workers=self._maxWorkers) as executor:
+
+            pending: Set[Future] = {executor.submit(self._scanDirectory, PurePosixPath('.'), NO_GIT_IGNORE_RULES)}
+            while len(pending) > 0:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directoryScan: DirectoryScan = future.result()
+
+                    discoveredModules.extend(directoryScan.modules)
+                    for relativePath, gitIgnoreRules in directoryScan.subdirectories:
+                        pending.add(executor.submit(self._scanDirectory, relativePath, gitIgnoreRules))
+
+        discoveredModules.sort(key=lambda discoveredModule: (-discoveredModule.size, discoveredModule.fqFileName))
+
+        self.logger.info(f'Found {len(discoveredModules)} modules in {rootDirectory}')
+
+        return discoveredModules
+
+    def _scanDirectory(self, relativeDirectory: PurePosixPath, gitIgnoreRules: GitIgnoreRules) -> DirectoryScan:
+        """
+        Runs on a pool thread
+
+        Args:
+            relativeDirectory:  The directory to list relative to the import directory
+            gitIgnoreRules:     The rules of the .gitignore files in the directories above it
+
+        Returns:  The directory's modules and the subdirectories to search next
+        """
+        directoryScan: DirectoryScan = DirectoryScan()
+        directory:     Path          = self._rootDirectory / relativeDirectory
+
+        if self._useGitIgnore is True:
+            gitIgnoreRules = GitIgnoreRules(gitIgnoreRules + self._readGitIgnore(directory=directory, relativeDirectory=relativeDirectory))
+        try:
+            entries: List[DirEntry] = list(scandir(directory))
+        except OSError as e:
+            self.logger.warning(f'{directory} could not be listed: {e}')
+            return directoryScan
+
+        for entry in entries:
+            relativePath: PurePosixPath = relativeDirectory / entry.name
+            try:
+                isDirectory: bool = entry.is_dir(follow_symlinks=False)     # A linked directory could lead back up
+                if self._isExcluded(relativePath=relativePath, isDirectory=isDirectory, gitIgnoreRules=gitIgnoreRules) is True:
+                    continue
+                if isDirectory is True:
+                    directoryScan.subdirectories.append((relativePath, gitIgnoreRules))
+                elif entry.is_file() is True and self._matches(patterns=self._includePatterns, relativePath=relativePath) is True:
+                    directoryScan.modules.append(DiscoveredModule(fqFileName=entry.path, size=entry.stat().st_size))
+            except OSError as e:
+                self.logger.warning(f'{entry.path} skipped: {e}')
+
+        return directoryScan
+
+    def _isExcluded(self, relativePath: PurePosixPath, isDirectory: bool, gitIgnoreRules: GitIgnoreRules) -> bool:
+
+        if self._matches(patterns=self._excludePatterns, relativePath=relativePath) is True:
+            return True
+
+        return isGitIgnored(rules=gitIgnoreRules, relativePath=relativePath, isDirectory=isDirectory)
+
+    def _matches(self, patterns: List[str], relativePath: PurePosixPath) -> bool:
+
+        for pattern in patterns:
+            if '/' in pattern:
+                if fnmatchcase(relativePath.as_posix(), pattern.strip('/')) is True:
+                    return True
+            elif fnmatchcase(relativePath.name, pattern) is True:
+                return True
+
+        return False
+
+    def _readGitIgnore(self, directory: Path, relativeDirectory: PurePosixPath) -> GitIgnoreRules:
+
+        gitIgnoreFile: Path = directory / GIT_IGNORE_FILE_NAME
+        try:
+            return parseGitIgnore(directory=relativeDirectory, text=gitIgnoreFile.read_text())
+        except FileNotFoundError:
+            return NO_GIT_IGNORE_RULES
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.warning(f'{gitIgnoreFile} could not be read: {e}')
+            return NO_GIT_IGNORE_RULES
@@ -0,0 +1,305 @@
+
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import NewType
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from collections import OrderedDict
+
+from hashlib import sha256
+
+from io import BytesIO
+
+from os import stat_result
+from os import utime
+
+from pathlib import Path
+
+from platform import python_version
+
+from pickle import HIGHEST_PROTOCOL
+from pickle import Pickler
+from pickle import Unpickler
+from pickle import UnpicklingError
+
+from zlib import compress
+from zlib import decompress
+
+from pyutmodelv2 import __version__ as pyutModelVersion
+
+from pyutplugins.ioplugins.python.ImportErrorReport import NO_MODULE_ERROR
+from pyutplugins.ioplugins.python.ParseTreeCache import ONE_MEGABYTE
+from pyutplugins.ioplugins.python.PythonBackend import PythonBackend
+from pyutplugins.ioplugins.python.SourceCodeReference import SourceCodeReference
+from pyutplugins.ioplugins.python.SourceCodeReference import makeSourceCodeReference
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ModuleResult
+from pyutplugins.ioplugins.python.visitor.ParserTypes import VERSION as VISITOR_VERSION
+
+from pyutplugins.ioplugins.python.pythonpegparser.PythonLexer import serializedATN as lexerSerializedATN
+from pyutplugins.ioplugins.python.pythonpegparser.PythonParser import serializedATN as parserSerializedATN
+
+#
+# Bump this when the visitors change what they extract or when ModuleResult changes
+#
+CACHE_FORMAT_VERSION: str = '5'
+
+CACHE_FILE_SUFFIX: str = '.cache'
+
+PASS_1_CONTEXT: str = 'Pass 1'
+SKIM_CONTEXT:   str = 'Skim'
+
+SOURCE_CODE_REFERENCE_ID: str = 'SourceCodeReference'
+
+NO_MODULE_RESULT: ModuleResult = cast(ModuleResult, None)
+
+CacheKey      = NewType('CacheKey',      str)
+CachedEntries = NewType('CachedEntries', OrderedDict[CacheKey, int])
+
+
+def pass2Context(classNames: Iterable[str], compactSourceCode: bool = False) -> str:
+    """
+    What pass 2 extracts from a module depends on the classes found in all the modules;
+    For example, associations are only created for known classes.  It also depends on
+    whether the method source code is copied or referenced
+
+    Args:
+        classNames:         The names of all the classes found during pass 1
+        compactSourceCode:  The visitors refer to the method source code instead of copying it
+
+    Returns:  A context for .makeKey
+    """
+    digest: str = sha256('\n'.join(sorted(classNames)).encode()).hexdigest()
+
+    return f'Pass 2 {digest} compact={compactSourceCode}'
+
+
+class EntryPickler(Pickler):
+    """
+    Pickles a source code reference without its module's file name;  The same module
+    content may be imported from anywhere
+    """
+    def persistent_id(self, obj: Any) -> Tuple[str, int, int] | None:
+        if isinstance(obj, SourceCodeReference) and obj.loaded is False:
+            return SOURCE_CODE_REFERENCE_ID, obj.startOffset, obj.endOffset
+
+        return None
+
+
+class EntryUnpickler(Unpickler):
+    """
+    Points the source code references at the module that is being imported
+    """
+    def __init__(self, entryFile: BytesIO, fqFileName: str):
+
+        super().__init__(entryFile)
+
+        self._fqFileName: str = fqFileName
+
+    def persistent_load(self, pid: Tuple[str, int, int]) -> SourceCodeReference:
+
+        persistentType, startOffset, endOffset = pid
+        if persistentType != SOURCE_CODE_REFERENCE_ID:
+            raise UnpicklingError(f'Unknown persistent id: {persistentType}')
+
+        return makeSourceCodeReference(fqFileName=self._fqFileName, startOffset=startOffset, endOffset=endOffset)
+
+
+class ModuleResultCache:
+    """
+    An on disk cache of what the visitors extract from each module.  Entries are
+    keyed by the module's content, so an unchanged module is not lexed, parsed or
+    visited again;  It does not matter where the module lives.  The source code references
+    of an entry point at the module that it is read for.  The key also covers
+    the backend, the grammar, the Python version, the visitor version and the pyutmodel
+    version so that a change to any of them simply makes the old entries unreachable.
+
+    Each entry is a compressed pickle of a ModuleResult in its own file.  The cache is
+    bounded by its total size on disk;  The least recently used entries are evicted
+    first.
+    """
+    _grammarFingerprint: str = ''
+
+    def __init__(self, cacheDirectory: Path, maximumSize: int, backend: PythonBackend = PythonBackend.PEG):
+        """
+
+        Args:
+            cacheDirectory: Where to keep the entries;  Created if necessary
+            maximumSize:    The size limit in megabytes
+            backend:        The backend that produces the entries
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._cacheDirectory: Path          = cacheDirectory
+        self._maximumSize:    int           = maximumSize * ONE_MEGABYTE
+        self._backend:        PythonBackend = backend
+
+        self._cacheDirectory.mkdir(parents=True, exist_ok=True)
+
+        self._currentSize: int           = 0
+        self._entries:     CachedEntries = self._loadEntries()
+
+    @property
+    def currentSize(self) -> int:
+        """
+        Returns:  The size in bytes of all the entries on disk
+        """
+        return self._currentSize
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, cacheKey: CacheKey) -> bool:
+        return cacheKey in self._entries
+
+    def makeKey(self, fqFileName: str, context: str = PASS_1_CONTEXT) -> CacheKey:
+        """
+        Computed once per module per pass;  Use the same key to .get and to .put so
+        that a module changing in between does not get the wrong entry
+
+        Args:
+            fqFileName: The fully qualified module file name
+            context:    Whatever else the extracted result depends on
+
+        Returns:  The key for the module's entry
+        """
+        keyHash = sha256()
+
+        keyHash.update(CACHE_FORMAT_VERSION.encode())
+        keyHash.update(self._backend.value.encode())
+        keyHash.update(python_version().encode())
+        keyHash.update(VISITOR_VERSION.encode())
+        keyHash.update(pyutModelVersion.encode())
+        keyHash.update(ModuleResultCache._getGrammarFingerprint().encode())
+        keyHash.update(context.encode())
+        keyHash.update(Path(fqFileName).read_bytes())
+
+        return CacheKey(keyHash.hexdigest())
+
+    def get(self, cacheKey: CacheKey, fqFileName: str) -> ModuleResult:
+        """
+        The caller is responsible for calling .reassignIds on the returned result
+
+        Args:
+            cacheKey:   From .makeKey
+            fqFileName: The module that is being imported
+
+        Returns:  The module's cached result or NO_MODULE_RESULT
+        """
+        if cacheKey not in self._entries:
+            return NO_MODULE_RESULT
+
+        cacheFile: Path = self._toCacheFile(cacheKey=cacheKey)
+        try:
+            unpickler:    EntryUnpickler = EntryUnpickler(BytesIO(decompress(cacheFile.read_bytes())), fqFileName=fqFileName)
+            moduleResult: ModuleResult   = unpickler.load()
+            utime(cacheFile)
+        except (OSError, Exception) as e:
+            self.logger.warning(f'Discarding unreadable cache entry for {fqFileName}: {e}')
+            self._remove(cacheKey=cacheKey)
+            return NO_MODULE_RESULT
+
+        self._entries.move_to_end(cacheKey)
+        moduleResult.fqFileName = fqFileName
+
+        return moduleResult
+
+    def put(self, cacheKey: CacheKey, moduleResult: ModuleResult):
+        """
+        Results with errors are not cached;  The module has to be reported again
+
+        Args:
+            cacheKey:       From .makeKey
+            moduleResult:   What the visitors extracted
+        """
+        if moduleResult.moduleError is not NO_MODULE_ERROR:
+            return
+
+        entryFile: BytesIO = BytesIO()
+        EntryPickler(entryFile, protocol=HIGHEST_PROTOCOL).dump(moduleResult)
+
+        entry:     bytes = compress(entryFile.getvalue())
+        entrySize: int   = len(entry)
+        if entrySize > self._maximumSize:
+            self.logger.info(f'{moduleResult.fqFileName} is too large to cache')
+            return
+
+        self._remove(cacheKey=cacheKey)
+
+        cacheFile: Path = self._toCacheFile(cacheKey=cacheKey)
+        tempFile:  Path = cacheFile.with_suffix('.tmp')
+        try:
+            tempFile.write_bytes(entry)
+            tempFile.replace(cacheFile)
+        except OSError as e:
+            self.logger.warning(f'Unable to cache {moduleResult.fqFileName}: {e}')
+            return
+
+        self._entries[cacheKey] = entrySize
+        self._currentSize += entrySize
+
+        self._evict()
+
+    def clear(self):
+        for cacheKey in list(self._entries.keys()):
+            self._remove(cacheKey=cacheKey)
+
+    def _loadEntries(self) -> CachedEntries:
+        """
+        Returns:  The existing entries, least recently used first
+        """
+        sizes:  Dict[Path, int]   = {}
+        mtimes: Dict[Path, float] = {}
+        for cacheFile in self._cacheDirectory.glob(f'*{CACHE_FILE_SUFFIX}'):
+            try:
+                stat: stat_result = cacheFile.stat()
+            except OSError:
+                continue
+            sizes[cacheFile]  = stat.st_size
+            mtimes[cacheFile] = stat.st_mtime
+
+        entries: CachedEntries = CachedEntries(OrderedDict())
+        for cacheFile in sorted(sizes.keys(), key=lambda f: mtimes[f]):
+            entries[CacheKey(cacheFile.stem)] = sizes[cacheFile]
+            self._currentSize += sizes[cacheFile]
+
+        return entries
+
+    def _evict(self):
+
+        while self._currentSize > self._maximumSize and len(self._entries) > 0:
+            leastRecentlyUsed: CacheKey = next(iter(self._entries))
+            self._remove(cacheKey=leastRecentlyUsed)
+
+    def _remove(self, cacheKey: CacheKey):
+
+        entrySize: int | None = self._entries.pop(cacheKey, None)
+        if entrySize is None:
+            return
+
+        self._currentSize -= entrySize
+        self._toCacheFile(cacheKey=cacheKey).unlink(missing_ok=True)
+
+    def _toCacheFile(self, cacheKey: CacheKey) -> Path:
+        return self._cacheDirectory / f'{cacheKey}{CACHE_FILE_SUFFIX}'
+
+    @classmethod
+    def _getGrammarFingerprint(cls) -> str:
+        """
+        Computed once per process
+
+        Returns:  A digest of the generated lexer and parser
+        """
+        if cls._grammarFingerprint == '':
+            grammarHash = sha256()
+            grammarHash.update(bytes(str(lexerSerializedATN()), 'utf-8'))
+            grammarHash.update(bytes(str(parserSerializedATN()), 'utf-8'))
+
+            cls._grammarFingerprint = grammarHash.hexdigest()
+
+        return cls._grammarFingerprint
@@ -0,0 +1,509 @@
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Set
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from os import cpu_count
+from os import path as osPath
+
+from time import perf_counter
+
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+from multiprocessing import get_context
+from multiprocessing.context import BaseContext
+
+from pyutplugins.ioplugins.python.CancellationToken import CancellationToken
+from pyutplugins.ioplugins.python.ImportErrorReport import MODULE_EXCEPTIONS
+from pyutplugins.ioplugins.python.ImportErrorReport import ModuleError
+from pyutplugins.ioplugins.python.ImportErrorReport import ModuleErrors
+from pyutplugins.ioplugins.python.ImportErrorReport import NO_MODULE_ERROR
+from pyutplugins.ioplugins.python.ImportErrorReport import PASS_1_NAME
+from pyutplugins.ioplugins.python.ImportErrorReport import PASS_2_NAME
+from pyutplugins.ioplugins.python.ImportErrorReport import SKIM_NAME
+from pyutplugins.ioplugins.python.ImportErrorReport import makeModuleError
+from pyutplugins.ioplugins.python.ModuleResultCache import CacheKey
+from pyutplugins.ioplugins.python.ModuleResultCache import ModuleResultCache
+from pyutplugins.ioplugins.python.ModuleResultCache import NO_MODULE_RESULT
+from pyutplugins.ioplugins.python.ModuleResultCache import PASS_1_CONTEXT
+from pyutplugins.ioplugins.python.ModuleResultCache import SKIM_CONTEXT
+from pyutplugins.ioplugins.python.ModuleResultCache import pass2Context
+from pyutplugins.ioplugins.python.PythonAstParser import AstModule
+from pyutplugins.ioplugins.python.PythonAstParser import PythonAstParser
+from pyutplugins.ioplugins.python.PythonBackend import PythonBackend
+from pyutplugins.ioplugins.python.PythonModuleParser import PythonModuleParser
+from pyutplugins.ioplugins.python.PythonModuleSkimmer import PythonModuleSkimmer
+from pyutplugins.ioplugins.python.PythonParseException import PythonParseException
+from pyutplugins.ioplugins.python.SymbolTable import SymbolTable
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ModuleResult
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+from pyutplugins.ioplugins.python.visitor.ParserTypes import mergeAssociations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import mergeParents
+
+from pyutplugins.ioplugins.python.visitor.PyutAstClassVisitor import PyutAstClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutAstVisitor import PyutAstVisitor
+from pyutplugins.ioplugins.python.visitor.PyutBaseVisitor import PyutBaseVisitor
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegClassVisitor import PyutPythonPegClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PyutPythonPegVisitor
+
+from pyutplugins.ioplugins.python.pythonpegparser.PythonParser import PythonParser
+
+ModuleResults  = NewType('ModuleResults',  List[ModuleResult])
+ClassNames     = NewType('ClassNames',     List[PyutClassName])
+CacheKeys      = NewType('CacheKeys',      Dict[str, CacheKey])
+
+#
+# The workers are started fresh rather than forked;  Forking copies a process that has
+# started wx and has other threads running, e.g. the import thread and the parser warm up
+#
+WORKER_START_METHOD: str = 'spawn'
+
+#
+# Each worker process gets its own copy of the pass 1 classes once, at start up,
+# rather than having them pickled with every module it is handed
+#
+_pass2PyutClasses: PyutClasses = PyutClasses({})
+#
+# One parser session per worker process;  It is reused for every module the worker is handed
+#
+_workerModuleParser: PythonModuleParser = PythonModuleParser()
+
+
+def _initializePass2Worker(pyutClasses: PyutClasses):
+
+    global _pass2PyutClasses
+    _pass2PyutClasses = pyutClasses
+
+
+def _pass1Worker(fqFileName: str, backend: PythonBackend, streamingParse: bool) -> ModuleResult:
+    """
+    Runs in a worker process
+
+    Args:
+        fqFileName:     The module to scan for classes
+        backend:        How to parse the module
+        streamingParse: Visit the PEG parse tree while parsing
+
+    Returns:  The classes defined in the module and its imports
+    """
+    startTime:    float        = perf_counter()
+    moduleResult: ModuleResult = ModuleResult(fqFileName=fqFileName)
+    try:
+        if backend == PythonBackend.AST:
+            astModule:    AstModule           = PythonAstParser().parse(fqFileName=fqFileName)
+            classVisitor: PyutAstClassVisitor = PyutAstClassVisitor()
+
+            classVisitor.visitModule(astModule)
+            moduleResult.pyutClasses = classVisitor.pyutClasses
+            moduleResult.imports     = classVisitor.imports
+        else:
+            visitor: PyutPythonPegClassVisitor = PyutPythonPegClassVisitor()
+            if _visitPegModule(fqFileName=fqFileName, visitor=visitor, streamingParse=streamingParse) is True:
+                moduleResult.pyutClasses = visitor.pyutClasses
+                moduleResult.imports     = visitor.imports
+
+    except MODULE_EXCEPTIONS as e:
+        moduleResult.moduleError = makeModuleError(fqFileName=fqFileName, passName=PASS_1_NAME, e=e, elapsedTime=perf_counter() - startTime)
+
+    return moduleResult
+
+
+def _pass2Worker(fqFileName: str, moduleClassNames: ClassNames, moduleOverrides: PyutClasses, backend: PythonBackend, streamingParse: bool,
+                 compactSourceCode: bool) -> ModuleResult:
+    """
+    Runs in a worker process
+
+    Args:
+        fqFileName:         The module to reverse engineer
+        moduleClassNames:   The names of the classes that pass 1 found in this module
+        moduleOverrides:    The names that this module sees differently than the pass 1 classes;  See SymbolTable.moduleOverrides
+        backend:            How to parse the module
+        streamingParse:     Visit the PEG parse tree while parsing
+        compactSourceCode:  Refer to the method source code instead of copying it
+
+    Returns:  The enhanced module classes with the module's parents and associations
+    """
+    startTime:    float        = perf_counter()
+    moduleResult: ModuleResult = ModuleResult(fqFileName=fqFileName)
+    pyutClasses:  PyutClasses  = _pass2PyutClasses
+    if len(moduleOverrides) > 0:
+        pyutClasses = PyutClasses(_pass2PyutClasses | moduleOverrides)
+    try:
+        if backend == PythonBackend.AST:
+            astModule:  AstModule      = PythonAstParser().parse(fqFileName=fqFileName)
+            astVisitor: PyutAstVisitor = PyutAstVisitor()
+
+            astVisitor.pyutClasses       = pyutClasses
+            astVisitor.compactSourceCode = compactSourceCode
+            astVisitor.visitModule(astModule)
+
+            moduleResult.pyutClasses  = PyutClasses({className: pyutClasses[className] for className in moduleClassNames})
+            moduleResult.parents      = astVisitor.parents
+            moduleResult.associations = astVisitor.associations
+        else:
+            visitor: PyutPythonPegVisitor = PyutPythonPegVisitor()
+
+            visitor.pyutClasses       = pyutClasses
+            visitor.compactSourceCode = compactSourceCode
+            if _visitPegModule(fqFileName=fqFileName, visitor=visitor, streamingParse=streamingParse) is True:
+                moduleResult.pyutClasses  = PyutClasses({className: pyutClasses[className] for className in moduleClassNames})
+                moduleResult.parents      = visitor.parents
+                moduleResult.associations = visitor.associations
+
+    except MODULE_EXCEPTIONS as e:
+        moduleResult.moduleError = makeModuleError(fqFileName=fqFileName, passName=PASS_2_NAME, e=e, elapsedTime=perf_counter() - startTime)
+
+    return moduleResult
+
+
+def _skimWorker(fqFileName: str) -> ModuleResult:
+    """
+    Runs in a worker process
+
+    Args:
+        fqFileName:     The module to skim
+
+    Returns:  The classes and parents defined in the module
+    """
+    startTime: float = perf_counter()
+    try:
+        moduleResult: ModuleResult = PythonModuleSkimmer().skim(fqFileName=fqFileName)
+    except MODULE_EXCEPTIONS as e:
+        moduleError: ModuleError = makeModuleError(fqFileName=fqFileName, passName=SKIM_NAME, e=e, elapsedTime=perf_counter() - startTime)
+        moduleResult = ModuleResult(fqFileName=fqFileName, moduleError=moduleError)
+
+    return moduleResult
+
+
+def _visitPegModule(fqFileName: str, visitor: PyutBaseVisitor, streamingParse: bool) -> bool:
+    """
+    Returns:  False if the module has syntax errors
+    """
+    if streamingParse is True:
+        tree: PythonParser.File_inputContext = _workerModuleParser.stream(fqFileName=fqFileName, visitor=visitor)
+    else:
+        tree = _workerModuleParser.parse(fqFileName=fqFileName)
+        if tree is not None:
+            visitor.visit(tree)
+
+    return tree is not None
+
+
+class ParallelReverseEngineer:
+    """
+    Runs the two reverse engineering passes with a process pool.  The ANTLR Python
+    runtime is pure Python;  So a single process only ever uses one core.
+
+    Workers return picklable ModuleResults.  These are merged in the parent process
+    in the order that the modules were given so that the results do not
+    depend on which worker finishes first.  The largest modules are submitted first
+    so that a large module started last does not leave the other workers idle.
+
+    When given a ModuleResultCache, only the modules that miss the cache are
+    handed to the workers.
+
+    The classes are kept in a SymbolTable;  The few names that a module sees differently
+    than the rest, e.g. its own classes with the same names as another module's classes,
+    are handed to its worker with the module.  So pass 2 enhances the module's own classes
+
+    This has no wx dependencies; The modules that fail are collected in .moduleErrors.  Unless
+    told to skip them, the first one cancels the modules not yet started and raises PythonParseException.
+    Pass 2 skips the modules that failed pass 1;  They would only fail again
+
+    The cancellation token is checked as each module finishes;  Once cancelled, the modules
+    not yet started are dropped and ImportCancelledException is raised
+    """
+    def __init__(self, maxWorkers: int = 0, moduleResultCache: ModuleResultCache | None = None, backend: PythonBackend = PythonBackend.PEG,
+                 streamingParse: bool = False, compactSourceCode: bool = False, symbolTable: SymbolTable | None = None, skipOnError: bool = True):
+        """
+
+        Args:
+            maxWorkers:         The number of worker processes;  0 means use every core
+            moduleResultCache:  Optional cache of previously reverse engineered modules
+            backend:            How the workers parse the modules
+            streamingParse:     The workers visit the PEG parse trees while parsing
+            compactSourceCode:  The workers refer to the method source code instead of copying it
+            symbolTable:        Where pass 1 and skim put the modules;  Defaults to a new one
+            skipOnError:        Keep going when a module fails
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        if maxWorkers == 0:
+            self._maxWorkers: int = cpu_count() or 1
+        else:
+            self._maxWorkers = maxWorkers
+
+        self._parents:      Parents       = Parents({})
+        self._associations: Associations  = Associations({})
+        self._moduleErrors: ModuleErrors  = ModuleErrors([])
+        self._pass2Results: ModuleResults = ModuleResults([])
+        self._pass1Failed:  Set[str]      = set()
+        self._symbolTable:  SymbolTable   = SymbolTable() if symbolTable is None else symbolTable
+
+        self._moduleResultCache: ModuleResultCache | None = moduleResultCache
+        self._backend:           PythonBackend            = backend
+        self._streamingParse:    bool                     = streamingParse
+        self._compactSourceCode: bool                     = compactSourceCode
+        self._skipOnError:       bool                     = skipOnError
+        self._cancellationToken: CancellationToken        = CancellationToken()
+        self._workerContext:     BaseContext              = get_context(WORKER_START_METHOD)
+
+    @property
+    def parents(self) -> Parents:
+        return self._parents
+
+    @parents.setter
+    def parents(self, newValue: Parents):
+        self._parents = newValue
+
+    @property
+    def associations(self) -> Associations:
+        return self._associations
+
+    @associations.setter
+    def associations(self, newValue: Associations):
+        self._associations = newValue
+
+    @property
+    def cancellationToken(self) -> CancellationToken:
+        return self._cancellationToken
+
+    @cancellationToken.setter
+    def cancellationToken(self, newValue: CancellationToken):
+        self._cancellationToken = newValue
+
+    @property
+    def workerContext(self) -> BaseContext:
+        """
+        Returns:  How the worker processes are started;  See WORKER_START_METHOD
+        """
+        return self._workerContext
+
+    @property
+    def moduleErrors(self) -> ModuleErrors:
+        """
+        Returns:  The modules that failed during the last pass
+        """
+        return self._moduleErrors
+
+    @property
+    def symbolTable(self) -> SymbolTable:
+        return self._symbolTable
+
+    @property
+    def pass2Results(self) -> ModuleResults:
+        """
+        Returns:  The results of the modules that were successfully reverse engineered during the last pass 2 or skim
+        """
+        return self._pass2Results
+
+    def doPass1(self, fqFileNames: List[str], progressCallback: Callable) -> PyutClasses:
+        """
+
+        Args:
+            fqFileNames:        The fully qualified names of the modules to scan
+            progressCallback:   The method to call to report progress
+
+        Returns:  The classes found so far by their bare names;  See SymbolTable.bareClasses
+        """
+        self._moduleErrors = ModuleErrors([])
+
+        cacheKeys, cachedResults = self._lookupCachedResults(fqFileNames=fqFileNames, context=PASS_1_CONTEXT)
+        with ProcessPoolExecutor(max_workers=self._maxWorkers, mp_context=self._workerContext) as executor:
+            futures: Dict[str, Future] = {}
+            for fqFileName in self._largestFirst(fqFileNames=fqFileNames):
+                if fqFileName not in cachedResults:
+                    futures[fqFileName] = executor.submit(_pass1Worker, fqFileName, self._backend, self._streamingParse)
+
+            moduleResults: ModuleResults = self._waitForResults(fqFileNames=fqFileNames, futures=futures, cachedResults=cachedResults,
+                                                                cacheKeys=cacheKeys, passName=PASS_1_NAME, progressCallback=progressCallback)
+
+        for moduleResult in moduleResults:
+            if self._isGoodResult(moduleResult=moduleResult) is True:
+                moduleResult.reassignIds()
+                self._symbolTable.addModule(fqFileName=moduleResult.fqFileName, pyutClasses=moduleResult.pyutClasses, imports=moduleResult.imports)
+                self._pass1Failed.discard(moduleResult.fqFileName)
+            else:
+                self._pass1Failed.add(moduleResult.fqFileName)
+
+        return self._symbolTable.bareClasses
+
+    def doPass2(self, fqFileNames: List[str], pyutClasses: PyutClasses, progressCallback: Callable) -> PyutClasses:
+        """
+
+        Args:
+            fqFileNames:        The fully qualified names of the modules to reverse engineer
+            pyutClasses:        The full list of classes scanned during pass 1 by their bare names
+            progressCallback:   The method to call to report progress
+
+        Returns:  The symbol table's classes updated with the methods, parameters, and fields found in pass 2
+        """
+        self._moduleErrors = ModuleErrors([])
+        self._pass2Results = ModuleResults([])
+
+        moduleCount: int = len(fqFileNames)
+        fqFileNames      = [fqFileName for fqFileName in fqFileNames if fqFileName not in self._pass1Failed]
+
+        cacheKeys, cachedResults = self._lookupCachedResults(fqFileNames=fqFileNames, context=pass2Context(pyutClasses.keys(), compactSourceCode=self._compactSourceCode))
+        with ProcessPoolExecutor(max_workers=self._maxWorkers, mp_context=self._workerContext, initializer=_initializePass2Worker, initargs=(pyutClasses,)) as executor:
+
+            futures: Dict[str, Future] = {}
+            for fqFileName in self._largestFirst(fqFileNames=fqFileNames):
+                if fqFileName not in cachedResults:
+                    moduleClassNames: ClassNames  = ClassNames(self._symbolTable.moduleClassNames(fqFileName=fqFileName))
+                    moduleOverrides:  PyutClasses = self._symbolTable.moduleOverrides(fqFileName=fqFileName, pyutClasses=pyutClasses)
+                    futures[fqFileName] = executor.submit(_pass2Worker, fqFileName, moduleClassNames, moduleOverrides, self._backend,
+                                                          self._streamingParse, self._compactSourceCode)
+
+            moduleResults: ModuleResults = self._waitForResults(fqFileNames=fqFileNames, futures=futures, cachedResults=cachedResults,
+                                                                cacheKeys=cacheKeys, passName=PASS_2_NAME, progressCallback=progressCallback,
+                                                                skippedCount=moduleCount - len(fqFileNames))
+
+        for moduleResult in moduleResults:
+            if self._isGoodResult(moduleResult=moduleResult) is True:
+                moduleResult.reassignIds()
+                self._symbolTable.updateClasses(fqFileName=moduleResult.fqFileName, pyutClasses=moduleResult.pyutClasses)
+                mergeParents(parents=self._parents, moreParents=moduleResult.parents)
+                mergeAssociations(associations=self._associations, moreAssociations=moduleResult.associations)
+                self._pass2Results.append(moduleResult)
+
+        return self._symbolTable.bareClasses
+
+    def doSkim(self, fqFileNames: List[str], progressCallback: Callable) -> PyutClasses:
+        """
+        Both passes at once for a header only import;  See PythonModuleSkimmer
+
+        Args:
+            fqFileNames:        The fully qualified names of the modules to skim
+            progressCallback:   The method to call to report progress
+
+        Returns:  The classes found so far by their bare names;  See SymbolTable.bareClasses
+        """
+        self._moduleErrors = ModuleErrors([])
+        self._pass2Results = ModuleResults([])
+
+        cacheKeys, cachedResults = self._lookupCachedResults(fqFileNames=fqFileNames, context=SKIM_CONTEXT)
+        with ProcessPoolExecutor(max_workers=self._maxWorkers, mp_context=self._workerContext) as executor:
+            futures: Dict[str, Future] = {}
+            for fqFileName in self._largestFirst(fqFileNames=fqFileNames):
+                if fqFileName not in cachedResults:
+                    futures[fqFileName] = executor.submit(_skimWorker, fqFileName)
+
+            moduleResults: ModuleResults = self._waitForResults(fqFileNames=fqFileNames, futures=futures, cachedResults=cachedResults,
+                                                                cacheKeys=cacheKeys, passName=SKIM_NAME, progressCallback=progressCallback)
+
+        for moduleResult in moduleResults:
+            if self._isGoodResult(moduleResult=moduleResult) is True:
+                moduleResult.reassignIds()
+                self._symbolTable.addModule(fqFileName=moduleResult.fqFileName, pyutClasses=moduleResult.pyutClasses, imports=moduleResult.imports)
+                mergeParents(parents=self._parents, moreParents=moduleResult.parents)
+                self._pass2Results.append(moduleResult)
+
+        return self._symbolTable.bareClasses
+
+    def _largestFirst(self, fqFileNames: List[str]) -> List[str]:
+        """
+        Returns:  The modules in the order to hand them to the workers
+        """
+        def moduleSize(fqFileName: str) -> int:
+            try:
+                return osPath.getsize(fqFileName)
+            except OSError:
+                return 0        # The worker reports it
+
+        return sorted(fqFileNames, key=moduleSize, reverse=True)
+
+    def _lookupCachedResults(self, fqFileNames: List[str], context: str) -> Tuple[CacheKeys, Dict[str, ModuleResult]]:
+        """
+
+        Args:
+            fqFileNames:    The modules to look up
+            context:        The pass's cache context
+
+        Returns:  The cache keys for all the modules and the results of the ones that hit the cache
+        """
+        cacheKeys:     CacheKeys               = CacheKeys({})
+        cachedResults: Dict[str, ModuleResult] = {}
+        if self._moduleResultCache is None:
+            return cacheKeys, cachedResults
+
+        for fqFileName in fqFileNames:
+            cacheKey:     CacheKey     = self._moduleResultCache.makeKey(fqFileName=fqFileName, context=context)
+            moduleResult: ModuleResult = self._moduleResultCache.get(cacheKey=cacheKey, fqFileName=fqFileName)
+
+            cacheKeys[fqFileName] = cacheKey
+            if moduleResult is not NO_MODULE_RESULT:
+                cachedResults[fqFileName] = moduleResult
+
+        return cacheKeys, cachedResults
+
+    def _waitForResults(self, fqFileNames: List[str], futures: Dict[str, Future], cachedResults: Dict[str, ModuleResult],
+                        cacheKeys: CacheKeys, passName: str, progressCallback: Callable, skippedCount: int = 0) -> ModuleResults:
+        """
+        Reports progress as the workers finish and then returns the results in the given order.
+        New results are added to the cache.  Cancelling, or a failed module when not skipping
+        them, drops the modules that have not started
+
+        Args:
+            fqFileNames:        All the modules in the order to merge them
+            futures:            The submitted work
+            cachedResults:      The modules that did not need to be submitted
+            cacheKeys:          The cache keys for all the modules, if there is a cache
+            passName:           For the progress message
+            progressCallback:   The method to call to report progress
+            skippedCount:       The modules of the pass that are not in fqFileNames;  They count as done
+
+        Returns:  The module results in the given order
+        """
+        completedCount: int = skippedCount + len(cachedResults)
+        if len(cachedResults) > 0:
+            progressCallback(completedCount, f'{passName} found {len(cachedResults)} unchanged modules')
+
+        for future in as_completed(futures.values()):
+            if self._cancellationToken.cancelled is True:
+                for pendingFuture in futures.values():
+                    pendingFuture.cancel()
+                self._cancellationToken.raiseIfCancelled()
+
+            completedCount += 1
+            moduleResult: ModuleResult = future.result()
+            progressCallback(completedCount, f'{passName} processed:\n {moduleResult.fqFileName}')
+
+            if moduleResult.moduleError is not NO_MODULE_ERROR and self._skipOnError is False:
+                for pendingFuture in futures.values():
+                    pendingFuture.cancel()
+                raise PythonParseException(f'{moduleResult.moduleError}')
+
+            if self._moduleResultCache is not None:
+                self._moduleResultCache.put(cacheKey=cacheKeys[moduleResult.fqFileName], moduleResult=moduleResult)
+
+        moduleResults: ModuleResults = ModuleResults([])
+        for fqFileName in fqFileNames:
+            if fqFileName in cachedResults:
+                moduleResults.append(cachedResults[fqFileName])
+            else:
+                moduleResults.append(futures[fqFileName].result())
+
+        return moduleResults
+
+    def _isGoodResult(self, moduleResult: ModuleResult) -> bool:
+
+        if moduleResult.moduleError is NO_MODULE_ERROR:
+            return True
+
+        self.logger.error(f'{moduleResult.moduleError.passName}: {moduleResult.moduleError}')
+        self._moduleErrors.append(moduleResult.moduleError)
+
+        return False
@@ -0,0 +1,110 @@
+
+from typing import Dict
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from pyutplugins.ioplugins.python.pythonpegparser.PythonParser import PythonParser
+
+#
+# Measured with tracemalloc against this project's modules and some large standard library
+# modules (argparse, typing, inspect, enum, ...);  A PEG parse tree (rule contexts plus tokens)
+# costs from 160 to 217 bytes for every byte of source, 194 on average.  The largest is used
+#
+PARSE_TREE_BYTES_PER_SOURCE_BYTE: int = 220
+
+ONE_MEGABYTE: int = 1024 * 1024
+
+NO_PARSE_TREE: PythonParser.File_inputContext = cast(PythonParser.File_inputContext, None)
+
+
+@dataclass
+class CachedParseTree:
+    tree:          PythonParser.File_inputContext = NO_PARSE_TREE
+    estimatedSize: int                            = 0
+
+
+CachedParseTrees = NewType('CachedParseTrees', Dict[str, CachedParseTree])
+
+
+class ParseTreeCache:
+    """
+    Keeps the parse trees built during the first reverse engineering pass, so
+    that the second pass does not have to lex and parse each module again.
+
+    Parse trees are large;  So the cache is bounded by an estimated memory size.
+    Modules whose trees do not fit are simply not retained and the second pass
+    re-parses them.
+    """
+    def __init__(self, maximumSize: int):
+        """
+
+        Args:
+            maximumSize:  The estimated memory limit in megabytes
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._maximumSize: int              = maximumSize * ONE_MEGABYTE
+        self._currentSize: int              = 0
+        self._parseTrees:  CachedParseTrees = CachedParseTrees({})
+
+    @property
+    def currentSize(self) -> int:
+        """
+        Returns:  The estimated memory size in bytes of the retained parse trees
+        """
+        return self._currentSize
+
+    def __len__(self) -> int:
+        return len(self._parseTrees)
+
+    def __contains__(self, fqFileName: str) -> bool:
+        return fqFileName in self._parseTrees
+
+    def add(self, fqFileName: str, tree: PythonParser.File_inputContext, sourceSize: int) -> bool:
+        """
+        Retain a module's parse tree if it fits
+
+        Args:
+            fqFileName: The fully qualified module file name
+            tree:       Its parse tree
+            sourceSize: The size of the module source in bytes
+
+        Returns:  'True' if the tree was retained, else 'False'
+        """
+        estimatedSize: int = sourceSize * PARSE_TREE_BYTES_PER_SOURCE_BYTE
+        if self._currentSize + estimatedSize > self._maximumSize:
+            self.logger.info(f'Parse tree cache full;  {fqFileName} will be re-parsed')
+            return False
+
+        self.remove(fqFileName=fqFileName)
+        self._parseTrees[fqFileName] = CachedParseTree(tree=tree, estimatedSize=estimatedSize)
+        self._currentSize += estimatedSize
+
+        return True
+
+    def remove(self, fqFileName: str) -> PythonParser.File_inputContext:
+        """
+        Releases the module's parse tree;  The second pass removes each tree as it
+        consumes it so that memory is released as the pass progresses
+
+        Args:
+            fqFileName: The fully qualified module file name
+
+        Returns:  The retained parse tree or NO_PARSE_TREE if it was not retained
+        """
+        cachedParseTree: CachedParseTree | None = self._parseTrees.pop(fqFileName, None)
+        if cachedParseTree is None:
+            return NO_PARSE_TREE
+
+        self._currentSize -= cachedParseTree.estimatedSize
+
+        return cachedParseTree.tree
+
+    def clear(self):
+        self._parseTrees  = CachedParseTrees({})
+        self._currentSize = 0
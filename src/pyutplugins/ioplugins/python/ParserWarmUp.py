@@ -0,0 +1,100 @@
+
+from logging import Logger
+from logging import getLogger
+
+from threading import Thread
+
+from time import perf_counter
+
+from pyutplugins.ioplugins.python.PythonModuleParser import PythonModuleParser
+
+WARM_UP_THREAD_NAME: str = 'Python Parser Warm Up'
+WARM_UP_MODULE_NAME: str = 'WarmUpSample'
+
+#
+# Exercises the rules that reverse engineering sees the most
+#
+WARM_UP_SAMPLE: str = (
+    'from typing import List\n'
+    '\n'
+    'from dataclasses import dataclass\n'
+    'from dataclasses import field\n'
+    '\n'
+    'from enum import Enum\n'
+    '\n'
+    '\n'
+    'class Color(Enum):\n'
+    '    RED  = "Red"\n'
+    '    BLUE = "Blue"\n'
+    '\n'
+    '\n'
+    '@dataclass\n'
+    'class Point:\n'
+    '    x: int = 0\n'
+    '    y: int = 0\n'
+    '\n'
+    '\n'
+    'class Shape:\n'
+    '    """\n'
+    '    A sample\n'
+    '    """\n'
+    '    def __init__(self, name: str, points: List[Point] = None):\n'
+    '        self._name:   str         = name\n'
+    '        self._points: List[Point] = [] if points is None else points\n'
+    '        self._color:  Color       = Color.RED\n'
+    '\n'
+    '    @property\n'
+    '    def name(self) -> str:\n'
+    '        return self._name\n'
+    '\n'
+    '    @name.setter\n'
+    '    def name(self, newValue: str):\n'
+    '        self._name = newValue\n'
+    '\n'
+    '    def area(self, scale: float = 1.0, *args, **kwargs) -> float:\n'
+    '        total: float = 0.0\n'
+    '        for point in self._points:\n'
+    '            if point.x > 0 and point.y > 0:\n'
+    '                total += point.x * point.y * scale\n'
+    '        return total\n'
+    '\n'
+    '    def __str__(self) -> str:\n'
+    '        return f"{self._name} {len(self._points)}"\n'
+    '\n'
+    '\n'
+    'class Circle(Shape):\n'
+    '    def __init__(self):\n'
+    '        super().__init__(name="Circle")\n'
+    '        self.radius: float = 1.0\n'
+)
+
+
+class ParserWarmUp:
+    """
+    Importing the generated lexer and parser deserializes their ATN;  Their DFA keeps
+    growing as the parser sees new input.  Parsing a small sample ahead of time means the
+    first real import does not pay for all of that.
+
+    IOPython starts it while the user picks the packages to import
+    """
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+    def start(self) -> Thread:
+        """
+        Returns:  The daemon thread that parses the sample
+        """
+        thread: Thread = Thread(target=self.warmUp, name=WARM_UP_THREAD_NAME, daemon=True)
+        thread.start()
+
+        return thread
+
+    def warmUp(self):
+
+        startTime: float = perf_counter()
+        try:
+            PythonModuleParser().parseSource(source=WARM_UP_SAMPLE, moduleName=WARM_UP_MODULE_NAME)
+        except (ValueError, Exception) as e:
+            self.logger.warning(f'Python parser warm up failed: {e}')
+
+        self.logger.info(f'Python parser warm up: {perf_counter() - startTime:.3f} seconds')
@@ -0,0 +1,400 @@
+
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from ast import AsyncFor
+from ast import AsyncFunctionDef
+from ast import AsyncWith
+from ast import Call
+from ast import ClassDef
+from ast import For
+from ast import FunctionDef
+from ast import If
+from ast import Match
+from ast import Module
+from ast import Try
+from ast import While
+from ast import With
+from ast import expr
+from ast import stmt
+from ast import parse as astParse
+
+from bisect import bisect_left
+from bisect import bisect_right
+
+from io import StringIO
+
+from re import finditer as regExFindIter
+
+from tokenize import COMMENT
+from tokenize import DEDENT
+from tokenize import ENDMARKER
+from tokenize import INDENT
+from tokenize import NEWLINE
+from tokenize import NL
+from tokenize import OP
+from tokenize import TokenError
+from tokenize import detect_encoding
+from tokenize import generate_tokens
+
+from pyutplugins.ioplugins.python.PythonParseException import PythonParseException
+
+Statements = List[stmt]
+
+NO_ARGUMENTS_TEXT: str = cast(str, None)
+
+#
+# Tokens that the PEG lexer either hides or that never appear in a getText() result
+#
+INSIGNIFICANT_TOKEN_TYPES: List[int] = [COMMENT, NL, NEWLINE, INDENT, DEDENT, ENDMARKER]
+
+CLOSING_BRACKETS: List[str] = [')', ']', '}']
+
+
+
+def readModuleSource(fqFileName: str) -> str:
+    """
+    Decodes a module the way Python does;  A BOM or a coding cookie selects the encoding,
+    utf-8 otherwise.  Unlike tokenize.open() the line endings are left alone so that source
+    offsets match the PEG parser's
+
+    Args:
+        fqFileName:  The module
+
+    Returns:  The module source
+
+    Raises SyntaxError if the coding cookie is not valid
+    """
+    with open(fqFileName, 'rb') as moduleFile:
+        encoding, _ = detect_encoding(moduleFile.readline)
+        moduleFile.seek(0)
+
+        return moduleFile.read().decode(encoding)
+
+
+try:
+    from ast import TryStar
+    TRY_STATEMENTS: tuple = (Try, TryStar)
+except ImportError:
+    TRY_STATEMENTS = (Try, )
+
+
+class AstModule:
+    """
+    A parsed module plus what is needed to reproduce the text that the PEG visitors
+    extract.  The PEG visitors use getText() which concatenates tokens without
+    any white space or comments;  The method source code is the raw text from the
+    first token of a statement to its last token, where the PEG lexer's last NEWLINE
+    and DEDENT tokens stretch up to the next statement.
+
+    Source positions are character offsets into the module text.  The module is only
+    tokenized the first time some text is asked for
+    """
+    def __init__(self, fqFileName: str, source: str, tree: Module):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._fqFileName: str    = fqFileName
+        self._source:     str    = source
+        self._tree:       Module = tree
+
+        self._lineOffsets: List[int] = [0] + [match.end() for match in regExFindIter('\r\n|\r|\n', source)]
+
+        self._tokenized:    bool      = False
+        self._tokenTypes:   List[int] = []
+        self._tokenStrings: List[str] = []
+        self._tokenStarts:  List[int] = []
+        self._tokenLines:   List[int] = []
+
+    @property
+    def fqFileName(self) -> str:
+        return self._fqFileName
+
+    @property
+    def tree(self) -> Module:
+        return self._tree
+
+    def getText(self, node: expr) -> str:
+        """
+        Same as the PEG parser's getText() for the rule context that matches the node;  Grouping
+        parentheses are part of the PEG context but not of the ast node
+
+        Args:
+            node:   An expression node
+
+        Returns:  The node's tokens without white space or comments
+        """
+        self._tokenize()
+
+        startIdx: int = bisect_left(self._tokenStarts, self._toOffset(node.lineno, node.col_offset))
+        endIdx:   int = bisect_left(self._tokenStarts, self._toOffset(cast(int, node.end_lineno), cast(int, node.end_col_offset)))
+
+        while startIdx > 1 and endIdx < len(self._tokenStrings) and self._tokenStrings[startIdx - 1] == '(' and self._tokenStrings[endIdx] == ')':
+            if self._tokenTypes[startIdx - 2] != OP or self._tokenStrings[startIdx - 2] in CLOSING_BRACKETS:
+                break       # A call or a subscript
+            startIdx -= 1
+            endIdx   += 1
+
+        return ''.join(self._tokenStrings[startIdx:endIdx])
+
+    def getClassArgumentsText(self, classDef: ClassDef) -> str:
+        """
+        Args:
+            classDef:
+
+        Returns:  The text between the class's parentheses less any trailing comma or
+        NO_ARGUMENTS_TEXT if there are none
+        """
+        self._tokenize()
+
+        idx: int = bisect_left(self._tokenStarts, self._toOffset(classDef.lineno, classDef.col_offset)) + 2   # skip 'class' NAME
+        if idx < len(self._tokenStrings) and self._tokenStrings[idx] == '[':
+            idx = self._findClosingBracket(openIdx=idx) + 1     # type parameters
+
+        if idx >= len(self._tokenStrings) or self._tokenStrings[idx] != '(':
+            return NO_ARGUMENTS_TEXT
+
+        closeIdx: int       = self._findClosingBracket(openIdx=idx)
+        argTokens: List[str] = self._tokenStrings[idx + 1:closeIdx]
+        if len(argTokens) > 0 and argTokens[-1] == ',':
+            argTokens = argTokens[:-1]
+        if len(argTokens) == 0:
+            return NO_ARGUMENTS_TEXT
+
+        return ''.join(argTokens)
+
+    def getCallArgumentsText(self, call: Call) -> str:
+        """
+        Args:
+            call:
+
+        Returns:  The text between the call's parentheses including any trailing comma or
+        NO_ARGUMENTS_TEXT if there are none
+        """
+        self._tokenize()
+
+        openIdx:  int = bisect_left(self._tokenStarts, self._toOffset(cast(int, call.func.end_lineno), cast(int, call.func.end_col_offset)))
+        closeIdx: int = bisect_left(self._tokenStarts, self._toOffset(cast(int, call.end_lineno), cast(int, call.end_col_offset))) - 1
+
+        while openIdx < closeIdx and self._tokenStrings[openIdx] != '(':
+            openIdx += 1
+        if closeIdx - openIdx <= 1:
+            return NO_ARGUMENTS_TEXT
+
+        return ''.join(self._tokenStrings[openIdx + 1:closeIdx])
+
+    def getStatementText(self, statements: Statements) -> str:
+        """
+        The PEG parser's raw text for a statement;  Simple statements on the same line
+        are a single PEG statement
+
+        Args:
+            statements: The ast statements that make up one PEG statement
+
+        Returns:  The raw source text
+        """
+        startOffset, endOffset = self.getStatementInterval(statements=statements)
+
+        return self._source[startOffset:endOffset]
+
+    def getStatementInterval(self, statements: Statements) -> Tuple[int, int]:
+        """
+        Args:
+            statements: The ast statements that make up one PEG statement
+
+        Returns:  The offsets of the statement's first character and of the character after its last
+        """
+        self._tokenize()
+
+        lastStatement: stmt = statements[-1]
+        endLine:       int  = cast(int, lastStatement.end_lineno)
+
+        nextIdx: int = bisect_right(self._tokenLines, endLine)
+        if nextIdx >= len(self._tokenStarts):
+            endOffset: int = len(self._source)
+        elif self._endsWithIndentedBlock(statement=lastStatement) is True:
+            endOffset = self._tokenStarts[nextIdx]                              # DEDENT
+        else:
+            endOffset = self._lineOffsets[self._tokenLines[nextIdx] - 1]        # NEWLINE
+
+        return self.getStatementStart(statement=statements[0]), endOffset
+
+    def getStatementStart(self, statement: stmt) -> int:
+        """
+        Args:
+            statement:
+
+        Returns:  The offset of the statement's first token;  That is the first decorator's '@'
+        """
+        decorators: List[expr] = getattr(statement, 'decorator_list', [])
+        if len(decorators) == 0:
+            return self._toOffset(statement.lineno, statement.col_offset)
+
+        self._tokenize()
+        decoratorIdx: int = bisect_left(self._tokenStarts, self._toOffset(decorators[0].lineno, decorators[0].col_offset)) - 1
+        while decoratorIdx > 0 and self._tokenStrings[decoratorIdx] != '@':
+            decoratorIdx -= 1
+
+        return self._tokenStarts[decoratorIdx]
+
+    def isIndentedBlock(self, block: Statements) -> bool:
+        """
+        Args:
+            block:  A compound statement's block
+
+        Returns:  'True' if the block starts on its own line, 'False' if it follows the ':'
+        """
+        return self.getIndentation(statement=block[0]).strip() == ''
+
+    def getIndentation(self, statement: stmt) -> str:
+        """
+        Args:
+            statement:
+
+        Returns:  The text on the statement's first line that comes before the statement
+        """
+        startOffset: int = self.getStatementStart(statement=statement)
+        lineStart:   int = self._lineOffsets[bisect_right(self._lineOffsets, startOffset) - 1]
+
+        return self._source[lineStart:startOffset]
+
+    def isElif(self, ifStatement: stmt) -> bool:
+        """
+        The ast represents 'elif' as an 'if' that is the only statement of the else block
+
+        Args:
+            ifStatement:  The sole statement of an if statement's else block
+
+        Returns:  'True' if it is really an 'elif'
+        """
+        if isinstance(ifStatement, If) is False:
+            return False
+
+        startOffset: int = self._toOffset(ifStatement.lineno, ifStatement.col_offset)
+
+        return self._source.startswith('elif', startOffset)
+
+    def _endsWithIndentedBlock(self, statement: stmt) -> bool:
+        """
+        Statements that end with an indented block end with a DEDENT token;  All others end with a
+        NEWLINE token
+
+        Args:
+            statement:
+
+        Returns:  'True' if the statement's last block is an indented one
+        """
+        lastBlock: Statements = self._lastBlock(statement=statement)
+        if len(lastBlock) == 0:
+            return False
+
+        return self.isIndentedBlock(block=lastBlock)
+
+    def _lastBlock(self, statement: stmt) -> Statements:
+
+        lastBlock: Statements = []
+        if isinstance(statement, (FunctionDef, AsyncFunctionDef, ClassDef, With, AsyncWith)):
+            lastBlock = statement.body
+        elif isinstance(statement, If):
+            if len(statement.orelse) == 0:
+                lastBlock = statement.body
+            elif self.isElif(ifStatement=statement.orelse[0]) is True:
+                lastBlock = self._lastBlock(statement=statement.orelse[0])
+            else:
+                lastBlock = statement.orelse
+        elif isinstance(statement, (For, AsyncFor, While)):
+            lastBlock = statement.orelse if len(statement.orelse) > 0 else statement.body
+        elif isinstance(statement, TRY_STATEMENTS):
+            if len(statement.finalbody) > 0:
+                lastBlock = statement.finalbody
+            elif len(statement.orelse) > 0:
+                lastBlock = statement.orelse
+            elif len(statement.handlers) > 0:
+                lastBlock = statement.handlers[-1].body
+            else:
+                lastBlock = statement.body
+        elif isinstance(statement, Match):
+            lastBlock = statement.cases[-1].body
+
+        return lastBlock
+
+    def _findClosingBracket(self, openIdx: int) -> int:
+
+        depth: int = 0
+        idx:   int = openIdx
+        while idx < len(self._tokenStrings):
+            tokenString: str = self._tokenStrings[idx]
+            if tokenString in ('(', '[', '{'):
+                depth += 1
+            elif tokenString in CLOSING_BRACKETS:
+                depth -= 1
+                if depth == 0:
+                    break
+            idx += 1
+
+        return idx
+
+    def _toOffset(self, lineNumber: int, byteColumn: int) -> int:
+        """
+        ast columns are UTF-8 byte offsets
+
+        Args:
+            lineNumber: 1 based
+            byteColumn: UTF-8 byte offset into the line
+
+        Returns:  The character offset into the module source
+        """
+        lineOffset: int = self._lineOffsets[lineNumber - 1]
+        line:       str = self._source[lineOffset:lineOffset + byteColumn]
+        if line.isascii() is False:
+            byteColumn = len(line.encode('utf-8')[:byteColumn].decode('utf-8', errors='ignore'))
+
+        return lineOffset + byteColumn
+
+    def _tokenize(self):
+
+        if self._tokenized is True:
+            return
+        self._tokenized = True
+
+        try:
+            for token in generate_tokens(StringIO(self._source).readline):
+                if token.type in INSIGNIFICANT_TOKEN_TYPES:
+                    continue
+                self._tokenTypes.append(token.type)
+                self._tokenStrings.append(token.string)
+                self._tokenStarts.append(self._lineOffsets[token.start[0] - 1] + token.start[1])
+                self._tokenLines.append(token.start[0])
+        except TokenError as e:
+            self.logger.warning(f'{self._fqFileName}: {e}')
+
+
+class PythonAstParser:
+    """
+    Parses a module with Python's built in parser.  This is the ast backend's
+    equivalent of the PythonModuleParser
+    """
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+    def parse(self, fqFileName: str) -> AstModule:
+        """
+        Args:
+            fqFileName:
+
+        Returns:  The module's ast and source
+
+        Raises PythonParseException if there are syntax errors in the module
+        """
+        try:
+            source: str    = readModuleSource(fqFileName=fqFileName)
+            tree:   Module = astParse(source, filename=fqFileName)
+        except SyntaxError as e:
+            self.logger.error(f'File {fqFileName} contains syntax errors')
+            raise PythonParseException(e.msg, line=e.lineno or 0, column=e.offset or 0)
+
+        return AstModule(fqFileName=fqFileName, source=source, tree=tree)
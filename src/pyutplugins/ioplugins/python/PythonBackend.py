@@ -0,0 +1,27 @@
+
+from enum import Enum
+
+
+class PythonBackend(Enum):
+    """
+    How IOPython turns Python modules into Pyut classes.  The PEG backend is the
+    reference implementation;  The ast backend uses Python's built in
+    parser and is much faster
+    """
+    PEG = 'Antlr PEG Parser'
+    AST = 'Python ast'
+
+    @classmethod
+    def toEnum(cls, enumStr: str) -> 'PythonBackend':
+
+        assert (enumStr is not None) and (enumStr != ''), 'I need a real string dude'
+        match enumStr:
+            case PythonBackend.PEG.value:
+                retEnum: PythonBackend = PythonBackend.PEG
+            case PythonBackend.AST.value:
+                retEnum = PythonBackend.AST
+            case _:
+                print(f'Unknown enumeration string {enumStr}')
+                retEnum = PythonBackend.PEG
+
+        return retEnum
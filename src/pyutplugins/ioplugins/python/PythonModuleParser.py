@@ -0,0 +1,300 @@
+
+from typing import Dict
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from enum import Enum
+
+from os import register_at_fork
+
+from threading import Lock
+
+from antlr4 import CommonTokenStream
+from antlr4 import FileStream
+from antlr4 import InputStream
+from antlr4 import ParserRuleContext
+from antlr4 import PredictionContextCache
+
+from antlr4.atn.PredictionMode import PredictionMode
+
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+from antlr4.error.ErrorStrategy import DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+
+from antlr4.tree.Tree import ParseTreeListener
+from antlr4.tree.Tree import ParseTreeVisitor
+
+from pyutplugins.ioplugins.python.PythonParseException import PythonParseException
+
+from pyutplugins.ioplugins.python.pythonpegparser.PythonLexer import PythonLexer
+from pyutplugins.ioplugins.python.pythonpegparser.PythonParser import PythonParser
+
+
+class PythonErrorListener(ErrorListener):
+    #
+    # Provides a default instance of {@link ConsoleErrorListener}.
+    #
+    # INSTANCE = None
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+
+        # print("line " + str(line) + ":" + str(column) + " " + msg, file=sys.stderr)
+        raise PythonParseException(msg, line=line, column=column)
+
+
+NO_STATEMENT_VISITOR: ParseTreeVisitor = cast(ParseTreeVisitor, None)
+NO_LOCK:              Lock             = cast(Lock, None)
+
+
+class StatementStreamer(ParseTreeListener):
+    """
+    Visits each module level statement as soon as the parser finishes it and then detaches
+    it from the parse tree.  So the tree never holds more than one module level statement;
+    Classes and functions are module level statements
+
+    A retry with LL prediction skips the statements that the SLL stage already visited
+    """
+    def __init__(self, visitor: ParseTreeVisitor, skipCount: int = 0, heldLock: Lock = NO_LOCK):
+        """
+
+        Args:
+            visitor:    Visits each module level statement
+            skipCount:  The number of module level statements to not visit
+            heldLock:   The lock that the parsing thread holds;  It is released while a statement is visited
+        """
+        self._visitor:        ParseTreeVisitor = visitor
+        self._skipCount:      int              = skipCount
+        self._heldLock:       Lock             = heldLock
+        self._statementCount: int              = 0
+
+    @property
+    def statementCount(self) -> int:
+        """
+        Returns:  The number of module level statements parsed so far
+        """
+        return self._statementCount
+
+    def exitEveryRule(self, ctx: ParserRuleContext):
+
+        if isinstance(ctx, PythonParser.StatementContext) and isinstance(ctx.parentCtx.parentCtx, PythonParser.File_inputContext):
+
+            self._statementCount += 1
+            if self._statementCount > self._skipCount:
+                self._visitStatement(ctx)
+
+            ctx.parentCtx.removeLastChild()
+
+    def _visitStatement(self, ctx: ParserRuleContext):
+        """
+        The parser is between predictions;  So other threads may use the DFA while the statement is visited
+        """
+        if self._heldLock is NO_LOCK:
+            self._visitor.visit(ctx)
+        else:
+            self._heldLock.release()
+            try:
+                self._visitor.visit(ctx)
+            finally:
+                self._heldLock.acquire()
+
+
+class ParseStage(Enum):
+    """
+    The prediction mode that produced a module's parse tree
+    """
+    SLL = 'SLL'
+    LL  = 'LL'
+
+
+ParseStages = NewType('ParseStages', Dict[str, ParseStage])
+
+DEFAULT_CACHE_CLEAR_INTERVAL: int = 200
+
+#
+# The generated recognizers share their DFA and prediction context cache between instances.  ANTLR's
+# Python runtime adds to them deep inside adaptivePredict() and has no hook to lock just that;  So a
+# parse holds this lock.  A streaming parse releases it while it visits a statement.  Giving each
+# thread its own DFA would throw away what ParserWarmUp built.  Only the import thread and the warm
+# up thread parse in this process;  ParallelReverseEngineer's workers are processes with their own DFA
+#
+sharedDFALock: Lock = Lock()
+
+
+def _resetSharedDFALock():
+    """
+    A worker process may be forked while the warm-up thread holds the lock
+    """
+    global sharedDFALock
+    sharedDFALock = Lock()
+
+
+register_at_fork(after_in_child=_resetSharedDFALock)
+
+
+class PythonModuleParser:
+    """
+    Runs the PEG lexer and parser over a single Python module.
+
+    Modules are parsed in two stages.  The first uses ANTLR's SLL prediction mode
+    which is much faster than full LL but fails on some input;  It bails out on the
+    first error instead of trying to recover.  Only then is the module parsed again
+    with full LL prediction and the normal error reporting.  A module that is
+    really broken is reported by the second stage.
+
+    .parseStages records which stage produced each module's parse tree
+
+    Use one instance for a whole reverse engineering run.  The lexer and parser are
+    created for the first module and then reset for each one after that.  The
+    prediction context caches are cleared every cacheClearInterval modules so that
+    a large import does not keep growing them
+
+    This deliberately has no wx dependencies so that it can be used
+    in worker processes
+    """
+    def __init__(self, cacheClearInterval: int = DEFAULT_CACHE_CLEAR_INTERVAL):
+        self.logger: Logger = getLogger(__name__)
+
+        self._cacheClearInterval: int         = cacheClearInterval
+        self._parseStages:        ParseStages = ParseStages({})
+        self._parseCount:         int         = 0
+
+        self._lexer:         PythonLexer         = cast(PythonLexer, None)
+        self._tokenStream:   CommonTokenStream   = cast(CommonTokenStream, None)
+        self._parser:        PythonParser        = cast(PythonParser, None)
+        self._errorListener: PythonErrorListener = PythonErrorListener()
+
+    @property
+    def parseStages(self) -> ParseStages:
+        """
+        Returns:  The stage that succeeded for each module parsed so far
+        """
+        return self._parseStages
+
+    def stageCount(self, parseStage: ParseStage) -> int:
+        """
+        Args:
+            parseStage:
+
+        Returns:  The number of modules that the stage parsed
+        """
+        return list(self._parseStages.values()).count(parseStage)
+
+    def parse(self, fqFileName: str) -> PythonParser.File_inputContext:
+        """
+        May return None if there are syntax errors in the input file
+        In that case the error listener will raise and PythonParseException exception
+        with the appropriate detailed error message
+
+        Args:
+            fqFileName:
+
+        Returns:  The module's parse tree
+        """
+        return self._parseStream(inputStream=FileStream(fqFileName), moduleName=fqFileName)
+
+    def parseSource(self, source: str, moduleName: str) -> PythonParser.File_inputContext:
+        """
+        Same as .parse for source that is not in a file
+
+        Args:
+            source:     The module source
+            moduleName: Identifies the module in .parseStages and the log
+
+        Returns:  The module's parse tree
+        """
+        return self._parseStream(inputStream=InputStream(source), moduleName=moduleName)
+
+    def stream(self, fqFileName: str, visitor: ParseTreeVisitor) -> PythonParser.File_inputContext:
+        """
+        Visits the module while parsing it instead of after;  Memory use is bounded by the
+        largest module level statement instead of by the whole module.  Same errors as .parse
+
+        Args:
+            fqFileName: The module to parse
+            visitor:    Visits each module level statement
+
+        Returns:  The parse tree without its module level statements
+        """
+        return self._parseStream(inputStream=FileStream(fqFileName), moduleName=fqFileName, visitor=visitor)
+
+    def _parseStream(self, inputStream: InputStream, moduleName: str, visitor: ParseTreeVisitor = NO_STATEMENT_VISITOR) -> PythonParser.File_inputContext:
+
+        with sharedDFALock:
+            parser: PythonParser = self._resetParser(inputStream=inputStream)
+
+            parser.removeErrorListeners()
+            parser._interp.predictionMode = PredictionMode.SLL
+            parser._errHandler            = BailErrorStrategy()
+            streamer: StatementStreamer = self._addStreamer(parser=parser, visitor=visitor, skipCount=0)
+            try:
+                tree: PythonParser.File_inputContext = parser.file_input()
+                self._parseStages[moduleName] = ParseStage.SLL
+            except ParseCancellationException:
+                self.logger.info(f'SLL prediction failed;  Using LL for {moduleName}')
+
+                parser.removeParseListeners()
+                parser.reset()
+                self._addStreamer(parser=parser, visitor=visitor, skipCount=streamer.statementCount)
+                parser.addErrorListener(self._errorListener)
+                parser._interp.predictionMode = PredictionMode.LL
+                parser._errHandler            = DefaultErrorStrategy()
+
+                tree = parser.file_input()
+                self._parseStages[moduleName] = ParseStage.LL
+
+        if parser.getNumberOfSyntaxErrors() != 0:
+            eMsg: str = f"File {moduleName} contains {parser.getNumberOfSyntaxErrors()} syntax errors"
+            self.logger.error(eMsg)
+            tree = cast(PythonParser.File_inputContext, None)
+
+        return tree
+
+    def _addStreamer(self, parser: PythonParser, visitor: ParseTreeVisitor, skipCount: int) -> StatementStreamer:
+
+        streamer: StatementStreamer = StatementStreamer(visitor=visitor, skipCount=skipCount, heldLock=sharedDFALock)
+        if visitor is not NO_STATEMENT_VISITOR:
+            parser.addParseListener(streamer)
+
+        return streamer
+
+    def _resetParser(self, inputStream: InputStream) -> PythonParser:
+        """
+        Creates the lexer and parser for the first module;  Afterward, points them at the new input
+
+        Args:
+            inputStream:  The next module
+
+        Returns:  The parser ready to parse the module
+        """
+        if self._parser is None:
+            self._lexer       = PythonLexer(inputStream)
+            self._tokenStream = CommonTokenStream(self._lexer)
+            self._parser      = PythonParser(self._tokenStream)
+        else:
+            #
+            # Parser.reset() cannot remove its trace listener while there are other parse listeners
+            #
+            self._parser.removeParseListeners()
+            self._lexer.inputStream = inputStream
+            self._tokenStream.setTokenSource(self._lexer)
+            self._parser.setTokenStream(self._tokenStream)
+
+        self._parseCount += 1
+        if self._parseCount % self._cacheClearInterval == 0:
+            self._clearContextCaches()
+
+        return self._parser
+
+    def _clearContextCaches(self):
+        """
+        The DFA is left alone;  It is what keeps the parsing fast and it stops growing once
+        the parser has seen most of the grammar
+        """
+        self.logger.debug(f'Clearing the prediction context caches after {self._parseCount} modules')
+
+        self._lexer._interp.sharedContextCache = PredictionContextCache()
+        PythonParser.sharedContextCache.cache.clear()
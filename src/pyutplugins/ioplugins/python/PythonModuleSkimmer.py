@@ -0,0 +1,364 @@
+
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from io import StringIO
+
+from tokenize import COMMENT
+from tokenize import DEDENT
+from tokenize import INDENT
+from tokenize import NEWLINE
+from tokenize import NL
+from tokenize import STRING
+from tokenize import TokenError
+from tokenize import TokenInfo
+from tokenize import generate_tokens
+
+from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.PyutField import PyutField
+from pyutmodelv2.PyutMethod import PyutMethod
+from pyutmodelv2.PyutType import PyutType
+
+from pyutmodelv2.enumerations.PyutStereotype import PyutStereotype
+from pyutmodelv2.enumerations.PyutVisibility import PyutVisibility
+
+from pyutplugins.ioplugins.python.PythonAstParser import NO_ARGUMENTS_TEXT
+from pyutplugins.ioplugins.python.PythonAstParser import readModuleSource
+from pyutplugins.ioplugins.python.PythonParseException import PythonParseException
+
+from pyutplugins.ioplugins.python.visitor.ParentsDictionaryHandler import ParentsDictionaryHandler
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ModuleImports
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ModuleResult
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+from pyutplugins.ioplugins.python.visitor.ParserTypes import addImport
+from pyutplugins.ioplugins.python.visitor.ParserTypes import addImportFrom
+
+from pyutplugins.ioplugins.python.visitor.PyutBaseVisitor import ENUMERATION_SUPER_CLASS
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegClassVisitor import generateMyCredits
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import MAGIC_DUNDER_METHODS
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PRIVATE_INDICATOR
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PROTECTED_INDICATOR
+
+LogicalLine = List[TokenInfo]
+
+#
+# (class body indentation level, class name)
+#
+EnclosingClass = Tuple[int, PyutClassName]
+
+OPENING_BRACKETS: List[str] = ['(', '[', '{']
+CLOSING_BRACKETS: List[str] = [')', ']', '}']
+
+PROPERTY_DECORATOR:  str       = 'property'
+ACCESSOR_DECORATORS: List[str] = ['.setter', '.deleter']
+DATACLASS_DECORATOR: str       = 'dataclass'
+NEW_TYPE:            str       = 'NewType'
+
+#
+# A module without either of these cannot define anything the skimmer reports
+#
+SKIM_KEYWORDS: List[str] = ['class', NEW_TYPE]
+
+
+class PythonModuleSkimmer:
+    """
+    A header only reverse engineering of a module.  It uses the tokenizer from the standard
+    library instead of a parser;  So it only finds:
+
+        * the classes, enumerations and new types
+        * the class parents
+        * the method names and their visibility
+        * the properties, data class fields and enumeration members as fields
+        * the module's imports;  Unlike the visitors, it also records the ones inside functions
+
+    Parameters, types and associations are not extracted.  Each module is scanned once; The
+    result has the same classes and parents that the two reverse engineering passes produce,
+    so the links are generated the same way
+
+    This deliberately has no wx dependencies so that it can be used
+    in worker processes
+    """
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+        self._pyutClasses:              PyutClasses              = PyutClasses({})
+        self._dataClassNames:           List[PyutClassName]      = []
+        self._imports:                  ModuleImports            = ModuleImports({})
+        self._parentsDictionaryHandler: ParentsDictionaryHandler = ParentsDictionaryHandler()
+
+    def skim(self, fqFileName: str) -> ModuleResult:
+        """
+        Args:
+            fqFileName:
+
+        Returns:  The module's classes and parents
+
+        Raises PythonParseException if the module cannot be tokenized
+        """
+        try:
+            source: str = readModuleSource(fqFileName=fqFileName)
+        except SyntaxError as e:
+            self.logger.error(f'File {fqFileName} could not be decoded')
+            raise PythonParseException(e.msg, line=e.lineno or 0, column=e.offset or 0)
+
+        return self.skimSource(source=source, moduleName=fqFileName)
+
+    def skimSource(self, source: str, moduleName: str) -> ModuleResult:
+        """
+        Same as .skim for source that is not in a file
+
+        Args:
+            source:     The module source
+            moduleName: Identifies the module in the result and the errors
+
+        Returns:  The module's classes and parents
+        """
+        self._pyutClasses                      = PyutClasses({})
+        self._dataClassNames                   = []
+        self._imports                          = ModuleImports({})
+        self._parentsDictionaryHandler.parents = Parents({})
+
+        if any(keyword in source for keyword in SKIM_KEYWORDS) is True:
+            try:
+                self._scan(source=source)
+            except TokenError as e:
+                self.logger.error(f'File {moduleName} could not be tokenized')
+                raise PythonParseException(f'{e.args[0]}', line=e.args[1][0], column=e.args[1][1])
+            except IndentationError as e:
+                self.logger.error(f'File {moduleName} could not be tokenized')
+                raise PythonParseException(e.msg, line=e.lineno or 0, column=e.offset or 0)
+
+        return ModuleResult(fqFileName=moduleName, pyutClasses=self._pyutClasses, parents=self._parentsDictionaryHandler.parents, imports=self._imports)
+
+    def _scan(self, source: str):
+        """
+        Python's logical lines plus the indentation level of each one are enough to find
+        the class and method headers
+
+        Args:
+            source: The module source
+        """
+        level:            int                  = 0
+        enclosingClasses: List[EnclosingClass] = []
+        decorators:       List[str]            = []
+        logicalLine:      LogicalLine          = []
+
+        for token in generate_tokens(StringIO(source).readline):
+            if token.type == INDENT:
+                level += 1
+            elif token.type == DEDENT:
+                level -= 1
+            elif token.type in (COMMENT, NL):
+                pass
+            elif token.type == NEWLINE:
+                while len(enclosingClasses) > 0 and enclosingClasses[-1][0] > level:
+                    enclosingClasses.pop()
+
+                self._skimLogicalLine(logicalLine=logicalLine, level=level, enclosingClasses=enclosingClasses, decorators=decorators)
+                logicalLine = []
+            else:
+                logicalLine.append(token)
+
+    def _skimLogicalLine(self, logicalLine: LogicalLine, level: int, enclosingClasses: List[EnclosingClass], decorators: List[str]):
+        """
+        Args:
+            logicalLine:        The tokens of the line without the NEWLINE
+            level:              The line's indentation level
+            enclosingClasses:   Updated when the line starts a class
+            decorators:         The decorators seen since the last definition;  Updated
+        """
+        strings: List[str] = [token.string for token in logicalLine]
+        if len(strings) == 0:
+            return
+
+        self._skimNewTypes(strings=strings, logicalLine=logicalLine)
+
+        if strings[0] == '@':
+            decorators.append(''.join(strings[1:]))
+            return
+
+        if strings[0] in ('import', 'from'):
+            self._skimImport(strings=strings)
+            decorators.clear()
+            return
+
+        if strings[0] == 'async':
+            strings = strings[1:]
+
+        enclosingClassName: PyutClassName = PyutClassName('')
+        if len(enclosingClasses) > 0 and enclosingClasses[-1][0] == level:
+            enclosingClassName = enclosingClasses[-1][1]
+
+        if strings[0] == 'class' and len(strings) > 1:
+            className: PyutClassName = PyutClassName(strings[1])
+
+            self._skimClassHeader(className=className, strings=strings, decorators=decorators)
+            enclosingClasses.append((level + 1, className))
+        elif strings[0] == 'def' and len(strings) > 1:
+            if enclosingClassName != '':
+                self._skimMethodHeader(className=enclosingClassName, methodName=strings[1], decorators=decorators)
+        elif enclosingClassName != '':
+            self._skimClassVariable(className=enclosingClassName, strings=strings)
+
+        decorators.clear()
+
+    def _skimClassHeader(self, className: PyutClassName, strings: List[str], decorators: List[str]):
+
+        pyutClass: PyutClass = PyutClass(name=className)
+
+        pyutClass.description = generateMyCredits()
+        if any(decorator.startswith(DATACLASS_DECORATOR) for decorator in decorators):
+            self._dataClassNames.append(className)
+
+        argumentsText: str = self._classArgumentsText(strings=strings)
+        if argumentsText is not NO_ARGUMENTS_TEXT:
+            if ENUMERATION_SUPER_CLASS in argumentsText.split(','):
+                pyutClass.stereotype = PyutStereotype.ENUMERATION
+            self._parentsDictionaryHandler.createParentChildEntryFromText(argumentsText=argumentsText, childName=className)
+
+        self._pyutClasses[className] = pyutClass
+
+    def _skimMethodHeader(self, className: PyutClassName, methodName: str, decorators: List[str]):
+
+        pyutClass: PyutClass = self._pyutClasses[className]
+
+        if PROPERTY_DECORATOR in decorators:
+            pyutClass.fields.append(PyutField(name=methodName, type=PyutType(''), visibility=PyutVisibility.PUBLIC))
+        elif any(decorator.endswith(accessor) for decorator in decorators for accessor in ACCESSOR_DECORATORS):
+            pass
+        else:
+            pyutVisibility: PyutVisibility = PyutVisibility.PUBLIC
+            if methodName in MAGIC_DUNDER_METHODS:
+                pass
+            elif methodName.startswith(PRIVATE_INDICATOR):
+                pyutVisibility = PyutVisibility.PRIVATE
+            elif methodName.startswith(PROTECTED_INDICATOR):
+                pyutVisibility = PyutVisibility.PROTECTED
+
+            pyutClass.methods.append(PyutMethod(name=methodName, visibility=pyutVisibility))
+
+    def _skimClassVariable(self, className: PyutClassName, strings: List[str]):
+        """
+        Enumeration members and data class fields
+
+        Args:
+            className:  The class whose body has the line
+            strings:    The line's token strings
+        """
+        pyutClass: PyutClass = self._pyutClasses[className]
+        if len(strings) < 2 or strings[1] not in ('=', ':'):
+            return
+
+        if pyutClass.stereotype == PyutStereotype.ENUMERATION and strings[1] == '=':
+            pyutClass.fields.append(PyutField(name=strings[0], type=PyutType(''), visibility=PyutVisibility.PUBLIC, defaultValue=''.join(strings[2:])))
+        elif className in self._dataClassNames:
+            equalsIdx: int = strings.index('=') if '=' in strings else len(strings)
+            pyutClass.fields.append(PyutField(name=strings[0],
+                                              type=PyutType(''.join(strings[2:equalsIdx]) if strings[1] == ':' else ''),
+                                              visibility=PyutVisibility.PUBLIC,
+                                              defaultValue=''.join(strings[equalsIdx + 1:])))
+
+    def _skimImport(self, strings: List[str]):
+        """
+        e.g. from ..visitor.ParserTypes import (Parents, Children as Kids)
+
+        Args:
+            strings:    The line's token strings starting with 'import' or 'from'
+        """
+        if strings[0] == 'import':
+            for names in self._splitImportedNames(strings=strings[1:]):
+                addImport(imports=self._imports, dottedName=''.join(names[0]), asName=names[1])
+        elif 'import' in strings:
+            importIdx:  int = strings.index('import')
+            moduleName: str = ''.join(strings[1:importIdx])
+            for names in self._splitImportedNames(strings=strings[importIdx + 1:]):
+                if names[0] != ['*']:
+                    addImportFrom(imports=self._imports, moduleName=moduleName, name=''.join(names[0]), asName=names[1])
+
+    def _splitImportedNames(self, strings: List[str]) -> List[Tuple[List[str], str | None]]:
+        """
+        Args:
+            strings:  The token strings after 'import'
+
+        Returns:  The imported names' token strings, each with its 'as' name or None
+        """
+        importedNames: List[Tuple[List[str], str | None]] = []
+
+        names: List[str] = []
+        for tokenString in strings + [',']:
+            if tokenString in ('(', ')'):
+                pass
+            elif tokenString == ',':
+                if len(names) > 0:
+                    if len(names) > 2 and names[-2] == 'as':
+                        importedNames.append((names[:-2], names[-1]))
+                    else:
+                        importedNames.append((names, None))
+                names = []
+            else:
+                names.append(tokenString)
+
+        return importedNames
+
+    def _skimNewTypes(self, strings: List[str], logicalLine: LogicalLine):
+        """
+        e.g. PyutClasses = NewType('PyutClasses', Dict[PyutClassName, PyutClass])
+
+        Args:
+            strings:        The line's token strings
+            logicalLine:    The line's tokens
+        """
+        for idx, tokenString in enumerate(strings[:-2]):
+            if tokenString == NEW_TYPE and strings[idx + 1] == '(' and logicalLine[idx + 2].type == STRING:
+
+                className: PyutClassName = PyutClassName(strings[idx + 2].strip("'").strip('"'))
+                pyutClass: PyutClass     = PyutClass(name=className)
+
+                pyutClass.description = generateMyCredits()
+                pyutClass.stereotype  = PyutStereotype.TYPE
+
+                self._pyutClasses[className] = pyutClass
+
+    def _classArgumentsText(self, strings: List[str]) -> str:
+        """
+        Args:
+            strings:  The class header's token strings starting with 'class'
+
+        Returns:  The text between the class's parentheses less any trailing comma or
+        NO_ARGUMENTS_TEXT if there are none;  Same as AstModule.getClassArgumentsText
+        """
+        idx: int = 2        # skip 'class' NAME
+        if idx < len(strings) and strings[idx] == '[':
+            idx = self._findClosingBracket(strings=strings, openIdx=idx) + 1     # type parameters
+
+        if idx >= len(strings) or strings[idx] != '(':
+            return NO_ARGUMENTS_TEXT
+
+        closeIdx:  int       = self._findClosingBracket(strings=strings, openIdx=idx)
+        argTokens: List[str] = strings[idx + 1:closeIdx]
+        if len(argTokens) > 0 and argTokens[-1] == ',':
+            argTokens = argTokens[:-1]
+        if len(argTokens) == 0:
+            return NO_ARGUMENTS_TEXT
+
+        return ''.join(argTokens)
+
+    def _findClosingBracket(self, strings: List[str], openIdx: int) -> int:
+
+        depth: int = 0
+        idx:   int = openIdx
+        while idx < len(strings):
+            if strings[idx] in OPENING_BRACKETS:
+                depth += 1
+            elif strings[idx] in CLOSING_BRACKETS:
+                depth -= 1
+                if depth == 0:
+                    break
+            idx += 1
+
+        return idx
@@ -1,3 +1,12 @@
 
 class PythonParseException(Exception):
-    pass
+    """
+    A module that could not be parsed;  The line and column are 0 when they are not known
+    """
+    def __init__(self, message: str, line: int = 0, column: int = 0):
+
+        super().__init__(message)
+
+        self.message: str = message
+        self.line:    int = line
+        self.column:  int = column
@@ -0,0 +1,647 @@
+
+from typing import Callable
+from typing import List
+from typing import Set
+
+from logging import Logger
+from logging import getLogger
+
+from os import sep as osSep
+from os import path as osPath
+
+from pathlib import Path
+
+from time import perf_counter
+
+from codeallybasic.ConfigurationLocator import ConfigurationLocator
+
+from pyutplugins.preferences.PluginPreferences import MODULE_NAME
+from pyutplugins.preferences.PluginPreferences import PluginPreferences
+
+from pyutplugins.ioplugins.python.CancellationToken import CancellationToken
+from pyutplugins.ioplugins.python.ClassSubset import ClassGraph
+from pyutplugins.ioplugins.python.ClassSubset import ClassNames
+from pyutplugins.ioplugins.python.ClassSubset import ClassSubset
+from pyutplugins.ioplugins.python.ImportErrorReport import ImportErrorReport
+from pyutplugins.ioplugins.python.ImportErrorReport import MODULE_EXCEPTIONS
+from pyutplugins.ioplugins.python.ImportErrorReport import ModuleError
+from pyutplugins.ioplugins.python.ImportErrorReport import PASS_1_NAME
+from pyutplugins.ioplugins.python.ImportErrorReport import PASS_2_NAME
+from pyutplugins.ioplugins.python.ImportErrorReport import SKIM_NAME
+from pyutplugins.ioplugins.python.ImportErrorReport import makeModuleError
+from pyutplugins.ioplugins.python.IncrementalImport import ImportedModules
+from pyutplugins.ioplugins.python.ModuleResultCache import CacheKey
+from pyutplugins.ioplugins.python.ModuleResultCache import ModuleResultCache
+from pyutplugins.ioplugins.python.ModuleResultCache import NO_MODULE_RESULT
+from pyutplugins.ioplugins.python.ModuleResultCache import PASS_1_CONTEXT
+from pyutplugins.ioplugins.python.ModuleResultCache import SKIM_CONTEXT
+from pyutplugins.ioplugins.python.ModuleResultCache import pass2Context
+from pyutplugins.ioplugins.python.ParseTreeCache import NO_PARSE_TREE
+from pyutplugins.ioplugins.python.ParseTreeCache import ParseTreeCache
+from pyutplugins.ioplugins.python.ParallelReverseEngineer import ParallelReverseEngineer
+from pyutplugins.ioplugins.python.PythonAstParser import AstModule
+from pyutplugins.ioplugins.python.PythonAstParser import PythonAstParser
+from pyutplugins.ioplugins.python.PythonBackend import PythonBackend
+from pyutplugins.ioplugins.python.PythonModuleParser import ParseStage
+from pyutplugins.ioplugins.python.PythonModuleParser import PythonModuleParser
+from pyutplugins.ioplugins.python.PythonModuleSkimmer import PythonModuleSkimmer
+from pyutplugins.ioplugins.python.PythonParseException import PythonParseException
+from pyutplugins.ioplugins.python.SymbolTable import QualifiedName
+from pyutplugins.ioplugins.python.SymbolTable import SymbolTable
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associate
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associates
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Children
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ModuleResult
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ParentName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+from pyutplugins.ioplugins.python.visitor.ParserTypes import mergeAssociations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import mergeParents
+from pyutplugins.ioplugins.python.visitor.PyutAstClassVisitor import PyutAstClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutAstVisitor import PyutAstVisitor
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegClassVisitor import PyutPythonPegClassVisitor
+
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PyutPythonPegVisitor
+
+from pyutplugins.ioplugins.python.pythonpegparser.PythonParser import PythonParser
+
+
+IMPORT_CACHE_DIRECTORY_NAME: str = 'importCache'
+
+
+class PythonReverseEngineer:
+    """
+    The model side of the Python import;  Modules in, .pyutClasses, .parents and .associations
+    out.  There are no wx or Ogl dependencies, so it runs headless, e.g. in benchmarks.  See
+    ReverseEngineerPythonV3 for the Ogl side
+
+    The passes may run on a worker thread;  They check the cancellation token between modules
+
+    The modules that fail are added to the error report;  It is shown once the import finishes.
+    Unless the preferences say to skip them, the first one stops the import with a PythonParseException.
+    Pass 2 skips the modules that failed pass 1
+
+    The classes of all the packages are kept in a symbol table;  So classes with the same name
+    in different packages are different classes.  The parents and associations are resolved
+    with each module's imports the first time that they are asked for
+    """
+    def __init__(self):
+
+        super().__init__()
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._cumulativeParents:      Parents           = Parents({})
+        self._cumulativeAssociations: Associations      = Associations({})
+        self._linksQualified:         bool              = True
+        self._classGraph:             ClassGraph | None = None
+
+        preferences: PluginPreferences = PluginPreferences()
+
+        self._backend:           PythonBackend  = preferences.pythonBackend
+        self._streamingParse:    bool           = preferences.streamingParse
+        self._compactSourceCode: bool           = preferences.compactSourceCode
+        self._skipOnError:       bool           = preferences.skipOnError
+        self._parseOnce:         bool           = preferences.parseOnce and not self._streamingParse
+        self._parseTreeCache:    ParseTreeCache = ParseTreeCache(maximumSize=preferences.parseTreeCacheSize)
+
+        self._moduleResultCache: ModuleResultCache | None = None
+        if preferences.importCache is True:
+            cacheDirectory: Path = ConfigurationLocator().applicationPath(MODULE_NAME) / IMPORT_CACHE_DIRECTORY_NAME
+            self._moduleResultCache = ModuleResultCache(cacheDirectory=cacheDirectory, maximumSize=preferences.importCacheSize, backend=self._backend)
+        #
+        # Pass 2 needs to know which classes each module defined during pass 1 and what it imported
+        #
+        self._symbolTable: SymbolTable = SymbolTable()
+        #
+        # What pass 2 extracted from each module;  Incremental imports start from these
+        #
+        self._importedModules: ImportedModules = ImportedModules({})
+
+        self._cancellationToken: CancellationToken = CancellationToken()
+        self._errorReport:       ImportErrorReport = ImportErrorReport()
+        self._pass1Failed:       Set[str]          = set()
+        #
+        # The serial passes are run once per package;  The progress count carries on across them
+        #
+        self._progressPassName: str = ''
+        self._progressCount:    int = 0
+
+        self._moduleParser:            PythonModuleParser      = PythonModuleParser()
+        self._astParser:               PythonAstParser         = PythonAstParser()
+        self._moduleSkimmer:           PythonModuleSkimmer     = PythonModuleSkimmer()
+        self._parallelReverseEngineer: ParallelReverseEngineer = ParallelReverseEngineer(maxWorkers=preferences.importWorkerCount,
+                                                                                         moduleResultCache=self._moduleResultCache,
+                                                                                         backend=self._backend,
+                                                                                         streamingParse=self._streamingParse,
+                                                                                         compactSourceCode=self._compactSourceCode,
+                                                                                         symbolTable=self._symbolTable,
+                                                                                         skipOnError=self._skipOnError)
+
+    def doPass1(self, directoryName: str, files: List[str], progressCallback: Callable) -> PyutClasses:
+        """
+        Adds the classes and imports of each module to the symbol table
+
+        Args:
+            directoryName:      The directory name where the selected files reside
+            files:              A list of files to scan
+            progressCallback:   The method to call to report progress
+
+        Returns:  The classes found so far by their bare names;  It is the symbol table's
+        dictionary, so calling this for each package does not copy it
+        """
+        for fileName in files:
+
+            self._cancellationToken.raiseIfCancelled()
+
+            fqFileName:       str   = f'{directoryName}{osSep}{fileName}'
+            startTime:        float = perf_counter()
+            currentFileCount: int   = self._nextModuleCount(passName=PASS_1_NAME)
+            try:
+                self.logger.info(f'1st pass Processing file: {fqFileName}')
+
+                progressCallback(currentFileCount, f'Pass 1 processing: {directoryName}\n {fileName}')
+
+                cacheKey:     CacheKey     = self._makeCacheKey(fqFileName=fqFileName, context=PASS_1_CONTEXT)
+                moduleResult: ModuleResult = self._getCachedResult(cacheKey=cacheKey, fqFileName=fqFileName)
+                if moduleResult is NO_MODULE_RESULT:
+                    moduleResult = self._findModuleClasses(fqFileName=fqFileName)
+
+                    self._putCachedResult(cacheKey=cacheKey, moduleResult=moduleResult)
+
+                self._symbolTable.addModule(fqFileName=fqFileName, pyutClasses=moduleResult.pyutClasses, imports=moduleResult.imports)
+                self._linksQualified = False
+                self._pass1Failed.discard(fqFileName)
+
+            except MODULE_EXCEPTIONS as e:
+                self._moduleFailed(fqFileName=fqFileName, passName=PASS_1_NAME, e=e, startTime=startTime)
+            except (ValueError, Exception) as e:
+                self.logger.error(f'Error in {directoryName}/{fileName}')
+                raise e
+
+        if len(self._symbolTable.bareClasses) == 0:
+            self.logger.warning(f'No classes processed in {directoryName}')
+
+        return self._symbolTable.bareClasses
+
+    def doPass2(self, directoryName: str, files: List[str], pyutClasses: PyutClasses, progressCallback: Callable) -> PyutClasses:
+        """
+        Reverse engineering Python files to PyutClass's
+
+        Args:
+            directoryName:  The directory name where the selected files reside
+            files:          A list of files to parse
+            pyutClasses:  The full list of classes scanned during pass 1 by their bare names
+            progressCallback: The method to call to report progress
+        """
+        context: str = pass2Context(pyutClasses.keys(), compactSourceCode=self._compactSourceCode)
+
+        for fileName in files:
+
+            self._cancellationToken.raiseIfCancelled()
+
+            fqFileName:       str   = f'{directoryName}{osSep}{fileName}'
+            startTime:        float = perf_counter()
+            currentFileCount: int   = self._nextModuleCount(passName=PASS_2_NAME)
+            if fqFileName in self._pass1Failed:
+                self.logger.info(f'2nd pass skipping {fqFileName};  It failed pass 1')
+                continue
+            try:
+                self.logger.info(f'2nd pass processing file: {fqFileName}')
+
+                progressCallback(currentFileCount, f'Processing: {directoryName}\n {fileName}')
+
+                cacheKey:     CacheKey     = self._makeCacheKey(fqFileName=fqFileName, context=context)
+                moduleResult: ModuleResult = self._getCachedResult(cacheKey=cacheKey, fqFileName=fqFileName)
+                if moduleResult is NO_MODULE_RESULT:
+                    moduleView: PyutClasses = self._symbolTable.moduleView(fqFileName=fqFileName, pyutClasses=pyutClasses)
+                    moduleResult = self._reverseEngineerModule(fqFileName=fqFileName, pyutClasses=moduleView)
+                    if moduleResult is NO_MODULE_RESULT:
+                        continue
+
+                    self._putCachedResult(cacheKey=cacheKey, moduleResult=moduleResult)
+                else:
+                    self._symbolTable.updateClasses(fqFileName=fqFileName, pyutClasses=moduleResult.pyutClasses)
+
+                self._addImportedModule(fqFileName=fqFileName, moduleResult=moduleResult)
+
+            except MODULE_EXCEPTIONS as e:
+                self._moduleFailed(fqFileName=fqFileName, passName=PASS_2_NAME, e=e, startTime=startTime)
+
+        self._logParseStages()
+
+        return pyutClasses
+
+    def doParallelPass1(self, fqFileNames: List[str], progressCallback: Callable) -> PyutClasses:
+        """
+        Same as .doPass1 except that the modules are parsed by a process pool
+
+        Args:
+            fqFileNames:      The fully qualified names of all the modules to import
+            progressCallback: The method to call to report progress
+
+        Returns:  The classes found in all the modules by their bare names
+        """
+        pyutClasses: PyutClasses = self._parallelReverseEngineer.doPass1(fqFileNames=fqFileNames, progressCallback=progressCallback)
+
+        self._linksQualified = False
+        self._collectParallelErrors()
+
+        return pyutClasses
+
+    def doParallelPass2(self, fqFileNames: List[str], pyutClasses: PyutClasses, progressCallback: Callable) -> PyutClasses:
+        """
+        Same as .doPass2 except that the modules are parsed and visited by a process pool
+
+        Args:
+            fqFileNames:      The fully qualified names of all the modules to import
+            pyutClasses:      The full list of classes scanned during pass 1
+            progressCallback: The method to call to report progress
+
+        Returns:  The enhanced classes
+        """
+        parallelReverseEngineer: ParallelReverseEngineer = self._parallelReverseEngineer
+
+        pyutClasses = parallelReverseEngineer.doPass2(fqFileNames=fqFileNames, pyutClasses=pyutClasses, progressCallback=progressCallback)
+
+        for moduleResult in parallelReverseEngineer.pass2Results:
+            self._addImportedModule(fqFileName=moduleResult.fqFileName, moduleResult=moduleResult)
+
+        self._collectParallelErrors()
+
+        return pyutClasses
+
+    def doSkim(self, directoryName: str, files: List[str], progressCallback: Callable) -> PyutClasses:
+        """
+        A header only import;  Replaces both passes.  Only the classes, their parents and the
+        member names are extracted.  See PythonModuleSkimmer
+
+        Args:
+            directoryName:      The directory name where the selected files reside
+            files:              A list of files to skim
+            progressCallback:   The method to call to report progress
+
+        Returns:  The classes found so far by their bare names;  See .doPass1
+        """
+        for fileName in files:
+
+            self._cancellationToken.raiseIfCancelled()
+
+            fqFileName:       str   = f'{directoryName}{osSep}{fileName}'
+            startTime:        float = perf_counter()
+            currentFileCount: int   = self._nextModuleCount(passName=SKIM_NAME)
+            try:
+                self.logger.info(f'Skimming file: {fqFileName}')
+
+                progressCallback(currentFileCount, f'Skimming: {directoryName}\n {fileName}')
+
+                cacheKey:     CacheKey     = self._makeCacheKey(fqFileName=fqFileName, context=SKIM_CONTEXT)
+                moduleResult: ModuleResult = self._getCachedResult(cacheKey=cacheKey, fqFileName=fqFileName)
+                if moduleResult is NO_MODULE_RESULT:
+                    moduleResult = self._moduleSkimmer.skim(fqFileName=fqFileName)
+
+                    self._putCachedResult(cacheKey=cacheKey, moduleResult=moduleResult)
+
+                self._symbolTable.addModule(fqFileName=fqFileName, pyutClasses=moduleResult.pyutClasses, imports=moduleResult.imports)
+                self._addImportedModule(fqFileName=fqFileName, moduleResult=moduleResult)
+
+            except MODULE_EXCEPTIONS as e:
+                self._moduleFailed(fqFileName=fqFileName, passName=SKIM_NAME, e=e, startTime=startTime)
+            except (ValueError, Exception) as e:
+                self.logger.error(f'Error in {directoryName}/{fileName}')
+                raise e
+
+        return self._symbolTable.bareClasses
+
+    def doParallelSkim(self, fqFileNames: List[str], progressCallback: Callable) -> PyutClasses:
+        """
+        Same as .doSkim except that the modules are skimmed by a process pool
+
+        Args:
+            fqFileNames:      The fully qualified names of all the modules to import
+            progressCallback: The method to call to report progress
+
+        Returns:  The classes found in all the modules by their bare names
+        """
+        parallelReverseEngineer: ParallelReverseEngineer = self._parallelReverseEngineer
+
+        pyutClasses: PyutClasses = parallelReverseEngineer.doSkim(fqFileNames=fqFileNames, progressCallback=progressCallback)
+
+        for moduleResult in parallelReverseEngineer.pass2Results:
+            self._addImportedModule(fqFileName=moduleResult.fqFileName, moduleResult=moduleResult)
+
+        self._collectParallelErrors()
+
+        return pyutClasses
+
+    @property
+    def cancellationToken(self) -> CancellationToken:
+        return self._cancellationToken
+
+    @cancellationToken.setter
+    def cancellationToken(self, newValue: CancellationToken):
+        self._cancellationToken = newValue
+        self._parallelReverseEngineer.cancellationToken = newValue
+
+    @property
+    def errorReport(self) -> ImportErrorReport:
+        return self._errorReport
+
+    @errorReport.setter
+    def errorReport(self, newValue: ImportErrorReport):
+        """
+        Share a report so that it collects the errors of more than one reverse engineer
+        """
+        self._errorReport = newValue
+
+    @property
+    def pyutClasses(self) -> PyutClasses:
+        """
+        Returns:  All the imported classes;  A class name that more than one module defines
+        is qualified by its module name
+        """
+        return self._symbolTable.pyutClasses
+
+    @property
+    def importedModules(self) -> ImportedModules:
+        """
+        Returns:  What pass 2 extracted from each module
+        """
+        return self._importedModules
+
+    @property
+    def parents(self) -> Parents:
+        """
+        Returns:  The parents and children of all the modules;  They are named like .pyutClasses.
+        A parent that is not an imported class keeps its name, e.g. Enum
+        """
+        if self._linksQualified is False:
+            self._qualifyLinks()
+        return self._cumulativeParents
+
+    @property
+    def associations(self) -> Associations:
+        """
+        Returns:  The associations of all the modules;  They are named like .pyutClasses
+        """
+        if self._linksQualified is False:
+            self._qualifyLinks()
+        return self._cumulativeAssociations
+
+    @property
+    def classGraph(self) -> ClassGraph:
+        """
+        Returns:  The classes linked by .parents and .associations
+        """
+        if self._linksQualified is False:
+            self._qualifyLinks()
+        if self._classGraph is None:
+            self._classGraph = ClassGraph(parents=self._cumulativeParents, associations=self._cumulativeAssociations)
+        return self._classGraph
+
+    def selectClasses(self, classSubset: ClassSubset) -> ClassNames:
+        """
+        Args:
+            classSubset:  The packages and the classes to show
+
+        Returns:  The classes to create shapes for;  Named like .pyutClasses
+        """
+        pyutClassNames: List[PyutClassName] = list(self.pyutClasses.keys())
+        packageNames:   Set[str]            = set(classSubset.packageNames)
+
+        classNames: ClassNames = ClassNames(set())
+        for fqFileName in self._importedModules.keys():
+            if osPath.dirname(fqFileName) in packageNames:
+                for className in self._symbolTable.moduleClassNames(fqFileName=fqFileName):
+                    classNames.add(self._displayName(name=self._symbolTable.qualifiedName(fqFileName=fqFileName, className=className)))
+
+        shownNames: Set[str]            = set(classSubset.classNames)
+        shown:      List[PyutClassName] = [className for className in pyutClassNames if className in shownNames or className.rpartition('.')[2] in shownNames]
+
+        classNames.update(self.classGraph.neighborhood(classNames=shown, hops=classSubset.hops))
+
+        return ClassNames(classNames.intersection(pyutClassNames))
+
+    def _addImportedModule(self, fqFileName: str, moduleResult: ModuleResult):
+        self._importedModules[fqFileName] = moduleResult
+        self._linksQualified = False
+
+    def _qualifyLinks(self):
+        """
+        Merges the parents and associations of all the modules by their qualified names and then
+        names them like .pyutClasses;  They can only be resolved once every module is in the symbol table
+        """
+        self._cumulativeParents      = Parents({})
+        self._cumulativeAssociations = Associations({})
+        self._classGraph             = None
+        for fqFileName, moduleResult in self._importedModules.items():
+            parents:      Parents      = self._symbolTable.qualifyParents(fqFileName=fqFileName, parents=moduleResult.parents)
+            associations: Associations = self._symbolTable.qualifyAssociations(fqFileName=fqFileName, associations=moduleResult.associations)
+
+            mergeParents(parents=self._cumulativeParents, moreParents=self._displayParents(parents=parents))
+            mergeAssociations(associations=self._cumulativeAssociations, moreAssociations=self._displayAssociations(associations=associations))
+
+        self._linksQualified = True
+
+    def _displayParents(self, parents: Parents) -> Parents:
+
+        displayParents: Parents = Parents({})
+        for parentName, children in parents.items():
+            displayChildren: Children = [self._displayName(name=childName) for childName in children]
+
+            mergeParents(parents=displayParents, moreParents=Parents({ParentName(self._displayName(name=parentName)): displayChildren}))
+
+        return displayParents
+
+    def _displayAssociations(self, associations: Associations) -> Associations:
+
+        displayAssociations: Associations = Associations({})
+        for className, associates in associations.items():
+            displayAssociates: Associates = Associates([])
+            for associate in associates:
+                displayAssociates.append(Associate(associateName=self._displayName(name=associate.associateName), associationType=associate.associationType))
+
+            mergeAssociations(associations=displayAssociations, moreAssociations=Associations({self._displayName(name=className): displayAssociates}))
+
+        return displayAssociations
+
+    def _displayName(self, name: str) -> PyutClassName:
+        return self._symbolTable.displayName(QualifiedName(name))
+
+    def _findModuleClasses(self, fqFileName: str) -> ModuleResult:
+        """
+        Pass 1 for a single module
+
+        Args:
+            fqFileName: The module to scan
+
+        Returns:  The classes defined in the module and its imports
+        """
+        if self._backend == PythonBackend.AST:
+            astModule:    AstModule           = self._astParser.parse(fqFileName=fqFileName)
+            classVisitor: PyutAstClassVisitor = PyutAstClassVisitor()
+
+            classVisitor.pyutClasses = PyutClasses({})
+            classVisitor.visitModule(astModule)
+
+            return ModuleResult(fqFileName=fqFileName, pyutClasses=classVisitor.pyutClasses, imports=classVisitor.imports)
+
+        visitor: PyutPythonPegClassVisitor = PyutPythonPegClassVisitor()
+
+        visitor.pyutClasses = PyutClasses({})
+        if self._streamingParse is True:
+            self._moduleParser.stream(fqFileName=fqFileName, visitor=visitor)
+        else:
+            tree: PythonParser.File_inputContext = self._setupPegBasedParser(fqFileName=fqFileName)
+            visitor.visit(tree)
+
+            if self._parseOnce is True:
+                self._parseTreeCache.add(fqFileName=fqFileName, tree=tree, sourceSize=osPath.getsize(fqFileName))
+
+        return ModuleResult(fqFileName=fqFileName, pyutClasses=visitor.pyutClasses, imports=visitor.imports)
+
+    def _reverseEngineerModule(self, fqFileName: str, pyutClasses: PyutClasses) -> ModuleResult:
+        """
+        Pass 2 for a single module;  The ast backend always parses the module again since
+        that is cheaper than keeping the trees around
+
+        Args:
+            fqFileName:     The module to reverse engineer
+            pyutClasses:    The classes that the module sees;  See SymbolTable.moduleView
+
+        Returns:  The module's classes, parents, and associations or NO_MODULE_RESULT
+        """
+        if self._backend == PythonBackend.AST:
+            astModule:  AstModule      = self._astParser.parse(fqFileName=fqFileName)
+            astVisitor: PyutAstVisitor = PyutAstVisitor()
+
+            astVisitor.pyutClasses       = pyutClasses
+            astVisitor.parents           = Parents({})
+            astVisitor.associations      = Associations({})
+            astVisitor.compactSourceCode = self._compactSourceCode
+            astVisitor.visitModule(astModule)
+
+            parents:      Parents      = astVisitor.parents
+            associations: Associations = astVisitor.associations
+        else:
+            visitor: PyutPythonPegVisitor = PyutPythonPegVisitor()
+
+            visitor.pyutClasses       = pyutClasses
+            visitor.parents           = Parents({})
+            visitor.associations      = Associations({})
+            visitor.compactSourceCode = self._compactSourceCode
+            if self._streamingParse is True:
+                tree: PythonParser.File_inputContext = self._moduleParser.stream(fqFileName=fqFileName, visitor=visitor)
+            else:
+                tree = self._parseTreeCache.remove(fqFileName=fqFileName)
+                if tree is NO_PARSE_TREE:
+                    tree = self._setupPegBasedParser(fqFileName=fqFileName)
+                if tree is not None:
+                    visitor.visit(tree)
+
+            if tree is None:
+                return NO_MODULE_RESULT
+
+            parents      = visitor.parents
+            associations = visitor.associations
+
+        moduleClassNames: List[PyutClassName] = self._symbolTable.moduleClassNames(fqFileName=fqFileName)
+
+        return ModuleResult(fqFileName=fqFileName,
+                            pyutClasses=PyutClasses({className: pyutClasses[className] for className in moduleClassNames}),
+                            parents=parents,
+                            associations=associations)
+
+    def _nextModuleCount(self, passName: str) -> int:
+        """
+        Counts the modules of a pass across all of its packages;  The count starts over
+        when a different pass starts
+
+        Args:
+            passName:   PASS_1_NAME, PASS_2_NAME or SKIM_NAME
+
+        Returns:  The number of the module that is about to be processed;  1 based
+        """
+        if passName != self._progressPassName:
+            self._progressPassName = passName
+            self._progressCount    = 0
+
+        self._progressCount += 1
+
+        return self._progressCount
+
+    def _makeCacheKey(self, fqFileName: str, context: str) -> CacheKey:
+
+        if self._moduleResultCache is None:
+            return CacheKey('')
+
+        return self._moduleResultCache.makeKey(fqFileName=fqFileName, context=context)
+
+    def _getCachedResult(self, cacheKey: CacheKey, fqFileName: str) -> ModuleResult:
+        """
+
+        Args:
+            cacheKey:   From ._makeCacheKey
+            fqFileName: The module to look up
+
+        Returns:  The module's cached result with fresh IDs or NO_MODULE_RESULT
+        """
+        if self._moduleResultCache is None:
+            return NO_MODULE_RESULT
+
+        moduleResult: ModuleResult = self._moduleResultCache.get(cacheKey=cacheKey, fqFileName=fqFileName)
+        if moduleResult is not NO_MODULE_RESULT:
+            self.logger.info(f'Unchanged module: {fqFileName}')
+            moduleResult.reassignIds()
+
+        return moduleResult
+
+    def _putCachedResult(self, cacheKey: CacheKey, moduleResult: ModuleResult):
+
+        if self._moduleResultCache is not None:
+            self._moduleResultCache.put(cacheKey=cacheKey, moduleResult=moduleResult)
+
+    def _logParseStages(self):
+
+        sllCount: int = self._moduleParser.stageCount(ParseStage.SLL)
+        llCount:  int = self._moduleParser.stageCount(ParseStage.LL)
+        if sllCount + llCount > 0:
+            self.logger.info(f'Modules parsed with SLL prediction: {sllCount}  with LL prediction: {llCount}')
+
+    def _moduleFailed(self, fqFileName: str, passName: str, e: Exception, startTime: float):
+        """
+        Args:
+            fqFileName:     The module that failed
+            passName:       The pass that it failed in
+            e:              One of the MODULE_EXCEPTIONS
+            startTime:      When the pass started on the module;  From perf_counter()
+
+        Raises PythonParseException when not skipping modules that fail
+        """
+        moduleError: ModuleError = makeModuleError(fqFileName=fqFileName, passName=passName, e=e, elapsedTime=perf_counter() - startTime)
+
+        self.logger.error(f'{passName}: {moduleError}')
+        self._errorReport.addError(moduleError)
+        if passName == PASS_1_NAME:
+            self._pass1Failed.add(fqFileName)
+        if self._skipOnError is False:
+            raise PythonParseException(f'{moduleError}')
+
+    def _collectParallelErrors(self):
+        self._errorReport.addErrors(self._parallelReverseEngineer.moduleErrors)
+
+    def _setupPegBasedParser(self, fqFileName: str) -> PythonParser.File_inputContext:
+        """
+        May return None if there are syntax errors in the input file
+        In that case the error listener will raise and PythonParseException exception
+        with the appropriate detailed error message
+
+        Args:
+            fqFileName:
+
+        Returns:  Returns a visitor
+        """
+        return self._moduleParser.parse(fqFileName=fqFileName)
@@ -1,5 +1,4 @@
 
-from typing import Callable
 from typing import Dict
 from typing import List
 from typing import NewType
@@ -9,30 +8,19 @@ from typing import cast
 from logging import Logger
 from logging import getLogger
 
-from os import sep as osSep
-from os import linesep as osLineSep
-
-from antlr4 import CommonTokenStream
-from antlr4 import FileStream
-
-from antlr4.error.ErrorListener import ErrorListener
-
 from pyutmodelv2.PyutClass import PyutClass
 from pyutmodelv2.enumerations.PyutLinkType import PyutLinkType
 
 from ogl.OglClass import OglClass
 from ogl.OglLink import OglLink
-from wx import ICON_ERROR
-from wx import ICON_WARNING
-from wx import MessageBox
-from wx import OK
 
 from pyutplugins.ExternalTypes import OglClasses
 from pyutplugins.ExternalTypes import OglLinks
 
 from pyutplugins.common.LinkMakerMixin import LinkMakerMixin
 
-from pyutplugins.ioplugins.python.PythonParseException import PythonParseException
+from pyutplugins.ioplugins.python.ClassSubset import ClassNames
+from pyutplugins.ioplugins.python.PythonReverseEngineer import PythonReverseEngineer
 
 from pyutplugins.ioplugins.python.visitor.ParserTypes import Associates
 from pyutplugins.ioplugins.python.visitor.ParserTypes import AssociationType
@@ -43,132 +31,69 @@ from pyutplugins.ioplugins.python.visitor.ParserTypes import ParentName
 from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
 from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
 from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
-from pyutplugins.ioplugins.python.visitor.PyutPythonPegClassVisitor import PyutPythonPegClassVisitor
-
-from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PyutPythonPegVisitor
-
-from pyutplugins.ioplugins.python.pythonpegparser.PythonLexer import PythonLexer
-from pyutplugins.ioplugins.python.pythonpegparser.PythonParser import PythonParser
 
 
 OglClassesDict = NewType('OglClassesDict', Dict[Union[PyutClassName, ParentName, ChildName], OglClass])
 
 
-class PythonErrorListener(ErrorListener):
-    #
-    # Provides a default instance of {@link ConsoleErrorListener}.
-    #
-    # INSTANCE = None
-
-    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
-
-        # print("line " + str(line) + ":" + str(column) + " " + msg, file=sys.stderr)
-        eMsg: str = f'{line=}{osLineSep}{column=}{osLineSep}{msg}'
-        raise PythonParseException(eMsg)
-
-
-class ReverseEngineerPythonV3(LinkMakerMixin):
+class ReverseEngineerPythonV3(PythonReverseEngineer, LinkMakerMixin):
+    """
+    The Ogl side of the Python import;  The passes are in PythonReverseEngineer.
+    Create the Ogl classes and links on the UI thread
 
+    Shapes may be created for only some of the classes;  The rest stay in the model and
+    are shown on demand with .showNeighbors
+    """
     def __init__(self):
 
         super().__init__()
 
         self.logger: Logger = getLogger(__name__)
 
-        # self._oglClassesDict: OglClassesDict  = OglClassesDict({})
-        self._oglClasses:     OglClasses      = OglClasses([])
-        self._oglLinks:       OglLinks        = OglLinks([])
-
-        self._cumulativeParents:      Parents       = Parents({})
-        self._cumulativeAssociations: Associations  = Associations({})
-
-    def doPass1(self, directoryName: str, files: List[str], progressCallback: Callable) -> PyutClasses:
-
-        pyutClasses:      PyutClasses = PyutClasses({})
-        currentFileCount: int         = 0
-
-        for fileName in files:
-
-            try:
-                fqFileName: str = f'{directoryName}{osSep}{fileName}'
-                self.logger.info(f'1st pass Processing file: {fqFileName}')
-
-                progressCallback(currentFileCount, f'Pass 1 processing: {directoryName}\n {fileName}')
-
-                tree:    PythonParser.File_inputContext = self._setupPegBasedParser(fqFileName=fqFileName)
-                visitor: PyutPythonPegClassVisitor      = PyutPythonPegClassVisitor()
-
-                visitor.pyutClasses = pyutClasses
-                visitor.visit(tree)
-                pyutClasses = visitor.pyutClasses
-
-            except (ValueError, Exception, PythonParseException) as e:
-                if isinstance(e, PythonParseException):
-                    errorMsg: str = f'{fileName}\n{e}'
-                    self.logger.error(e)
-                    MessageBox(errorMsg, 'Error', OK | ICON_ERROR)
-                    pass
-                else:
-                    self.logger.error(f'Error in {directoryName}/{fileName}')
-                    raise e
-
-            if len(pyutClasses) == 0:
-                MessageBox('No classes processed', 'Warning', OK | ICON_WARNING)
+        self._oglLinks:       OglLinks                 = OglLinks([])
+        self._oglClassesDict: OglClassesDict           = OglClassesDict({})     # Every shape created so far
+        self._oglClassNames:  Dict[int, PyutClassName] = {}                     # id(OglClass) to its class name
+        self._pyutClasses:    PyutClasses              = PyutClasses({})
 
-        return pyutClasses
-
-    def doPass2(self, directoryName: str, files: List[str], pyutClasses: PyutClasses, progressCallback: Callable) -> PyutClasses:
+    @property
+    def oglLinks(self) -> OglLinks:
         """
-        Reverse engineering Python files to OglClass's
-
-        Args:
-            directoryName:  The directory name where the selected files reside
-            files:          A list of files to parse
-            pyutClasses:  The full list of classes scanned during pass 1
-            progressCallback: The method to call to report progress
+        Returns:  The links created by the last .generateLinks
         """
-        currentFileCount: int = 0
-
-        for fileName in files:
-
-            try:
-                fqFileName: str = f'{directoryName}{osSep}{fileName}'
-                self.logger.info(f'2nd pass processing file: {fqFileName}')
-
-                progressCallback(currentFileCount, f'Processing: {directoryName}\n {fileName}')
-
-                tree: PythonParser.File_inputContext = self._setupPegBasedParser(fqFileName=fqFileName)
-                if tree is None:
-                    continue
-
-                visitor: PyutPythonPegVisitor = PyutPythonPegVisitor()
+        return self._oglLinks
 
-                visitor.pyutClasses  = pyutClasses
-                visitor.parents      = self._cumulativeParents
-                visitor.associations = self._cumulativeAssociations
-                visitor.visit(tree)
+    @property
+    def deferredClassNames(self) -> ClassNames:
+        """
+        Returns:  The classes that do not have a shape yet
+        """
+        return ClassNames({className for className in self._pyutClasses if className not in self._oglClassesDict})
 
-                self._cumulativeParents      = visitor.parents
-                self._cumulativeAssociations = visitor.associations
+    def createdShape(self, oglClass: OglClass) -> bool:
+        """
+        Args:
+            oglClass:   A shape on the frame
 
-            except (ValueError, Exception, PythonParseException) as e:
-                if isinstance(e, PythonParseException):
-                    errorMsg: str = f'{fileName}\n{e}'
-                    self.logger.error(e)
-                    MessageBox(errorMsg, 'Error', OK | ICON_ERROR)
-                    pass
-                else:
-                    raise e
-        return pyutClasses
+        Returns:  'True' if this reverse engineer created it
+        """
+        return id(oglClass) in self._oglClassNames
 
-    @property
-    def oglLinks(self) -> OglLinks:
-        return self._oglLinks
+    def generateOglClasses(self, pyutClasses: PyutClasses, classNames: ClassNames | None = None) -> OglClassesDict:
+        """
+        Args:
+            pyutClasses:    The classes keyed like .pyutClasses
+            classNames:     The classes to create shapes for;  None creates them all
 
-    def generateOglClasses(self, pyutClasses: PyutClasses) -> OglClassesDict:
+        Returns:  Only the Ogl classes created by this call;  Classes that already have one are skipped
+        """
+        self._pyutClasses = pyutClasses
+        if classNames is None:
+            classNames = ClassNames(set(pyutClasses.keys()))
 
         oglClassesDict: OglClassesDict = OglClassesDict({})
         for pyutClassName in pyutClasses:
+            if pyutClassName not in classNames or pyutClassName in self._oglClassesDict:
+                continue
             try:
                 pyutClass: PyutClass = pyutClasses[pyutClassName]
                 oglClass:  OglClass  = OglClass(pyutClass)
@@ -178,25 +103,54 @@ class ReverseEngineerPythonV3(LinkMakerMixin):
             except (ValueError, Exception) as e:
                 self.logger.error(f"Error while creating class {pyutClassName},  {e}")
 
+        self._oglClassesDict.update(oglClassesDict)
+        self._oglClassNames.update({id(oglClass): PyutClassName(oglClassName) for oglClassName, oglClass in oglClassesDict.items()})
+
         return oglClassesDict
 
     def generateLinks(self, oglClassesDict: OglClassesDict):
+        """
+        Creates the links that have an end in oglClassesDict;  The other end must have a shape.
+        Links to classes without one are created when they get one
 
+        Args:
+            oglClassesDict:  The Ogl classes from the last .generateOglClasses
+        """
+        self._oglLinks = OglLinks([])
         self._generateInheritanceLinks(oglClassesDict)
         self._generateAssociationLinks(oglClassesDict)
 
+    def showNeighbors(self, oglClasses: OglClasses, hops: int) -> OglClassesDict:
+        """
+        Create the shapes of the classes near the given ones and their links;  The links are in .oglLinks
+
+        Args:
+            oglClasses:     Shapes created by this reverse engineer;  Others are ignored
+            hops:           How many links away to go
+
+        Returns:  The Ogl classes that were created
+        """
+        classNames: List[PyutClassName] = [self._oglClassNames[id(oglClass)] for oglClass in oglClasses if self.createdShape(oglClass=oglClass)]
+        neighbors:  ClassNames          = self.classGraph.neighborhood(classNames=classNames, hops=hops)
+
+        oglClassesDict: OglClassesDict = self.generateOglClasses(pyutClasses=self._pyutClasses, classNames=neighbors)
+        self.generateLinks(oglClassesDict=oglClassesDict)
+
+        return oglClassesDict
+
     def _generateInheritanceLinks(self, oglClassesDict: OglClassesDict):
 
-        parents: Parents = self._cumulativeParents
+        parents: Parents = self.parents
 
         for parentName in parents.keys():
             children: Children = parents[parentName]
 
             for childName in children:
-
+                if self._isNewLink(oglClassesDict=oglClassesDict, sourceName=childName, destinationName=parentName) is False:
+                    continue
                 try:
-                    parentOglClass: OglClass = oglClassesDict[parentName]
-                    childOglClass:  OglClass = oglClassesDict[childName]
+                    parentOglClass: OglClass = self._oglClassesDict[parentName]
+                    childOglClass:  OglClass = self._oglClassesDict[childName]
                     oglLink:        OglLink  = self.createLink(src=childOglClass, dst=parentOglClass, linkType=PyutLinkType.INHERITANCE)
 
                     self._oglLinks.append(oglLink)
@@ -206,21 +160,36 @@ class ReverseEngineerPythonV3(LinkMakerMixin):
 
     def _generateAssociationLinks(self, oglClassesDict: OglClassesDict):
 
-        associations: Associations = self._cumulativeAssociations
+        associations: Associations = self.associations
         for className in associations:
 
             pyutClassName: PyutClassName = cast(PyutClassName, className)
             associates:    Associates    = associations[pyutClassName]
 
             for associate in associates:
-                sourceClass:      OglClass = oglClassesDict[pyutClassName]
-                destinationClass: OglClass = oglClassesDict[associate.associateName]
+                if self._isNewLink(oglClassesDict=oglClassesDict, sourceName=pyutClassName, destinationName=associate.associateName) is False:
+                    continue
+
+                sourceClass:      OglClass = self._oglClassesDict[pyutClassName]
+                destinationClass: OglClass = self._oglClassesDict[associate.associateName]
 
                 pyutLinkType: PyutLinkType = self._toPyutLinkType(associationType=associate.associationType)
                 oglLink: OglLink = self.createLink(src=sourceClass, dst=destinationClass, linkType=pyutLinkType)
 
                 self._oglLinks.append(oglLink)
 
+    def _isNewLink(self, oglClassesDict: OglClassesDict, sourceName: str, destinationName: str) -> bool:
+        """
+        Returns:  'True' if an end is one of the new shapes and neither end is a class without a shape
+        """
+        if sourceName not in oglClassesDict and destinationName not in oglClassesDict:
+            return False
+
+        return self._isDeferred(sourceName) is False and self._isDeferred(destinationName) is False
+
+    def _isDeferred(self, className: str) -> bool:
+        return className in self._pyutClasses and className not in self._oglClassesDict
+
     def _toPyutLinkType(self, associationType: AssociationType) -> PyutLinkType:
 
         match associationType:
@@ -234,32 +203,3 @@ class ReverseEngineerPythonV3(LinkMakerMixin):
                 assert False, f'Unknown association type: {associationType.name}'
 
         return pyutLinkType
-
-    def _setupPegBasedParser(self, fqFileName: str) -> PythonParser.File_inputContext:
-        """
-        May return None if there are syntax errors in the input file
-        In that case the error listener will raise and PythonParseException exception
-        with the appropriate detailed error message
-
-        Args:
-            fqFileName:
-
-        Returns:  Returns a visitor
-        """
-
-        fileStream: FileStream  = FileStream(fqFileName)
-        lexer:      PythonLexer = PythonLexer(fileStream)
-
-        stream: CommonTokenStream = CommonTokenStream(lexer)
-        parser: PythonParser      = PythonParser(stream)
-
-        parser.removeParseListeners()
-        parser.addErrorListener(PythonErrorListener())
-
-        tree: PythonParser.File_inputContext = parser.file_input()
-        if parser.getNumberOfSyntaxErrors() != 0:
-            eMsg: str = f"File {fqFileName} contains {parser.getNumberOfSyntaxErrors()} syntax errors"
-            self.logger.error(eMsg)
-            tree = cast(PythonParser.File_inputContext, None)
-
-        return tree
@@ -0,0 +1,211 @@
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from os import stat as osStat
+
+from collections import OrderedDict
+
+from dataclasses import dataclass
+
+from codeallybasic.SingletonV3 import SingletonV3
+
+from pyutmodelv2.PyutMethod import SourceCode
+
+from pyutplugins.ioplugins.python.PythonAstParser import readModuleSource
+
+FileId = NewType('FileId', int)
+
+#
+# The number of module sources kept in memory after a method's code is loaded;  The
+# methods of one class are usually viewed or exported together
+#
+LOADED_SOURCES_SIZE: int = 16
+
+#
+# Every list method that reads or changes the code loads it first
+#
+LOADING_METHODS: List[str] = [
+    '__len__', '__iter__', '__reversed__', '__getitem__', '__contains__', '__repr__',
+    '__eq__', '__ne__', '__lt__', '__le__', '__gt__', '__ge__',
+    '__add__', '__mul__', '__rmul__', '__iadd__', '__imul__', '__setitem__', '__delitem__',
+    'append', 'extend', 'insert', 'remove', 'pop', 'clear', 'index', 'count', 'copy', 'sort', 'reverse',
+]
+
+
+@dataclass
+class SourceFile:
+    fqFileName:       str = ''
+    size:             int = 0
+    modificationTime: int = 0
+
+
+class SourceFiles(metaclass=SingletonV3):
+    """
+    The modules whose method source code is referenced rather than copied.  A module's
+    source is read the first time that the code of one of its methods is used;  It is
+    shared by the rest of its methods until it ages out
+
+    A module that changed on disk after it was registered gives empty source code
+    rather than the wrong lines
+    """
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+        self._fileIds:       Dict[str, FileId]         = {}
+        self._sourceFiles:   List[SourceFile]          = []
+        self._loadedSources: OrderedDict[FileId, str]  = OrderedDict()
+
+    def register(self, fqFileName: str) -> FileId:
+        """
+        Args:
+            fqFileName:  A module whose method source code will be referenced
+
+        Returns:  The module's id;  It changes when the module changes on disk
+        """
+        fileStat = osStat(fqFileName)
+
+        sourceFile: SourceFile    = SourceFile(fqFileName=fqFileName, size=fileStat.st_size, modificationTime=fileStat.st_mtime_ns)
+        fileId:     FileId | None = self._fileIds.get(fqFileName)
+        if fileId is None or self._sourceFiles[fileId] != sourceFile:
+            fileId = FileId(len(self._sourceFiles))
+
+            self._sourceFiles.append(sourceFile)
+            self._fileIds[fqFileName] = fileId
+
+        return fileId
+
+    def fqFileName(self, fileId: FileId) -> str:
+        return self._sourceFiles[fileId].fqFileName
+
+    def sourceCode(self, fileId: FileId, startOffset: int, endOffset: int) -> SourceCode:
+        """
+        Args:
+            fileId:         The registered module
+            startOffset:    The offset of the method's first character
+            endOffset:      The offset of the method's last character
+
+        Returns:  The method's lines less the 'def' line's indentation and any trailing blank lines
+        """
+        source: str | None = self._loadSource(fileId=fileId)
+        if source is None:
+            return SourceCode([])
+
+        lineStart:   int = source.rfind('\n', 0, startOffset) + 1
+        indentation: str = source[lineStart:startOffset]
+        methodText:  str = source[startOffset:endOffset + 1]
+
+        return SourceCode([line.removeprefix(indentation) for line in methodText.rstrip().splitlines()])
+
+    def clear(self):
+        self._loadedSources.clear()
+
+    def _loadSource(self, fileId: FileId) -> str | None:
+
+        source: str | None = self._loadedSources.get(fileId)
+        if source is not None:
+            self._loadedSources.move_to_end(fileId)
+        else:
+            sourceFile: SourceFile = self._sourceFiles[fileId]
+            try:
+                if self._hasChanged(sourceFile=sourceFile) is True:
+                    self.logger.warning(f'{sourceFile.fqFileName} changed since it was imported;  Its source code is not available')
+                else:
+                    # Read like the parsers do so that the offsets line up
+                    source = readModuleSource(fqFileName=sourceFile.fqFileName)
+
+                    self._loadedSources[fileId] = source
+                    if len(self._loadedSources) > LOADED_SOURCES_SIZE:
+                        self._loadedSources.popitem(last=False)
+            except OSError as e:
+                self.logger.warning(f'{sourceFile.fqFileName} could not be read: {e}')
+
+        return source
+
+    def _hasChanged(self, sourceFile: SourceFile) -> bool:
+        try:
+            fileStat = osStat(sourceFile.fqFileName)
+        except OSError:
+            return True
+
+        return fileStat.st_size != sourceFile.size or fileStat.st_mtime_ns != sourceFile.modificationTime
+
+
+def makeSourceCodeReference(fqFileName: str, startOffset: int, endOffset: int) -> 'SourceCodeReference':
+    """
+    Also rebuilds unpickled references;  They are registered in the process that unpickles them
+    """
+    return SourceCodeReference(fileId=SourceFiles().register(fqFileName=fqFileName), startOffset=startOffset, endOffset=endOffset)
+
+
+class SourceCodeReference(list):
+    """
+    A method's source code as (file id, start offset, end offset) into its module.  The lines
+    are only built the first time the code is used, e.g. when it is viewed or exported.  Until
+    then it costs a few integers rather than a copy of the method
+
+    It is a list, so it can be a PyutMethod's SourceCode
+    """
+    __slots__ = ('_fileId', '_startOffset', '_endOffset', '_loaded')
+
+    def __init__(self, fileId: FileId, startOffset: int, endOffset: int):
+
+        super().__init__()
+
+        self._fileId:      FileId = fileId
+        self._startOffset: int    = startOffset
+        self._endOffset:   int    = endOffset
+        self._loaded:      bool   = False
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def startOffset(self) -> int:
+        return self._startOffset
+
+    @property
+    def endOffset(self) -> int:
+        return self._endOffset
+
+    def __reduce__(self) -> Tuple[Callable, Tuple]:
+        """
+        Pickles the reference rather than the lines unless they are loaded
+        """
+        if self._loaded is True:
+            return list, (list(self),)
+
+        return makeSourceCodeReference, (SourceFiles().fqFileName(fileId=self._fileId), self._startOffset, self._endOffset)
+
+    def _load(self):
+        if self._loaded is False:
+            self._loaded = True
+            list.extend(self, SourceFiles().sourceCode(fileId=self._fileId, startOffset=self._startOffset, endOffset=self._endOffset))
+
+
+def _makeLoadingMethod(methodName: str) -> Callable:
+
+    listMethod: Callable = getattr(list, methodName)
+
+    def loadingMethod(self: SourceCodeReference, *args, **kwargs):
+        self._load()
+        # The list methods read another reference's items directly;  e.g. ==
+        for argument in args:
+            if isinstance(argument, SourceCodeReference):
+                argument._load()
+        return listMethod(self, *args, **kwargs)
+
+    loadingMethod.__name__ = methodName
+
+    return loadingMethod
+
+
+for loadingMethodName in LOADING_METHODS:
+    setattr(SourceCodeReference, loadingMethodName, _makeLoadingMethod(loadingMethodName))
@@ -0,0 +1,422 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pathlib import Path
+
+from pyutmodelv2.PyutClass import PyutClass
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associate
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associates
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ChildName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Children
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ModuleImports
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ParentName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+from pyutplugins.ioplugins.python.visitor.ParserTypes import moduleImportsFactory
+
+#
+# A class name prefixed by its module name, e.g. pyutplugins.ioplugins.python.visitor.ParserTypes.ModuleResult
+#
+QualifiedName  = NewType('QualifiedName',  str)
+QualifiedNames = NewType('QualifiedNames', List[QualifiedName])
+
+NO_QUALIFIED_NAME: QualifiedName = QualifiedName('')
+
+PACKAGE_MODULE_NAME: str = '__init__'
+
+
+@dataclass
+class ModuleSymbols:
+    """
+    What the symbol table knows about a single module
+    """
+    moduleName:  str                 = ''
+    packageName: str                 = ''       # Where the module's relative imports start
+    classNames:  List[PyutClassName] = field(default_factory=list)
+    imports:     ModuleImports       = field(default_factory=moduleImportsFactory)
+
+
+class SymbolTable:
+    """
+    The imported classes keyed by their module qualified names.  The bare class names are
+    an alias index into them;  So classes with the same name in different packages no
+    longer replace each other.
+
+    A module's name comes from its file name and the packages, i.e. the directories with an
+    __init__.py, that contain it.  The names that a module uses are resolved with the
+    module's own classes first and then with its imports
+
+    Modules are added and replaced one at a time;  Nothing is copied when a module is added
+
+    This deliberately has no wx dependencies so that it can be used
+    in worker processes
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._modules:      Dict[str, ModuleSymbols]            = {}
+        self._moduleFiles:  Dict[str, str]                      = {}    # module name to file name
+        self._classes:      Dict[QualifiedName, PyutClass]      = {}
+        self._aliases:      Dict[PyutClassName, QualifiedNames] = {}
+        self._bareClasses:  PyutClasses                         = PyutClasses({})
+        self._packageNames: Dict[Path, str]                     = {}
+
+    @property
+    def bareClasses(self) -> PyutClasses:
+        """
+        Returns:  The classes keyed by their bare names;  A name defined in more than one module
+        is the one from the module added last.  This is the table's own dictionary, not a copy
+        """
+        return self._bareClasses
+
+    @property
+    def pyutClasses(self) -> PyutClasses:
+        """
+        Returns:  Every class keyed by its display name;  See .displayName
+        """
+        return PyutClasses({self.displayName(qualifiedName): pyutClass for qualifiedName, pyutClass in self._classes.items()})
+
+    def moduleName(self, fqFileName: str) -> str:
+        """
+        Args:
+            fqFileName:  A module
+
+        Returns:  The module's dotted name
+        """
+        modulePath:  Path = Path(fqFileName)
+        packageName: str  = self._packageName(directory=modulePath.parent)
+
+        if modulePath.stem == PACKAGE_MODULE_NAME and packageName != '':
+            return packageName
+
+        return self._join(packageName, modulePath.stem)
+
+    def addModule(self, fqFileName: str, pyutClasses: PyutClasses, imports: ModuleImports):
+        """
+        Adds a module or replaces what was known about it
+
+        Args:
+            fqFileName:     The module
+            pyutClasses:    The classes that it defines
+            imports:        What it imports
+        """
+        self.removeModule(fqFileName=fqFileName)
+
+        modulePath:  Path = Path(fqFileName)
+        moduleName:  str  = self._uniqueModuleName(fqFileName=fqFileName)
+        packageName: str  = moduleName if modulePath.stem == PACKAGE_MODULE_NAME else self._packageName(directory=modulePath.parent)
+
+        self._moduleFiles[moduleName] = fqFileName
+        self._modules[fqFileName]     = ModuleSymbols(moduleName=moduleName, packageName=packageName, classNames=list(pyutClasses.keys()), imports=imports)
+
+        for className, pyutClass in pyutClasses.items():
+            qualifiedName: QualifiedName = QualifiedName(self._join(moduleName, className))
+
+            self._classes[qualifiedName] = pyutClass
+            self._aliases.setdefault(className, QualifiedNames([])).append(qualifiedName)
+            self._bareClasses[className] = pyutClass
+
+    def updateClasses(self, fqFileName: str, pyutClasses: PyutClasses):
+        """
+        Replaces a module's classes with new versions of them, e.g. from the import cache or
+        from a worker process;  Classes that the module did not define when it was added are ignored
+
+        Args:
+            fqFileName:     A module that was added
+            pyutClasses:    New versions of its classes
+        """
+        moduleSymbols: ModuleSymbols | None = self._modules.get(fqFileName)
+        if moduleSymbols is None:
+            return
+
+        for className, pyutClass in pyutClasses.items():
+            if className in moduleSymbols.classNames:
+                qualifiedName: QualifiedName = QualifiedName(self._join(moduleSymbols.moduleName, className))
+
+                self._classes[qualifiedName] = pyutClass
+                if self._aliases[className][-1] == qualifiedName:
+                    self._bareClasses[className] = pyutClass
+
+    def removeModule(self, fqFileName: str):
+        """
+        Args:
+            fqFileName:  The module to forget;  Nothing happens if it was not added
+        """
+        moduleSymbols: ModuleSymbols | None = self._modules.pop(fqFileName, None)
+        if moduleSymbols is None:
+            return
+
+        del self._moduleFiles[moduleSymbols.moduleName]
+        for className in moduleSymbols.classNames:
+            qualifiedName: QualifiedName  = QualifiedName(self._join(moduleSymbols.moduleName, className))
+            aliases:       QualifiedNames = self._aliases[className]
+
+            del self._classes[qualifiedName]
+            aliases.remove(qualifiedName)
+            if len(aliases) == 0:
+                del self._aliases[className]
+                del self._bareClasses[className]
+            else:
+                self._bareClasses[className] = self._classes[aliases[-1]]
+
+    def moduleClassNames(self, fqFileName: str) -> List[PyutClassName]:
+        """
+        Returns:  The names of the classes that the module defines;  Empty if it was not added
+        """
+        moduleSymbols: ModuleSymbols | None = self._modules.get(fqFileName)
+        if moduleSymbols is None:
+            return []
+
+        return moduleSymbols.classNames
+
+    def moduleView(self, fqFileName: str, pyutClasses: PyutClasses) -> PyutClasses:
+        """
+        The classes that a module sees by the names that it uses;  Its own classes are always
+        the ones that it defines and imported classes are also known by their 'as' names
+
+        Args:
+            fqFileName:     The module
+            pyutClasses:    The classes by their bare names, usually .bareClasses
+
+        Returns:  pyutClasses itself unless the module sees some names differently;  Then a copy
+        """
+        moduleOverrides: PyutClasses = self.moduleOverrides(fqFileName=fqFileName, pyutClasses=pyutClasses)
+        if len(moduleOverrides) == 0:
+            return pyutClasses
+
+        return PyutClasses(pyutClasses | moduleOverrides)
+
+    def moduleOverrides(self, fqFileName: str, pyutClasses: PyutClasses) -> PyutClasses:
+        """
+        Args:
+            fqFileName:     The module
+            pyutClasses:    The classes by their bare names, usually .bareClasses
+
+        Returns:  Only the names that the module sees differently than pyutClasses;  Usually empty
+        """
+        moduleSymbols: ModuleSymbols | None = self._modules.get(fqFileName)
+        if moduleSymbols is None:
+            return PyutClasses({})
+
+        viewClasses: PyutClasses = PyutClasses({})
+        for localName in moduleSymbols.imports.keys():
+            qualifiedName: QualifiedName = self.resolve(name=localName, fqFileName=fqFileName)
+            if qualifiedName != NO_QUALIFIED_NAME:
+                viewClasses[PyutClassName(localName)] = self._classes[qualifiedName]
+
+        for className in moduleSymbols.classNames:
+            viewClasses[className] = self._classes[QualifiedName(self._join(moduleSymbols.moduleName, className))]
+
+        return PyutClasses({className: pyutClass for className, pyutClass in viewClasses.items() if pyutClasses.get(className) is not pyutClass})
+
+    def qualifiedName(self, fqFileName: str, className: PyutClassName) -> QualifiedName:
+        """
+        Returns:  The qualified name of a class that the module defines
+        """
+        return QualifiedName(self._join(self._modules[fqFileName].moduleName, className))
+
+    def resolve(self, name: str, fqFileName: str) -> QualifiedName:
+        """
+        Finds the class that a name used in a module refers to
+
+        Args:
+            name:       A bare or dotted name, e.g. Parents or ParserTypes.Parents
+            fqFileName: The module that uses the name
+
+        Returns:  The class's qualified name or NO_QUALIFIED_NAME if it is not an imported class
+        """
+        moduleSymbols: ModuleSymbols | None = self._modules.get(fqFileName)
+        if moduleSymbols is None:
+            return self._resolveUnimported(name=name, packageName='')
+
+        if name in moduleSymbols.classNames:
+            return QualifiedName(self._join(moduleSymbols.moduleName, name))
+
+        head, _, rest = name.partition('.')
+        if head in moduleSymbols.imports:
+            target: str = self._absoluteName(moduleSymbols.imports[head], packageName=moduleSymbols.packageName)
+            return self._resolveTarget(target=self._join(target, rest))
+
+        return self._resolveUnimported(name=name, packageName=moduleSymbols.packageName)
+
+    def displayName(self, qualifiedName: QualifiedName) -> PyutClassName:
+        """
+        Returns:  The bare name unless more than one module defines a class with that name;
+        Then the qualified name.  Names that are not in the table are returned as they are
+        """
+        if qualifiedName not in self._classes:
+            return PyutClassName(qualifiedName)
+
+        className: PyutClassName = PyutClassName(qualifiedName.rpartition('.')[2])
+        if len(self._aliases[className]) == 1:
+            return className
+
+        return PyutClassName(qualifiedName)
+
+    def qualifyParents(self, fqFileName: str, parents: Parents) -> Parents:
+        """
+        Args:
+            fqFileName:     The module that the parents came from
+            parents:        The module's parents by the names that it uses
+
+        Returns:  The parents and children by their qualified names;  A parent that is not
+        an imported class keeps its name, e.g. Enum
+        """
+        qualifiedParents: Parents = Parents({})
+        for parentName, children in parents.items():
+            qualifiedParent:   QualifiedName = self.resolve(name=parentName, fqFileName=fqFileName)
+            qualifiedChildren: Children      = qualifiedParents.setdefault(ParentName(qualifiedParent or parentName), [])
+
+            qualifiedChildren.extend([ChildName(self.resolve(name=childName, fqFileName=fqFileName) or childName) for childName in children])
+
+        return qualifiedParents
+
+    def qualifyAssociations(self, fqFileName: str, associations: Associations) -> Associations:
+        """
+        Args:
+            fqFileName:     The module that the associations came from
+            associations:   The module's associations by the names that it uses
+
+        Returns:  The associations by qualified names;  The ones with classes that were not
+        imported are dropped
+        """
+        qualifiedAssociations: Associations = Associations({})
+        for className, associates in associations.items():
+            qualifiedClassName: QualifiedName = self.resolve(name=className, fqFileName=fqFileName)
+            if qualifiedClassName == NO_QUALIFIED_NAME:
+                continue
+
+            qualifiedAssociates: Associates = qualifiedAssociations.setdefault(PyutClassName(qualifiedClassName), Associates([]))
+            for associate in associates:
+                qualifiedAssociate: QualifiedName = self.resolve(name=associate.associateName, fqFileName=fqFileName)
+                if qualifiedAssociate != NO_QUALIFIED_NAME:
+                    qualifiedAssociates.append(Associate(associateName=PyutClassName(qualifiedAssociate), associationType=associate.associationType))
+
+        return qualifiedAssociations
+
+    def _resolveTarget(self, target: str) -> QualifiedName:
+        """
+        Resolves what an import refers to.  Modules that are not in a package have short names;
+        So a target also matches a class whose qualified name is a suffix of it or the other way
+        around.  Last, a package can re-export a class from one of its modules
+
+        Args:
+            target:  An absolute dotted name from an import
+
+        Returns:  The class's qualified name or NO_QUALIFIED_NAME
+        """
+        if target in self._classes:
+            return QualifiedName(target)
+
+        targetModule, _, className = target.rpartition('.')
+        candidates: QualifiedNames = self._aliases.get(PyutClassName(className), QualifiedNames([]))
+
+        matches: List[QualifiedName] = [q for q in candidates if target.endswith(f'.{q}') or q.endswith(f'.{target}')]
+        if len(matches) == 0 and targetModule != '':
+            matches = [q for q in candidates if f'.{q.rpartition(".")[0]}.'.find(f'.{targetModule}.') != -1]
+
+        if len(matches) == 0:
+            return NO_QUALIFIED_NAME
+
+        return matches[-1]
+
+    def _resolveUnimported(self, name: str, packageName: str) -> QualifiedName:
+        """
+        A name that the module neither defines nor imports, e.g. from a 'from x import *'.
+        A bare name prefers the module's own package
+
+        Args:
+            name:           A bare or dotted name
+            packageName:    The package of the module that uses the name
+
+        Returns:  The class's qualified name or NO_QUALIFIED_NAME
+        """
+        if '.' in name:
+            return self._resolveTarget(target=name)
+
+        candidates: QualifiedNames = self._aliases.get(PyutClassName(name), QualifiedNames([]))
+        if len(candidates) == 0:
+            return NO_QUALIFIED_NAME
+
+        samePackage: List[QualifiedName] = [q for q in candidates if q.rpartition('.')[0].rpartition('.')[0] == packageName]
+        if len(samePackage) > 0:
+            return samePackage[-1]
+
+        return candidates[-1]
+
+    def _absoluteName(self, target: str, packageName: str) -> str:
+        """
+        Args:
+            target:         An import target that may be relative, e.g. ..visitor.ParserTypes.Parents
+            packageName:    The package of the importing module
+
+        Returns:  The target without its leading dots;  A target that goes above the
+        top package is relative to it
+        """
+        relativeName: str = target.lstrip('.')
+        levels:       int = len(target) - len(relativeName)
+        if levels == 0:
+            return target
+
+        baseName: str = packageName
+        for _ in range(levels - 1):
+            baseName = baseName.rpartition('.')[0]
+
+        return self._join(baseName, relativeName)
+
+    def _uniqueModuleName(self, fqFileName: str) -> str:
+        """
+        Modules that are not in a package can have the same name;  e.g. two directories with
+        a Utils.py.  The later ones are prefixed with the names of the directories above them until they are unique
+
+        Args:
+            fqFileName:  The module
+
+        Returns:  A module name that no other module has
+        """
+        moduleName:  str  = self.moduleName(fqFileName=fqFileName)
+        directory:   Path = Path(fqFileName).parent
+        packageName: str  = self._packageName(directory=directory)
+        if packageName != '':
+            directory = directory.parents[packageName.count('.')]   # Above the top package
+
+        while moduleName in self._moduleFiles and directory.parent != directory:
+            moduleName = self._join(directory.name, moduleName)
+            directory  = directory.parent
+
+        return moduleName
+
+    def _packageName(self, directory: Path) -> str:
+        """
+        Returns:  The dotted name of the packages that end with directory;  Empty if it is not a package
+        """
+        packageName: str | None = self._packageNames.get(directory)
+        if packageName is None:
+            if (directory / f'{PACKAGE_MODULE_NAME}.py').exists() is True and directory.parent != directory:
+                packageName = self._join(self._packageName(directory=directory.parent), directory.name)
+            else:
+                packageName = ''
+            self._packageNames[directory] = packageName
+
+        return packageName
+
+    def _join(self, prefix: str, name: str) -> str:
+
+        if prefix == '':
+            return name
+        if name == '':
+            return prefix
+
+        return f'{prefix}.{name}'
@@ -22,6 +22,7 @@
 # Developed by : Robert Einhorn
 
 from collections import deque
+from typing import Deque
 from typing import TextIO
 from antlr4 import InputStream, Lexer, Token
 from antlr4.Token import CommonToken
@@ -35,8 +36,8 @@ class PythonLexerBase(Lexer):
         # A stack that keeps track of the indentation lengths
         self._indent_length_stack: Deque[int]
 
-        # A list where tokens are waiting to be loaded into the token stream
-        self._pending_tokens: list[CommonToken]
+        # A queue where tokens are waiting to be loaded into the token stream
+        self._pending_tokens: Deque[CommonToken]
 
         # last pending token types
         self._previous_pending_token_type: int
@@ -61,7 +62,7 @@ class PythonLexerBase(Lexer):
 
     def init(self):
         self._indent_length_stack = deque()
-        self._pending_tokens = []
+        self._pending_tokens = deque()
         self._previous_pending_token_type = 0
         self._last_pending_token_type_from_default_channel = 0
         self._opened = 0
@@ -74,9 +75,13 @@ class PythonLexerBase(Lexer):
         self._ffg_token = None
         self._ERR_TXT = " ERROR: "
 
+    def reset(self):
+        self.init()
+        super().reset()
+
     def nextToken(self) -> CommonToken: # reading the input stream until a return EOF
         self.check_next_token()
-        return self._pending_tokens.pop(0) # add the queued token to the token stream
+        return self._pending_tokens.popleft() # add the queued token to the token stream
 
     def check_next_token(self):
         if self._previous_pending_token_type != Token.EOF:
@@ -284,7 +289,7 @@ class PythonLexerBase(Lexer):
         self.add_pending_token(token)
 
     def add_pending_token(self, token: CommonToken):
-        # save the last pending token type because the _pending_tokens list can be empty by the nextToken()
+        # save the last pending token type because the _pending_tokens queue can be empty by the nextToken()
         self._previous_pending_token_type = token.type
         if token.channel == Token.DEFAULT_CHANNEL:
             self._last_pending_token_type_from_default_channel = self._previous_pending_token_type
@@ -0,0 +1,130 @@
+
+from typing import List
+from typing import NewType
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from ast import Attribute
+from ast import Constant
+from ast import Name
+from ast import Subscript
+from ast import Tuple as AstTuple
+from ast import expr
+from ast import iter_child_nodes
+from ast import parse
+
+from collections import OrderedDict
+
+from codeallybasic.SingletonV3 import SingletonV3
+
+#
+# The names in an annotation in the order that they appear, e.g. Dict[str, 'pkg.Foo'] -> ('Dict', 'str', 'pkg.Foo')
+#
+ReferencedNames = NewType('ReferencedNames', Tuple[str, ...])
+
+NO_REFERENCED_NAMES: ReferencedNames = ReferencedNames(())
+
+#
+# The number of different annotations remembered;  A module usually repeats a few annotations many times
+#
+ANNOTATION_CACHE_SIZE: int = 4096
+
+#
+# The arguments of these are not types
+#
+LITERAL_NAME:   str = 'Literal'
+ANNOTATED_NAME: str = 'Annotated'
+
+
+class AnnotationResolver(metaclass=SingletonV3):
+    """
+    Finds the names that a type annotation refers to.  These are inside subscripts, e.g.
+    Optional[Foo] or list[Foo], unions, e.g. Foo | None, and forward references, e.g. 'Foo'.
+    The arguments of Literal and the metadata of Annotated are skipped
+
+    The names are remembered by annotation text;  So an annotation used by many fields
+    is only parsed once.  Annotations that are not valid expressions refer to nothing
+    """
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+        self._referencedNames: OrderedDict[str, ReferencedNames] = OrderedDict()
+
+    def referencedNames(self, annotation: str) -> ReferencedNames:
+        """
+        Args:
+            annotation:  The annotation's text
+
+        Returns:  The dotted names that it refers to without duplicates
+        """
+        referencedNames: ReferencedNames | None = self._referencedNames.get(annotation)
+        if referencedNames is None:
+            names: List[str] = []
+            self._collectNames(annotation=annotation, names=names)
+
+            referencedNames = ReferencedNames(tuple(names))
+            self._referencedNames[annotation] = referencedNames
+            if len(self._referencedNames) > ANNOTATION_CACHE_SIZE:
+                self._referencedNames.popitem(last=False)
+        else:
+            self._referencedNames.move_to_end(annotation)
+
+        return referencedNames
+
+    def clear(self):
+        self._referencedNames.clear()
+
+    def _collectNames(self, annotation: str, names: List[str]):
+
+        try:
+            expression: expr = parse(annotation.strip(), mode='eval').body
+        except SyntaxError:
+            self.logger.debug(f'Not an expression: {annotation}')
+            return
+
+        self._visitExpression(expression=expression, names=names)
+
+    def _visitExpression(self, expression: expr, names: List[str]):
+
+        if isinstance(expression, (Name, Attribute)):
+            dottedName: str = self._dottedName(expression=expression)
+            if dottedName == '':
+                self._visitChildren(expression=expression, names=names)
+            elif dottedName not in names:
+                names.append(dottedName)
+        elif isinstance(expression, Constant):
+            if isinstance(expression.value, str):       # A forward reference
+                self._collectNames(annotation=expression.value, names=names)
+        elif isinstance(expression, Subscript):
+            self._visitExpression(expression=expression.value, names=names)
+
+            typeName: str = self._dottedName(expression=expression.value).rpartition('.')[2]
+            if typeName == LITERAL_NAME:
+                pass
+            elif typeName == ANNOTATED_NAME and isinstance(expression.slice, AstTuple) and len(expression.slice.elts) > 0:
+                self._visitExpression(expression=expression.slice.elts[0], names=names)
+            else:
+                self._visitExpression(expression=expression.slice, names=names)
+        else:
+            self._visitChildren(expression=expression, names=names)
+
+    def _visitChildren(self, expression: expr, names: List[str]):
+
+        for child in iter_child_nodes(expression):
+            if isinstance(child, expr):
+                self._visitExpression(expression=child, names=names)
+
+    def _dottedName(self, expression: expr) -> str:
+        """
+        Returns:  e.g. 'pkg.Foo' or '' if the expression is not just names and dots
+        """
+        if isinstance(expression, Name):
+            return expression.id
+        if isinstance(expression, Attribute):
+            prefix: str = self._dottedName(expression=expression.value)
+            if prefix != '':
+                return f'{prefix}.{expression.attr}'
+
+        return ''
@@ -0,0 +1,82 @@
+
+from typing import Dict
+from typing import NewType
+from typing import Set
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from pyutmodelv2.PyutMethod import PyutMethod
+from pyutmodelv2.PyutMethod import PyutMethods
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import MethodName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PropertyName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+
+MethodKey     = Tuple[PyutClassName, MethodName]
+PropertyKey   = Tuple[PyutClassName, PropertyName]
+
+MethodIndex   = NewType('MethodIndex',   Dict[MethodKey, PyutMethod])
+PropertyIndex = NewType('PropertyIndex', Set[PropertyKey])
+ClassMethods  = NewType('ClassMethods',  Dict[PyutClassName, PyutMethods])
+
+NO_PYUT_METHOD: PyutMethod = cast(PyutMethod, None)
+
+
+class ClassMemberIndex:
+    """
+    Indexes the methods and properties that a visitor creates by class so that looking
+    one up does not scan the class's method list.
+
+    The methods are kept per class in the order they are visited;  .addMethodsToClasses
+    puts them in the PyutClass method lists when the visit is done
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._methodIndex:   MethodIndex   = MethodIndex({})
+        self._propertyIndex: PropertyIndex = PropertyIndex(set())
+        self._classMethods:  ClassMethods  = ClassMethods({})
+
+    def addMethod(self, className: PyutClassName, pyutMethod: PyutMethod):
+        """
+        When a class defines a method more than once, parameters go to the first one
+
+        Args:
+            className:  The method's class
+            pyutMethod: The new method
+        """
+        self._methodIndex.setdefault((className, MethodName(pyutMethod.name)), pyutMethod)
+        self._classMethods.setdefault(className, PyutMethods([])).append(pyutMethod)
+
+    def findMethod(self, className: PyutClassName, methodName: MethodName) -> PyutMethod:
+        """
+        Args:
+            className:  The method's class
+            methodName: The method name
+
+        Returns:  The method or the sentinel value NO_PYUT_METHOD
+        """
+        return self._methodIndex.get((className, methodName), NO_PYUT_METHOD)
+
+    def addProperty(self, className: PyutClassName, propertyName: PropertyName):
+        self._propertyIndex.add((className, propertyName))
+
+    def isProperty(self, className: PyutClassName, propertyName: PropertyName) -> bool:
+        return (className, propertyName) in self._propertyIndex
+
+    def addMethodsToClasses(self, pyutClasses: PyutClasses):
+        """
+        Appends the indexed methods to their classes;  The methods are only added once
+
+        Args:
+            pyutClasses:  The classes the visitor updated
+        """
+        for className, pyutMethods in self._classMethods.items():
+            pyutClasses[className].methods.extend(pyutMethods)
+
+        self._classMethods = ClassMethods({})
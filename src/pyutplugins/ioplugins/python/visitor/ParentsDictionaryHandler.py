@@ -31,8 +31,17 @@ class ParentsDictionaryHandler:
 
     def createParentChildEntry(self, argumentsCtx: PythonParser.ArgumentsContext, childName: Union[PyutClassName, ChildName]):
 
-        args:       PythonParser.ArgsContext = argumentsCtx.args()
-        parentName: ParentName               = ParentName(args.getText())
+        args: PythonParser.ArgsContext = argumentsCtx.args()
+
+        self.createParentChildEntryFromText(argumentsText=args.getText(), childName=childName)
+
+    def createParentChildEntryFromText(self, argumentsText: str, childName: Union[PyutClassName, ChildName]):
+        """
+        Args:
+            argumentsText:  The class arguments as the PEG parser's getText() returns them;  e.g. 'Base1,metaclass=Meta'
+            childName:      Child class name
+        """
+        parentName: ParentName = ParentName(argumentsText)
         self.logger.debug(f'Class: {childName} is subclass of {parentName}')
 
         multiParents = parentName.split(',')
@@ -7,8 +7,13 @@ from typing import Union
 from enum import Enum
 
 from dataclasses import dataclass
+from dataclasses import field
 
 from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.PyutObject import PyutObject
+
+from pyutplugins.ioplugins.python.ImportErrorReport import ModuleError
+from pyutplugins.ioplugins.python.ImportErrorReport import NO_MODULE_ERROR
 
 VERSION: str = '2.0'
 
@@ -16,16 +21,24 @@ PyutClassName = NewType('PyutClassName', str)
 ParentName    = NewType('ParentName',    str)
 PropertyName  = NewType('PropertyName',  str)
 ChildName     = NewType('ChildName',     str)
+MethodName    = NewType('MethodName',    str)
 
-PropertyNames = NewType('PropertyNames', List[PropertyName])
 PyutClasses   = NewType('PyutClasses',   Dict[PyutClassName, PyutClass])
 
-PropertyMap   = NewType('PropertyMap',    Dict[PyutClassName, PropertyNames])
 Children      = List[Union[PyutClassName, ChildName]]
 Parents       = NewType('Parents',        Dict[ParentName,    Children])
 
 AssociateName = PyutClassName
 
+#
+# The names that a module imports mapped to what they refer to;  Relative imports keep their
+# leading dots, e.g.
+#
+#     from ..visitor.ParserTypes import Parents as P     'P'  -> '..visitor.ParserTypes.Parents'
+#     import os.path                                     'os' -> 'os'
+#
+ModuleImports = NewType('ModuleImports', Dict[str, str])
+
 
 class AssociationType(Enum):
 
@@ -58,3 +71,115 @@ Associates = NewType('Associates', List[Associate])
 #
 #
 Associations = NewType('Associations', Dict[PyutClassName, Associates])
+
+
+def pyutClassesFactory() -> PyutClasses:
+    return PyutClasses({})
+
+
+def parentsFactory() -> Parents:
+    return Parents({})
+
+
+def associationsFactory() -> Associations:
+    return Associations({})
+
+
+def moduleImportsFactory() -> ModuleImports:
+    return ModuleImports({})
+
+
+def addImportFrom(imports: ModuleImports, moduleName: str, name: str, asName: str | None):
+    """
+    Records a 'from moduleName import name as asName'
+
+    Args:
+        imports:    Updated
+        moduleName: The module text including any leading dots
+        name:       The imported name
+        asName:     The local name if it is not name
+    """
+    if moduleName.endswith('.'):
+        imports[asName or name] = f'{moduleName}{name}'
+    else:
+        imports[asName or name] = f'{moduleName}.{name}'
+
+
+def addImport(imports: ModuleImports, dottedName: str, asName: str | None):
+    """
+    Records an 'import dottedName as asName';  Without the 'as', only the first name is bound
+
+    Args:
+        imports:    Updated
+        dottedName: The imported module
+        asName:     The local name
+    """
+    if asName is None:
+        firstName: str = dottedName.split('.')[0]
+        imports[firstName] = firstName
+    else:
+        imports[asName] = dottedName
+
+
+@dataclass
+class ModuleResult:
+    """
+    What the visitors extract from a single module.  It is picklable so
+    that modules can be reverse engineered in worker processes;  A module
+    that failed has a module error instead
+    """
+    fqFileName:   str           = ''
+    pyutClasses:  PyutClasses   = field(default_factory=pyutClassesFactory)
+    parents:      Parents       = field(default_factory=parentsFactory)
+    associations: Associations  = field(default_factory=associationsFactory)
+    imports:      ModuleImports = field(default_factory=moduleImportsFactory)
+    moduleError:  ModuleError   = NO_MODULE_ERROR
+
+    def reassignIds(self):
+        """
+        Model objects get their IDs from a per process generator;  Objects unpickled from
+        a worker process or from the import cache may share IDs with objects created in this
+        process, so re-stamp them from this process's generator
+        """
+        for pyutClass in self.pyutClasses.values():
+
+            pyutObjects: List[PyutObject] = [pyutClass]
+            pyutObjects.extend(pyutClass.fields)
+            for pyutMethod in pyutClass.methods:
+                pyutObjects.append(pyutMethod)
+                pyutObjects.extend(pyutMethod.parameters)
+
+            for pyutObject in pyutObjects:
+                pyutObject.id = next(PyutObject.idGenerator)
+
+
+def mergeParents(parents: Parents, moreParents: Parents):
+    """
+    Merge a module's parents into the cumulative parents;  Children are appended in
+    module order so the result is the same as visiting all the modules with one dictionary.
+    The module's lists are copied so that it is not changed by later merges
+
+    Args:
+        parents:        The cumulative parents;  Updated in place
+        moreParents:    A module's parents
+    """
+    for parentName, children in moreParents.items():
+        if parentName in parents:
+            parents[parentName].extend(children)
+        else:
+            parents[parentName] = list(children)
+
+
+def mergeAssociations(associations: Associations, moreAssociations: Associations):
+    """
+    Same as mergeParents but for associations
+
+    Args:
+        associations:       The cumulative associations;  Updated in place
+        moreAssociations:   A module's associations
+    """
+    for className, associates in moreAssociations.items():
+        if className in associations:
+            associations[className].extend(associates)
+        else:
+            associations[className] = Associates(list(associates))
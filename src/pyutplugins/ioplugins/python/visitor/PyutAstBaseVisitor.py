@@ -0,0 +1,265 @@
+
+from typing import List
+from typing import Union
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from ast import AnnAssign
+from ast import Assign
+from ast import AsyncFor
+from ast import AsyncFunctionDef
+from ast import AsyncWith
+from ast import AugAssign
+from ast import ClassDef
+from ast import For
+from ast import FunctionDef
+from ast import If
+from ast import Match
+from ast import Name
+from ast import NodeVisitor
+from ast import Try
+from ast import While
+from ast import With
+from ast import expr
+
+from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.PyutField import PyutField
+from pyutmodelv2.PyutType import PyutType
+
+from pyutmodelv2.enumerations.PyutVisibility import PyutVisibility
+
+from pyutplugins.ioplugins.python.PythonAstParser import AstModule
+from pyutplugins.ioplugins.python.PythonAstParser import Statements
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PropertyName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+
+NO_CLASS_NAME: PyutClassName = PyutClassName('')
+
+AnyFunctionDef = Union[FunctionDef, AsyncFunctionDef]
+AnyAssignment  = Union[Assign, AnnAssign, AugAssign]
+
+AUGMENTED_OPERATORS: dict = {
+    'Add': '+=', 'Sub': '-=', 'Mult': '*=', 'MatMult': '@=', 'Div': '/=', 'Mod': '%=', 'Pow': '**=',
+    'LShift': '<<=', 'RShift': '>>=', 'BitOr': '|=', 'BitXor': '^=', 'BitAnd': '&=', 'FloorDiv': '//='
+}
+
+
+class PyutAstBaseVisitor(NodeVisitor):
+    """
+    The ast backend's equivalent of the PyutBaseVisitor.  It walks the ast in the
+    same order that the PEG visitors walk the parse tree and keeps track of the
+    enclosing classes and functions so that the subclasses see the same context
+    """
+    def __init__(self):
+
+        self.baseLogger: Logger = getLogger(__name__)
+
+        self._pyutClasses:   PyutClasses         = PyutClasses({})
+        self._astModule:     AstModule           = cast(AstModule, None)
+        self._classDefs:     List[ClassDef]      = []   # The enclosing classes;  innermost is last
+        self._functionDepth: int                 = 0
+
+    def visitModule(self, astModule: AstModule):
+        """
+        The entry point;  Same as the PEG visitor's visit(tree)
+
+        Args:
+            astModule:  The parsed module
+        """
+        self._astModule = astModule
+        self.visit(astModule.tree)
+
+    def visit_ClassDef(self, node: ClassDef):
+
+        self._visitClassDef(node=node)
+
+        self._classDefs.append(node)
+        self._visitNodes(node.decorator_list)
+        self._visitNodes(node.bases)
+        self._visitNodes(node.keywords)
+        self._visitBlock(block=node.body)
+        self._classDefs.pop()
+
+    def visit_FunctionDef(self, node: FunctionDef):
+        self._visitAnyFunctionDef(node=node)
+
+    def visit_AsyncFunctionDef(self, node: AsyncFunctionDef):
+        self._visitAnyFunctionDef(node=node)
+
+    def visit_If(self, node: If):
+
+        self.visit(node.test)
+        self._visitBlock(block=node.body)
+        if len(node.orelse) == 0:
+            pass
+        elif self._astModule.isElif(ifStatement=node.orelse[0]) is True:
+            self.visit(node.orelse[0])
+        else:
+            self._visitBlock(block=node.orelse)
+
+    def visit_For(self, node: For):
+        self._visitLoop(node=node)
+
+    def visit_AsyncFor(self, node: AsyncFor):
+        self._visitLoop(node=node)
+
+    def visit_While(self, node: While):
+
+        self.visit(node.test)
+        self._visitBlock(block=node.body)
+        self._visitBlock(block=node.orelse)
+
+    def visit_With(self, node: With):
+        self._visitWith(node=node)
+
+    def visit_AsyncWith(self, node: AsyncWith):
+        self._visitWith(node=node)
+
+    def visit_Try(self, node: Try):
+
+        self._visitBlock(block=node.body)
+        for handler in node.handlers:
+            if handler.type is not None:
+                self.visit(handler.type)
+            self._visitBlock(block=handler.body)
+        self._visitBlock(block=node.orelse)
+        self._visitBlock(block=node.finalbody)
+
+    def visit_TryStar(self, node):
+        self.visit_Try(node=node)
+
+    def visit_Match(self, node: Match):
+
+        self.visit(node.subject)
+        for case in node.cases:
+            self.visit(case.pattern)
+            if case.guard is not None:
+                self.visit(case.guard)
+            self._visitBlock(block=case.body)
+
+    def _visitClassDef(self, node: ClassDef):
+        """
+        Called before any of the class's children are visited;  Subclasses override this
+
+        Args:
+            node:
+        """
+        pass
+
+    def _visitFunctionDef(self, node: AnyFunctionDef):
+        """
+        Called before any of the function's children are visited;  Subclasses override this
+
+        Args:
+            node:
+        """
+        pass
+
+    def _visitBlock(self, block: Statements):
+        """
+        Visits the statements of a compound statement's block;  Subclasses can override this
+        to look at the block as a whole
+
+        Args:
+            block:
+        """
+        self._visitNodes(block)
+
+    def _visitNodes(self, nodes: List):
+        for node in nodes:
+            self.visit(node)
+
+    def _visitAnyFunctionDef(self, node: AnyFunctionDef):
+
+        self._visitFunctionDef(node=node)
+
+        self._functionDepth += 1
+        self._visitNodes(node.decorator_list)
+        self.visit(node.args)
+        if node.returns is not None:
+            self.visit(node.returns)
+        self._visitBlock(block=node.body)
+        self._functionDepth -= 1
+
+    def _visitLoop(self, node: Union[For, AsyncFor]):
+
+        self.visit(node.target)
+        self.visit(node.iter)
+        self._visitBlock(block=node.body)
+        self._visitBlock(block=node.orelse)
+
+    def _visitWith(self, node: Union[With, AsyncWith]):
+
+        self._visitNodes(node.items)
+        self._visitBlock(block=node.body)
+
+    def _enclosingClassName(self) -> PyutClassName:
+        """
+        Returns:  The innermost class that encloses the current node or NO_CLASS_NAME
+        """
+        if len(self._classDefs) == 0:
+            return NO_CLASS_NAME
+
+        return PyutClassName(self._classDefs[-1].name)
+
+    def _isInsideAFunction(self) -> bool:
+        return self._functionDepth > 0
+
+    def _getText(self, node: expr) -> str:
+        return self._astModule.getText(node=node)
+
+    def _makeFieldForClass(self, className: PyutClassName, propertyName: Union[PropertyName, str], typeStr: str, defaultValue: str):
+        """
+
+        Args:
+            className:
+            propertyName:
+            typeStr:
+            defaultValue:
+        """
+        pyutField: PyutField = PyutField(name=propertyName, type=PyutType(typeStr), visibility=PyutVisibility.PUBLIC, defaultValue=defaultValue)
+        pyutClass: PyutClass = self._pyutClasses[className]
+
+        pyutClass.fields.append(pyutField)
+
+    def _assignmentParts(self, node: AnyAssignment) -> List[str]:
+        """
+        The PEG visitors index into the children of an assignment context;  These are the
+        texts of those children
+
+        e.g.
+            name: str = 'Ozzee'      ->  ['name', ':', 'str', '=', "'Ozzee'"]
+            a = b = 0               ->  ['a', '=', 'b', '=', '0']
+
+        Args:
+            node:
+
+        Returns:  The texts of the PEG assignment context's children
+        """
+        parts: List[str] = []
+        if isinstance(node, AnnAssign):
+            if node.simple == 0 and isinstance(node.target, Name):
+                parts = ['(', self._getText(node.target), ')', ':', self._getText(node.annotation)]
+            else:
+                parts = [self._getText(node.target), ':', self._getText(node.annotation)]
+            if node.value is not None:
+                parts.extend(['=', self._getText(node.value)])
+        elif isinstance(node, Assign):
+            for target in node.targets:
+                parts.extend([self._getText(target), '='])
+            parts.append(self._getText(node.value))
+        else:
+            parts = [self._getText(node.target), AUGMENTED_OPERATORS.get(node.op.__class__.__name__, '='), self._getText(node.value)]
+
+        return parts
+
+    def _isFirstAssignmentPartAToken(self, node: AnyAssignment) -> bool:
+        """
+        Returns:  'True' when the PEG assignment context starts with a NAME or '(' token
+        rather than a target rule context
+        """
+        return isinstance(node, AnnAssign) and isinstance(node.target, Name)
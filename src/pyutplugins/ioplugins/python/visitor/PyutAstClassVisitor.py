@@ -0,0 +1,146 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from ast import AnnAssign
+from ast import Assign
+from ast import AugAssign
+from ast import Call
+from ast import ClassDef
+from ast import Import
+from ast import ImportFrom
+
+from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.enumerations.PyutStereotype import PyutStereotype
+
+from pyutplugins.ioplugins.python.PythonAstParser import NO_ARGUMENTS_TEXT
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ModuleImports
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ParentName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+from pyutplugins.ioplugins.python.visitor.ParserTypes import addImport
+from pyutplugins.ioplugins.python.visitor.ParserTypes import addImportFrom
+
+from pyutplugins.ioplugins.python.visitor.PyutAstBaseVisitor import AnyAssignment
+from pyutplugins.ioplugins.python.visitor.PyutAstBaseVisitor import NO_CLASS_NAME
+from pyutplugins.ioplugins.python.visitor.PyutAstBaseVisitor import PyutAstBaseVisitor
+
+from pyutplugins.ioplugins.python.visitor.PyutBaseVisitor import ENUMERATION_SUPER_CLASS
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegClassVisitor import generateMyCredits
+
+
+class PyutAstClassVisitor(PyutAstBaseVisitor):
+    """
+    The ast backend's version of the PyutPythonPegClassVisitor;  Does a scan
+    to identify all the classes, enumerations and new types and records the
+    module's imports
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.logger: Logger = getLogger(__name__)
+
+        self._imports: ModuleImports = ModuleImports({})
+
+    @property
+    def pyutClasses(self) -> PyutClasses:
+        return self._pyutClasses
+
+    @pyutClasses.setter
+    def pyutClasses(self, pyutClasses: PyutClasses):
+        self._pyutClasses = pyutClasses
+
+    @property
+    def imports(self) -> ModuleImports:
+        return self._imports
+
+    def _visitClassDef(self, node: ClassDef):
+        """
+        Check if we are an enumeration
+
+        Args:
+            node:
+        """
+        className: PyutClassName = PyutClassName(node.name)
+
+        pyutClass: PyutClass = PyutClass(name=className)
+        pyutClass.description = generateMyCredits()
+
+        argumentsText: str = self._astModule.getClassArgumentsText(classDef=node)
+        if argumentsText is not NO_ARGUMENTS_TEXT:
+            parentName: ParentName = ParentName(argumentsText)
+            self.logger.debug(f'Class: {className} is subclass of {parentName}')
+            parents: List[str] = parentName.split(',')
+            for parent in parents:
+                if parent == ENUMERATION_SUPER_CLASS:
+                    pyutClass.stereotype = PyutStereotype.ENUMERATION
+                    break
+
+        self._pyutClasses[className] = pyutClass
+
+    def visit_Call(self, node: Call):
+
+        if self._getText(node.func).startswith('NewType'):
+            argStr: str = self._astModule.getCallArgumentsText(call=node)
+            if argStr is not NO_ARGUMENTS_TEXT:
+
+                typeValueList: List[str] = argStr.split(',')
+                self.logger.debug(f'{typeValueList=}')
+
+                className: PyutClassName = PyutClassName(typeValueList[0].strip("'").strip('"'))
+                self.logger.debug(f'{className}')
+
+                pyutClass: PyutClass = PyutClass(name=className)
+
+                pyutClass.description = generateMyCredits()
+                pyutClass.stereotype  = PyutStereotype.TYPE
+
+                self._pyutClasses[className] = pyutClass
+
+        self.generic_visit(node)
+
+    def visit_Import(self, node: Import):
+
+        if self._isInsideAFunction() is False:
+            for alias in node.names:
+                addImport(imports=self._imports, dottedName=alias.name, asName=alias.asname)
+
+    def visit_ImportFrom(self, node: ImportFrom):
+
+        if self._isInsideAFunction() is False:
+            moduleName: str = f'{"." * node.level}{node.module or ""}'
+            for alias in node.names:
+                if alias.name != '*':
+                    addImportFrom(imports=self._imports, moduleName=moduleName, name=alias.name, asName=alias.asname)
+
+    def visit_Assign(self, node: Assign):
+        self._visitAssignment(node=node)
+
+    def visit_AnnAssign(self, node: AnnAssign):
+        self._visitAssignment(node=node)
+
+    def visit_AugAssign(self, node: AugAssign):
+        self._visitAssignment(node=node)
+
+    def _visitAssignment(self, node: AnyAssignment):
+        """
+        If it is an assignment inside a class marked as an enumeration, then
+        create Fields to emulate the enumeration
+
+        Args:
+            node:
+        """
+        className: PyutClassName = self._enclosingClassName()
+
+        if self._isInsideAFunction() is False and className != NO_CLASS_NAME:
+            pyutClass: PyutClass = self._pyutClasses[className]
+            if pyutClass.stereotype == PyutStereotype.ENUMERATION:
+                parts:        List[str] = self._assignmentParts(node=node)
+                enumName:     str       = parts[0]
+                defaultValue: str       = parts[2]
+                self._makeFieldForClass(className=className, propertyName=enumName, typeStr='', defaultValue=defaultValue)
+
+        self.generic_visit(node)
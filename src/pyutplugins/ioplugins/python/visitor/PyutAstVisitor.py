@@ -0,0 +1,405 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from ast import AnnAssign
+from ast import Assign
+from ast import AugAssign
+from ast import ClassDef
+from ast import arg
+from ast import arguments
+from ast import expr
+
+from pyutmodelv2.PyutMethod import PyutMethod
+from pyutmodelv2.PyutMethod import SourceCode
+from pyutmodelv2.PyutParameter import PyutParameter
+from pyutmodelv2.PyutType import PyutType
+
+from pyutmodelv2.enumerations.PyutVisibility import PyutVisibility
+
+from pyutplugins.ioplugins.python.PythonAstParser import AstModule
+from pyutplugins.ioplugins.python.PythonAstParser import NO_ARGUMENTS_TEXT
+from pyutplugins.ioplugins.python.PythonAstParser import Statements
+from pyutplugins.ioplugins.python.SourceCodeReference import FileId
+from pyutplugins.ioplugins.python.SourceCodeReference import SourceCodeReference
+from pyutplugins.ioplugins.python.SourceCodeReference import SourceFiles
+
+from pyutplugins.ioplugins.python.visitor.AnnotationResolver import AnnotationResolver
+from pyutplugins.ioplugins.python.visitor.ClassMemberIndex import ClassMemberIndex
+from pyutplugins.ioplugins.python.visitor.ParentsDictionaryHandler import ParentsDictionaryHandler
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associate
+from pyutplugins.ioplugins.python.visitor.ParserTypes import AssociateName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associates
+from pyutplugins.ioplugins.python.visitor.ParserTypes import AssociationType
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import MethodName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PropertyName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+
+from pyutplugins.ioplugins.python.visitor.PyutAstBaseVisitor import AnyAssignment
+from pyutplugins.ioplugins.python.visitor.PyutAstBaseVisitor import AnyFunctionDef
+from pyutplugins.ioplugins.python.visitor.PyutAstBaseVisitor import NO_CLASS_NAME
+from pyutplugins.ioplugins.python.visitor.PyutAstBaseVisitor import PyutAstBaseVisitor
+
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import MAGIC_DUNDER_METHODS
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import NO_FILE_ID
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PARAMETER_SELF
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PRIVATE_INDICATOR
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PROPERTY_DECORATOR
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PROTECTED_INDICATOR
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import ParameterNameAndType
+
+
+class PyutAstVisitor(PyutAstBaseVisitor):
+    """
+    The ast backend's version of the PyutPythonPegVisitor.  The PEG visitor is the
+    reference;  This one builds the same methods, parameters, fields, parents and
+    associations
+    """
+    def __init__(self):
+
+        super().__init__()
+        self.logger: Logger = getLogger(__name__)
+
+        self._associations:       Associations       = Associations({})
+        self._classMemberIndex:   ClassMemberIndex   = ClassMemberIndex()
+        self._annotationResolver: AnnotationResolver = AnnotationResolver()
+
+        self._parentsDictionaryHandler: ParentsDictionaryHandler = ParentsDictionaryHandler()
+
+        self._compactSourceCode: bool   = False
+        self._sourceFileId:      FileId = NO_FILE_ID
+
+    def visitModule(self, astModule: AstModule):
+
+        if len(self._pyutClasses) == 0:
+            # Stop the process
+            self.logger.warning(f'No classes to process')
+        else:
+            super().visitModule(astModule)
+            self._classMemberIndex.addMethodsToClasses(pyutClasses=self._pyutClasses)
+
+    @property
+    def pyutClasses(self) -> PyutClasses:
+
+        return self._pyutClasses
+
+    @pyutClasses.setter
+    def pyutClasses(self, pyutClasses: PyutClasses):
+        self._pyutClasses = pyutClasses
+
+    @property
+    def parents(self) -> Parents:
+        return self._parentsDictionaryHandler.parents
+
+    @parents.setter
+    def parents(self, parents: Parents):
+        self._parentsDictionaryHandler.parents = parents
+
+    @property
+    def associations(self) -> Associations:
+        return self._associations
+
+    @associations.setter
+    def associations(self, newValue: Associations):
+        self._associations = newValue
+
+    @property
+    def compactSourceCode(self) -> bool:
+        return self._compactSourceCode
+
+    @compactSourceCode.setter
+    def compactSourceCode(self, newValue: bool):
+        self._compactSourceCode = newValue
+
+    def visit_Assign(self, node: Assign):
+        self._visitAssignment(node=node)
+
+    def visit_AnnAssign(self, node: AnnAssign):
+        self._visitAssignment(node=node)
+
+    def visit_AugAssign(self, node: AugAssign):
+        self._visitAssignment(node=node)
+
+    def _visitClassDef(self, node: ClassDef):
+
+        className: PyutClassName = PyutClassName(node.name)
+
+        self.logger.debug(f'{className=}')
+
+        argumentsText: str = self._astModule.getClassArgumentsText(classDef=node)
+        if argumentsText is not NO_ARGUMENTS_TEXT:
+            self._parentsDictionaryHandler.createParentChildEntryFromText(argumentsText=argumentsText, childName=className)
+
+    def _visitFunctionDef(self, node: AnyFunctionDef):
+
+        className: PyutClassName = self._enclosingClassName()
+
+        if className != NO_CLASS_NAME:
+
+            methodName:    MethodName = MethodName(node.name)
+            returnTypeStr: str        = self._extractReturnType(node=node)
+
+            pyutVisibility: PyutVisibility = PyutVisibility.PUBLIC
+            if methodName in MAGIC_DUNDER_METHODS:
+                pass
+            elif methodName.startswith(PRIVATE_INDICATOR):
+                pyutVisibility = PyutVisibility.PRIVATE
+            elif methodName.startswith(PROTECTED_INDICATOR):
+                pyutVisibility = PyutVisibility.PROTECTED
+
+            if self._isProperty(node=node) is True:
+                self._makePropertyEntry(className=className, methodName=methodName)
+                self._handleField(className=className, propertyName=PropertyName(methodName), typeStr=returnTypeStr)
+            else:
+                self.logger.debug(f'{methodName=}')
+                if className not in self._pyutClasses:
+                    assert False, f'This should not happen missing class name for: {methodName}'
+                else:
+                    pyutMethod: PyutMethod = PyutMethod(name=methodName, returnType=PyutType(returnTypeStr), visibility=pyutVisibility)
+
+                    pyutMethod.sourceCode = self._extractSourceCode(node=node)
+                    self._classMemberIndex.addMethod(className=className, pyutMethod=pyutMethod)
+
+        if self._hasParameters(parameters=node.args) is True:
+            self._visitParameters(className=className, node=node)
+
+    def _visitParameters(self, className: PyutClassName, node: AnyFunctionDef):
+        """
+        Only the parameters that are neither positional only nor keyword only are
+        converted;  Same as the PEG visitor
+
+        Args:
+            className:  The enclosing class name or NO_CLASS_NAME
+            node:       The function whose parameters are not empty
+        """
+        if className == NO_CLASS_NAME:
+            self.logger.warning('This set of parameters belong to a method outside of a class')
+        elif self._isThisAParameterListForAProperty(className=className, propertyName=PropertyName(node.name)) is True:
+            pass
+        else:
+            methodName: MethodName = MethodName(node.name)
+            self.logger.debug(f'{className=} {methodName=}')
+
+            parameters:     arguments  = node.args
+            defaultCount:   int        = min(len(parameters.defaults), len(parameters.args))
+            noDefaultCount: int        = len(parameters.args) - defaultCount
+            noDefaultArgs:  List[arg]  = parameters.args[:noDefaultCount]
+            defaultArgs:    List[arg]  = parameters.args[noDefaultCount:]
+            defaults:       List[expr] = parameters.defaults[len(parameters.defaults) - defaultCount:]
+
+            if len(defaultArgs) != 0:
+                self._handleFullParameters(className=className, methodName=methodName, defaultArgs=defaultArgs, defaults=defaults)
+            elif len(noDefaultArgs) != 0:
+                self._handleTypeAnnotated(className=className, methodName=methodName, noDefaultArgs=noDefaultArgs)
+            elif len(parameters.posonlyargs) != 0:
+                self.logger.error(f'{className}.{methodName} positional only parameters are not supported')
+
+    def _visitAssignment(self, node: AnyAssignment):
+        """
+        Fields of data classes
+
+        Args:
+            node:
+        """
+        className: PyutClassName = self._enclosingClassName()
+
+        if className != NO_CLASS_NAME:
+
+            if self._isThisAnAssignmentForADataClass(classDef=self._classDefs[-1]) is True and self._isInsideAFunction() is False:
+
+                self.logger.debug(f'{className} is a data class')
+                parts: List[str] = self._assignmentParts(node=node)
+                if len(parts) == 5:
+                    self._handleFullField(className=className, parts=parts)
+
+                elif len(parts) == 3:
+                    if self._isFirstAssignmentPartAToken(node=node) is True:
+                        self._handleNoDefaultValueField(className=className, parts=parts)
+                    else:
+                        self._handleNoTypeSpecifiedField(className=className, parts=parts)
+
+        self.generic_visit(node)
+
+    def _extractSourceCode(self, node: AnyFunctionDef) -> SourceCode:
+        """
+        Same as the PEG visitor;  The 'def' line's indentation is removed from every line
+
+        Args:
+            node:
+
+        Returns:  The method's source code less any trailing blank lines or a SourceCodeReference
+        """
+        if self._compactSourceCode is True:
+            if self._sourceFileId is NO_FILE_ID:
+                self._sourceFileId = SourceFiles().register(fqFileName=self._astModule.fqFileName)
+            startOffset, endOffset = self._astModule.getStatementInterval(statements=[node])
+            return cast(SourceCode, SourceCodeReference(fileId=self._sourceFileId, startOffset=startOffset, endOffset=endOffset - 1))
+
+        methodText:  str = self._astModule.getStatementText(statements=[node])
+        indentation: str = self._astModule.getIndentation(statement=node)
+
+        return SourceCode([line.removeprefix(indentation) for line in methodText.rstrip().splitlines()])
+
+    def _hasParameters(self, parameters: arguments) -> bool:
+
+        return (len(parameters.posonlyargs) + len(parameters.args) + len(parameters.kwonlyargs)) != 0 or \
+            parameters.vararg is not None or parameters.kwarg is not None
+
+    def _handleFullParameters(self, className: PyutClassName, methodName: MethodName, defaultArgs: List[arg], defaults: List[expr]):
+        """
+        Handles these type:
+            fullScale(self, intParameter: int = 0, floatParameter: float = 42.0, stringParameter: str = ''):
+        """
+        for parameter, default in zip(defaultArgs, defaults):
+
+            nameAndType: ParameterNameAndType = self._extractParameterNameAndType(parameter=parameter)
+            defaultStr:  str                  = self._getText(default)
+
+            pyutParameter: PyutParameter = PyutParameter(name=nameAndType.name, type=PyutType(nameAndType.typeName), defaultValue=defaultStr)
+            self._updateModelMethodParameter(className=className, methodName=methodName, pyutParameter=pyutParameter)
+
+    def _handleTypeAnnotated(self, className: PyutClassName, methodName: MethodName, noDefaultArgs: List[arg]):
+
+        for parameter in noDefaultArgs:
+            nameAndType: ParameterNameAndType = self._extractParameterNameAndType(parameter=parameter)
+
+            if nameAndType.name == PARAMETER_SELF:
+                continue
+
+            pyutParameter: PyutParameter = PyutParameter(name=nameAndType.name, type=PyutType(nameAndType.typeName))
+
+            self._updateModelMethodParameter(className=className, methodName=methodName, pyutParameter=pyutParameter)
+
+    def _extractParameterNameAndType(self, parameter: arg) -> ParameterNameAndType:
+
+        if parameter.annotation is None:
+            typeStr: str = ''
+        else:
+            typeStr = self._getText(parameter.annotation)
+
+        return ParameterNameAndType(name=parameter.arg, typeName=typeStr)
+
+    def _isProperty(self, node: AnyFunctionDef) -> bool:
+        """
+        Args:
+            node:
+
+        Returns: If its annotated as a property.
+        """
+        ans: bool = False
+        for decorator in node.decorator_list:
+            if self._getText(decorator) == PROPERTY_DECORATOR:
+                ans = True
+                break
+        return ans
+
+    def _extractReturnType(self, node: AnyFunctionDef) -> str:
+
+        if node.returns is None:
+            returnTypeStr: str = ''
+        else:
+            returnTypeStr = self._getText(node.returns)
+
+        return returnTypeStr
+
+    def _updateModelMethodParameter(self, className: PyutClassName, methodName: MethodName, pyutParameter: PyutParameter):
+
+        self.logger.debug(f'{pyutParameter=}')
+
+        pyutMethod: PyutMethod = self._classMemberIndex.findMethod(className=className, methodName=methodName)
+
+        pyutMethod.addParameter(parameter=pyutParameter)
+
+    def _handleField(self, className: PyutClassName, propertyName: PropertyName, typeStr: str):
+        """
+        Turns methods annotated as property into an UML field
+        Also check to see if it needs to make a entry into the association dictionary
+
+        Args:
+            className:
+            propertyName:
+            typeStr:        The property's return type
+        """
+        self.logger.debug(f'{className} property name: {propertyName}')
+
+        self._makeFieldForClass(className, propertyName, typeStr, defaultValue='')
+
+        self._makeAssociationEntry(className, typeStr)
+
+    def _handleNoTypeSpecifiedField(self, className: PyutClassName, parts: List[str]):
+        """
+        From inside a data class
+
+        Args:
+            className:
+            parts:      The assignment parts
+        """
+        self._makeFieldForClass(className=className, propertyName=parts[0], typeStr='', defaultValue=parts[2])
+
+    def _handleNoDefaultValueField(self, className: PyutClassName, parts: List[str]):
+        """
+        From inside a data class
+        no default value
+
+        Args:
+            className:
+            parts:      The assignment parts
+        """
+        self._makeFieldForClass(className=className, propertyName=parts[0], typeStr=parts[2], defaultValue='')
+        self._makeAssociationEntry(className=className, typeStr=parts[2])
+
+    def _handleFullField(self, className: PyutClassName, parts: List[str]):
+        """
+        From within a data class
+        Full annotated and with default value
+
+        Args:
+            className:
+            parts:      The assignment parts
+        """
+        self._makeFieldForClass(className=className, propertyName=parts[0], typeStr=parts[2], defaultValue=parts[4])
+        self._makeAssociationEntry(className=className, typeStr=parts[2])
+
+    def _makeAssociationEntry(self, className, typeStr):
+        """
+        Now check to see if this type refers to any of our known classes;  If so, then create
+        an association entry for each one, e.g. Foo in Optional[Foo], list[Foo] or 'Foo'.  A
+        dotted name, e.g. pkg.Foo, is known by its last name and kept as it is written
+
+        Args:
+            className:
+            typeStr:
+        """
+        for referencedName in self._annotationResolver.referencedNames(annotation=typeStr):
+            if referencedName in self._pyutClasses or referencedName.rpartition('.')[2] in self._pyutClasses:
+
+                associateName: AssociateName = AssociateName(referencedName)
+                associate:     Associate     = Associate(associateName=associateName, associationType=AssociationType.ASSOCIATION)
+
+                if className in self._associations:
+                    self._associations[className].append(associate)
+                else:
+                    self._associations[className] = Associates([associate])
+
+    def _makePropertyEntry(self, className: PyutClassName, methodName: MethodName):
+        """
+        Make an entry into the property index.  This ensures that we do not try to create
+        arguments for an annotated method when we visit the method parameters
+
+        Args:
+            methodName:  A property name which we turn into a field
+        """
+        self._classMemberIndex.addProperty(className=className, propertyName=PropertyName(methodName))
+
+    def _isThisAParameterListForAProperty(self, className: PyutClassName, propertyName: PropertyName) -> bool:
+        return self._classMemberIndex.isProperty(className=className, propertyName=propertyName)
+
+    def _isThisAnAssignmentForADataClass(self, classDef: ClassDef) -> bool:
+
+        return len(classDef.decorator_list) != 0
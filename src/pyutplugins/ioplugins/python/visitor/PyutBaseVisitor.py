@@ -1,11 +1,18 @@
 
+from typing import List
+from typing import Tuple
 from typing import Union
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
-from antlr4 import ParserRuleContext
+from enum import Enum
+
+from dataclasses import dataclass
+
+from antlr4.tree.Tree import ParseTree
+from antlr4.tree.Tree import TerminalNode
 from antlr4.tree.Tree import TerminalNodeImpl
 
 from pyutmodelv2.PyutClass import PyutClass
@@ -22,10 +29,81 @@ from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
 from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
 
 
-NO_CLASS_DEF_CONTEXT: PythonParser.Class_defContext = cast(PythonParser.Class_defContext, None)
+ENUMERATION_SUPER_CLASS: str = 'Enum'
+
+NO_CLASS_DEF_CONTEXT:    PythonParser.Class_defContext    = cast(PythonParser.Class_defContext, None)
+NO_FUNCTION_DEF_CONTEXT: PythonParser.Function_defContext = cast(PythonParser.Function_defContext, None)
+
+
+@dataclass
+class ClassFacts:
+    """
+    What the visitors need to know about a class;  Computed once when the visit enters the class
+    """
+    classDef:      PythonParser.Class_defContext = NO_CLASS_DEF_CONTEXT
+    className:     PyutClassName                 = PyutClassName('')
+    isDataClass:   bool                          = False
+    isEnumeration: bool                          = False
+
+
+NO_CLASS_FACTS: ClassFacts = cast(ClassFacts, None)
+
+
+class TraversalPolicy(Enum):
+    """
+    How much of the parse tree the visitors walk
+    """
+    FULL   = 'Full'
+    PRUNED = 'Pruned'
+
+
+#
+# The only rules that can lead to a class, a function, its parameters, a class level
+# assignment, an import or a block of statements;  The pruned traversal does not descend into any
+# other rule.  Those are expressions, targets, decorators and the simple statements other
+# than assignments.  The visitors read what they need from them with getText()
+#
+TRAVERSED_RULES: Tuple[type, ...] = (
+    PythonParser.StatementsContext,
+    PythonParser.StatementContext,
+    PythonParser.Compound_stmtContext,
+    PythonParser.Simple_stmtsContext,
+    PythonParser.Simple_stmtContext,
+    PythonParser.AssignmentContext,
+    PythonParser.Import_stmtContext,
+    PythonParser.BlockContext,
+    PythonParser.Class_defContext,
+    PythonParser.Class_def_rawContext,
+    PythonParser.Function_defContext,
+    PythonParser.Function_def_rawContext,
+    PythonParser.ParamsContext,
+    PythonParser.ParametersContext,
+    PythonParser.If_stmtContext,
+    PythonParser.Elif_stmtContext,
+    PythonParser.Else_blockContext,
+    PythonParser.While_stmtContext,
+    PythonParser.For_stmtContext,
+    PythonParser.With_stmtContext,
+    PythonParser.Try_stmtContext,
+    PythonParser.Except_blockContext,
+    PythonParser.Except_star_blockContext,
+    PythonParser.Finally_blockContext,
+    PythonParser.Match_stmtContext,
+    PythonParser.Case_blockContext,
+)
 
 
 class PyutBaseVisitor(PythonPegParserVisitor):
+    """
+    Keeps a stack of the enclosing classes and a stack of the enclosing functions so that
+    the visitors do not have to walk up the parse tree to find them.  Subclasses that
+    override .visitClass_def or .visitFunction_def must visit the children by calling
+    the super class method
+
+    By default the traversal is pruned;  See TRAVERSED_RULES.  Inside a function only the
+    compound statements are visited since only they can hold a nested class or function.
+    Function signatures and blocks are still visited
+    """
 
     def __init__(self):
 
@@ -33,6 +111,99 @@ class PyutBaseVisitor(PythonPegParserVisitor):
 
         self._pyutClasses:  PyutClasses = PyutClasses({})
 
+        self._classFacts:   List[ClassFacts]                       = []
+        self._functionDefs: List[PythonParser.Function_defContext] = []
+
+        self._traversalPolicy:  TraversalPolicy = TraversalPolicy.PRUNED
+        self._visitedNodeCount: int             = 0
+
+    @property
+    def traversalPolicy(self) -> TraversalPolicy:
+        return self._traversalPolicy
+
+    @traversalPolicy.setter
+    def traversalPolicy(self, newValue: TraversalPolicy):
+        self._traversalPolicy = newValue
+
+    @property
+    def visitedNodeCount(self) -> int:
+        """
+        Returns:  The number of parse tree nodes, including tokens, visited so far
+        """
+        return self._visitedNodeCount
+
+    def visitChildren(self, node: ParseTree):
+        """
+        Same as ParseTreeVisitor.visitChildren except for the pruning
+
+        Args:
+            node:   The rule whose children to visit
+        """
+        result = self.defaultResult()
+        for child in node.getChildren():
+            if self.shouldVisitNextChild(node, result) is False:
+                break
+            if self._isPruned(child=child) is True:
+                continue
+            self._visitedNodeCount += 1
+            result = self.aggregateResult(result, child.accept(self))
+
+        return result
+
+    def visitClass_def(self, ctx: PythonParser.Class_defContext):
+
+        classFacts: ClassFacts = ClassFacts(classDef=ctx,
+                                            className=self._extractClassName(ctx=ctx),
+                                            isDataClass=self._isDataClass(ctx=ctx),
+                                            isEnumeration=self._isEnumeration(ctx=ctx)
+                                            )
+        self._classFacts.append(classFacts)
+        result = self.visitChildren(ctx)
+        self._classFacts.pop()
+
+        return result
+
+    def visitFunction_def(self, ctx: PythonParser.Function_defContext):
+
+        self._functionDefs.append(ctx)
+        result = self.visitChildren(ctx)
+        self._functionDefs.pop()
+
+        return result
+
+    def _isPruned(self, child: ParseTree) -> bool:
+
+        if self._traversalPolicy == TraversalPolicy.FULL:
+            return False
+        if isinstance(child, TerminalNode) or isinstance(child, TRAVERSED_RULES) is False:
+            return True
+
+        return isinstance(child, PythonParser.Simple_stmtsContext) and self._isInsideAFunction()
+
+    def _enclosingClassFacts(self) -> ClassFacts:
+        """
+        Returns:  The facts about the nearest enclosing class or the sentinel value NO_CLASS_FACTS
+        """
+        if len(self._classFacts) == 0:
+            return NO_CLASS_FACTS
+
+        return self._classFacts[-1]
+
+    def _enclosingFunctionDef(self) -> PythonParser.Function_defContext:
+        """
+        Returns:  The nearest enclosing function definition or the sentinel value NO_FUNCTION_DEF_CONTEXT
+        """
+        if len(self._functionDefs) == 0:
+            return NO_FUNCTION_DEF_CONTEXT
+
+        return self._functionDefs[-1]
+
+    def _isInsideAFunction(self) -> bool:
+        """
+        Returns:  'True' if any of the enclosing definitions is a function;  Even if a class is nearer
+        """
+        return len(self._functionDefs) > 0
+
     def _makeFieldForClass(self, className: PyutClassName, propertyName: Union[PropertyName, str], typeStr: str, defaultValue: str):
         """
 
@@ -74,42 +245,27 @@ class PyutBaseVisitor(PythonPegParserVisitor):
 
         return className
 
-    def _extractMethodContext(self, ctx: ParserRuleContext) -> PythonParser.Function_defContext:
-
-        currentCtx: ParserRuleContext = ctx
-
-        while isinstance(currentCtx, PythonParser.Function_defContext) is False:
-            currentCtx = currentCtx.parentCtx
-            if currentCtx is None:
-                break
-
-        if currentCtx is not None:
-            raw: PythonParser.Function_def_rawContext = cast(PythonParser.Function_defContext, currentCtx).function_def_raw()
-            self.baseLogger.debug(f'Found method: {raw.NAME()}')
-
-        return cast(PythonParser.Function_defContext, currentCtx)
-
-    def _isThisAssignmentInsideAMethod(self, ctx: PythonParser.AssignmentContext) -> bool:
+    def _isDataClass(self, ctx: PythonParser.Class_defContext) -> bool:
 
         ans: bool = False
 
-        currentCtx: ParserRuleContext = self._extractMethodContext(ctx=ctx)
-        if currentCtx is not None:
-            ans = True
-
+        decoratorsCtx: PythonParser.DecoratorsContext = ctx.decorators()
+        if decoratorsCtx is not None:
+            for decorator in decoratorsCtx.children:
+                if isinstance(decorator, PythonParser.Named_expressionContext) is True:
+                    ans = True
+                    break
         return ans
 
-    def _extractClassDefContext(self, ctx: ParserRuleContext) -> PythonParser.Class_defContext:
-        """
-        Args:
-            ctx:
+    def _isEnumeration(self, ctx: PythonParser.Class_defContext) -> bool:
 
-        Returns:  Either a class definition context or the sentinel value NO_CLASS_DEF_CONTEXT
-        """
-        currentCtx: ParserRuleContext = ctx
-        while currentCtx.parentCtx:
-            if isinstance(currentCtx, PythonParser.Class_defContext):
-                return currentCtx
-            currentCtx = currentCtx.parentCtx
+        ans: bool = False
 
-        return NO_CLASS_DEF_CONTEXT
+        argumentsCtx: PythonParser.ArgumentsContext = self._findArgListContext(ctx)
+        if argumentsCtx is not None:
+            args: PythonParser.ArgsContext = argumentsCtx.args()
+            for parent in args.getText().split(','):
+                if parent == ENUMERATION_SUPER_CLASS:
+                    ans = True
+                    break
+        return ans
@@ -1,38 +1,76 @@
 
 from typing import List
+from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
 from os import linesep as osLineSep
 
+from antlr4 import ParserRuleContext
+
+from antlr4.tree.Tree import ParseTree
+from antlr4.tree.Tree import TerminalNode
+
 from pyutmodelv2.PyutClass import PyutClass
 from pyutmodelv2.enumerations.PyutStereotype import PyutStereotype
 
-from pyutplugins.ioplugins.python.visitor.ParserTypes import ParentName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ModuleImports
 from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
 from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
 from pyutplugins.ioplugins.python.visitor.ParserTypes import VERSION
+from pyutplugins.ioplugins.python.visitor.ParserTypes import addImport
+from pyutplugins.ioplugins.python.visitor.ParserTypes import addImportFrom
 
 from pyutplugins.ioplugins.python.pythonpegparser.PythonParser import PythonParser
-from pyutplugins.ioplugins.python.visitor.PyutBaseVisitor import NO_CLASS_DEF_CONTEXT
 
+from pyutplugins.ioplugins.python.visitor.PyutBaseVisitor import ClassFacts
+from pyutplugins.ioplugins.python.visitor.PyutBaseVisitor import NO_CLASS_FACTS
 from pyutplugins.ioplugins.python.visitor.PyutBaseVisitor import PyutBaseVisitor
+from pyutplugins.ioplugins.python.visitor.PyutBaseVisitor import TraversalPolicy
+
+NO_PRIMARY_CONTEXT: PythonParser.PrimaryContext = cast(PythonParser.PrimaryContext, None)
+
+
+def generateMyCredits() -> str:
+    """
+
+    Returns:    Reversed Engineered by the one and only:
+                Gato Malo - Humberto A. Sanchez II
+                Generated: ${DAY} ${MONTH_NAME_FULL} ${YEAR}
+                Version: ${VERSION}
+
+    """
+    from datetime import date
 
+    today: date = date.today()
+    formatDated: str = today.strftime('%d %B %Y')
 
-ENUMERATION_SUPER_CLASS: str = 'Enum'
+    hasiiCredits: str = (
+        f'Reversed Engineered by the one and only:{osLineSep}'
+        f'Gato Malo - Humberto A. Sanchez II{osLineSep}'
+        f'Generated: {formatDated}{osLineSep}'
+        f'Version: {VERSION}'
+    )
+
+    return hasiiCredits
 
 
 class PyutPythonPegClassVisitor(PyutBaseVisitor):
     """
     Simply does a scan to identify all the classes;   A separate
     is needed to do inheritance
+
+    It also records the module's imports so that the names used in the
+    module can be resolved to the class that they refer to
     """
 
     def __init__(self):
         super().__init__()
         self.logger: Logger = getLogger(__name__)
 
+        self._imports: ModuleImports = ModuleImports({})
+
     @property
     def pyutClasses(self) -> PyutClasses:
         return self._pyutClasses
@@ -41,6 +79,10 @@ class PyutPythonPegClassVisitor(PyutBaseVisitor):
     def pyutClasses(self, pyutClasses: PyutClasses):
         self._pyutClasses = pyutClasses
 
+    @property
+    def imports(self) -> ModuleImports:
+        return self._imports
+
     def visitClass_def(self, ctx: PythonParser.Class_defContext):
         """
         Visit a parse tree produced by PythonParser#class_def.
@@ -48,38 +90,87 @@ class PyutPythonPegClassVisitor(PyutBaseVisitor):
         Args:
             ctx:
         """
-        #
-        # Check if we are an enumeration
-        #
         className: PyutClassName = self._extractClassName(ctx=ctx)
 
         pyutClass: PyutClass = PyutClass(name=className)
-        pyutClass.description = self._generateMyCredits()
-
-        argumentsCtx: PythonParser.ArgumentsContext = self._findArgListContext(ctx)
+        pyutClass.description = generateMyCredits()
 
-        if argumentsCtx is not None:
-            args: PythonParser.ArgsContext = argumentsCtx.args()
-            parentName: ParentName = ParentName(args.getText())
-            self.logger.debug(f'Class: {className} is subclass of {parentName}')
-            parents: List[str] = parentName.split(',')
-            for parent in parents:
-                if parent == ENUMERATION_SUPER_CLASS:
-                    pyutClass.stereotype = PyutStereotype.ENUMERATION
-                    break
+        if self._isEnumeration(ctx=ctx) is True:
+            pyutClass.stereotype = PyutStereotype.ENUMERATION
 
         self._pyutClasses[className] = pyutClass
 
-        return self.visitChildren(ctx)
+        return super().visitClass_def(ctx)
+
+    def visitImport_stmt(self, ctx: PythonParser.Import_stmtContext):
+        """
+        Imports inside a function are not recorded;  They do not change what the
+        module's class level names refer to
+
+        Args:
+            ctx:
+        """
+        if self._isInsideAFunction() is False:
+            importName: PythonParser.Import_nameContext = ctx.import_name()
+            if importName is not None:
+                for dottedAsName in importName.dotted_as_names().dotted_as_name():
+                    asName: str | None = None if dottedAsName.NAME() is None else dottedAsName.NAME().getText()
+                    addImport(imports=self._imports, dottedName=dottedAsName.dotted_name().getText(), asName=asName)
+            else:
+                self._recordImportFrom(ctx=ctx.import_from())
+
+        return None
 
     def visitPrimary(self, ctx: PythonParser.PrimaryContext):
+        """
+        Only visited by the full traversal
+
+        Args:
+            ctx:
+        """
+        self._makeNewTypeClass(ctx=ctx)
+
+        return self.visitChildren(ctx)
+
+    def visitAssignment(self, ctx: PythonParser.AssignmentContext):
         """
         If it is an assignment inside a class marked as an enumeration, then
         create Fields to emulate the enumeration
 
+        The pruned traversal does not descend into the assigned value;  So look for
+        a new type there
+
         Args:
             ctx:
         """
+        if self._isInsideAFunction() is False:
+
+            classFacts: ClassFacts = self._enclosingClassFacts()
+            if classFacts is NO_CLASS_FACTS:
+                pass
+            else:
+                if classFacts.isEnumeration is True:
+                    className: PyutClassName = classFacts.className
+                    if len(ctx.children) >= 2:
+                        enumName:     str = ctx.children[0].getText()
+                        defaultValue: str = ctx.children[2].getText()
+                        self.logger.info(f'')
+                        self._makeFieldForClass(className=className, propertyName=enumName, typeStr='', defaultValue=defaultValue)
+
+        if self._traversalPolicy == TraversalPolicy.PRUNED:
+            primaryCtx: PythonParser.PrimaryContext = self._assignedPrimary(ctx=ctx)
+            if primaryCtx is not NO_PRIMARY_CONTEXT:
+                self._makeNewTypeClass(ctx=primaryCtx)
+
+        return self.visitChildren(ctx)
+
+    def _makeNewTypeClass(self, ctx: PythonParser.PrimaryContext):
+        """
+        e.g. PyutClasses = NewType('PyutClasses', Dict[PyutClassName, PyutClass])
+
+        Args:
+            ctx:  A primary that may be a NewType call
+        """
         primaryStr: str = ctx.getText()
         if primaryStr.startswith('NewType'):
             argumentsCtx: PythonParser.ArgumentsContext = ctx.arguments()
@@ -94,56 +185,49 @@ class PyutPythonPegClassVisitor(PyutBaseVisitor):
 
                 pyutClass: PyutClass = PyutClass(name=className)
 
-                pyutClass.description = self._generateMyCredits()
+                pyutClass.description = generateMyCredits()
                 pyutClass.stereotype  = PyutStereotype.TYPE
 
                 self._pyutClasses[className] = pyutClass
 
-        return self.visitChildren(ctx)
-
-    def visitAssignment(self, ctx: PythonParser.AssignmentContext):
+    def _assignedPrimary(self, ctx: PythonParser.AssignmentContext) -> PythonParser.PrimaryContext:
         """
-        Visit a parse tree produced by PythonParser#assignment.
-
         Args:
             ctx:
+
+        Returns:  The primary that is the whole assigned value or NO_PRIMARY_CONTEXT if the value is
+        anything else
         """
-        if self._isThisAssignmentInsideAMethod(ctx=ctx) is False:
+        valueCtx: ParseTree = ctx.children[-1]
+        while isinstance(valueCtx, PythonParser.PrimaryContext) is False and isinstance(valueCtx, ParserRuleContext) and valueCtx.getChildCount() == 1:
+            valueCtx = valueCtx.getChild(0)
 
-            classCtx:  PythonParser.Class_defContext = self._extractClassDefContext(ctx)
-            if classCtx == NO_CLASS_DEF_CONTEXT:
-                pass
-            else:
-                className: PyutClassName                 = self._extractClassName(ctx=classCtx)
-                pyutClass: PyutClass                     = self._pyutClasses[className]
-                if pyutClass.stereotype == PyutStereotype.ENUMERATION:
-                    if len(ctx.children) >= 2:
-                        enumName:     str = ctx.children[0].getText()
-                        defaultValue: str = ctx.children[2].getText()
-                        self.logger.info(f'')
-                        self._makeFieldForClass(className=className, propertyName=enumName, typeStr='', defaultValue=defaultValue)
+        if isinstance(valueCtx, PythonParser.PrimaryContext):
+            return valueCtx
 
-        return self.visitChildren(ctx)
+        return NO_PRIMARY_CONTEXT
 
-    def _generateMyCredits(self) -> str:
+    def _recordImportFrom(self, ctx: PythonParser.Import_fromContext):
         """
+        e.g. from ..visitor.ParserTypes import Parents, Children as Kids
 
-        Returns:    Reversed Engineered by the one and only:
-                    Gato Malo - Humberto A. Sanchez II
-                    Generated: ${DAY} ${MONTH_NAME_FULL} ${YEAR}
-                    Version: ${VERSION}
-
+        Args:
+            ctx:
         """
-        from datetime import date
+        leadingDots: str = ''
+        for child in ctx.children[1:]:
+            if child.getText() in ('.', '...'):
+                leadingDots = f'{leadingDots}{child.getText()}'
+            else:
+                break
 
-        today: date = date.today()
-        formatDated: str = today.strftime('%d %B %Y')
+        dottedName: PythonParser.Dotted_nameContext = ctx.dotted_name()
+        moduleName: str                             = leadingDots if dottedName is None else f'{leadingDots}{dottedName.getText()}'
 
-        hasiiCredits: str = (
-            f'Reversed Engineered by the one and only:{osLineSep}'
-            f'Gato Malo - Humberto A. Sanchez II{osLineSep}'
-            f'Generated: {formatDated}{osLineSep}'
-            f'Version: {VERSION}'
-        )
+        asNames: PythonParser.Import_from_as_namesContext = ctx.import_from_targets().import_from_as_names()
+        if asNames is None:     # from x import *
+            return
 
-        return hasiiCredits
+        for asName in asNames.import_from_as_name():
+            names: List[TerminalNode] = asName.NAME()
+            addImportFrom(imports=self._imports, moduleName=moduleName, name=names[0].getText(), asName=names[1].getText() if len(names) > 1 else None)
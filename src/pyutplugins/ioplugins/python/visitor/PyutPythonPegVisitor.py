@@ -6,25 +6,28 @@ from typing import NewType
 from logging import Logger
 from logging import getLogger
 
-from re import search as regExSearch
-from re import Match as regExMatch
-
 from dataclasses import dataclass
 
+from antlr4 import FileStream
+from antlr4 import InputStream
 from antlr4 import ParserRuleContext
 from antlr4.tree.Tree import TerminalNodeImpl
 
-from pyutmodelv2.PyutClass import PyutClass
 from pyutmodelv2.PyutMethod import PyutMethod
-from pyutmodelv2.PyutMethod import PyutMethods
 from pyutmodelv2.PyutMethod import SourceCode
 from pyutmodelv2.PyutParameter import PyutParameter
 from pyutmodelv2.PyutType import PyutType
 
 from pyutmodelv2.enumerations.PyutVisibility import PyutVisibility
 
+from pyutplugins.ioplugins.python.SourceCodeReference import FileId
+from pyutplugins.ioplugins.python.SourceCodeReference import SourceCodeReference
+from pyutplugins.ioplugins.python.SourceCodeReference import SourceFiles
+
 from pyutplugins.ioplugins.python.pythonpegparser.PythonParser import PythonParser
 
+from pyutplugins.ioplugins.python.visitor.AnnotationResolver import AnnotationResolver
+from pyutplugins.ioplugins.python.visitor.ClassMemberIndex import ClassMemberIndex
 from pyutplugins.ioplugins.python.visitor.ParentsDictionaryHandler import ParentsDictionaryHandler
 from pyutplugins.ioplugins.python.visitor.ParserTypes import Associate
 from pyutplugins.ioplugins.python.visitor.ParserTypes import AssociateName
@@ -32,18 +35,15 @@ from pyutplugins.ioplugins.python.visitor.ParserTypes import Associates
 from pyutplugins.ioplugins.python.visitor.ParserTypes import AssociationType
 from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
 
+from pyutplugins.ioplugins.python.visitor.ParserTypes import MethodName
 from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
-from pyutplugins.ioplugins.python.visitor.ParserTypes import PropertyMap
 from pyutplugins.ioplugins.python.visitor.ParserTypes import PropertyName
-from pyutplugins.ioplugins.python.visitor.ParserTypes import PropertyNames
 from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
 from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
-from pyutplugins.ioplugins.python.visitor.PyutBaseVisitor import NO_CLASS_DEF_CONTEXT
-
+from pyutplugins.ioplugins.python.visitor.PyutBaseVisitor import ClassFacts
+from pyutplugins.ioplugins.python.visitor.PyutBaseVisitor import NO_CLASS_FACTS
 from pyutplugins.ioplugins.python.visitor.PyutBaseVisitor import PyutBaseVisitor
 
-MethodName    = NewType('MethodName', str)
-
 ClassNames    = NewType('ClassNames',  List[PyutClassName])
 MethodNames   = NewType('MethodNames', List[MethodName])
 
@@ -57,6 +57,8 @@ NO_CLASS_NAME: PyutClassName = PyutClassName('')
 
 NO_METHOD_CTX: PythonParser.AssignmentContext = cast(PythonParser.AssignmentContext, None)
 
+NO_FILE_ID: FileId = cast(FileId, None)
+
 # noinspection SpellCheckingInspection
 MAGIC_DUNDER_METHODS:      List[str] = ['__init__', '__str__', '__repr__', '__new__', '__del__',
                                         '__eq__', '__ne__', '__lt__', '__gt__', '__le__', '__ge__'
@@ -97,12 +99,14 @@ class PyutPythonPegVisitor(PyutBaseVisitor):
         super().__init__()
         self.logger: Logger = getLogger(__name__)
 
-        self._associations: Associations = Associations({})
-        self._propertyMap:  PropertyMap  = PropertyMap({})
+        self._associations:       Associations       = Associations({})
+        self._classMemberIndex:   ClassMemberIndex   = ClassMemberIndex()
+        self._annotationResolver: AnnotationResolver = AnnotationResolver()
 
         self._parentsDictionaryHandler: ParentsDictionaryHandler = ParentsDictionaryHandler()
 
-        self._currentCode:               SourceCode    = cast(SourceCode, None)
+        self._compactSourceCode: bool   = False
+        self._sourceFileId:      FileId = NO_FILE_ID
 
     def visit(self, tree: PythonParser.File_inputContext):
 
@@ -111,6 +115,7 @@ class PyutPythonPegVisitor(PyutBaseVisitor):
             self.logger.warning(f'No classes to process')
         else:
             super().visit(tree)
+            self._classMemberIndex.addMethodsToClasses(pyutClasses=self._pyutClasses)
 
     @property
     def pyutClasses(self) -> PyutClasses:
@@ -119,13 +124,6 @@ class PyutPythonPegVisitor(PyutBaseVisitor):
 
     @pyutClasses.setter
     def pyutClasses(self, pyutClasses: PyutClasses):
-
-        classNames = pyutClasses.keys()
-        #
-        # Create property map for each class
-        #
-        for className in classNames:
-            self._propertyMap[className] = PropertyNames([])
         self._pyutClasses = pyutClasses
 
     @property
@@ -144,6 +142,17 @@ class PyutPythonPegVisitor(PyutBaseVisitor):
     def associations(self, newValue: Associations):
         self._associations = newValue
 
+    @property
+    def compactSourceCode(self) -> bool:
+        """
+        Returns:  'True' if the method source code refers to the module file instead of being copied
+        """
+        return self._compactSourceCode
+
+    @compactSourceCode.setter
+    def compactSourceCode(self, newValue: bool):
+        self._compactSourceCode = newValue
+
     def visitClass_def(self, ctx: PythonParser.Class_defContext):
         """
         Visit a parse tree produced by PythonParser#class_def.
@@ -160,7 +169,7 @@ class PyutPythonPegVisitor(PyutBaseVisitor):
         if argumentsCtx is not None:
             self._parentsDictionaryHandler.createParentChildEntry(argumentsCtx, className)
 
-        return self.visitChildren(ctx)
+        return super().visitClass_def(ctx)
 
     def visitFunction_def(self, ctx: PythonParser.Function_defContext):
         """
@@ -169,11 +178,11 @@ class PyutPythonPegVisitor(PyutBaseVisitor):
         Args:
             ctx:
         """
-        classCtx: PythonParser.Class_defContext = self._extractClassDefContext(ctx)
+        classFacts: ClassFacts = self._enclosingClassFacts()
 
-        if classCtx != NO_CLASS_DEF_CONTEXT:
+        if classFacts is not NO_CLASS_FACTS:
 
-            className:     PyutClassName = self._extractClassName(ctx=classCtx)
+            className:     PyutClassName = classFacts.className
             methodName:    MethodName    = self._extractMethodName(ctx=ctx.function_def_raw())
             returnTypeStr: str           = self._extractReturnType(ctx=ctx)
 
@@ -187,23 +196,22 @@ class PyutPythonPegVisitor(PyutBaseVisitor):
 
             if self._isProperty(ctx) is True:
                 self._makePropertyEntry(className=className, methodName=methodName)
-                self._handleField(ctx=ctx)
+                self._handleField(className=className, ctx=ctx)
             else:
                 self.logger.debug(f'{methodName=}')
                 if className not in self._pyutClasses:
                     assert False, f'This should not happen missing class name for: {methodName}'
                 else:
-                    pyutClass:  PyutClass  = self._pyutClasses[className]
                     pyutMethod: PyutMethod = PyutMethod(name=methodName, returnType=PyutType(returnTypeStr), visibility=pyutVisibility)
 
                     try:
-                        pyutMethod.sourceCode = self._currentCode
-                        pyutClass.methods.append(pyutMethod)
+                        pyutMethod.sourceCode = self._extractSourceCode(ctx=ctx)
+                        self._classMemberIndex.addMethod(className=className, pyutMethod=pyutMethod)
                     except Exception as e:
                         self.logger.error(f'{e=}')
                         self.logger.error(f'Missing source code for {className}.{methodName}')
 
-        return self.visitChildren(ctx)
+        return super().visitFunction_def(ctx)
 
     def visitParameters(self, ctx: PythonParser.ParametersContext):
         """
@@ -221,13 +229,13 @@ class PyutPythonPegVisitor(PyutBaseVisitor):
 
         Returns:
         """
-        classCtx:  PythonParser.Class_defContext    = self._extractClassDefContext(ctx)
-        if classCtx == NO_CLASS_DEF_CONTEXT:
+        classFacts: ClassFacts = self._enclosingClassFacts()
+        if classFacts is NO_CLASS_FACTS:
             self.logger.warning('This set of parameters belong to a method outside of a class')
         else:
-            methodCtx: PythonParser.Function_defContext = self._extractMethodContext(ctx)
+            methodCtx: PythonParser.Function_defContext = self._enclosingFunctionDef()
 
-            className:    PyutClassName    = self._extractClassName(ctx=classCtx)
+            className:    PyutClassName    = classFacts.className
             propertyName: PropertyName = self._extractPropertyName(ctx=methodCtx.function_def_raw())
             if self._isThisAParameterListForAProperty(className=className, propertyName=propertyName) is True:
                 pass
@@ -260,13 +268,13 @@ class PyutPythonPegVisitor(PyutBaseVisitor):
         Args:
             ctx:
         """
-        classDefContext: PythonParser.Class_defContext = self._extractClassDefContext(ctx=ctx)
+        classFacts: ClassFacts = self._enclosingClassFacts()
 
-        if classDefContext != NO_CLASS_DEF_CONTEXT:
+        if classFacts is not NO_CLASS_FACTS:
 
-            if self._isThisAnAssignmentForADataClass(ctx=classDefContext) is True and self._isThisAssignmentInsideAMethod(ctx=ctx) is False:
+            if classFacts.isDataClass is True and self._isInsideAFunction() is False:
 
-                className: PyutClassName = self._extractClassName(ctx=classDefContext)
+                className: PyutClassName = classFacts.className
                 self.logger.debug(f'{className} is a data class')
                 if len(ctx.children) == 5:
                     self._handleFullField(className, ctx)
@@ -279,35 +287,6 @@ class PyutPythonPegVisitor(PyutBaseVisitor):
 
         return self.visitChildren(ctx)
 
-    def visitStatements(self, ctx: PythonParser.StatementsContext):
-
-        parentCtx = ctx.parentCtx
-
-        if isinstance(parentCtx, PythonParser.BlockContext):
-            blockContext: PythonParser.BlockContext      = cast(PythonParser.BlockContext, parentCtx)
-            statements:   PythonParser.StatementsContext = blockContext.statements()
-
-            for child in statements.children:
-
-                statement:     PythonParser.StatementContext = cast(PythonParser.StatementContext, child)
-                statementText: str = statement.start.getInputStream().getText(statement.start.start, statement.stop.stop)
-
-                match: regExMatch | None = regExSearch(METHOD_FIND_PATTERN, statementText)
-
-                if match is not None:
-
-                    self.logger.debug(f'statementText:\n{statementText}')
-
-                    splitStatements: List[str] = statementText.split('\n')
-
-                    sourceCode: SourceCode = SourceCode([])
-                    for s in splitStatements:
-                        s = s.removeprefix('    ')
-                        sourceCode.append(f'{s}')
-                    self._currentCode = sourceCode
-
-        return self.visitChildren(ctx)
-
     def _handleFullParameters(self, className: PyutClassName, methodName: MethodName, defaultContexts: List[PythonParser.Param_with_defaultContext]):
         """
         Handles these type:
@@ -391,42 +370,24 @@ class PyutPythonPegVisitor(PyutBaseVisitor):
 
         return ParameterNameAndType(name=paramName, typeName=typeStr)
 
-    def _findModelMethod(self, pyutClass: PyutClass, methodName: MethodName) -> PyutMethod:
-
-        foundMethod: PyutMethod = cast(PyutMethod, None)
-
-        pyutMethods: PyutMethods = pyutClass.methods
-        for method in pyutMethods:
-            pyutMethod: PyutMethod = cast(PyutMethod, method)
-            if pyutMethod.name == methodName:
-                foundMethod = pyutMethod
-                break
-
-        return foundMethod
-
     def _updateModelMethodParameter(self, className: PyutClassName, methodName: MethodName, pyutParameter: PyutParameter):
 
         self.logger.debug(f'{pyutParameter=}')
 
-        pyutClass:  PyutClass  = self._pyutClasses[className]
-        pyutMethod: PyutMethod = self._findModelMethod(methodName=methodName, pyutClass=pyutClass)
+        pyutMethod: PyutMethod = self._classMemberIndex.findMethod(className=className, methodName=methodName)
 
         pyutMethod.addParameter(parameter=pyutParameter)
 
-    def _handleField(self, ctx: PythonParser.Function_defContext):
+    def _handleField(self, className: PyutClassName, ctx: PythonParser.Function_defContext):
         """
         Turns methods annotated as property into an UML field
         Also check to see if it needs to make a entry into the association dictionary
 
         Args:
-            ctx:
+            className:  The enclosing class
+            ctx:        The property's function definition
         """
-
-        classCtx:  PythonParser.Class_defContext    = self._extractClassDefContext(ctx)
-        methodCtx: PythonParser.Function_defContext = self._extractMethodContext(ctx)
-
-        className:    PyutClassName  = self._extractClassName(ctx=classCtx)
-        propertyName: PropertyName   = self._extractPropertyName(ctx=methodCtx.function_def_raw())
+        propertyName: PropertyName   = self._extractPropertyName(ctx=ctx.function_def_raw())
         self.logger.debug(f'{className} property name: {propertyName}')
         #
         # it is really a property name
@@ -482,23 +443,25 @@ class PyutPythonPegVisitor(PyutBaseVisitor):
 
     def _makeAssociationEntry(self, className, typeStr):
         """
-        Now check to see if this type is one of our known classes;  If so, then create
-        an association entry
+        Now check to see if this type refers to any of our known classes;  If so, then create
+        an association entry for each one, e.g. Foo in Optional[Foo], list[Foo] or 'Foo'.  A
+        dotted name, e.g. pkg.Foo, is known by its last name and kept as it is written
 
         Args:
             className:
             typeStr:
 
         """
-        if typeStr in self._pyutClasses:
+        for referencedName in self._annotationResolver.referencedNames(annotation=typeStr):
+            if referencedName in self._pyutClasses or referencedName.rpartition('.')[2] in self._pyutClasses:
 
-            associateName: AssociateName = AssociateName(typeStr)
-            associate:     Associate     = Associate(associateName=associateName, associationType=AssociationType.ASSOCIATION)
+                associateName: AssociateName = AssociateName(referencedName)
+                associate:     Associate     = Associate(associateName=associateName, associationType=AssociationType.ASSOCIATION)
 
-            if className in self._associations:
-                self._associations[className].append(associate)
-            else:
-                self._associations[className] = Associates([associate])
+                if className in self._associations:
+                    self._associations[className].append(associate)
+                else:
+                    self._associations[className] = Associates([associate])
 
     def _extractPropertyName(self, ctx: PythonParser.Function_def_rawContext) -> PropertyName:
 
@@ -512,36 +475,39 @@ class PyutPythonPegVisitor(PyutBaseVisitor):
 
     def _makePropertyEntry(self, className: PyutClassName, methodName: MethodName):
         """
-        Make an entry into the property map.  This ensures that we do not try to create
+        Make an entry into the property index.  This ensures that we do not try to create
         arguments for an annotated method when we visit the method parameters
 
         Args:
             methodName:  A property name which we turn into a field
 
         """
-        self._propertyMap[className].append(cast(PropertyName, methodName))
+        self._classMemberIndex.addProperty(className=className, propertyName=PropertyName(methodName))
 
-    def _isThisAParameterListForAProperty(self, className: PyutClassName, propertyName: PropertyName):
-        ans: bool = False
+    def _isThisAParameterListForAProperty(self, className: PyutClassName, propertyName: PropertyName) -> bool:
+        return self._classMemberIndex.isProperty(className=className, propertyName=propertyName)
 
-        propertyNames: PropertyNames = self._propertyMap[className]
-        if propertyName in propertyNames:
-            ans = True
+    def _extractSourceCode(self, ctx: PythonParser.Function_defContext) -> SourceCode:
+        """
+        The method's first and last tokens delimit its text in the input, decorators included;
+        The 'def' line's indentation is removed from every line
 
-        return ans
+        Args:
+            ctx:
 
-    def _isThisAnAssignmentForADataClass(self, ctx: PythonParser.Class_defContext) -> bool:
+        Returns:  The method's source code less any trailing blank lines;  A SourceCodeReference
+        when the source code is compact and the module was parsed from a file
+        """
+        inputStream: InputStream = ctx.start.getInputStream()
+        if self._compactSourceCode is True and isinstance(inputStream, FileStream):
+            if self._sourceFileId is NO_FILE_ID:
+                self._sourceFileId = SourceFiles().register(fqFileName=inputStream.fileName)
+            return cast(SourceCode, SourceCodeReference(fileId=self._sourceFileId, startOffset=ctx.start.start, endOffset=ctx.stop.stop))
 
-        ans: bool = False
+        methodText:  str = inputStream.getText(ctx.start.start, ctx.stop.stop)
+        indentation: str = inputStream.getText(ctx.start.start - ctx.start.column, ctx.start.start - 1)
 
-        decoratorsCtx: PythonParser.DecoratorsContext = ctx.decorators()
-        if decoratorsCtx is not None:
-            for decorator in decoratorsCtx.children:
-                if isinstance(decorator, PythonParser.Named_expressionContext) is True:
-                    # self.logger.info(f'{decorator.getText()=}')
-                    ans = True
-                    break
-        return ans
+        return SourceCode([line.removeprefix(indentation) for line in methodText.rstrip().splitlines()])
 
     def _extractReturnType(self, ctx: PythonParser.Function_defContext) -> str:
 
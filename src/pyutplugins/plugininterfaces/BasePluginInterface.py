@@ -52,7 +52,14 @@ class BasePluginInterface:
     Implementations set the protected variables during class construction
 
     There should be no implementations of this interface
+
+    Implementations declare their name and formats as class attributes;  The plugin
+    registrations read them without creating a plugin.  A format that the plugin does not
+    support is None
     """
+    PLUGIN_NAME:   PluginName   = PluginName('Implementor must provide the plugin name')
+    INPUT_FORMAT:  InputFormat  = InputFormat(formatName=UNSPECIFIED_NAME, extension=UNSPECIFIED_EXTENSION, description=UNSPECIFIED_DESCRIPTION)
+    OUTPUT_FORMAT: OutputFormat = OutputFormat(formatName=UNSPECIFIED_NAME, extension=UNSPECIFIED_EXTENSION, description=UNSPECIFIED_DESCRIPTION)
 
     def __init__(self, pluginAdapter: IPluginAdapter):
         """
@@ -67,16 +74,16 @@ class BasePluginInterface:
         self._pluginPreferences: PluginPreferences = PluginPreferences()
 
         #
-        # To be set by implementor constructor and read by property
-        self._name:         PluginName = PluginName('Implementor must provide the plugin name')
-        self._author:       str = 'Implementor must provide the plugin author'
-        self._version:      str = 'Implementor must provide the version'
-        self._inputFormat:  InputFormat  = InputFormat(formatName=UNSPECIFIED_NAME, extension=UNSPECIFIED_EXTENSION, description=UNSPECIFIED_DESCRIPTION)
-        self._outputFormat: OutputFormat = OutputFormat(formatName=UNSPECIFIED_NAME, extension=UNSPECIFIED_EXTENSION, description=UNSPECIFIED_DESCRIPTION)
+        # The author and version are set by implementor constructor;  All are read by property
+        self._name:         PluginName   = self.PLUGIN_NAME
+        self._author:       str          = 'Implementor must provide the plugin author'
+        self._version:      str          = 'Implementor must provide the version'
+        self._inputFormat:  InputFormat  = self.INPUT_FORMAT
+        self._outputFormat: OutputFormat = self.OUTPUT_FORMAT
 
         self._oglObjects:         OglObjects       = cast(OglObjects, None)         # The imported Ogl Objects
         self._selectedOglObjects: OglObjects       = cast(OglObjects, None)         # The selected Ogl Objects requested by .executeExport()
-        self._frameInformation:   FrameInformation = cast(FrameInformation, None)   # The frame information requested by .executeExport()
+        self._frameInformation:   FrameInformation = cast(FrameInformation, None)   # The frame information requested by .executeImport(), .executeExport() or .executeTool()
 
         #
         # Plugins that require an active frame or frame(s) should set this value to `True`
@@ -105,7 +112,7 @@ class BasePluginInterface:
     @property
     def name(self) -> PluginName:
         """
-        Implementations set the protected variable at class construction
+        Implementations set the class attribute
 
         Returns:  The plugin name
         """
@@ -132,7 +139,7 @@ class BasePluginInterface:
     @property
     def inputFormat(self) -> InputFormat:
         """
-        Implementations set the protected variable at class construction
+        Implementations set the class attribute
 
         Returns: The input format type; Plugins should return `None` if they do
         not support input operations
@@ -142,7 +149,7 @@ class BasePluginInterface:
     @property
     def outputFormat(self) -> OutputFormat:
         """
-        Implementations set the protected variable at class construction
+        Implementations set the class attribute
 
         Returns: The output format type;  Plugins should return `None` if they do
         not support output operations
@@ -303,19 +310,20 @@ class BasePluginInterface:
 
         return response
 
-    def _layoutUmlClasses(self, oglClasses: OglClasses):
+    def _layoutUmlClasses(self, oglClasses: OglClasses, startY: int = 20):
         """
         Organize by vertical descending sizes
 
         Args:
             oglClasses
+            startY:     Where the first row goes;  Below the existing shapes when adding to a diagram
         """
         # Sort by descending height
         # noinspection PyProtectedMember
         sortedOglClasses = sorted(oglClasses, key=lambda oglClassToSort: oglClassToSort._height, reverse=True)
 
         x: int = 20
-        y: int = 20
+        y: int = startY
 
         incY: int = 0
         for oglClass in sortedOglClasses:
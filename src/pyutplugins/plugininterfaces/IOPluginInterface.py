@@ -52,6 +52,8 @@ class IOPluginInterface(BasePluginInterface, ABC):
             frameInformation:
         """
         assert self.inputFormat is not None, 'Developer error. We cannot import w/o an import format'
+
+        self._frameInformation = frameInformation
         if self._requireActiveFrame is True:
             if frameInformation.frameActive is False:
                 self.displayNoUmlFrame()
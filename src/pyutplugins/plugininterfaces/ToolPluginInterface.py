@@ -17,13 +17,16 @@ class ToolPluginInterface(BasePluginInterface, ABC):
     """
     This interface defines the methods and properties that Pyut Tool
     pyutplugins must implement.
+
+    Implementations also declare MENU_TITLE
     """
+    MENU_TITLE: str = 'Not Set'
 
     def __init__(self, pluginAdapter: IPluginAdapter):
 
         super().__init__(pluginAdapter=pluginAdapter)
 
-        self._menuTitle: str = 'Not Set'
+        self._menuTitle: str = self.MENU_TITLE
 
     def executeTool(self):
         """
@@ -38,6 +41,7 @@ class ToolPluginInterface(BasePluginInterface, ABC):
 
     def _executeTool(self, frameInformation: FrameInformation):
 
+        self._frameInformation = frameInformation
         if frameInformation.frameActive is False:
             self.displayNoUmlFrame()
         else:
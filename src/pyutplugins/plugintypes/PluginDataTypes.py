@@ -1,4 +1,6 @@
 
+from typing import TYPE_CHECKING
+
 from typing import Dict
 from typing import List
 from typing import NewType
@@ -8,11 +10,14 @@ from enum import Enum
 from dataclasses import dataclass
 from dataclasses import field
 
+if TYPE_CHECKING:
+    from pyutplugins.PluginRegistration import PluginRegistration
+
 #
-#  Both of these hold the class plugintypes for the Plugins
+#  Both of these hold the plugin registrations;  A registration creates its plugin and answers its metadata
 #
-PluginList  = NewType('PluginList',  List[type])
-PluginIDMap = NewType('PluginIDMap', Dict[int, type])
+PluginList  = NewType('PluginList',  List['PluginRegistration'])
+PluginIDMap = NewType('PluginIDMap', Dict[int, 'PluginRegistration'])
 
 
 def createPlugIdMapFactory() -> PluginIDMap:
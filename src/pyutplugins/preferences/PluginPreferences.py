@@ -16,6 +16,8 @@ from codeallybasic.PassThroughInterpolation import PassThroughInterpolation
 
 from pyutplugins.ioplugins.mermaid.MermaidDirection import MermaidDirection
 
+from pyutplugins.ioplugins.python.PythonBackend import PythonBackend
+
 from pyutplugins.toolplugins.orthogonal.LayoutAreaSize import LayoutAreaSize
 
 MODULE_NAME:          str = 'pyutplugins'
@@ -26,6 +28,8 @@ DEFAULT_ORTHOGONAL_LAYOUT_SIZE:     LayoutAreaSize   = LayoutAreaSize(512, 512)
 DEFAULT_ORTHOGONAL_LAYOUT_SIZE_STR: str              = DEFAULT_ORTHOGONAL_LAYOUT_SIZE.__str__()
 DEFAULT_MERMAID_DIRECTION:          MermaidDirection = MermaidDirection.RightToLeft
 DEFAULT_MERMAID_DIRECTION_STR:      str              = DEFAULT_MERMAID_DIRECTION.value
+DEFAULT_PYTHON_BACKEND:             PythonBackend    = PythonBackend.PEG
+DEFAULT_PYTHON_BACKEND_STR:         str              = DEFAULT_PYTHON_BACKEND.value
 
 DEFAULT_PDF_OUTPUT_PATH: Path       = Path('/tmp')
 
@@ -71,9 +75,28 @@ SECTION_FEATURES: ValueDescriptions = ValueDescriptions(
     }
 )
 
+SECTION_PYTHON: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('parseOnce'):          ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('parseTreeCacheSize'): ValueDescription(defaultValue='512',   deserializer=SecureConversions.secureInteger),
+        KeyName('streamingParse'):     ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('skimImport'):         ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('compactSourceCode'):  ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('parallelImport'):     ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('importWorkerCount'):  ValueDescription(defaultValue='0',     deserializer=SecureConversions.secureInteger),
+        KeyName('importCache'):        ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('importCacheSize'):    ValueDescription(defaultValue='256',   deserializer=SecureConversions.secureInteger),
+        KeyName('pythonBackend'):      ValueDescription(defaultValue=DEFAULT_PYTHON_BACKEND_STR, enumUseValue=True, deserializer=PythonBackend),
+        KeyName('incrementalImport'):  ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('skipOnError'):        ValueDescription(defaultValue='True',  deserializer=SecureConversions.secureBoolean),
+        KeyName('neighborhoodHops'):   ValueDescription(defaultValue='1',     deserializer=SecureConversions.secureInteger),
+    }
+)
+
 PLUGIN_SECTIONS: Sections = Sections(
     {
         SectionName('PyutPlugins'): SECTION_PYUT_PLUGINS,
+        SectionName('Python'):      SECTION_PYTHON,
         SectionName('Pdf'):         SECTION_PDF,
         SectionName('Features'):    SECTION_FEATURES,
         SectionName('Debug'):       SECTION_DEBUG,
@@ -16,6 +16,8 @@ from pyutplugins.ExternalTypes import OglObjects
 
 
 class ToolArrangeLinks(ToolPluginInterface):
+    PLUGIN_NAME: PluginName = PluginName('Arrange Links')
+    MENU_TITLE:  str        = 'Arrange links'
 
     def __init__(self, pluginAdapter: IPluginAdapter):
 
@@ -23,12 +25,9 @@ class ToolArrangeLinks(ToolPluginInterface):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name      = PluginName('Arrange Links')
         self._author    = 'Cedric Dutoit <dutoitc@shimbawa.ch>'
         self._version   = '1.1'
 
-        self._menuTitle = 'Arrange links'
-
         self._requireSelection = False
 
     def setOptions(self) -> bool:
@@ -40,18 +40,17 @@ NameDictionary = NewType('NameDictionary', Dict[str, OglClass])
 
 
 class ToolForceDirectedLayout(ToolPluginInterface):
+    PLUGIN_NAME: PluginName = PluginName('Force Directed Layout')
+    MENU_TITLE:  str        = 'Force Directed Layout'
 
     def __init__(self, pluginAdapter: IPluginAdapter):
         super().__init__(pluginAdapter=pluginAdapter)
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name      = PluginName('Force Directed Layout')
         self._author    = 'Humberto A. Sanchez II'
         self._version   = '1.0'
 
-        self._menuTitle = 'Force Directed Layout'
-
         self._fdl: ForceDirectedLayout = ForceDirectedLayout()
         self._layoutProgressDialog: ProgressDialog = NO_PROGRESS_DIALOG
 
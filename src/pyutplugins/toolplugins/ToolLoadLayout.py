@@ -36,6 +36,9 @@ PLUGIN_DESCRIPTION: PluginDescription = PluginDescription('Load Diagram Layout')
 
 
 class ToolLoadLayout(ToolPluginInterface):
+    PLUGIN_NAME:  PluginName  = PluginName('Load Layout')
+    MENU_TITLE:   str         = 'Load Layout'
+    INPUT_FORMAT: InputFormat = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
 
     def __init__(self, pluginAdapter: IPluginAdapter):
 
@@ -43,12 +46,8 @@ class ToolLoadLayout(ToolPluginInterface):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name      = PluginName('Save Layout')
         self._author    = 'Humberto A. Sanchez II'
         self._version   = '2.0'
-        self._menuTitle = 'Load Layout'
-
-        self._inputFormat = InputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
 
         self._inputFileName: str = ''
 
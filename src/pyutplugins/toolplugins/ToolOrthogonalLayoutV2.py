@@ -41,6 +41,9 @@ class ToolOrthogonalLayoutV2(ToolPluginInterface):
     Version 2 of this plugin.  Does not depend on python-tulip.  Instead, it depends on a homegrown
     version
     """
+    PLUGIN_NAME: PluginName = PluginName('Orthogonal Layout')
+    MENU_TITLE:  str        = 'Orthogonal Layout V2'
+
     def __init__(self, pluginAdapter: IPluginAdapter):
 
         super().__init__(pluginAdapter)
@@ -50,12 +53,9 @@ class ToolOrthogonalLayoutV2(ToolPluginInterface):
         self._layoutWidth:  int = 0
         self._layoutHeight: int = 0
 
-        self._name      = PluginName('Orthogonal Layout')
         self._author    = 'Humberto A. Sanchez II'
         self._version   = '2.1'
 
-        self._menuTitle = 'Orthogonal Layout V2'
-
         self._requireSelection = True
 
     def setOptions(self) -> bool:
@@ -35,6 +35,8 @@ PLUGIN_DESCRIPTION: PluginDescription = PluginDescription('Save Configuration')
 
 
 class ToolOrthogonalRouting(ToolPluginInterface):
+    PLUGIN_NAME: PluginName = PluginName('Orthogonal Routing')
+    MENU_TITLE:  str        = 'Orthogonal Routing'
 
     def __init__(self, pluginAdapter: IPluginAdapter):
 
@@ -42,12 +44,9 @@ class ToolOrthogonalRouting(ToolPluginInterface):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name      = PluginName('Orthogonal Routing')
         self._author    = 'Humberto A. Sanchez II'
         self._version   = '1.0'
 
-        self._menuTitle = 'Orthogonal Routing'
-
     def setOptions(self) -> bool:
         with DlgOrthoRoutingConfig(NO_PARENT_WINDOW, pluginAdapter=self._pluginAdapter) as dlg:
             if dlg.ShowModal() == OK:
@@ -40,6 +40,9 @@ PLUGIN_DESCRIPTION: PluginDescription = PluginDescription('Save Diagram Layout')
 
 
 class ToolSaveLayout(ToolPluginInterface):
+    PLUGIN_NAME:   PluginName   = PluginName('Save Layout')
+    MENU_TITLE:    str          = 'Save Layout'
+    OUTPUT_FORMAT: OutputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
 
     # noinspection SpellCheckingInspection
     def __init__(self, pluginAdapter: IPluginAdapter):
@@ -48,14 +51,9 @@ class ToolSaveLayout(ToolPluginInterface):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name      = PluginName('Save Layout')
         self._author    = 'Humberto A. Sanchez II'
         self._version   = '2.0'
 
-        self._menuTitle = 'Save Layout'
-
-        self._outputFormat = OutputFormat(formatName=FORMAT_NAME, extension=PLUGIN_EXTENSION, description=PLUGIN_DESCRIPTION)
-
         self._outputFileName: str = ''
 
     def setOptions(self) -> bool:
@@ -0,0 +1,101 @@
+
+from typing import TYPE_CHECKING
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from wx import ICON_INFORMATION
+from wx import OK
+
+from wx import MessageBox
+
+from ogl.OglClass import OglClass
+
+from pyutplugins.ExternalTypes import OglClasses
+
+from pyutplugins.IPluginAdapter import IPluginAdapter
+
+from pyutplugins.plugininterfaces.ToolPluginInterface import ToolPluginInterface
+
+from pyutplugins.plugintypes.PluginDataTypes import PluginName
+
+from pyutplugins.ioplugins.python.DeferredClasses import DeferredClasses
+from pyutplugins.ioplugins.python.DeferredClasses import FrameName
+
+if TYPE_CHECKING:
+    # Importing the Python parser is slow;  Only an import needs it
+    from pyutplugins.ioplugins.python.ReverseEngineerPythonV3 import OglClassesDict
+    from pyutplugins.ioplugins.python.ReverseEngineerPythonV3 import ReverseEngineerPythonV3
+
+NEIGHBORS_GAP: int = 40
+
+
+class ToolShowNeighbors(ToolPluginInterface):
+    """
+    Shows the classes near the selected ones that a Python import did not create shapes for;
+    See the import dialog's 'Show' options.  How near is the 'Neighborhood Hops' preference.
+
+    Only the last import into the current frame is used;  Selected shapes that it did not
+    create are ignored
+    """
+    PLUGIN_NAME: PluginName = PluginName('Show Neighbors')
+    MENU_TITLE:  str        = 'Show Neighbors'
+
+    def __init__(self, pluginAdapter: IPluginAdapter):
+
+        super().__init__(pluginAdapter)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._author    = 'Humberto A. Sanchez II'
+        self._version   = '1.0'
+
+        self._requireSelection = True
+
+    def setOptions(self) -> bool:
+        """
+        The frame is not known yet;  See .doAction
+
+        Returns:  'True'
+        """
+        return True
+
+    def doAction(self):
+
+        frameName:       FrameName       = FrameName(self._frameInformation.diagramTitle)
+        deferredClasses: DeferredClasses = DeferredClasses()
+        if deferredClasses.hasDeferredClasses(frameName=frameName) is False:
+            MessageBox('Every imported class is already shown', 'Show Neighbors', OK | ICON_INFORMATION)
+            return
+
+        reverseEngineer: ReverseEngineerPythonV3 = deferredClasses.reverseEngineer(frameName=frameName)
+
+        selectedClasses: OglClasses = OglClasses([oglObject for oglObject in self._selectedOglObjects
+                                                  if isinstance(oglObject, OglClass) and reverseEngineer.createdShape(oglClass=oglObject)])
+        if len(selectedClasses) == 0:
+            self.logger.info('The last import into this frame did not create any of the selected classes')
+            return
+
+        oglClassesDict: OglClassesDict = reverseEngineer.showNeighbors(oglClasses=selectedClasses, hops=self._pluginPreferences.neighborhoodHops)
+
+        self.logger.info(f'Showing {len(oglClassesDict)} classes;  {len(reverseEngineer.deferredClassNames)} are still not shown')
+        if len(oglClassesDict) == 0:
+            return
+
+        self._layoutUmlClasses(oglClasses=OglClasses(list(oglClassesDict.values())), startY=self._bottom(oglClasses=selectedClasses) + NEIGHBORS_GAP)
+        self._layoutLinks(oglLinks=reverseEngineer.oglLinks)
+
+        self._pluginAdapter.indicatePluginModifiedProject()
+
+    def _bottom(self, oglClasses: OglClasses) -> int:
+        """
+        Returns:  The lowest y coordinate of the classes
+        """
+        bottoms: List[int] = [0]
+        for oglClass in oglClasses:
+            x, y          = oglClass.GetPosition()
+            width, height = oglClass.GetSize()
+            bottoms.append(int(y + height))
+
+        return max(bottoms)
@@ -23,18 +23,18 @@ class ToolSugiyama(ToolPluginInterface):
     """
     ToSugiyama : Automatic layout algorithm based on Sugiyama levels.
     """
+    PLUGIN_NAME: PluginName = PluginName('Sugiyama Automatic Layout')
+    MENU_TITLE:  str        = 'Sugiyama Automatic Layout'
+
     def __init__(self, pluginAdapter: IPluginAdapter):
 
         super().__init__(pluginAdapter)
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name      = PluginName('Sugiyama Automatic Layout')
         self._author    = 'Nicolas Dubois <nicdub@gmx.ch>'
         self._version   = '1.1'
 
-        self._menuTitle = 'Sugiyama Automatic Layout'
-
         #
         # TODO Move to separate class
         #
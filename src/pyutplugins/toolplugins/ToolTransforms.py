@@ -24,18 +24,18 @@ class ToolTransforms(ToolPluginInterface):
 
     TODO: Explore parameterizing x transform and adding other transforms
     """
+    PLUGIN_NAME: PluginName = PluginName('Transformations')
+    MENU_TITLE:  str        = 'Transformation X/Y'
+
     def __init__(self, pluginAdapter: IPluginAdapter):
 
         super().__init__(pluginAdapter=pluginAdapter)
 
         self.logger: Logger = getLogger(__name__)
 
-        self._name      = PluginName('Transformations')
         self._author    = 'C.Dutoit/Humberto A. Sanchez II'
         self._version   = '1.5'
 
-        self._menuTitle = 'Transformation X/Y'
-
         self._transformX: int = 0
         self._transformY: int = 0
 
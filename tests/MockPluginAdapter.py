@@ -92,6 +92,13 @@ class MockPluginAdapter(IPluginAdapter):
     def addShape(self, shape: OglObjectType):
         pass
 
+    @property
+    def canDeleteShapes(self) -> bool:
+        return True
+
+    def deleteShape(self, shape: OglObjectType):
+        pass
+
     def loadProject(self, pluginProject: PluginProject):
         pass
 
@@ -0,0 +1,101 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from json import loads as jsonLoads
+
+from subprocess import run as subProcessRun
+
+from sys import executable
+
+DEFAULT_REPETITIONS: int = 5
+DEFAULT_MODULE_NAME: str = 'pyutplugins.PluginManager'
+
+#
+# Importing any of these at startup is a regression
+#
+DEFERRED_MODULE_NAMES: List[str] = [
+    'pyutplugins.ioplugins.python.pythonpegparser.PythonParser',
+    'pyutplugins.ioplugins.python.pythonpegparser.PythonLexer',
+    'networkx',
+    'pyforcedirectedlayout',
+    'pyimage2pdf',
+]
+
+IMPORT_SCRIPT: str = (
+    'from importlib import import_module\n'
+    'from json import dumps\n'
+    'from sys import modules\n'
+    'from time import perf_counter\n'
+    'startTime = perf_counter()\n'
+    'import_module({moduleName!r})\n'
+    'elapsedTime = perf_counter() - startTime\n'
+    'print(dumps({{"elapsedTime": elapsedTime, "loadedModules": [name for name in {deferredModuleNames!r} if name in modules]}}))\n'
+)
+
+
+@dataclass
+class ImportTime:
+    elapsedTime:   float     = 0.0
+    loadedModules: List[str] = field(default_factory=list)
+
+
+class ImportTimeBenchmark:
+    """
+    Measures how long importing a module takes in a fresh interpreter;  By default the
+    module that Pyut imports at startup.  Also reports the deferred modules that the
+    import pulled in anyway.  The best repetition is reported
+
+        python -m tests.benchmarks.ImportTimeBenchmark --repetitions 10
+    """
+    def __init__(self, moduleName: str = DEFAULT_MODULE_NAME, repetitions: int = DEFAULT_REPETITIONS):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._moduleName:  str = moduleName
+        self._repetitions: int = repetitions
+
+    def run(self) -> ImportTime:
+        """
+        Returns:  The fastest repetition
+        """
+        best: ImportTime = ImportTime(elapsedTime=float('inf'))
+        for repetition in range(self._repetitions):
+            importTime: ImportTime = self._importInFreshInterpreter()
+            self.logger.debug(f'Repetition {repetition}: {importTime.elapsedTime:.3f} seconds')
+            if importTime.elapsedTime < best.elapsedTime:
+                best = importTime
+
+        return best
+
+    def _importInFreshInterpreter(self) -> ImportTime:
+
+        script: str = IMPORT_SCRIPT.format(moduleName=self._moduleName, deferredModuleNames=DEFERRED_MODULE_NAMES)
+
+        completedProcess = subProcessRun([executable, '-c', script], capture_output=True, text=True, check=True)
+        result           = jsonLoads(completedProcess.stdout.splitlines()[-1])
+
+        return ImportTime(elapsedTime=result['elapsedTime'], loadedModules=result['loadedModules'])
+
+
+if __name__ == '__main__':
+
+    parser: ArgumentParser = ArgumentParser(description='Measures the time it takes to import a module')
+    parser.add_argument('--module',      default=DEFAULT_MODULE_NAME,            help='The module to import')
+    parser.add_argument('--repetitions', type=int, default=DEFAULT_REPETITIONS, help='The number of fresh interpreters to import it in')
+
+    arguments:  Namespace            = parser.parse_args()
+    benchmark:  ImportTimeBenchmark  = ImportTimeBenchmark(moduleName=arguments.module, repetitions=arguments.repetitions)
+    importTime: ImportTime           = benchmark.run()
+
+    print(f'{arguments.module} imported in {importTime.elapsedTime:.3f} seconds')
+    for moduleName in importTime.loadedModules:
+        print(f'    Deferred module loaded anyway: {moduleName}')
@@ -0,0 +1,99 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from dataclasses import dataclass
+
+from pathlib import Path
+
+from time import perf_counter
+
+from antlr4 import InputStream
+from antlr4 import Token
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutplugins.ioplugins.python.pythonpegparser.PythonLexer import PythonLexer
+
+DEFAULT_REPETITIONS: int = 10
+
+RESOURCES_TEST_CLASSES_PACKAGE_NAME: str = f'{UnitTestBase.RESOURCES_PACKAGE_NAME}.testclasses'
+
+
+@dataclass
+class LexerThroughput:
+    tokenCount:    int   = 0
+    elapsedTime:   float = 0.0
+
+    @property
+    def tokensPerSecond(self) -> float:
+        if self.elapsedTime == 0.0:
+            return 0.0
+        return self.tokenCount / self.elapsedTime
+
+
+class LexerBenchmark:
+    """
+    Measures how many tokens per second the Python lexer produces over a fixed corpus, the
+    Python test classes.  Most of the lexer is generated;  This is mainly here to catch
+    regressions in the hand-written PythonLexerBase.
+
+    The sources are read before timing starts;  So only lexing is measured.  The best
+    repetition is reported since it is the least disturbed by the rest of the machine
+
+        python -m tests.benchmarks.LexerBenchmark --repetitions 20
+    """
+    def __init__(self, repetitions: int = DEFAULT_REPETITIONS):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._repetitions: int       = repetitions
+        self._sources:     List[str] = [modulePath.read_text(encoding='utf-8') for modulePath in self._corpus()]
+
+    def run(self) -> LexerThroughput:
+        """
+        Returns:  The fastest repetition
+        """
+        best: LexerThroughput = LexerThroughput()
+        for repetition in range(self._repetitions):
+            throughput: LexerThroughput = self._lexCorpus()
+            self.logger.debug(f'Repetition {repetition}: {throughput.tokensPerSecond:,.0f} tokens/sec')
+            if throughput.tokensPerSecond > best.tokensPerSecond:
+                best = throughput
+
+        return best
+
+    def _lexCorpus(self) -> LexerThroughput:
+
+        tokenCount: int   = 0
+        startTime:  float = perf_counter()
+        for source in self._sources:
+            lexer: PythonLexer = PythonLexer(InputStream(source))
+            while lexer.nextToken().type != Token.EOF:
+                tokenCount += 1
+
+        return LexerThroughput(tokenCount=tokenCount, elapsedTime=perf_counter() - startTime)
+
+    def _corpus(self) -> List[Path]:
+
+        fqFileName:  str  = UnitTestBase.getFullyQualifiedResourceFileName(RESOURCES_TEST_CLASSES_PACKAGE_NAME, 'SimpleClass.py')
+        testClasses: Path = Path(fqFileName).parent
+
+        return sorted(modulePath for modulePath in testClasses.rglob('*.py') if modulePath.name != '__init__.py')
+
+
+if __name__ == '__main__':
+
+    parser: ArgumentParser = ArgumentParser(description='Measures the Python lexer throughput')
+    parser.add_argument('--repetitions', type=int, default=DEFAULT_REPETITIONS, help='The number of times to lex the corpus')
+
+    arguments:  Namespace       = parser.parse_args()
+    benchmark:  LexerBenchmark  = LexerBenchmark(repetitions=arguments.repetitions)
+    throughput: LexerThroughput = benchmark.run()
+
+    print(f'{throughput.tokenCount:,} tokens in {throughput.elapsedTime:.3f} seconds;  {throughput.tokensPerSecond:,.0f} tokens/sec')
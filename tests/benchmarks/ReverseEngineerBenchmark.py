@@ -0,0 +1,406 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+
+from io import StringIO
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from pathlib import Path
+
+from sys import exit as sysExit
+
+from tempfile import TemporaryDirectory
+
+from time import perf_counter
+
+from tokenize import generate_tokens
+
+from tracemalloc import get_traced_memory
+from tracemalloc import start as startTracing
+from tracemalloc import stop as stopTracing
+
+from antlr4 import InputStream
+from antlr4 import Token
+
+from pyutplugins.ioplugins.python.PythonAstParser import AstModule
+from pyutplugins.ioplugins.python.PythonAstParser import PythonAstParser
+from pyutplugins.ioplugins.python.PythonBackend import PythonBackend
+from pyutplugins.ioplugins.python.PythonModuleParser import PythonModuleParser
+from pyutplugins.ioplugins.python.SymbolTable import SymbolTable
+
+from pyutplugins.ioplugins.python.pythonpegparser.PythonLexer import PythonLexer
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+from pyutplugins.ioplugins.python.visitor.ParserTypes import mergeAssociations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import mergeParents
+from pyutplugins.ioplugins.python.visitor.PyutAstClassVisitor import PyutAstClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutAstVisitor import PyutAstVisitor
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegClassVisitor import PyutPythonPegClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PyutPythonPegVisitor
+
+from tests.benchmarks.SyntheticCorpus import CorpusLanguage
+from tests.benchmarks.SyntheticCorpus import CorpusParameters
+from tests.benchmarks.SyntheticCorpus import SyntheticCorpus
+from tests.benchmarks.SyntheticCorpus import addCorpusArguments
+from tests.benchmarks.SyntheticCorpus import toCorpusParameters
+
+DEFAULT_REPETITIONS: int   = 3
+DEFAULT_TOLERANCE:   float = 0.25
+#
+# Phases faster than this are all noise
+#
+MINIMUM_REGRESSION_TIME: float = 0.01
+
+LEX_PHASE:    str = 'lex'
+PARSE_PHASE:  str = 'parse'
+PASS_1_PHASE: str = 'pass1'
+PASS_2_PHASE: str = 'pass2'
+LINKS_PHASE:  str = 'links'
+
+PhaseTimes = NewType('PhaseTimes', Dict[str, float])
+#
+# What pass 2 found in a module;  The links are resolved once every module is in the symbol table
+#
+ModuleLinks = NewType('ModuleLinks', Dict[str, Tuple[Parents, Associations]])
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The best time of each phase in seconds and the peak memory of a separate traced run in bytes
+    """
+    language:         str              = CorpusLanguage.PYTHON.value
+    backend:          str              = ''
+    fileCount:        int              = 0
+    phaseTimes:       Dict[str, float] = field(default_factory=dict)
+    peakMemory:       int              = 0
+    corpusParameters: Dict[str, int]   = field(default_factory=dict)
+
+    @property
+    def totalTime(self) -> float:
+        return sum(self.phaseTimes.values())
+
+    @property
+    def filesPerSecond(self) -> float:
+        if self.totalTime == 0.0:
+            return 0.0
+        return self.fileCount / self.totalTime
+
+    def toJson(self) -> str:
+
+        resultDict: Dict[str, Any] = asdict(self)
+
+        resultDict['totalTime']      = self.totalTime
+        resultDict['filesPerSecond'] = self.filesPerSecond
+
+        return jsonDumps(resultDict, indent=4)
+
+    @classmethod
+    def fromJson(cls, jsonString: str) -> 'BenchmarkResult':
+
+        resultDict: Dict[str, Any] = jsonLoads(jsonString)
+
+        return BenchmarkResult(language=resultDict['language'],
+                               backend=resultDict['backend'],
+                               fileCount=resultDict['fileCount'],
+                               phaseTimes=resultDict['phaseTimes'],
+                               peakMemory=resultDict['peakMemory'],
+                               corpusParameters=resultDict['corpusParameters'])
+
+
+class ReverseEngineerBenchmark:
+    """
+    Times each phase of reverse engineering a synthetic corpus;  See SyntheticCorpus.
+
+    Python has all the phases, lex, parse, pass1, pass2, and links.  The phases are timed
+    separately, so the sources are read and the modules are parsed before the passes are timed.
+    Parsing lexes the module again.  The links are resolved in the model;  Creating the Ogl
+    links needs a wx application.
+
+    Java and DTD are reversed in a single pass that creates the Ogl classes, so they only have
+    the parse phase and, for Java, the links phase;  They create a wx application.
+
+    Each phase's best repetition is reported.  The peak memory is measured in a separate run,
+    since tracing slows everything down.  A baseline is a previous run's --json output
+
+        python -m tests.benchmarks.ReverseEngineerBenchmark --modules 500 --json result.json --baseline baseline.json
+    """
+    def __init__(self, filePaths: List[Path], language: CorpusLanguage, backend: PythonBackend = PythonBackend.PEG, repetitions: int = DEFAULT_REPETITIONS):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._filePaths:   List[Path]     = filePaths
+        self._language:    CorpusLanguage = language
+        self._backend:     PythonBackend  = backend
+        self._repetitions: int            = repetitions
+
+        self._wxApp: Any = None
+
+    def run(self) -> BenchmarkResult:
+        """
+        Returns:  The fastest time of each phase
+        """
+        best: PhaseTimes = PhaseTimes({})
+        for repetition in range(self._repetitions):
+            phaseTimes: PhaseTimes = self._reverseEngineer()
+            self.logger.debug(f'Repetition {repetition}: {phaseTimes}')
+            for phase, elapsedTime in phaseTimes.items():
+                best[phase] = min(elapsedTime, best.get(phase, elapsedTime))
+
+        startTracing()
+        self._reverseEngineer()
+        peakMemory: int = get_traced_memory()[1]
+        stopTracing()
+
+        backend: str = self._backend.value if self._language == CorpusLanguage.PYTHON else ''
+
+        return BenchmarkResult(language=self._language.value, backend=backend, fileCount=len(self._filePaths), phaseTimes=best, peakMemory=peakMemory)
+
+    def _reverseEngineer(self) -> PhaseTimes:
+
+        match self._language:
+            case CorpusLanguage.PYTHON:
+                phaseTimes: PhaseTimes = self._reverseEngineerPython()
+            case CorpusLanguage.JAVA:
+                phaseTimes = self._reverseEngineerJava()
+            case CorpusLanguage.DTD:
+                phaseTimes = self._reverseEngineerDtd()
+            case _:
+                assert False, f'Unknown corpus language: {self._language}'
+
+        return phaseTimes
+
+    def _reverseEngineerPython(self) -> PhaseTimes:
+
+        fqFileNames: List[str]  = [str(filePath) for filePath in self._filePaths]
+        sources:     List[str]  = [filePath.read_text(encoding='utf-8') for filePath in self._filePaths]
+        phaseTimes:  PhaseTimes = PhaseTimes({})
+
+        startTime: float = perf_counter()
+        self._lex(sources=sources)
+        phaseTimes[LEX_PHASE] = perf_counter() - startTime
+
+        startTime = perf_counter()
+        modules: List[Any] = self._parse(fqFileNames=fqFileNames, sources=sources)
+        phaseTimes[PARSE_PHASE] = perf_counter() - startTime
+
+        symbolTable: SymbolTable = SymbolTable()
+
+        startTime = perf_counter()
+        self._pass1(fqFileNames=fqFileNames, modules=modules, symbolTable=symbolTable)
+        phaseTimes[PASS_1_PHASE] = perf_counter() - startTime
+
+        startTime = perf_counter()
+        moduleLinks: ModuleLinks = self._pass2(fqFileNames=fqFileNames, modules=modules, symbolTable=symbolTable)
+        phaseTimes[PASS_2_PHASE] = perf_counter() - startTime
+
+        startTime = perf_counter()
+        self._resolveLinks(moduleLinks=moduleLinks, symbolTable=symbolTable)
+        phaseTimes[LINKS_PHASE] = perf_counter() - startTime
+
+        return phaseTimes
+
+    def _lex(self, sources: List[str]):
+
+        for source in sources:
+            if self._backend == PythonBackend.AST:
+                for _ in generate_tokens(StringIO(source).readline):
+                    pass
+            else:
+                lexer: PythonLexer = PythonLexer(InputStream(source))
+                while lexer.nextToken().type != Token.EOF:
+                    pass
+
+    def _parse(self, fqFileNames: List[str], sources: List[str]) -> List[Any]:
+        """
+        Returns:  The parse trees or the AstModules
+        """
+        if self._backend == PythonBackend.AST:
+            astParser: PythonAstParser = PythonAstParser()
+            return [astParser.parse(fqFileName=fqFileName) for fqFileName in fqFileNames]
+
+        moduleParser: PythonModuleParser = PythonModuleParser()
+
+        return [moduleParser.parseSource(source=source, moduleName=fqFileName) for fqFileName, source in zip(fqFileNames, sources)]
+
+    def _pass1(self, fqFileNames: List[str], modules: List[Any], symbolTable: SymbolTable):
+
+        for fqFileName, module in zip(fqFileNames, modules):
+            if self._backend == PythonBackend.AST:
+                astClassVisitor: PyutAstClassVisitor = PyutAstClassVisitor()
+
+                astClassVisitor.pyutClasses = PyutClasses({})
+                astClassVisitor.visitModule(module)
+                symbolTable.addModule(fqFileName=fqFileName, pyutClasses=astClassVisitor.pyutClasses, imports=astClassVisitor.imports)
+            else:
+                classVisitor: PyutPythonPegClassVisitor = PyutPythonPegClassVisitor()
+
+                classVisitor.pyutClasses = PyutClasses({})
+                classVisitor.visit(module)
+                symbolTable.addModule(fqFileName=fqFileName, pyutClasses=classVisitor.pyutClasses, imports=classVisitor.imports)
+
+    def _pass2(self, fqFileNames: List[str], modules: List[Any], symbolTable: SymbolTable) -> ModuleLinks:
+
+        pyutClasses: PyutClasses = symbolTable.bareClasses
+        moduleLinks: ModuleLinks = ModuleLinks({})
+        for fqFileName, module in zip(fqFileNames, modules):
+            moduleView: PyutClasses = symbolTable.moduleView(fqFileName=fqFileName, pyutClasses=pyutClasses)
+            if self._backend == PythonBackend.AST:
+                astModule:  AstModule      = module
+                astVisitor: PyutAstVisitor = PyutAstVisitor()
+
+                astVisitor.pyutClasses  = moduleView
+                astVisitor.parents      = Parents({})
+                astVisitor.associations = Associations({})
+                astVisitor.visitModule(astModule)
+                moduleLinks[fqFileName] = (astVisitor.parents, astVisitor.associations)
+            else:
+                visitor: PyutPythonPegVisitor = PyutPythonPegVisitor()
+
+                visitor.pyutClasses  = moduleView
+                visitor.parents      = Parents({})
+                visitor.associations = Associations({})
+                visitor.visit(module)
+                moduleLinks[fqFileName] = (visitor.parents, visitor.associations)
+
+        return moduleLinks
+
+    def _resolveLinks(self, moduleLinks: ModuleLinks, symbolTable: SymbolTable) -> Tuple[Parents, Associations]:
+
+        allParents:      Parents      = Parents({})
+        allAssociations: Associations = Associations({})
+        for fqFileName, (parents, associations) in moduleLinks.items():
+            mergeParents(parents=allParents, moreParents=symbolTable.qualifyParents(fqFileName=fqFileName, parents=parents))
+            mergeAssociations(associations=allAssociations, moreAssociations=symbolTable.qualifyAssociations(fqFileName=fqFileName, associations=associations))
+
+        return allParents, allAssociations
+
+    def _reverseEngineerJava(self) -> PhaseTimes:
+
+        self._createWxApp()
+
+        from pyutplugins.ioplugins.java.JavaReader import JavaReader
+
+        javaReader: JavaReader = JavaReader()
+        phaseTimes: PhaseTimes = PhaseTimes({})
+
+        startTime: float = perf_counter()
+        for filePath in self._filePaths:
+            javaReader.parseFile(str(filePath))
+        phaseTimes[PARSE_PHASE] = perf_counter() - startTime
+
+        startTime = perf_counter()
+        self.logger.debug(f'{len(javaReader.reversedLinks)} Java links')
+        phaseTimes[LINKS_PHASE] = perf_counter() - startTime
+
+        return phaseTimes
+
+    def _reverseEngineerDtd(self) -> PhaseTimes:
+
+        self._createWxApp()
+
+        from pyutplugins.ioplugins.dtd.DTDParser import DTDParser
+
+        phaseTimes: PhaseTimes = PhaseTimes({})
+
+        startTime: float = perf_counter()
+        for filePath in self._filePaths:
+            dtdParser: DTDParser = DTDParser()
+            dtdParser.open(str(filePath))
+        phaseTimes[PARSE_PHASE] = perf_counter() - startTime
+
+        return phaseTimes
+
+    def _createWxApp(self):
+        """
+        The Ogl classes need one
+        """
+        if self._wxApp is None:
+            from wx import App
+
+            self._wxApp = App()
+
+
+def findRegressions(result: BenchmarkResult, baseline: BenchmarkResult, tolerance: float) -> List[str]:
+    """
+    Args:
+        result:     This run
+        baseline:   A previous run
+        tolerance:  How much slower or bigger than the baseline is still ok;  0.25 is 25%
+
+    Returns:  A description of each phase that is slower than the baseline and of the peak memory if it grew;
+    Runs of different corpora are not comparable, so that is the only description then
+    """
+    if (result.language, result.backend, result.corpusParameters) != (baseline.language, baseline.backend, baseline.corpusParameters):
+        return [f'The baseline is for a different corpus: {baseline.language} {baseline.backend} {baseline.corpusParameters}']
+
+    regressions: List[str] = []
+    for phase, elapsedTime in result.phaseTimes.items():
+        baselineTime: float | None = baseline.phaseTimes.get(phase)
+        if baselineTime is not None and elapsedTime > max(baselineTime * (1.0 + tolerance), MINIMUM_REGRESSION_TIME):
+            regressions.append(f'{phase}: {elapsedTime:.3f} seconds;  The baseline is {baselineTime:.3f} seconds')
+
+    if baseline.peakMemory > 0 and result.peakMemory > baseline.peakMemory * (1.0 + tolerance):
+        regressions.append(f'Peak memory: {result.peakMemory:,} bytes;  The baseline is {baseline.peakMemory:,} bytes')
+
+    return regressions
+
+
+if __name__ == '__main__':
+
+    parser: ArgumentParser = ArgumentParser(description='Times each phase of reverse engineering a synthetic corpus')
+    parser.add_argument('--language',    choices=[language.value for language in CorpusLanguage], default=CorpusLanguage.PYTHON.value, help='The reverse engineer to time')
+    parser.add_argument('--backend',     choices=[backend.name for backend in PythonBackend], default=PythonBackend.PEG.name, help='The Python parser')
+    parser.add_argument('--repetitions', type=int, default=DEFAULT_REPETITIONS, help='The number of times to reverse engineer the corpus')
+    parser.add_argument('--directory',   type=Path, default=None, help='Where to write the corpus;  Defaults to a temporary directory')
+    parser.add_argument('--json',        type=Path, default=None, help='Write the result to this file')
+    parser.add_argument('--baseline',    type=Path, default=None, help='Fail if slower than the result in this file')
+    parser.add_argument('--tolerance',   type=float, default=DEFAULT_TOLERANCE, help='How much slower than the baseline is still ok')
+    addCorpusArguments(parser)
+
+    arguments:        Namespace        = parser.parse_args()
+    corpusParameters: CorpusParameters = toCorpusParameters(arguments)
+    corpusLanguage:   CorpusLanguage   = CorpusLanguage(arguments.language)
+
+    with TemporaryDirectory() as temporaryDirectory:
+        corpusDirectory: Path = Path(temporaryDirectory) if arguments.directory is None else arguments.directory
+
+        filePaths: List[Path]               = SyntheticCorpus(corpusParameters=corpusParameters).write(directory=corpusDirectory, language=corpusLanguage)
+        benchmark: ReverseEngineerBenchmark = ReverseEngineerBenchmark(filePaths=filePaths,
+                                                                       language=corpusLanguage,
+                                                                       backend=PythonBackend[arguments.backend],
+                                                                       repetitions=arguments.repetitions)
+        result:    BenchmarkResult          = benchmark.run()
+
+    result.corpusParameters = asdict(corpusParameters)
+
+    for phase, elapsedTime in result.phaseTimes.items():
+        print(f'{phase:<8} {elapsedTime:>10.3f} seconds')
+    print(f'{"total":<8} {result.totalTime:>10.3f} seconds;  {result.filesPerSecond:,.1f} files/sec;  Peak memory {result.peakMemory:,} bytes')
+
+    if arguments.json is not None:
+        arguments.json.write_text(result.toJson())
+
+    if arguments.baseline is not None:
+        regressions: List[str] = findRegressions(result=result, baseline=BenchmarkResult.fromJson(arguments.baseline.read_text()), tolerance=arguments.tolerance)
+        for regression in regressions:
+            print(f'Regression {regression}')
+        if len(regressions) > 0:
+            sysExit(1)
@@ -0,0 +1,259 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from dataclasses import dataclass
+
+from enum import Enum
+
+from pathlib import Path
+
+DEFAULT_MODULE_COUNT:       int = 100
+DEFAULT_CLASSES_PER_MODULE: int = 5
+DEFAULT_METHODS_PER_CLASS:  int = 10
+DEFAULT_INHERITANCE_DEPTH:  int = 3
+DEFAULT_PACKAGE_COUNT:      int = 5
+
+DTD_FILE_NAME: str = 'Synthetic.dtd'
+
+
+class CorpusLanguage(Enum):
+    PYTHON = 'python'
+    JAVA   = 'java'
+    DTD    = 'dtd'
+
+
+@dataclass
+class CorpusParameters:
+    """
+    The classes are numbered across the whole corpus.  A class's depth is its number modulo
+    .inheritanceDepth + 1;  A class that is not at depth 0 extends the class before it, which
+    may be in the module before it.  Each class after the first in a module is also associated
+    with the class before it
+    """
+    moduleCount:      int = DEFAULT_MODULE_COUNT
+    classesPerModule: int = DEFAULT_CLASSES_PER_MODULE
+    methodsPerClass:  int = DEFAULT_METHODS_PER_CLASS
+    inheritanceDepth: int = DEFAULT_INHERITANCE_DEPTH
+    packageCount:     int = DEFAULT_PACKAGE_COUNT
+
+    @property
+    def classCount(self) -> int:
+        return self.moduleCount * self.classesPerModule
+
+
+class SyntheticCorpus:
+    """
+    Writes source code with a known shape so that the reverse engineers can be timed on
+    code bases of any size;  The same parameters always write the same code.
+
+    Python modules are spread over packages and import their parents from the other packages.
+    Java modules are a file per module.  A DTD is a single file;  Its elements are the classes,
+    the methods are attributes and the parents contain their children
+
+        python -m tests.benchmarks.SyntheticCorpus --language java --modules 500 /tmp/corpus
+    """
+    def __init__(self, corpusParameters: CorpusParameters):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._parameters: CorpusParameters = corpusParameters
+
+    def write(self, directory: Path, language: CorpusLanguage) -> List[Path]:
+        """
+        Args:
+            directory:  Where to write the corpus;  Created if it does not exist
+            language:   What to write
+
+        Returns:  The files to reverse engineer, in module order
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        match language:
+            case CorpusLanguage.PYTHON:
+                filePaths: List[Path] = self._writePython(directory=directory)
+            case CorpusLanguage.JAVA:
+                filePaths = self._writeJava(directory=directory)
+            case CorpusLanguage.DTD:
+                filePaths = self._writeDtd(directory=directory)
+            case _:
+                assert False, f'Unknown corpus language: {language}'
+
+        self.logger.info(f'Wrote {len(filePaths)} {language.value} files to {directory}')
+
+        return filePaths
+
+    def _writePython(self, directory: Path) -> List[Path]:
+
+        for packageNumber in range(self._parameters.packageCount):
+            packagePath: Path = directory / self._packageName(packageNumber)
+            packagePath.mkdir(exist_ok=True)
+            (packagePath / '__init__.py').write_text('')
+
+        filePaths: List[Path] = []
+        for moduleNumber in range(self._parameters.moduleCount):
+            filePath: Path = directory / self._packageName(self._packageOf(moduleNumber)) / f'{self._moduleName(moduleNumber)}.py'
+
+            filePath.write_text(self._pythonModule(moduleNumber=moduleNumber))
+            filePaths.append(filePath)
+
+        return filePaths
+
+    def _pythonModule(self, moduleNumber: int) -> str:
+
+        lines: List[str] = []
+        firstClass: int = moduleNumber * self._parameters.classesPerModule
+        if moduleNumber > 0 and self._parentOf(firstClass) is not None:
+            previousModule: int = moduleNumber - 1
+            lines.append(f'from {self._packageName(self._packageOf(previousModule))}.{self._moduleName(previousModule)} import {self._className(firstClass - 1)}')
+            lines.append('')
+
+        for classNumber in range(firstClass, firstClass + self._parameters.classesPerModule):
+            parentNumber: int | None = self._parentOf(classNumber)
+            parentList:   str        = '' if parentNumber is None else f'({self._className(parentNumber)})'
+
+            lines.extend(['', f'class {self._className(classNumber)}{parentList}:'])
+            lines.append(f'    """\n    Synthetic class {classNumber}\n    """')
+            lines.append('    def __init__(self, name: str = \'\'):')
+            if parentNumber is not None:
+                lines.append('        super().__init__(name)')
+            lines.append('        self._name:  str = name')
+            lines.append(f'        self._count: int = {classNumber}')
+
+            if classNumber > firstClass:
+                lines.append('')
+                lines.append('    @property')
+                lines.append(f'    def partner(self) -> {self._className(classNumber - 1)}:')
+                lines.append(f'        return {self._className(classNumber - 1)}()')
+
+            for methodNumber in range(self._parameters.methodsPerClass):
+                lines.append('')
+                lines.append(f'    def method{methodNumber}(self, value: int, scale: float = 1.0) -> float:')
+                lines.append(f'        total: float = (value + self._count + {methodNumber}) * scale')
+                lines.append('        if self._name != \'\':')
+                lines.append('            total += len(self._name)')
+                lines.append('        return total')
+            lines.append('')
+
+        return '\n'.join(lines)
+
+    def _writeJava(self, directory: Path) -> List[Path]:
+
+        filePaths: List[Path] = []
+        for moduleNumber in range(self._parameters.moduleCount):
+            filePath: Path = directory / f'{self._moduleName(moduleNumber)}.java'
+
+            filePath.write_text(self._javaModule(moduleNumber=moduleNumber))
+            filePaths.append(filePath)
+
+        return filePaths
+
+    def _javaModule(self, moduleNumber: int) -> str:
+
+        lines:      List[str] = []
+        firstClass: int       = moduleNumber * self._parameters.classesPerModule
+        for classNumber in range(firstClass, firstClass + self._parameters.classesPerModule):
+            parentNumber: int | None = self._parentOf(classNumber)
+            extends:      str        = '' if parentNumber is None else f' extends {self._className(parentNumber)}'
+
+            lines.append('/**')
+            lines.append(f' * Synthetic class {classNumber}')
+            lines.append(' */')
+            lines.append(f'public class {self._className(classNumber)}{extends} {{')
+            lines.append('    private String name;')
+            lines.append('    private int count;')
+            if classNumber > firstClass:
+                lines.append(f'    private {self._className(classNumber - 1)} partner;')
+
+            for methodNumber in range(self._parameters.methodsPerClass):
+                lines.append('')
+                lines.append(f'    public double method{methodNumber}(int value, double scale) {{')
+                lines.append(f'        double total = (value + count + {methodNumber}) * scale;')
+                lines.append('        return total;')
+                lines.append('    }')
+            lines.append('}')
+            lines.append('')
+
+        return '\n'.join(lines)
+
+    def _writeDtd(self, directory: Path) -> List[Path]:
+
+        lines: List[str] = [f'<!DOCTYPE {self._className(0)} [']
+        for classNumber in range(self._parameters.classCount):
+            children: List[str] = [self._className(childNumber) for childNumber in self._childrenOf(classNumber)]
+            content:  str       = '(#PCDATA)' if len(children) == 0 else f'({",".join(children)})'
+
+            lines.append(f'    <!ELEMENT {self._className(classNumber)} {content}>')
+            for methodNumber in range(self._parameters.methodsPerClass):
+                lines.append(f'    <!ATTLIST {self._className(classNumber)} attribute{methodNumber} CDATA #IMPLIED>')
+        lines.append(']>')
+
+        filePath: Path = directory / DTD_FILE_NAME
+        filePath.write_text('\n'.join(lines) + '\n')
+
+        return [filePath]
+
+    def _parentOf(self, classNumber: int) -> int | None:
+
+        if classNumber % (self._parameters.inheritanceDepth + 1) == 0:
+            return None
+
+        return classNumber - 1
+
+    def _childrenOf(self, classNumber: int) -> List[int]:
+
+        childNumber: int = classNumber + 1
+        if childNumber < self._parameters.classCount and self._parentOf(childNumber) == classNumber:
+            return [childNumber]
+
+        return []
+
+    def _packageOf(self, moduleNumber: int) -> int:
+        return moduleNumber % self._parameters.packageCount
+
+    def _packageName(self, packageNumber: int) -> str:
+        return f'package{packageNumber}'
+
+    def _moduleName(self, moduleNumber: int) -> str:
+        return f'Module{moduleNumber}'
+
+    def _className(self, classNumber: int) -> str:
+        return f'Class{classNumber}'
+
+
+def addCorpusArguments(parser: ArgumentParser):
+    """
+    The corpus options that the benchmarks share
+    """
+    parser.add_argument('--modules',  type=int, default=DEFAULT_MODULE_COUNT,       help='The number of modules')
+    parser.add_argument('--classes',  type=int, default=DEFAULT_CLASSES_PER_MODULE, help='The number of classes per module')
+    parser.add_argument('--methods',  type=int, default=DEFAULT_METHODS_PER_CLASS,  help='The number of methods per class')
+    parser.add_argument('--depth',    type=int, default=DEFAULT_INHERITANCE_DEPTH,  help='The longest inheritance chain')
+    parser.add_argument('--packages', type=int, default=DEFAULT_PACKAGE_COUNT,      help='The number of Python packages')
+
+
+def toCorpusParameters(arguments: Namespace) -> CorpusParameters:
+
+    return CorpusParameters(moduleCount=arguments.modules,
+                            classesPerModule=arguments.classes,
+                            methodsPerClass=arguments.methods,
+                            inheritanceDepth=arguments.depth,
+                            packageCount=arguments.packages)
+
+
+if __name__ == '__main__':
+
+    parser: ArgumentParser = ArgumentParser(description='Writes a synthetic corpus for the reverse engineering benchmarks')
+    parser.add_argument('directory', type=Path, help='Where to write the corpus')
+    parser.add_argument('--language', choices=[language.value for language in CorpusLanguage], default=CorpusLanguage.PYTHON.value, help='What to write')
+    addCorpusArguments(parser)
+
+    arguments: Namespace       = parser.parse_args()
+    corpus:    SyntheticCorpus = SyntheticCorpus(corpusParameters=toCorpusParameters(arguments))
+    filePaths: List[Path]      = corpus.write(directory=arguments.directory, language=CorpusLanguage(arguments.language))
+
+    print(f'Wrote {len(filePaths)} files to {arguments.directory}')
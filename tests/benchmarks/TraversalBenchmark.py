@@ -0,0 +1,132 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pathlib import Path
+
+from time import perf_counter
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutplugins.ioplugins.python.PythonModuleParser import PythonModuleParser
+
+from pyutplugins.ioplugins.python.pythonpegparser.PythonParser import PythonParser
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+from pyutplugins.ioplugins.python.visitor.PyutBaseVisitor import TraversalPolicy
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegClassVisitor import PyutPythonPegClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PyutPythonPegVisitor
+
+RESOURCES_TEST_CLASSES_PACKAGE_NAME: str = f'{UnitTestBase.RESOURCES_PACKAGE_NAME}.testclasses'
+
+ModuleTrees = NewType('ModuleTrees', Dict[str, PythonParser.File_inputContext])
+
+
+@dataclass
+class TraversalCost:
+    """
+    What both passes cost with one traversal policy
+    """
+    nodesVisited: Dict[str, int] = field(default_factory=dict)
+    elapsedTime:  float          = 0.0
+
+    @property
+    def totalNodesVisited(self) -> int:
+        return sum(self.nodesVisited.values())
+
+
+class TraversalBenchmark:
+    """
+    Counts the parse tree nodes that the PEG visitors visit in each module with the full
+    and the pruned traversal;  It also times both passes.  The modules are parsed before
+    anything is measured, so only visiting is measured.  By default, the corpus is the
+    Python test classes
+
+        python -m tests.benchmarks.TraversalBenchmark --directory src/pyutplugins
+    """
+    def __init__(self, directory: Path | None = None):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._moduleTrees: ModuleTrees = self._parseCorpus(directory=directory)
+
+    def run(self, traversalPolicy: TraversalPolicy) -> TraversalCost:
+
+        traversalCost: TraversalCost = TraversalCost()
+        pyutClasses:   PyutClasses   = PyutClasses({})
+
+        startTime: float = perf_counter()
+        for moduleName, tree in self._moduleTrees.items():
+            classVisitor: PyutPythonPegClassVisitor = PyutPythonPegClassVisitor()
+
+            classVisitor.traversalPolicy = traversalPolicy
+            classVisitor.pyutClasses     = pyutClasses
+            classVisitor.visit(tree)
+            traversalCost.nodesVisited[moduleName] = classVisitor.visitedNodeCount
+
+        parents:      Parents      = Parents({})
+        associations: Associations = Associations({})
+        for moduleName, tree in self._moduleTrees.items():
+            visitor: PyutPythonPegVisitor = PyutPythonPegVisitor()
+
+            visitor.traversalPolicy = traversalPolicy
+            visitor.pyutClasses     = pyutClasses
+            visitor.parents         = parents
+            visitor.associations    = associations
+            visitor.visit(tree)
+            traversalCost.nodesVisited[moduleName] += visitor.visitedNodeCount
+
+        traversalCost.elapsedTime = perf_counter() - startTime
+
+        return traversalCost
+
+    def _parseCorpus(self, directory: Path | None) -> ModuleTrees:
+
+        if directory is None:
+            fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(RESOURCES_TEST_CLASSES_PACKAGE_NAME, 'SimpleClass.py')
+            directory = Path(fqFileName).parent
+
+        moduleParser: PythonModuleParser = PythonModuleParser()
+        moduleTrees:  ModuleTrees        = ModuleTrees({})
+        for modulePath in sorted(directory.rglob('*.py')):
+            try:
+                tree: PythonParser.File_inputContext = moduleParser.parse(fqFileName=str(modulePath))
+                if tree is not None:
+                    moduleTrees[str(modulePath.relative_to(directory))] = tree
+            except (ValueError, Exception) as e:
+                self.logger.warning(f'Skipping {modulePath}: {e}')
+
+        return moduleTrees
+
+
+if __name__ == '__main__':
+
+    parser: ArgumentParser = ArgumentParser(description='Counts the parse tree nodes that the PEG visitors visit')
+    parser.add_argument('--directory', type=Path, default=None, help='The modules to visit;  Defaults to the test classes')
+
+    arguments:  Namespace          = parser.parse_args()
+    benchmark:  TraversalBenchmark = TraversalBenchmark(directory=arguments.directory)
+    fullCost:   TraversalCost      = benchmark.run(traversalPolicy=TraversalPolicy.FULL)
+    prunedCost: TraversalCost      = benchmark.run(traversalPolicy=TraversalPolicy.PRUNED)
+
+    moduleNames: List[str] = list(fullCost.nodesVisited.keys())
+    nameWidth:   int       = max(len(moduleName) for moduleName in moduleNames)
+
+    print(f'{"Module":<{nameWidth}} {"Full":>10} {"Pruned":>10}')
+    for moduleName in moduleNames:
+        print(f'{moduleName:<{nameWidth}} {fullCost.nodesVisited[moduleName]:>10,} {prunedCost.nodesVisited[moduleName]:>10,}')
+
+    print(f'{"Total":<{nameWidth}} {fullCost.totalNodesVisited:>10,} {prunedCost.totalNodesVisited:>10,}')
+    print(f'Full: {fullCost.elapsedTime:.3f} seconds  Pruned: {prunedCost.elapsedTime:.3f} seconds')
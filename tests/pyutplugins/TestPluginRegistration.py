@@ -0,0 +1,101 @@
+
+from typing import Dict
+from typing import List
+from typing import cast
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import patch
+
+from pyutplugins.PluginManager import IO_PLUGINS
+from pyutplugins.PluginManager import TOOL_PLUGINS
+
+from pyutplugins.PluginRegistration import PluginRegistration
+
+from pyutplugins.plugininterfaces.BasePluginInterface import BasePluginInterface
+from pyutplugins.plugininterfaces.ToolPluginInterface import ToolPluginInterface
+
+from pyutplugins.plugintypes.BaseFormat import BaseFormat
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestPluginRegistration(ProjectTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testMetadataDoesNotCreatePlugins(self):
+
+        for registration in IO_PLUGINS + TOOL_PLUGINS:
+            with patch.object(registration.pluginClass, '__init__', side_effect=AssertionError(f'{registration.className} was created')):
+                self.assertNotEqual('', registration.name, f'{registration.className} has no name')
+                self.assertIsNotNone(registration.inputFormat or registration.outputFormat or registration.menuTitle, f'{registration.className} has no menu entry')
+
+    def testIOPluginsMatchRegistrations(self):
+
+        for registration in IO_PLUGINS:
+            plugin: BasePluginInterface = self._createPluginInformation(registration=registration)
+
+            self.assertEqual(plugin.name, registration.name, f'{registration.className} name is out of sync')
+            self._assertSameFormat(plugin.inputFormat,  registration.inputFormat,  f'{registration.className} input format is out of sync')
+            self._assertSameFormat(plugin.outputFormat, registration.outputFormat, f'{registration.className} output format is out of sync')
+
+    def testToolPluginsMatchRegistrations(self):
+
+        for registration in TOOL_PLUGINS:
+            plugin: ToolPluginInterface = cast(ToolPluginInterface, self._createPluginInformation(registration=registration))
+
+            self.assertEqual(plugin.name,      registration.name,      f'{registration.className} name is out of sync')
+            self.assertEqual(plugin.menuTitle, registration.menuTitle, f'{registration.className} menu title is out of sync')
+
+    def testNamesAreDistinct(self):
+
+        for registrations in [IO_PLUGINS, TOOL_PLUGINS]:
+            names: List[str] = [registration.name for registration in registrations]
+            self.assertEqual(len(names), len(set(names)), f'Duplicate plugin names: {names}')
+
+        menuTitles: List[str] = [registration.menuTitle for registration in TOOL_PLUGINS]
+        self.assertEqual(len(menuTitles), len(set(menuTitles)), f'Duplicate menu titles: {menuTitles}')
+
+    def testLayoutToolNames(self):
+
+        names: Dict[str, str] = {registration.className: registration.name for registration in TOOL_PLUGINS}
+
+        self.assertEqual('Save Layout', names['ToolSaveLayout'], 'Wrong save layout name')
+        self.assertEqual('Load Layout', names['ToolLoadLayout'], 'Wrong load layout name')
+
+    def _createPluginInformation(self, registration: PluginRegistration) -> BasePluginInterface:
+        return registration.pluginClass(None)     # type: ignore
+
+    def _assertSameFormat(self, pluginFormat: BaseFormat, registrationFormat: BaseFormat, message: str):
+
+        if pluginFormat is None:
+            self.assertIsNone(registrationFormat, message)
+        else:
+            self.assertIsNotNone(registrationFormat, message)
+            self.assertEqual(pluginFormat.formatName,  registrationFormat.formatName,  message)
+            self.assertEqual(pluginFormat.extension,   registrationFormat.extension,   message)
+            self.assertEqual(pluginFormat.description, registrationFormat.description, message)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestPluginRegistration))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
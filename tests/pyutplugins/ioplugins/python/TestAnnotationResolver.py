@@ -0,0 +1,140 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from ast import parse as astParse
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutplugins.ioplugins.python.PythonAstParser import AstModule
+from pyutplugins.ioplugins.python.PythonModuleParser import PythonModuleParser
+
+from pyutplugins.ioplugins.python.visitor.AnnotationResolver import AnnotationResolver
+from pyutplugins.ioplugins.python.visitor.AnnotationResolver import ReferencedNames
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associates
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.PyutAstClassVisitor import PyutAstClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutAstVisitor import PyutAstVisitor
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegClassVisitor import PyutPythonPegClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PyutPythonPegVisitor
+
+TEST_SOURCE: str = (
+    'from typing import Optional\n'
+    '\n'
+    'from dataclasses import dataclass\n'
+    '\n'
+    '\n'
+    'class Foo:\n'
+    '    pass\n'
+    '\n'
+    '\n'
+    '@dataclass\n'
+    'class Holder:\n'
+    '    optionalFoo: Optional[Foo] = None\n'
+    '    foos:        list[Foo]\n'
+    '    forwardFoo:  \'Foo\'\n'
+    '    unionFoo:    Foo | None = None\n'
+    '    count:       int = 0\n'
+)
+
+HOLDER_CLASS_NAME: PyutClassName = PyutClassName('Holder')
+
+
+class TestAnnotationResolver(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._annotationResolver: AnnotationResolver = AnnotationResolver()
+
+    def tearDown(self):
+        super().tearDown()
+        self._annotationResolver.clear()
+
+    def testContainers(self):
+
+        self.assertEqual(('Optional', 'Foo'),        self._referencedNames('Optional[Foo]'),   'Optional')
+        self.assertEqual(('Dict', 'str', 'Foo'),     self._referencedNames('Dict[str,Foo]'),   'Dict')
+        self.assertEqual(('Foo',),                    self._referencedNames('Foo|None'),        'None is not a name')
+        self.assertEqual(('list', 'Foo'),            self._referencedNames('list[list[Foo]]'), 'Duplicates are dropped')
+
+    def testForwardReferences(self):
+
+        self.assertEqual(('Foo',),              self._referencedNames("'Foo'"),              'Forward reference')
+        self.assertEqual(('Optional', 'Foo'),   self._referencedNames('Optional["Foo"]'),    'Nested forward reference')
+        self.assertEqual(('pkg.Foo',),          self._referencedNames('pkg.Foo'),            'Dotted name')
+
+    def testNotTypes(self):
+
+        self.assertEqual(('Literal',),          self._referencedNames("Literal['Foo']"),                'Literal values are not types')
+        self.assertEqual(('Annotated', 'Foo'),  self._referencedNames("Annotated[Foo,'Bar']"),         'Annotated metadata is not a type')
+        self.assertEqual((),                    self._referencedNames(''),                              'No annotation')
+        self.assertEqual((),                    self._referencedNames('Foo['),                          'Not an expression')
+
+    def testMemoized(self):
+
+        referencedNames: ReferencedNames = self._annotationResolver.referencedNames(annotation='Optional[Foo]')
+
+        self.assertIs(referencedNames, self._annotationResolver.referencedNames(annotation='Optional[Foo]'), 'Should not be parsed again')
+
+    def testPegAssociations(self):
+
+        moduleParser: PythonModuleParser        = PythonModuleParser()
+        classVisitor: PyutPythonPegClassVisitor = PyutPythonPegClassVisitor()
+        visitor:      PyutPythonPegVisitor      = PyutPythonPegVisitor()
+
+        tree = moduleParser.parseSource(source=TEST_SOURCE, moduleName='TestAnnotationResolver')
+        classVisitor.visit(tree)
+
+        visitor.pyutClasses = classVisitor.pyutClasses
+        visitor.visit(tree)
+
+        self._checkAssociations(associations=visitor.associations)
+
+    def testAstAssociations(self):
+
+        astModule:    AstModule           = AstModule(fqFileName='TestAnnotationResolver', source=TEST_SOURCE, tree=astParse(TEST_SOURCE))
+        classVisitor: PyutAstClassVisitor = PyutAstClassVisitor()
+        visitor:      PyutAstVisitor      = PyutAstVisitor()
+
+        classVisitor.visitModule(astModule)
+
+        visitor.pyutClasses = classVisitor.pyutClasses
+        visitor.visitModule(astModule)
+
+        self._checkAssociations(associations=visitor.associations)
+
+    def _referencedNames(self, annotation: str) -> ReferencedNames:
+        return self._annotationResolver.referencedNames(annotation=annotation)
+
+    def _checkAssociations(self, associations: Associations):
+
+        associates:     Associates = associations[HOLDER_CLASS_NAME]
+        associateNames: List[str]  = [associate.associateName for associate in associates]
+
+        self.assertEqual(['Foo', 'Foo', 'Foo', 'Foo'], associateNames, 'Every field annotated with Foo should be an association')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestAnnotationResolver))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
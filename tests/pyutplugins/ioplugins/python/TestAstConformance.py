@@ -0,0 +1,176 @@
+
+from typing import List
+from typing import Tuple
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.PyutField import PyutField
+from pyutmodelv2.PyutMethod import PyutMethod
+from pyutmodelv2.PyutParameter import PyutParameter
+
+from pyutplugins.ioplugins.python.PythonAstParser import PythonAstParser
+from pyutplugins.ioplugins.python.PythonModuleParser import PythonModuleParser
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+from pyutplugins.ioplugins.python.visitor.PyutAstClassVisitor import PyutAstClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutAstVisitor import PyutAstVisitor
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegClassVisitor import PyutPythonPegClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PyutPythonPegVisitor
+
+from tests.ProjectTestBase import ProjectTestBase
+
+ReverseEngineeredResults = Tuple[PyutClasses, Parents, Associations]
+
+
+class TestAstConformance(UnitTestBase):
+    """
+    The PEG visitors are the reference;  The ast backend has to extract the same
+    model from every test class
+
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+    pegResults: ReverseEngineeredResults = (PyutClasses({}), Parents({}), Associations({}))
+    astResults: ReverseEngineeredResults = (PyutClasses({}), Parents({}), Associations({}))
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        fqFileName:  str       = UnitTestBase.getFullyQualifiedResourceFileName(ProjectTestBase.RESOURCES_TEST_CLASSES_PACKAGE_NAME, 'SimpleClass.py')
+        testClasses: Path      = Path(fqFileName).parent
+        fqFileNames: List[str] = sorted(str(modulePath) for modulePath in testClasses.glob('*.py') if modulePath.name != '__init__.py')
+
+        TestAstConformance.pegResults = TestAstConformance._reverseEngineerPeg(fqFileNames=fqFileNames)
+        TestAstConformance.astResults = TestAstConformance._reverseEngineerAst(fqFileNames=fqFileNames)
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testSameClasses(self):
+
+        pegClasses: PyutClasses = TestAstConformance.pegResults[0]
+        astClasses: PyutClasses = TestAstConformance.astResults[0]
+
+        self.assertEqual(list(pegClasses.keys()), list(astClasses.keys()), 'The backends found different classes')
+
+        for className, pegClass in pegClasses.items():
+            astClass: PyutClass = astClasses[className]
+            self.assertEqual(pegClass.stereotype,           astClass.stereotype,           f'{className} stereotype')
+            self.assertEqual(self._fieldsSummary(pegClass), self._fieldsSummary(astClass), f'{className} fields')
+
+    def testSameMethods(self):
+
+        pegClasses: PyutClasses = TestAstConformance.pegResults[0]
+        astClasses: PyutClasses = TestAstConformance.astResults[0]
+
+        for className, pegClass in pegClasses.items():
+            astClass: PyutClass = astClasses[className]
+            self.assertEqual(self._methodsSummary(pegClass), self._methodsSummary(astClass), f'{className} methods')
+
+    def testSameMethodSourceCode(self):
+
+        pegClasses: PyutClasses = TestAstConformance.pegResults[0]
+        astClasses: PyutClasses = TestAstConformance.astResults[0]
+
+        for className, pegClass in pegClasses.items():
+            astClass: PyutClass = astClasses[className]
+            for pegMethod, astMethod in zip(pegClass.methods, astClass.methods):
+                self.assertEqual(pegMethod.sourceCode, astMethod.sourceCode, f'{className}.{pegMethod.name} source code')
+
+    def testSameParentsAndAssociations(self):
+
+        pegParents, pegAssociations = TestAstConformance.pegResults[1], TestAstConformance.pegResults[2]
+        astParents, astAssociations = TestAstConformance.astResults[1], TestAstConformance.astResults[2]
+
+        self.assertEqual(pegParents, astParents, 'Parents do not match')
+        self.assertEqual(list(pegAssociations.keys()), list(astAssociations.keys()), 'Associated classes do not match')
+        for className, pegAssociates in pegAssociations.items():
+            self.assertEqual([(a.associateName, a.associationType) for a in pegAssociates],
+                             [(a.associateName, a.associationType) for a in astAssociations[className]],
+                             f'{className} associates')
+
+    @classmethod
+    def _reverseEngineerPeg(cls, fqFileNames: List[str]) -> ReverseEngineeredResults:
+
+        moduleParser: PythonModuleParser = PythonModuleParser()
+        pyutClasses:  PyutClasses        = PyutClasses({})
+        for fqFileName in fqFileNames:
+            classVisitor: PyutPythonPegClassVisitor = PyutPythonPegClassVisitor()
+            classVisitor.pyutClasses = pyutClasses
+            classVisitor.visit(moduleParser.parse(fqFileName=fqFileName))
+
+        parents:      Parents      = Parents({})
+        associations: Associations = Associations({})
+        for fqFileName in fqFileNames:
+            visitor: PyutPythonPegVisitor = PyutPythonPegVisitor()
+            visitor.pyutClasses  = pyutClasses
+            visitor.parents      = parents
+            visitor.associations = associations
+            visitor.visit(moduleParser.parse(fqFileName=fqFileName))
+
+        return pyutClasses, parents, associations
+
+    @classmethod
+    def _reverseEngineerAst(cls, fqFileNames: List[str]) -> ReverseEngineeredResults:
+
+        astParser:   PythonAstParser = PythonAstParser()
+        pyutClasses: PyutClasses     = PyutClasses({})
+        for fqFileName in fqFileNames:
+            classVisitor: PyutAstClassVisitor = PyutAstClassVisitor()
+            classVisitor.pyutClasses = pyutClasses
+            classVisitor.visitModule(astParser.parse(fqFileName=fqFileName))
+
+        parents:      Parents      = Parents({})
+        associations: Associations = Associations({})
+        for fqFileName in fqFileNames:
+            visitor: PyutAstVisitor = PyutAstVisitor()
+            visitor.pyutClasses  = pyutClasses
+            visitor.parents      = parents
+            visitor.associations = associations
+            visitor.visitModule(astParser.parse(fqFileName=fqFileName))
+
+        return pyutClasses, parents, associations
+
+    def _fieldsSummary(self, pyutClass: PyutClass) -> List[Tuple]:
+
+        fields: List[PyutField] = pyutClass.fields
+        return [(f.name, f.type.value, f.defaultValue, f.visibility) for f in fields]
+
+    def _methodsSummary(self, pyutClass: PyutClass) -> List[Tuple]:
+
+        summary: List[Tuple] = []
+        for method in pyutClass.methods:
+            pyutMethod: PyutMethod          = method
+            parameters: List[PyutParameter] = pyutMethod.parameters
+            summary.append((pyutMethod.name,
+                            pyutMethod.returnType.value,
+                            pyutMethod.visibility,
+                            [(p.name, p.type.value, p.defaultValue) for p in parameters]))
+        return summary
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestAstConformance))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,96 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.PyutMethod import PyutMethod
+
+from pyutplugins.ioplugins.python.visitor.ClassMemberIndex import ClassMemberIndex
+from pyutplugins.ioplugins.python.visitor.ClassMemberIndex import NO_PYUT_METHOD
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import MethodName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PropertyName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+
+SHAPE:  PyutClassName = PyutClassName('Shape')
+CIRCLE: PyutClassName = PyutClassName('Circle')
+
+
+class TestClassMemberIndex(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._classMemberIndex: ClassMemberIndex = ClassMemberIndex()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testFindMethodByClass(self):
+
+        shapeArea:  PyutMethod = PyutMethod(name='area')
+        circleArea: PyutMethod = PyutMethod(name='area')
+
+        self._classMemberIndex.addMethod(className=SHAPE,  pyutMethod=shapeArea)
+        self._classMemberIndex.addMethod(className=CIRCLE, pyutMethod=circleArea)
+
+        self.assertIs(shapeArea,  self._classMemberIndex.findMethod(className=SHAPE,  methodName=MethodName('area')), 'Wrong Shape method')
+        self.assertIs(circleArea, self._classMemberIndex.findMethod(className=CIRCLE, methodName=MethodName('area')), 'Wrong Circle method')
+        self.assertIs(NO_PYUT_METHOD, self._classMemberIndex.findMethod(className=SHAPE, methodName=MethodName('radius')), 'Should not be found')
+
+    def testRedefinedMethodFindsTheFirstOne(self):
+
+        firstMethod:  PyutMethod = PyutMethod(name='draw')
+        secondMethod: PyutMethod = PyutMethod(name='draw')
+
+        self._classMemberIndex.addMethod(className=SHAPE, pyutMethod=firstMethod)
+        self._classMemberIndex.addMethod(className=SHAPE, pyutMethod=secondMethod)
+
+        self.assertIs(firstMethod, self._classMemberIndex.findMethod(className=SHAPE, methodName=MethodName('draw')), 'Parameters go to the first one')
+
+    def testIsProperty(self):
+
+        self._classMemberIndex.addProperty(className=SHAPE, propertyName=PropertyName('name'))
+
+        self.assertTrue(self._classMemberIndex.isProperty(className=SHAPE,   propertyName=PropertyName('name')), 'Shape.name is a property')
+        self.assertFalse(self._classMemberIndex.isProperty(className=CIRCLE, propertyName=PropertyName('name')), 'Circle.name is not a property')
+
+    def testAddMethodsToClasses(self):
+
+        pyutClass:   PyutClass   = PyutClass(name=SHAPE)
+        pyutClasses: PyutClasses = PyutClasses({SHAPE: pyutClass})
+
+        self._classMemberIndex.addMethod(className=SHAPE, pyutMethod=PyutMethod(name='area'))
+        self._classMemberIndex.addMethod(className=SHAPE, pyutMethod=PyutMethod(name='draw'))
+
+        self.assertEqual(0, len(pyutClass.methods), 'Methods are not added while visiting')
+
+        self._classMemberIndex.addMethodsToClasses(pyutClasses=pyutClasses)
+        self._classMemberIndex.addMethodsToClasses(pyutClasses=pyutClasses)
+
+        self.assertEqual(['area', 'draw'], [pyutMethod.name for pyutMethod in pyutClass.methods], 'Methods should be added once in visit order')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestClassMemberIndex))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,153 @@
+
+from typing import Dict
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutplugins.ioplugins.python.ClassSubset import ClassGraph
+from pyutplugins.ioplugins.python.ClassSubset import ClassNames
+from pyutplugins.ioplugins.python.ClassSubset import ClassSubset
+from pyutplugins.ioplugins.python.PythonReverseEngineer import PythonReverseEngineer
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associate
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associates
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ParentName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+
+#
+# Base <- Middle <- Leaf -> Part   Other is not linked
+#
+TEST_PACKAGES: Dict[str, Dict[str, str]] = {
+    'core': {
+        'Base.py': (
+            'class Base:\n'
+            '    pass\n'
+            '\n'
+            '\n'
+            'class Middle(Base):\n'
+            '    pass\n'
+        ),
+    },
+    'leaves': {
+        'Leaf.py': (
+            'from core.Base import Middle\n'
+            '\n'
+            '\n'
+            'class Part:\n'
+            '    pass\n'
+            '\n'
+            '\n'
+            'class Leaf(Middle):\n'
+            '    @property\n'
+            '    def part(self) -> Part:\n'
+            '        return Part()\n'
+        ),
+        'Other.py': (
+            'class Other:\n'
+            '    pass\n'
+        ),
+    },
+}
+
+
+class TestClassSubset(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._rootPath:           Path               = Path(self._temporaryDirectory.name)
+
+        for packageName, modules in TEST_PACKAGES.items():
+            packagePath: Path = self._rootPath / packageName
+
+            packagePath.mkdir()
+            (packagePath / '__init__.py').write_text('')
+            for fileName, text in modules.items():
+                (packagePath / fileName).write_text(text)
+
+        self._reverseEngineer: PythonReverseEngineer = self._reverseEngineerPackages()
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testNeighborhood(self):
+
+        parents:      Parents      = Parents({ParentName('A'): [PyutClassName('B')], ParentName('B'): [PyutClassName('C')]})
+        associations: Associations = Associations({PyutClassName('C'): Associates([Associate(associateName=PyutClassName('D'))])})
+        classGraph:   ClassGraph   = ClassGraph(parents=parents, associations=associations)
+
+        self.assertEqual({'B'},                classGraph.neighborhood(classNames=[PyutClassName('B')], hops=0), 'Only the class')
+        self.assertEqual({'A', 'B', 'C'},      classGraph.neighborhood(classNames=[PyutClassName('B')], hops=1), 'Parents and children')
+        self.assertEqual({'A', 'B', 'C', 'D'}, classGraph.neighborhood(classNames=[PyutClassName('A')], hops=5), 'Should stop when there is nothing more')
+        self.assertEqual({'X'},                classGraph.neighborhood(classNames=[PyutClassName('X')], hops=1), 'Unlinked class')
+
+    def testSelectNeighbors(self):
+
+        classNames: ClassNames = self._reverseEngineer.selectClasses(classSubset=ClassSubset(classNames=['Leaf'], hops=1))
+
+        self.assertEqual({'Middle', 'Leaf', 'Part'}, classNames, 'Wrong neighbors')
+
+    def testSelectPackages(self):
+
+        classSubset: ClassSubset = ClassSubset(packageNames=[str(self._rootPath / 'leaves')], hops=1)
+        classNames:  ClassNames  = self._reverseEngineer.selectClasses(classSubset=classSubset)
+
+        self.assertEqual({'Part', 'Leaf', 'Other'}, classNames, 'Only the classes of the package')
+
+    def testSelectPackagesAndNeighbors(self):
+
+        classSubset: ClassSubset = ClassSubset(packageNames=[str(self._rootPath / 'core')], classNames=['Part'], hops=2)
+        classNames:  ClassNames  = self._reverseEngineer.selectClasses(classSubset=classSubset)
+
+        self.assertEqual({'Base', 'Middle', 'Leaf', 'Part'}, classNames, 'Should be both')
+
+    def _reverseEngineerPackages(self) -> PythonReverseEngineer:
+
+        reverseEngineer: PythonReverseEngineer = PythonReverseEngineer()
+        packages:        Dict[str, List[str]]  = {str(self._rootPath / packageName): ['__init__.py'] + list(modules.keys()) for packageName, modules in TEST_PACKAGES.items()}
+
+        pyutClasses: PyutClasses = PyutClasses({})
+        for directoryName, files in packages.items():
+            pyutClasses = reverseEngineer.doPass1(directoryName=directoryName, files=files, progressCallback=self._progressCallback)
+        for directoryName, files in packages.items():
+            reverseEngineer.doPass2(directoryName=directoryName, files=files, pyutClasses=pyutClasses, progressCallback=self._progressCallback)
+
+        return reverseEngineer
+
+    def _progressCallback(self, currentFileCount: int, msg: str):
+        self.logger.debug(f'{currentFileCount} {msg}')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestClassSubset))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
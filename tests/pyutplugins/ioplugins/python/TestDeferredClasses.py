@@ -0,0 +1,93 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutmodelv2.PyutClass import PyutClass
+
+from pyutplugins.ioplugins.python.ClassSubset import ClassNames
+from pyutplugins.ioplugins.python.DeferredClasses import DeferredClasses
+from pyutplugins.ioplugins.python.DeferredClasses import FrameName
+from pyutplugins.ioplugins.python.DeferredClasses import NO_REVERSE_ENGINEER
+from pyutplugins.ioplugins.python.ReverseEngineerPythonV3 import ReverseEngineerPythonV3
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+
+FIRST_FRAME:  FrameName = FrameName('Class Diagram')
+SECOND_FRAME: FrameName = FrameName('Class Diagram 2')
+
+
+class TestDeferredClasses(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        DeferredClasses().clear()
+
+    def tearDown(self):
+        super().tearDown()
+        DeferredClasses().clear()
+
+    def testKeptByFrame(self):
+
+        reverseEngineer: ReverseEngineerPythonV3 = self._deferredImport()
+        deferredClasses: DeferredClasses         = DeferredClasses()
+
+        deferredClasses.remember(frameName=FIRST_FRAME, reverseEngineer=reverseEngineer)
+
+        self.assertIs(reverseEngineer, deferredClasses.reverseEngineer(frameName=FIRST_FRAME), 'The import should be kept for its frame')
+        self.assertTrue(deferredClasses.hasDeferredClasses(frameName=FIRST_FRAME), 'No class has a shape yet')
+        self.assertIs(NO_REVERSE_ENGINEER, deferredClasses.reverseEngineer(frameName=SECOND_FRAME), 'Another frame should not see the import')
+        self.assertFalse(deferredClasses.hasDeferredClasses(frameName=SECOND_FRAME), 'Another frame has nothing to show')
+
+    def testNewImportForgetsPrevious(self):
+
+        deferredClasses: DeferredClasses = DeferredClasses()
+
+        deferredClasses.remember(frameName=FIRST_FRAME,  reverseEngineer=self._deferredImport())
+        deferredClasses.remember(frameName=SECOND_FRAME, reverseEngineer=self._deferredImport())
+        deferredClasses.forget(frameName=FIRST_FRAME)
+
+        self.assertIs(NO_REVERSE_ENGINEER, deferredClasses.reverseEngineer(frameName=FIRST_FRAME), 'The previous import should be released')
+        self.assertTrue(deferredClasses.hasDeferredClasses(frameName=SECOND_FRAME), 'Other frames keep their imports')
+
+    def testForeignShapesNotCreated(self):
+
+        reverseEngineer: ReverseEngineerPythonV3 = self._deferredImport()
+
+        self.assertFalse(reverseEngineer.createdShape(oglClass=object()), 'The reverse engineer did not create this shape')     # type: ignore
+
+    def _deferredImport(self) -> ReverseEngineerPythonV3:
+        """
+        Returns:  An import that did not create any shapes
+        """
+        pyutClasses:     PyutClasses             = PyutClasses({PyutClassName('Opie'): PyutClass(name='Opie')})
+        reverseEngineer: ReverseEngineerPythonV3 = ReverseEngineerPythonV3()
+
+        reverseEngineer.generateOglClasses(pyutClasses=pyutClasses, classNames=ClassNames(set()))
+
+        return reverseEngineer
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestDeferredClasses))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,160 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutplugins.ioplugins.python.ImportErrorReport import ImportErrorReport
+from pyutplugins.ioplugins.python.ImportErrorReport import ModuleError
+from pyutplugins.ioplugins.python.ImportErrorReport import PASS_1_NAME
+from pyutplugins.ioplugins.python.ImportErrorReport import PASS_2_NAME
+from pyutplugins.ioplugins.python.ImportErrorReport import makeModuleError
+from pyutplugins.ioplugins.python.ParallelReverseEngineer import ParallelReverseEngineer
+from pyutplugins.ioplugins.python.PythonAstParser import PythonAstParser
+from pyutplugins.ioplugins.python.PythonParseException import PythonParseException
+from pyutplugins.ioplugins.python.PythonReverseEngineer import PythonReverseEngineer
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+
+GOOD_MODULE: str = (
+    'class Good:\n'
+    '    pass\n'
+)
+
+#
+# Python 2
+#
+BROKEN_MODULE: str = (
+    'class Broken:\n'
+    '    print "broken"\n'
+)
+
+
+class TestImportErrorReport(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+        rootPath: Path = Path(self._temporaryDirectory.name)
+
+        self._goodFileName:   str = str(rootPath / 'Good.py')
+        self._brokenFileName: str = str(rootPath / 'Broken.py')
+
+        Path(self._goodFileName).write_text(GOOD_MODULE)
+        Path(self._brokenFileName).write_text(BROKEN_MODULE)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testErrorPosition(self):
+
+        try:
+            PythonAstParser().parse(fqFileName=self._brokenFileName)
+            self.fail('Python 2 should not parse')
+        except PythonParseException as e:
+            moduleError: ModuleError = makeModuleError(fqFileName=self._brokenFileName, passName=PASS_1_NAME, e=e, elapsedTime=0.5)
+
+            self.assertEqual(2, moduleError.line, 'Wrong line')
+            self.assertGreater(moduleError.column, 0, 'Should have a column')
+            self.assertEqual(self._brokenFileName, moduleError.fqFileName, 'Wrong module')
+
+    def testSummary(self):
+
+        errorReport: ImportErrorReport = ImportErrorReport()
+        for moduleNumber in range(3):
+            errorReport.addError(ModuleError(fqFileName=f'Module{moduleNumber}.py', passName=PASS_1_NAME, line=1, column=2, message='invalid syntax', elapsedTime=0.25))
+
+        summary: str = errorReport.summary(maximumErrors=2)
+
+        self.assertIn('3 module(s)',     summary, 'Should count every module')
+        self.assertIn('0.75 seconds',    summary, 'Should total the time')
+        self.assertIn('Module1.py line 1 column 2: invalid syntax', summary, 'Should list the first modules')
+        self.assertNotIn('Module2.py',   summary, 'Should only list the first modules')
+        self.assertIn('and 1 more',      summary, 'Should say that there are more')
+
+    def testModuleReportedOnce(self):
+
+        errorReport: ImportErrorReport = ImportErrorReport()
+        errorReport.addError(ModuleError(fqFileName='Module.py', passName=PASS_1_NAME, message='invalid syntax'))
+        errorReport.addError(ModuleError(fqFileName='Module.py', passName=PASS_2_NAME, message='invalid syntax'))
+
+        self.assertEqual(1, len(errorReport.moduleErrors), 'A module should only be reported once')
+        self.assertEqual(PASS_1_NAME, errorReport.moduleErrors[0].passName, 'The first failure should be reported')
+
+    def testPass2SkipsPass1Failures(self):
+
+        reverseEngineer: PythonReverseEngineer = PythonReverseEngineer()
+        directoryName:   str                   = str(Path(self._brokenFileName).parent)
+        files:           List[str]             = [Path(fqFileName).name for fqFileName in self._fqFileNames()]
+
+        pyutClasses: PyutClasses = reverseEngineer.doPass1(directoryName=directoryName, files=files, progressCallback=self._progressCallback)
+        reverseEngineer.doPass2(directoryName=directoryName, files=files, pyutClasses=pyutClasses, progressCallback=self._progressCallback)
+
+        self.assertEqual(1, len(reverseEngineer.errorReport.moduleErrors), 'The broken module should be reported once')
+        self.assertIn('1 module(s)', reverseEngineer.errorReport.summary(), 'Wrong count')
+
+    def testParallelPass2SkipsPass1Failures(self):
+
+        reverseEngineer: ParallelReverseEngineer = ParallelReverseEngineer(maxWorkers=1)
+        pyutClasses:     PyutClasses             = reverseEngineer.doPass1(fqFileNames=self._fqFileNames(), progressCallback=self._progressCallback)
+
+        reverseEngineer.doPass2(fqFileNames=self._fqFileNames(), pyutClasses=pyutClasses, progressCallback=self._progressCallback)
+
+        self.assertEqual(0, len(reverseEngineer.moduleErrors), 'Pass 2 should not try the broken module again')
+
+    def testParallelSkipsModule(self):
+
+        reverseEngineer: ParallelReverseEngineer = ParallelReverseEngineer(maxWorkers=1)
+        pyutClasses:     PyutClasses             = reverseEngineer.doPass1(fqFileNames=self._fqFileNames(), progressCallback=self._progressCallback)
+
+        self.assertIn('Good', pyutClasses, 'The good module should be imported')
+        self.assertEqual(1, len(reverseEngineer.moduleErrors), 'The broken module should be reported')
+
+        moduleError: ModuleError = reverseEngineer.moduleErrors[0]
+        self.assertEqual(self._brokenFileName, moduleError.fqFileName, 'Wrong module')
+        self.assertEqual(2,                    moduleError.line,       'Wrong line')
+        self.assertEqual(PASS_1_NAME,          moduleError.passName,   'Wrong pass')
+
+    def testParallelStopsOnError(self):
+
+        reverseEngineer: ParallelReverseEngineer = ParallelReverseEngineer(maxWorkers=1, skipOnError=False)
+
+        self.assertRaises(PythonParseException, lambda: reverseEngineer.doPass1(fqFileNames=self._fqFileNames(), progressCallback=self._progressCallback))
+
+    def _fqFileNames(self) -> List[str]:
+        return [self._brokenFileName, self._goodFileName]
+
+    def _progressCallback(self, currentFileCount: int, msg: str):
+        self.logger.debug(f'{currentFileCount} {msg}')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestImportErrorReport))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,215 @@
+
+from typing import Dict
+from typing import List
+
+from os import utime
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutplugins.ioplugins.python.IncrementalImport import FileChanges
+from pyutplugins.ioplugins.python.IncrementalImport import ImportDelta
+from pyutplugins.ioplugins.python.IncrementalImport import ImportSnapshot
+from pyutplugins.ioplugins.python.IncrementalImport import ImportedModules
+from pyutplugins.ioplugins.python.IncrementalImport import IncrementalImport
+from pyutplugins.ioplugins.python.IncrementalImport import LinkKey
+from pyutplugins.ioplugins.python.PythonAstParser import PythonAstParser
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import AssociationType
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ModuleResult
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+from pyutplugins.ioplugins.python.visitor.PyutAstClassVisitor import PyutAstClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutAstVisitor import PyutAstVisitor
+
+SHAPES_MODULE: str = (
+    'class Shape:\n'
+    '    def __init__(self):\n'
+    '        self.name: str = ""\n'
+    '\n'
+    '\n'
+    'class Circle(Shape):\n'
+    '    pass\n'
+    '\n'
+    '\n'
+    'class Square(Shape):\n'
+    '    pass\n'
+)
+
+CHANGED_SHAPES_MODULE: str = (
+    'class Shape:\n'
+    '    def __init__(self):\n'
+    '        self.name: str = ""\n'
+    '\n'
+    '    def area(self) -> float:\n'
+    '        return 0.0\n'
+    '\n'
+    '\n'
+    'class Circle(Shape):\n'
+    '    pass\n'
+)
+
+DRAWING_MODULE: str = (
+    'from dataclasses import dataclass\n'
+    '\n'
+    '\n'
+    '@dataclass\n'
+    'class Drawing:\n'
+    '    square: Square = Square()\n'
+    '    circle: Circle = Circle()\n'
+)
+
+LAYER_MODULE: str = (
+    'class Layer:\n'
+    '    pass\n'
+)
+
+
+class TestIncrementalImport(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._modulesPath:        Path               = Path(self._temporaryDirectory.name)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testNothingChanged(self):
+
+        fqFileNames: List[str]         = self._writeModules({'Shapes.py': SHAPES_MODULE, 'Drawing.py': DRAWING_MODULE})
+        incremental: IncrementalImport = self._snapshotOf(fqFileNames)
+
+        fileChanges: FileChanges = incremental.classifyFiles(fqFileNames=fqFileNames)
+
+        self.assertFalse(fileChanges.hasChanges, 'Nothing was changed')
+        self.assertEqual(fqFileNames, fileChanges.unchangedFiles, 'All the modules are unchanged')
+
+    def testTouchedModuleIsUnchanged(self):
+
+        fqFileNames: List[str]         = self._writeModules({'Shapes.py': SHAPES_MODULE})
+        incremental: IncrementalImport = self._snapshotOf(fqFileNames)
+
+        utime(fqFileNames[0], ns=(0, 0))
+
+        fileChanges: FileChanges = incremental.classifyFiles(fqFileNames=fqFileNames)
+
+        self.assertFalse(fileChanges.hasChanges, 'Same content is not a change')
+
+    def testClassifyFiles(self):
+
+        fqFileNames: List[str]         = self._writeModules({'Shapes.py': SHAPES_MODULE, 'Drawing.py': DRAWING_MODULE})
+        incremental: IncrementalImport = self._snapshotOf(fqFileNames)
+
+        newFileNames: List[str] = self._writeModules({'Shapes.py': CHANGED_SHAPES_MODULE, 'Layer.py': LAYER_MODULE})
+
+        fileChanges: FileChanges = incremental.classifyFiles(fqFileNames=newFileNames)
+
+        self.assertEqual([newFileNames[1]], fileChanges.addedFiles,   'Layer.py is new')
+        self.assertEqual([newFileNames[0]], fileChanges.changedFiles, 'Shapes.py changed')
+        self.assertEqual([fqFileNames[1]],  fileChanges.removedFiles, 'Drawing.py was not selected')
+
+    def testComputeDelta(self):
+
+        fqFileNames: List[str]         = self._writeModules({'Shapes.py': SHAPES_MODULE, 'Drawing.py': DRAWING_MODULE})
+        incremental: IncrementalImport = self._snapshotOf(fqFileNames)
+
+        self._writeModules({'Shapes.py': CHANGED_SHAPES_MODULE, 'Layer.py': LAYER_MODULE})
+        fqFileNames.append(str(self._modulesPath / 'Layer.py'))
+
+        importDelta: ImportDelta = incremental.computeDelta(importedModules=self._reverseEngineer(fqFileNames))
+
+        self.assertEqual(['Layer'],  list(importDelta.addedClasses.keys()),   'Incorrect added classes')
+        self.assertEqual(['Shape'],  list(importDelta.changedClasses.keys()), 'Incorrect changed classes')
+        self.assertEqual(['Square'], importDelta.removedClassNames,           'Incorrect removed classes')
+        self.assertEqual([], importDelta.addedLinks, 'No new links')
+
+        expectedRemovedLinks: List[LinkKey] = [
+            LinkKey(sourceName=PyutClassName('Square'),  destinationName=PyutClassName('Shape'),  associationType=AssociationType.INHERITANCE),
+            LinkKey(sourceName=PyutClassName('Drawing'), destinationName=PyutClassName('Square'), associationType=AssociationType.ASSOCIATION),
+        ]
+        self.assertEqual(expectedRemovedLinks, importDelta.removedLinks, 'Incorrect removed links')
+
+    def testUnchangedClassesAreNotDifferent(self):
+
+        fqFileNames: List[str]         = self._writeModules({'Shapes.py': SHAPES_MODULE, 'Drawing.py': DRAWING_MODULE})
+        incremental: IncrementalImport = self._snapshotOf(fqFileNames)
+
+        importDelta: ImportDelta = incremental.computeDelta(importedModules=self._reverseEngineer(fqFileNames))
+
+        self.assertTrue(importDelta.isEmpty, 'Reverse engineering the same modules again is not a change')
+
+    def _writeModules(self, modules: Dict[str, str]) -> List[str]:
+
+        fqFileNames: List[str] = []
+        for fileName, source in modules.items():
+            modulePath: Path = self._modulesPath / fileName
+            modulePath.write_text(source)
+            fqFileNames.append(str(modulePath))
+
+        return fqFileNames
+
+    def _snapshotOf(self, fqFileNames: List[str]) -> IncrementalImport:
+
+        importSnapshot: ImportSnapshot = IncrementalImport(importSnapshot=ImportSnapshot()).takeSnapshot(fqFileNames=fqFileNames,
+                                                                                                         importedModules=self._reverseEngineer(fqFileNames))
+        return IncrementalImport(importSnapshot=importSnapshot)
+
+    def _reverseEngineer(self, fqFileNames: List[str]) -> ImportedModules:
+
+        astParser:     PythonAstParser        = PythonAstParser()
+        pyutClasses:   PyutClasses            = PyutClasses({})
+        moduleClasses: Dict[str, PyutClasses] = {}
+        for fqFileName in fqFileNames:
+            classVisitor: PyutAstClassVisitor = PyutAstClassVisitor()
+            classVisitor.pyutClasses = PyutClasses({})
+            classVisitor.visitModule(astParser.parse(fqFileName=fqFileName))
+
+            moduleClasses[fqFileName] = classVisitor.pyutClasses
+            pyutClasses.update(classVisitor.pyutClasses)
+
+        importedModules: ImportedModules = ImportedModules({})
+        for fqFileName in fqFileNames:
+            visitor: PyutAstVisitor = PyutAstVisitor()
+            visitor.pyutClasses  = pyutClasses
+            visitor.parents      = Parents({})
+            visitor.associations = Associations({})
+            visitor.visitModule(astParser.parse(fqFileName=fqFileName))
+
+            importedModules[fqFileName] = ModuleResult(fqFileName=fqFileName,
+                                                       pyutClasses=moduleClasses[fqFileName],
+                                                       parents=visitor.parents,
+                                                       associations=visitor.associations)
+        return importedModules
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestIncrementalImport))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,135 @@
+
+from typing import Dict
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+from pathlib import PurePosixPath
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutplugins.ioplugins.python.ModuleDiscovery import DiscoveredModules
+from pyutplugins.ioplugins.python.ModuleDiscovery import GitIgnoreRules
+from pyutplugins.ioplugins.python.ModuleDiscovery import ModuleDiscovery
+from pyutplugins.ioplugins.python.ModuleDiscovery import isGitIgnored
+from pyutplugins.ioplugins.python.ModuleDiscovery import parseGitIgnore
+
+TEST_TREE: Dict[str, str] = {
+    '.gitignore':                     'build/\n*_pb2.py\n!keep_pb2.py\n',
+    'top.py':                         'x = 1\n',
+    'notes.txt':                      'not a module\n',
+    'package/__init__.py':            '',
+    'package/large.py':               'x = 1\n' * 100,
+    'package/messages_pb2.py':        'x = 1\n',
+    'package/keep_pb2.py':            'x = 1\n',
+    'package/deep/deeper/medium.py':  'x = 1\n' * 10,
+    'package/deep/.gitignore':        '/local.py\n',
+    'package/deep/local.py':          'x = 1\n',
+    'build/generated.py':             'x = 1\n',
+    'tests/testTop.py':               'x = 1\n',
+    '__pycache__/top.py':             'x = 1\n',
+}
+
+
+class TestModuleDiscovery(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._rootPath:           Path               = Path(self._temporaryDirectory.name)
+
+        for fileName, text in TEST_TREE.items():
+            filePath: Path = self._rootPath / fileName
+
+            filePath.parent.mkdir(parents=True, exist_ok=True)
+            filePath.write_text(text)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testGitIgnore(self):
+
+        moduleNames: List[str] = self._discover(moduleDiscovery=ModuleDiscovery(maxWorkers=4))
+
+        self.assertIn('top.py',                        moduleNames, 'Not ignored')
+        self.assertIn('package/keep_pb2.py',           moduleNames, 'A negated pattern should bring it back')
+        self.assertIn('package/deep/deeper/medium.py', moduleNames, 'Should search every level')
+        self.assertNotIn('package/messages_pb2.py',    moduleNames, 'Ignored by name')
+        self.assertNotIn('build/generated.py',         moduleNames, 'The directory is ignored')
+        self.assertNotIn('package/deep/local.py',      moduleNames, 'Ignored by the nested .gitignore')
+        self.assertNotIn('__pycache__/top.py',         moduleNames, 'Excluded by default')
+        self.assertNotIn('notes.txt',                  moduleNames, 'Not included')
+
+    def testWithoutGitIgnore(self):
+
+        moduleNames: List[str] = self._discover(moduleDiscovery=ModuleDiscovery(useGitIgnore=False))
+
+        self.assertIn('build/generated.py',      moduleNames, 'The .gitignore files should not matter')
+        self.assertIn('package/messages_pb2.py', moduleNames, 'The .gitignore files should not matter')
+
+    def testIncludeExclude(self):
+
+        moduleDiscovery: ModuleDiscovery = ModuleDiscovery(includePatterns=['*.py'], excludePatterns=['tests', 'package/deep/*', '__init__.py'], useGitIgnore=False)
+        moduleNames:     List[str]       = self._discover(moduleDiscovery=moduleDiscovery)
+
+        self.assertIn('__pycache__/top.py',            moduleNames, 'Only the given patterns are excluded')
+        self.assertNotIn('tests/testTop.py',           moduleNames, 'Excluded by directory name')
+        self.assertNotIn('package/deep/local.py',      moduleNames, 'Excluded by path')
+        self.assertNotIn('package/__init__.py',        moduleNames, 'Excluded by file name')
+
+    def testLargestFirst(self):
+
+        discoveredModules: DiscoveredModules = ModuleDiscovery(maxWorkers=4).discover(rootDirectory=str(self._rootPath))
+        sizes:             List[int]         = [discoveredModule.size for discoveredModule in discoveredModules]
+
+        self.assertEqual(sorted(sizes, reverse=True), sizes, 'Should be largest first')
+        self.assertEqual('package/large.py', self._relativeName(discoveredModules[0].fqFileName), 'Wrong largest module')
+
+    def testGitIgnorePatterns(self):
+
+        rules: GitIgnoreRules = parseGitIgnore(directory=PurePosixPath('.'), text='# comment\n**/gen/*.py\ndoc/[!a]*.py\n')
+
+        self.assertTrue(isGitIgnored(rules=rules, relativePath=PurePosixPath('a/b/gen/x.py'), isDirectory=False), '** matches any directories')
+        self.assertTrue(isGitIgnored(rules=rules, relativePath=PurePosixPath('gen/x.py'),     isDirectory=False), '** matches no directories')
+        self.assertFalse(isGitIgnored(rules=rules, relativePath=PurePosixPath('gen/y/x.py'),  isDirectory=False), '* does not match /')
+        self.assertTrue(isGitIgnored(rules=rules, relativePath=PurePosixPath('doc/b.py'),     isDirectory=False), 'Negated character class')
+        self.assertFalse(isGitIgnored(rules=rules, relativePath=PurePosixPath('doc/a.py'),    isDirectory=False), 'Negated character class')
+        self.assertFalse(isGitIgnored(rules=rules, relativePath=PurePosixPath('x/doc/b.py'),  isDirectory=False), 'Anchored to the .gitignore directory')
+
+    def _discover(self, moduleDiscovery: ModuleDiscovery) -> List[str]:
+
+        discoveredModules: DiscoveredModules = moduleDiscovery.discover(rootDirectory=str(self._rootPath))
+
+        return [self._relativeName(discoveredModule.fqFileName) for discoveredModule in discoveredModules]
+
+    def _relativeName(self, fqFileName: str) -> str:
+        return Path(fqFileName).relative_to(self._rootPath).as_posix()
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestModuleDiscovery))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
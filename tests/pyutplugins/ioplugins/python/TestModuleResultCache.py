@@ -0,0 +1,214 @@
+
+from typing import List
+
+from pathlib import Path
+
+from shutil import copyfile
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.PyutMethod import PyutMethod
+from pyutmodelv2.PyutMethod import SourceCode
+
+from pyutplugins.ioplugins.python.ModuleResultCache import CacheKey
+from pyutplugins.ioplugins.python.ModuleResultCache import ModuleResultCache
+from pyutplugins.ioplugins.python.ModuleResultCache import NO_MODULE_RESULT
+from pyutplugins.ioplugins.python.ModuleResultCache import PASS_1_CONTEXT
+from pyutplugins.ioplugins.python.ModuleResultCache import pass2Context
+
+from pyutplugins.ioplugins.python.ParallelReverseEngineer import ParallelReverseEngineer
+from pyutplugins.ioplugins.python.SourceCodeReference import SourceCodeReference
+from pyutplugins.ioplugins.python.SourceCodeReference import makeSourceCodeReference
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ModuleResult
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+
+from tests.ProjectTestBase import ProjectTestBase
+
+TEST_MODULES: List[str] = ['Opie.py', 'MultipleInheritance.py', 'AssociationClasses.py', 'SimpleClass.py']
+
+
+class TestModuleResultCache(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+        self._cacheDirectory:  Path = Path(self._temporaryDirectory.name) / 'importCache'
+        self._moduleDirectory: Path = Path(self._temporaryDirectory.name) / 'modules'
+        self._moduleDirectory.mkdir()
+
+        self._fqFileNames: List[str] = []
+        for fileName in TEST_MODULES:
+            fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(ProjectTestBase.RESOURCES_TEST_CLASSES_PACKAGE_NAME, fileName)
+            copiedFileName: Path = self._moduleDirectory / fileName
+            copyfile(fqFileName, copiedFileName)
+            self._fqFileNames.append(str(copiedFileName))
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testPutAndGet(self):
+
+        cache:    ModuleResultCache = ModuleResultCache(cacheDirectory=self._cacheDirectory, maximumSize=1)
+        cacheKey: CacheKey          = cache.makeKey(fqFileName=self._fqFileNames[0])
+
+        self.assertIs(NO_MODULE_RESULT, cache.get(cacheKey=cacheKey, fqFileName=self._fqFileNames[0]), 'Cache should start empty')
+
+        cache.put(cacheKey=cacheKey, moduleResult=self._makeModuleResult(fqFileName=self._fqFileNames[0]))
+
+        moduleResult: ModuleResult = cache.get(cacheKey=cacheKey, fqFileName=self._fqFileNames[0])
+
+        self.assertIsNot(NO_MODULE_RESULT, moduleResult, 'Should be a cache hit')
+        self.assertIn('Ozzee', moduleResult.pyutClasses, 'Did not get back what we put in')
+
+    def testPersistent(self):
+
+        cacheKey: CacheKey = ModuleResultCache(cacheDirectory=self._cacheDirectory, maximumSize=1).makeKey(fqFileName=self._fqFileNames[0])
+
+        ModuleResultCache(cacheDirectory=self._cacheDirectory, maximumSize=1).put(cacheKey=cacheKey,
+                                                                                  moduleResult=self._makeModuleResult(fqFileName=self._fqFileNames[0]))
+
+        cache: ModuleResultCache = ModuleResultCache(cacheDirectory=self._cacheDirectory, maximumSize=1)
+
+        self.assertIsNot(NO_MODULE_RESULT, cache.get(cacheKey=cacheKey, fqFileName=self._fqFileNames[0]), 'Entries should survive a new cache instance')
+
+    def testKeyIsContentAddressed(self):
+
+        cache:    ModuleResultCache = ModuleResultCache(cacheDirectory=self._cacheDirectory, maximumSize=1)
+        original: CacheKey          = cache.makeKey(fqFileName=self._fqFileNames[0])
+
+        self.assertNotEqual(original, cache.makeKey(fqFileName=self._fqFileNames[0], context=pass2Context(['Ozzee'])), 'Passes must not share entries')
+
+        with open(self._fqFileNames[0], 'a') as moduleFile:
+            moduleFile.write('\n# changed\n')
+
+        self.assertNotEqual(original, cache.makeKey(fqFileName=self._fqFileNames[0], context=PASS_1_CONTEXT), 'A changed module needs a new key')
+
+    def testKeyCoversCompactSourceCode(self):
+
+        cache:     ModuleResultCache = ModuleResultCache(cacheDirectory=self._cacheDirectory, maximumSize=1)
+        copied:    CacheKey          = cache.makeKey(fqFileName=self._fqFileNames[0], context=pass2Context(['Ozzee'], compactSourceCode=False))
+        reference: CacheKey          = cache.makeKey(fqFileName=self._fqFileNames[0], context=pass2Context(['Ozzee'], compactSourceCode=True))
+
+        self.assertNotEqual(copied, reference, 'Copied and referenced source code must not share entries')
+
+    def testSourceCodeReferencesFollowTheModule(self):
+
+        movedDirectory: Path = Path(self._temporaryDirectory.name) / 'moved'
+        movedDirectory.mkdir()
+        movedFileName:  str  = str(movedDirectory / TEST_MODULES[0])
+        copyfile(self._fqFileNames[0], movedFileName)
+
+        cache:        ModuleResultCache = ModuleResultCache(cacheDirectory=self._cacheDirectory, maximumSize=1)
+        cacheKey:     CacheKey          = cache.makeKey(fqFileName=self._fqFileNames[0])
+        moduleResult: ModuleResult      = self._makeModuleResult(fqFileName=self._fqFileNames[0])
+
+        pyutMethod: PyutMethod = PyutMethod(name='ozzee')
+        pyutMethod.sourceCode  = SourceCode(makeSourceCodeReference(fqFileName=self._fqFileNames[0], startOffset=0, endOffset=20))
+        moduleResult.pyutClasses[PyutClassName('Ozzee')].methods.append(pyutMethod)
+
+        expectedCode: List[str] = list(makeSourceCodeReference(fqFileName=self._fqFileNames[0], startOffset=0, endOffset=20))
+
+        cache.put(cacheKey=cacheKey, moduleResult=moduleResult)
+        Path(self._fqFileNames[0]).unlink()
+
+        self.assertEqual(cacheKey, cache.makeKey(fqFileName=movedFileName), 'The key should not depend on where the module lives')
+
+        movedResult: ModuleResult = cache.get(cacheKey=cacheKey, fqFileName=movedFileName)
+        movedMethod: PyutMethod   = movedResult.pyutClasses[PyutClassName('Ozzee')].methods[0]
+
+        self.assertIsInstance(movedMethod.sourceCode, SourceCodeReference, 'Should still be a reference')
+        self.assertEqual(expectedCode, list(movedMethod.sourceCode), 'The source code should be read from the moved module')
+
+    def testLeastRecentlyUsedEviction(self):
+
+        cache: ModuleResultCache = ModuleResultCache(cacheDirectory=self._cacheDirectory, maximumSize=0)
+
+        cacheKey: CacheKey = cache.makeKey(fqFileName=self._fqFileNames[0])
+        cache.put(cacheKey=cacheKey, moduleResult=self._makeModuleResult(fqFileName=self._fqFileNames[0]))
+
+        self.assertEqual(0, len(cache), 'Nothing fits in an empty cache')
+        self.assertEqual(0, cache.currentSize, 'Size not released')
+
+        cache = ModuleResultCache(cacheDirectory=self._cacheDirectory, maximumSize=1)
+
+        keys: List[CacheKey] = [cache.makeKey(fqFileName=fqFileName) for fqFileName in self._fqFileNames[0:3]]
+        for cacheKey in keys:
+            cache.put(cacheKey=cacheKey, moduleResult=self._makeModuleResult(fqFileName=self._fqFileNames[0]))
+
+        cache.get(cacheKey=keys[0], fqFileName=self._fqFileNames[0])
+        #
+        # Shrink the cache to two entries
+        #
+        cache._maximumSize = cache.currentSize - 1
+        cache._evict()
+
+        self.assertNotIn(keys[1], cache, 'The least recently used entry should be evicted')
+        self.assertIn(keys[0],    cache, 'Recently used entries should be kept')
+        self.assertIn(keys[2],    cache, 'Recently added entries should be kept')
+
+    def testParallelReverseEngineerUsesCache(self):
+
+        cache: ModuleResultCache = ModuleResultCache(cacheDirectory=self._cacheDirectory, maximumSize=16)
+
+        uncachedClasses: PyutClasses = self._reverseEngineer(cache=cache)
+
+        self.assertEqual(2 * len(self._fqFileNames), len(cache), 'Both passes should cache every module')
+
+        cachedClasses: PyutClasses = self._reverseEngineer(cache=cache)
+
+        self.assertEqual(sorted(uncachedClasses.keys()), sorted(cachedClasses.keys()), 'Cached import should find the same classes')
+
+        pyutClass: PyutClass = cachedClasses[PyutClassName('SimpleClass')]
+        self.assertEqual(10, len(pyutClass.methods), 'Cached methods are missing')
+
+    def _reverseEngineer(self, cache: ModuleResultCache) -> PyutClasses:
+
+        reverseEngineer: ParallelReverseEngineer = ParallelReverseEngineer(maxWorkers=2, moduleResultCache=cache)
+
+        pyutClasses: PyutClasses = reverseEngineer.doPass1(fqFileNames=self._fqFileNames, progressCallback=self._progressCallback)
+        pyutClasses              = reverseEngineer.doPass2(fqFileNames=self._fqFileNames, pyutClasses=pyutClasses, progressCallback=self._progressCallback)
+
+        return pyutClasses
+
+    def _makeModuleResult(self, fqFileName: str) -> ModuleResult:
+
+        pyutClasses: PyutClasses = PyutClasses({PyutClassName('Ozzee'): PyutClass(name='Ozzee')})
+
+        return ModuleResult(fqFileName=fqFileName, pyutClasses=pyutClasses)
+
+    def _progressCallback(self, currentFileCount: int, msg: str):
+        self.logger.debug(f'{currentFileCount} {msg}')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestModuleResultCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,159 @@
+
+from typing import List
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutmodelv2.PyutClass import PyutClass
+
+from pyutplugins.ioplugins.python.CancellationToken import CancellationToken
+from pyutplugins.ioplugins.python.ImportCancelledException import ImportCancelledException
+from pyutplugins.ioplugins.python.ParallelReverseEngineer import ParallelReverseEngineer
+from pyutplugins.ioplugins.python.ParallelReverseEngineer import WORKER_START_METHOD
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ParentName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+
+from tests.ProjectTestBase import ProjectTestBase
+
+TEST_MODULES: List[str] = ['Opie.py', 'MultipleInheritance.py', 'AssociationClasses.py', 'SimpleClass.py']
+
+
+class TestParallelReverseEngineer(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._fqFileNames: List[str] = [
+            UnitTestBase.getFullyQualifiedResourceFileName(ProjectTestBase.RESOURCES_TEST_CLASSES_PACKAGE_NAME, fileName) for fileName in TEST_MODULES
+        ]
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testPass1FindsAllClasses(self):
+
+        reverseEngineer: ParallelReverseEngineer = ParallelReverseEngineer(maxWorkers=2)
+        pyutClasses:     PyutClasses             = reverseEngineer.doPass1(fqFileNames=self._fqFileNames, progressCallback=self._progressCallback)
+
+        self.assertIn('Opie',        pyutClasses, 'Missing class from Opie.py')
+        self.assertIn('Car',         pyutClasses, 'Missing class from MultipleInheritance.py')
+        self.assertIn('Pages',       pyutClasses, 'Missing synthetic class from AssociationClasses.py')
+        self.assertIn('SimpleClass', pyutClasses, 'Missing class from SimpleClass.py')
+
+    def testPass2Merges(self):
+
+        reverseEngineer: ParallelReverseEngineer = ParallelReverseEngineer(maxWorkers=2)
+
+        pyutClasses: PyutClasses = reverseEngineer.doPass1(fqFileNames=self._fqFileNames, progressCallback=self._progressCallback)
+        pyutClasses              = reverseEngineer.doPass2(fqFileNames=self._fqFileNames, pyutClasses=pyutClasses, progressCallback=self._progressCallback)
+
+        self.assertIn(ParentName('Cat'),     reverseEngineer.parents, 'Missing parent from Opie.py')
+        self.assertIn(ParentName('Flyable'), reverseEngineer.parents, 'Missing parent from MultipleInheritance.py')
+        self.assertEqual(2, len(reverseEngineer.associations), 'Incorrect number of associations generated')
+
+        pyutClass: PyutClass = pyutClasses[PyutClassName('SimpleClass')]
+        self.assertEqual(10, len(pyutClass.methods), 'Methods found by the worker were not merged')
+
+    def testSkimMergesParents(self):
+
+        reverseEngineer: ParallelReverseEngineer = ParallelReverseEngineer(maxWorkers=2)
+        pyutClasses:     PyutClasses             = reverseEngineer.doSkim(fqFileNames=self._fqFileNames, progressCallback=self._progressCallback)
+
+        self.assertIn('Pages',                   pyutClasses,                  'Missing synthetic class from AssociationClasses.py')
+        self.assertIn(ParentName('Cat'),         reverseEngineer.parents,      'Missing parent from Opie.py')
+        self.assertIn(ParentName('Flyable'),     reverseEngineer.parents,      'Missing parent from MultipleInheritance.py')
+        self.assertEqual(len(self._fqFileNames), len(reverseEngineer.pass2Results), 'Every module should have a result')
+
+    def testUniqueIds(self):
+
+        reverseEngineer: ParallelReverseEngineer = ParallelReverseEngineer(maxWorkers=2)
+
+        pyutClasses: PyutClasses = reverseEngineer.doPass1(fqFileNames=self._fqFileNames, progressCallback=self._progressCallback)
+        pyutClasses              = reverseEngineer.doPass2(fqFileNames=self._fqFileNames, pyutClasses=pyutClasses, progressCallback=self._progressCallback)
+
+        ids: List[int] = [pyutClass.id for pyutClass in pyutClasses.values()]
+
+        self.assertEqual(len(ids), len(set(ids)), 'Classes built in different workers must not share ids')
+
+    def testWorkersAreSpawned(self):
+        """
+        The pass 2 workers only see the pass 1 classes through the pool initializer when they
+        are not forked
+        """
+        reverseEngineer: ParallelReverseEngineer = ParallelReverseEngineer(maxWorkers=2)
+
+        self.assertEqual('spawn', WORKER_START_METHOD, 'Forking a process that runs wx is not safe')
+        self.assertEqual(WORKER_START_METHOD, reverseEngineer.workerContext.get_start_method(), 'The pools must use the worker context')
+
+        pyutClasses: PyutClasses = reverseEngineer.doPass1(fqFileNames=self._fqFileNames, progressCallback=self._progressCallback)
+        pyutClasses              = reverseEngineer.doPass2(fqFileNames=self._fqFileNames, pyutClasses=pyutClasses, progressCallback=self._progressCallback)
+
+        self.assertEqual(0, len(reverseEngineer.moduleErrors), 'Spawned workers should parse every module')
+        self.assertIn(ParentName('Cat'), reverseEngineer.parents, 'Spawned pass 2 workers did not get the pass 1 classes')
+
+    def testPass2CountsModulesThatFailedPass1(self):
+
+        progressCounts: List[int] = []
+
+        def recordProgress(currentFileCount: int, msg: str):
+            progressCounts.append(currentFileCount)
+
+        with TemporaryDirectory() as temporaryDirectory:
+            brokenModule: Path = Path(temporaryDirectory) / 'Broken.py'
+            brokenModule.write_text('class Broken(:\n    pass\n')
+
+            fqFileNames:     List[str]               = self._fqFileNames + [str(brokenModule)]
+            reverseEngineer: ParallelReverseEngineer = ParallelReverseEngineer(maxWorkers=2)
+
+            pyutClasses: PyutClasses = reverseEngineer.doPass1(fqFileNames=fqFileNames, progressCallback=self._progressCallback)
+            reverseEngineer.doPass2(fqFileNames=fqFileNames, pyutClasses=pyutClasses, progressCallback=recordProgress)
+
+        self.assertEqual(len(fqFileNames), progressCounts[-1], 'The module that failed pass 1 counts as done')
+        self.assertEqual(len(self._fqFileNames), len(progressCounts), 'Only the processed modules are reported')
+
+    def testCancelledBetweenModules(self):
+
+        cancellationToken: CancellationToken       = CancellationToken()
+        reverseEngineer:   ParallelReverseEngineer = ParallelReverseEngineer(maxWorkers=1)
+
+        reverseEngineer.cancellationToken = cancellationToken
+
+        def cancelAfterFirstModule(currentFileCount: int, msg: str):
+            cancellationToken.cancel()
+
+        self.assertRaises(ImportCancelledException,
+                          lambda: reverseEngineer.doPass1(fqFileNames=self._fqFileNames, progressCallback=cancelAfterFirstModule))
+
+    def _progressCallback(self, currentFileCount: int, msg: str):
+        self.logger.debug(f'{currentFileCount} {msg}')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestParallelReverseEngineer))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,93 @@
+
+from typing import cast
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutplugins.ioplugins.python.ParseTreeCache import NO_PARSE_TREE
+from pyutplugins.ioplugins.python.ParseTreeCache import ONE_MEGABYTE
+from pyutplugins.ioplugins.python.ParseTreeCache import PARSE_TREE_BYTES_PER_SOURCE_BYTE
+from pyutplugins.ioplugins.python.ParseTreeCache import ParseTreeCache
+
+from pyutplugins.ioplugins.python.pythonpegparser.PythonParser import PythonParser
+
+FAKE_TREE: PythonParser.File_inputContext = cast(PythonParser.File_inputContext, object())
+
+#
+# Exactly half of a 1 MB cache
+#
+HALF_CACHE_SOURCE_SIZE: int = ONE_MEGABYTE // PARSE_TREE_BYTES_PER_SOURCE_BYTE // 2
+
+
+class TestParseTreeCache(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testAddAndRemove(self):
+
+        cache: ParseTreeCache = ParseTreeCache(maximumSize=1)
+
+        retained: bool = cache.add(fqFileName='/tmp/Ozzee.py', tree=FAKE_TREE, sourceSize=HALF_CACHE_SOURCE_SIZE)
+
+        self.assertTrue(retained, 'Tree should fit')
+        self.assertIn('/tmp/Ozzee.py', cache, 'Tree should be retained')
+
+        tree: PythonParser.File_inputContext = cache.remove(fqFileName='/tmp/Ozzee.py')
+
+        self.assertIs(FAKE_TREE, tree, 'Should get back what we put in')
+        self.assertEqual(0, len(cache), 'Remove should release the tree')
+        self.assertEqual(0, cache.currentSize, 'Remove should release the memory estimate')
+
+    def testRemoveMissing(self):
+
+        cache: ParseTreeCache = ParseTreeCache(maximumSize=1)
+
+        self.assertIs(NO_PARSE_TREE, cache.remove(fqFileName='/tmp/Opie.py'), 'Missing trees have to be re-parsed')
+
+    def testMemoryCap(self):
+
+        cache: ParseTreeCache = ParseTreeCache(maximumSize=1)
+
+        self.assertTrue(cache.add(fqFileName='/tmp/Ozzee.py', tree=FAKE_TREE, sourceSize=HALF_CACHE_SOURCE_SIZE))
+        self.assertTrue(cache.add(fqFileName='/tmp/Opie.py',  tree=FAKE_TREE, sourceSize=HALF_CACHE_SOURCE_SIZE))
+        self.assertFalse(cache.add(fqFileName='/tmp/Fran.py', tree=FAKE_TREE, sourceSize=HALF_CACHE_SOURCE_SIZE), 'Should exceed the cap')
+
+        self.assertEqual(2, len(cache), 'Only the trees that fit are retained')
+
+    def testReAddSameModule(self):
+
+        cache: ParseTreeCache = ParseTreeCache(maximumSize=1)
+
+        cache.add(fqFileName='/tmp/Ozzee.py', tree=FAKE_TREE, sourceSize=HALF_CACHE_SOURCE_SIZE)
+        cache.add(fqFileName='/tmp/Ozzee.py', tree=FAKE_TREE, sourceSize=HALF_CACHE_SOURCE_SIZE)
+
+        self.assertEqual(HALF_CACHE_SOURCE_SIZE * PARSE_TREE_BYTES_PER_SOURCE_BYTE, cache.currentSize, 'Should not double count')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestParseTreeCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
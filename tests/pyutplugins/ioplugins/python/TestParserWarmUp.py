@@ -0,0 +1,68 @@
+
+from threading import Thread
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutplugins.ioplugins.python.ParserWarmUp import ParserWarmUp
+from pyutplugins.ioplugins.python.ParserWarmUp import WARM_UP_MODULE_NAME
+from pyutplugins.ioplugins.python.ParserWarmUp import WARM_UP_SAMPLE
+from pyutplugins.ioplugins.python.PythonModuleParser import ParseStage
+from pyutplugins.ioplugins.python.PythonModuleParser import PythonModuleParser
+
+from pyutplugins.ioplugins.python.pythonpegparser.PythonLexer import PythonLexer
+from pyutplugins.ioplugins.python.pythonpegparser.PythonParser import PythonParser
+
+
+class TestParserWarmUp(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testRecognizersShareTheirTables(self):
+
+        self.assertIs(PythonLexer.atn,             PythonLexer.atn,             'The lexer ATN is only deserialized once')
+        self.assertIs(PythonParser.decisionsToDFA, PythonParser.decisionsToDFA, 'The parser DFA is only built once')
+
+    def testWarmUpSampleUsesTheFastStage(self):
+
+        moduleParser: PythonModuleParser = PythonModuleParser()
+        moduleParser.parseSource(source=WARM_UP_SAMPLE, moduleName=WARM_UP_MODULE_NAME)
+
+        self.assertEqual(ParseStage.SLL, moduleParser.parseStages[WARM_UP_MODULE_NAME], 'The sample should not need LL')
+
+    def testWarmUpFillsTheParserDFA(self):
+
+        thread: Thread = ParserWarmUp().start()
+        thread.join()
+
+        stateCount: int = sum(len(dfa.states) for dfa in PythonParser.decisionsToDFA)
+        self.assertGreater(stateCount, 0, 'The warm up should have added DFA states')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestParserWarmUp))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
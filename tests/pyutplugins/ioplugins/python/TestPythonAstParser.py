@@ -0,0 +1,104 @@
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutplugins.ioplugins.python.PythonAstParser import AstModule
+from pyutplugins.ioplugins.python.PythonAstParser import PythonAstParser
+from pyutplugins.ioplugins.python.PythonParseException import PythonParseException
+
+UTF8_BOM: bytes = b'\xef\xbb\xbf'
+
+#
+# 'Café' and 'Señor' are not valid utf-8 when encoded as latin-1
+#
+LATIN1_MODULE: str = (
+    '# -*- coding: latin-1 -*-\n'
+    '\n'
+    'class Cafe:\n'
+    '    def greet(self) -> str:\n'
+    '        return "Señor"\n'
+)
+
+BOM_MODULE: str = (
+    'class Menu:\n'
+    '    def dish(self) -> str:\n'
+    '        return "Crème brûlée"\n'
+)
+
+BAD_COOKIE_MODULE: str = (
+    '# -*- coding: no-such-encoding -*-\n'
+    'class Broken:\n'
+    '    pass\n'
+)
+
+
+class TestPythonAstParser(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._astParser:          PythonAstParser    = PythonAstParser()
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testCodingCookie(self):
+
+        fqFileName: Path = self._writeModule(fileName='Latin1.py', contents=LATIN1_MODULE.encode('latin-1'))
+
+        astModule: AstModule = self._astParser.parse(fqFileName=str(fqFileName))
+
+        self.assertIn('"Señor"', astModule.getStatementText(astModule.tree.body[0].body[0].body), 'Should decode with the cookie\'s encoding')     # type: ignore
+
+    def testByteOrderMark(self):
+
+        fqFileName: Path = self._writeModule(fileName='Bom.py', contents=UTF8_BOM + BOM_MODULE.encode('utf-8'))
+
+        astModule: AstModule = self._astParser.parse(fqFileName=str(fqFileName))
+
+        self.assertEqual('Menu', astModule.tree.body[0].name, 'The BOM should not be part of the source')     # type: ignore
+        self.assertIn('"Crème brûlée"', astModule.getStatementText(astModule.tree.body[0].body[0].body), 'Should decode as utf-8')     # type: ignore
+
+    def testUnknownCodingCookie(self):
+
+        fqFileName: Path = self._writeModule(fileName='BadCookie.py', contents=BAD_COOKIE_MODULE.encode('utf-8'))
+
+        self.assertRaises(PythonParseException, lambda: self._astParser.parse(fqFileName=str(fqFileName)))
+
+    def _writeModule(self, fileName: str, contents: bytes) -> Path:
+
+        fqFileName: Path = Path(self._temporaryDirectory.name) / fileName
+        fqFileName.write_bytes(contents)
+
+        return fqFileName
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestPythonAstParser))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
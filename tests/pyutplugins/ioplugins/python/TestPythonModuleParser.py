@@ -0,0 +1,188 @@
+
+from typing import List
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from antlr4 import CommonTokenStream
+from antlr4 import InputStream
+
+from antlr4.tree.Trees import Trees
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutplugins.ioplugins.python.PythonModuleParser import ParseStage
+from pyutplugins.ioplugins.python.PythonModuleParser import PythonModuleParser
+from pyutplugins.ioplugins.python.PythonModuleParser import StatementStreamer
+from pyutplugins.ioplugins.python.PythonModuleParser import sharedDFALock
+from pyutplugins.ioplugins.python.PythonParseException import PythonParseException
+
+from pyutplugins.ioplugins.python.pythonpegparser.PythonLexer import PythonLexer
+from pyutplugins.ioplugins.python.pythonpegparser.PythonParser import PythonParser
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegClassVisitor import PyutPythonPegClassVisitor
+
+from tests.ProjectTestBase import ProjectTestBase
+
+BROKEN_MODULE: str = (
+    'class Broken:\n'
+    '    def method(self:\n'
+    '        pass\n'
+)
+
+
+class LockProbingVisitor(PyutPythonPegClassVisitor):
+    """
+    Records whether the DFA lock is held each time a module level statement is visited
+    """
+    def __init__(self):
+        super().__init__()
+        self.lockStates: List[bool] = []
+
+    def visitStatement(self, ctx: PythonParser.StatementContext):
+
+        self.lockStates.append(sharedDFALock.locked())
+
+        return super().visitStatement(ctx)
+
+
+class TestPythonModuleParser(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._moduleParser: PythonModuleParser = PythonModuleParser()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testSLLStage(self):
+
+        fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(ProjectTestBase.RESOURCES_TEST_CLASSES_PACKAGE_NAME, 'SimpleClass.py')
+
+        tree: PythonParser.File_inputContext = self._moduleParser.parse(fqFileName=fqFileName)
+
+        self.assertIsNotNone(tree, 'Should have parsed')
+        self.assertEqual(ParseStage.SLL, self._moduleParser.parseStages[fqFileName], 'Simple code should not need LL prediction')
+        self.assertEqual(1, self._moduleParser.stageCount(ParseStage.SLL), 'Incorrect SLL count')
+        self.assertEqual(0, self._moduleParser.stageCount(ParseStage.LL),  'Incorrect LL count')
+
+    def testSyntaxErrorsStillReported(self):
+
+        with TemporaryDirectory() as temporaryDirectory:
+            fqFileName: Path = Path(temporaryDirectory) / 'Broken.py'
+            fqFileName.write_text(BROKEN_MODULE)
+
+            self.assertRaises(PythonParseException, lambda: self._moduleParser.parse(fqFileName=str(fqFileName)))
+
+        self.assertEqual(0, len(self._moduleParser.parseStages), 'A broken module has no successful stage')
+
+    def testReusedParserAfterSyntaxError(self):
+
+        fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(ProjectTestBase.RESOURCES_TEST_CLASSES_PACKAGE_NAME, 'SimpleClass.py')
+
+        self.assertRaises(PythonParseException, lambda: self._moduleParser.parseSource(source=BROKEN_MODULE, moduleName='Broken'))
+
+        tree: PythonParser.File_inputContext = self._moduleParser.parse(fqFileName=fqFileName)
+
+        self.assertIsNotNone(tree, 'The previous error should not leak into the next module')
+        self.assertEqual(ParseStage.SLL, self._moduleParser.parseStages[fqFileName], 'The prediction mode should be reset')
+
+    def testReusedParserProducesTheSameTrees(self):
+
+        moduleParser: PythonModuleParser = PythonModuleParser(cacheClearInterval=2)
+        for fileName in ['SimpleClass.py', 'ClassWithProperties.py', 'DeepInheritance.py', 'SimpleClass.py']:
+            fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(ProjectTestBase.RESOURCES_TEST_CLASSES_PACKAGE_NAME, fileName)
+
+            reusedTree: PythonParser.File_inputContext = moduleParser.parse(fqFileName=fqFileName)
+            freshTree:  PythonParser.File_inputContext = PythonModuleParser().parse(fqFileName=fqFileName)
+
+            self.assertEqual(Trees.toStringTree(freshTree, PythonParser.ruleNames), Trees.toStringTree(reusedTree, PythonParser.ruleNames), f'{fileName} parsed differently')
+
+    def testStreamingFindsTheSameClasses(self):
+
+        for fileName in ['DeepInheritance.py', 'AssociationClasses.py', 'MultipleInheritance.py']:
+            fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(ProjectTestBase.RESOURCES_TEST_CLASSES_PACKAGE_NAME, fileName)
+
+            treeVisitor: PyutPythonPegClassVisitor = self._createClassVisitor()
+            treeVisitor.visit(self._moduleParser.parse(fqFileName=fqFileName))
+
+            streamVisitor: PyutPythonPegClassVisitor = self._createClassVisitor()
+            self._moduleParser.stream(fqFileName=fqFileName, visitor=streamVisitor)
+
+            self.assertEqual(list(treeVisitor.pyutClasses.keys()), list(streamVisitor.pyutClasses.keys()), f'{fileName} streamed differently')
+
+    def testStreamingDetachesModuleStatements(self):
+
+        fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(ProjectTestBase.RESOURCES_TEST_CLASSES_PACKAGE_NAME, 'DeepInheritance.py')
+
+        tree: PythonParser.File_inputContext = self._moduleParser.stream(fqFileName=fqFileName, visitor=self._createClassVisitor())
+
+        statements: PythonParser.StatementsContext = tree.statements()
+        self.assertTrue(statements is None or statements.getChildCount() == 0, 'Module level statements should have been detached')
+
+    def testStreamingSkipsStatementsVisitedBeforeTheLLRetry(self):
+
+        source: str = (
+            'class First:\n'
+            '    pass\n'
+            '\n'
+            'class Second(First):\n'
+            '    pass\n'
+        )
+        streamVisitor: PyutPythonPegClassVisitor = self._createClassVisitor()
+        streamer:      StatementStreamer         = StatementStreamer(visitor=streamVisitor, skipCount=1)
+
+        parser: PythonParser = PythonParser(CommonTokenStream(PythonLexer(InputStream(source))))
+        parser.addParseListener(streamer)
+        parser.file_input()
+
+        self.assertEqual(2,          streamer.statementCount,                 'Both statements are counted')
+        self.assertEqual(['Second'], list(streamVisitor.pyutClasses.keys()), 'The first statement was already visited')
+
+    def testStreamingVisitsWithoutTheDFALock(self):
+
+        fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(ProjectTestBase.RESOURCES_TEST_CLASSES_PACKAGE_NAME, 'DeepInheritance.py')
+
+        streamVisitor: LockProbingVisitor = LockProbingVisitor()
+        streamVisitor.pyutClasses = PyutClasses({})
+
+        self._moduleParser.stream(fqFileName=fqFileName, visitor=streamVisitor)
+
+        self.assertNotEqual(0, len(streamVisitor.lockStates), 'Should have visited the module statements')
+        self.assertNotIn(True, streamVisitor.lockStates, 'Other threads may parse while a statement is visited')
+        self.assertFalse(sharedDFALock.locked(), 'The lock should be released after the parse')
+
+    def _createClassVisitor(self) -> PyutPythonPegClassVisitor:
+
+        visitor: PyutPythonPegClassVisitor = PyutPythonPegClassVisitor()
+        visitor.pyutClasses = PyutClasses({})
+
+        return visitor
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestPythonModuleParser))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
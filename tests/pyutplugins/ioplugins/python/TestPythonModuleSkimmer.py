@@ -0,0 +1,157 @@
+
+from typing import List
+from typing import Tuple
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutmodelv2.PyutClass import PyutClass
+
+from pyutmodelv2.enumerations.PyutStereotype import PyutStereotype
+from pyutmodelv2.enumerations.PyutVisibility import PyutVisibility
+
+from pyutplugins.ioplugins.python.PythonModuleParser import PythonModuleParser
+from pyutplugins.ioplugins.python.PythonModuleSkimmer import PythonModuleSkimmer
+from pyutplugins.ioplugins.python.PythonParseException import PythonParseException
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import ModuleResult
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+from pyutplugins.ioplugins.python.visitor.ParserTypes import mergeParents
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegClassVisitor import PyutPythonPegClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PyutPythonPegVisitor
+
+from tests.ProjectTestBase import ProjectTestBase
+
+NESTED_MODULE: str = (
+    'class Outer(Base):\n'
+    '    def method(self):\n'
+    '        class Inner:\n'
+    '            def innerMethod(self): pass\n'
+    '        def helper(): pass\n'
+    '        return Inner\n'
+    '\n'
+    '    async def _asyncMethod(self):\n'
+    '        pass\n'
+    '\n'
+    'def function():\n'
+    '    pass\n'
+)
+
+UNTERMINATED_MODULE: str = (
+    'class Broken:\n'
+    '    """\n'
+)
+
+
+class TestPythonModuleSkimmer(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._skimmer: PythonModuleSkimmer = PythonModuleSkimmer()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testSameClassesAndParentsAsThePegVisitors(self):
+
+        fqFileName:  str       = UnitTestBase.getFullyQualifiedResourceFileName(ProjectTestBase.RESOURCES_TEST_CLASSES_PACKAGE_NAME, 'SimpleClass.py')
+        testClasses: Path      = Path(fqFileName).parent
+        fqFileNames: List[str] = sorted(str(modulePath) for modulePath in testClasses.glob('*.py') if modulePath.name != '__init__.py')
+
+        pegClasses, pegParents = self._reverseEngineerPeg(fqFileNames=fqFileNames)
+
+        skimClasses: PyutClasses = PyutClasses({})
+        skimParents: Parents     = Parents({})
+        for fqFileName in fqFileNames:
+            moduleResult: ModuleResult = self._skimmer.skim(fqFileName=fqFileName)
+            skimClasses.update(moduleResult.pyutClasses)
+            mergeParents(parents=skimParents, moreParents=moduleResult.parents)
+
+        self.assertEqual(list(pegClasses.keys()), list(skimClasses.keys()), 'Skimming found different classes')
+        self.assertEqual(pegParents, skimParents, 'Skimming found different parents')
+        for className, pegClass in pegClasses.items():
+            self.assertEqual(pegClass.stereotype, skimClasses[className].stereotype, f'{className} stereotype')
+
+    def testEnumerationMembers(self):
+
+        pyutClass: PyutClass = self._skimTestClass(fileName='SimpleEnumeration.py', className='SimpleEnumeration')
+
+        self.assertEqual(PyutStereotype.ENUMERATION, pyutClass.stereotype, 'Should be an enumeration')
+        self.assertEqual(5, len(pyutClass.fields), 'Every member should be a field')
+
+    def testDataClassFields(self):
+
+        pyutClass: PyutClass = self._skimTestClass(fileName='SimpleDataClass.py', className='SimpleDataClass')
+
+        self.assertEqual(['z', 'w', 'x', 'y'], [pyutField.name for pyutField in pyutClass.fields], 'Missing data class fields')
+
+    def testMethodHeaders(self):
+
+        moduleResult: ModuleResult = self._skimmer.skimSource(source=NESTED_MODULE, moduleName='Nested')
+
+        outer: PyutClass = moduleResult.pyutClasses[PyutClassName('Outer')]
+        inner: PyutClass = moduleResult.pyutClasses[PyutClassName('Inner')]
+
+        self.assertEqual(['method', '_asyncMethod'],                      [pyutMethod.name for pyutMethod in outer.methods],       'Nested functions are not methods')
+        self.assertEqual([PyutVisibility.PUBLIC, PyutVisibility.PROTECTED], [pyutMethod.visibility for pyutMethod in outer.methods], 'Incorrect visibility')
+        self.assertEqual(['innerMethod'],                                 [pyutMethod.name for pyutMethod in inner.methods],       'Missing single line method')
+        self.assertEqual({'Base': ['Outer']},                             moduleResult.parents,                                    'Incorrect parents')
+
+    def testUntokenizableModule(self):
+        self.assertRaises(PythonParseException, lambda: self._skimmer.skimSource(source=UNTERMINATED_MODULE, moduleName='Broken'))
+
+    def _skimTestClass(self, fileName: str, className: str) -> PyutClass:
+
+        fqFileName:   str          = UnitTestBase.getFullyQualifiedResourceFileName(ProjectTestBase.RESOURCES_TEST_CLASSES_PACKAGE_NAME, fileName)
+        moduleResult: ModuleResult = self._skimmer.skim(fqFileName=fqFileName)
+
+        return moduleResult.pyutClasses[PyutClassName(className)]
+
+    def _reverseEngineerPeg(self, fqFileNames: List[str]) -> Tuple[PyutClasses, Parents]:
+
+        moduleParser: PythonModuleParser = PythonModuleParser()
+        pyutClasses:  PyutClasses        = PyutClasses({})
+        for fqFileName in fqFileNames:
+            classVisitor: PyutPythonPegClassVisitor = PyutPythonPegClassVisitor()
+            classVisitor.pyutClasses = pyutClasses
+            classVisitor.visit(moduleParser.parse(fqFileName=fqFileName))
+
+        parents: Parents = Parents({})
+        for fqFileName in fqFileNames:
+            visitor: PyutPythonPegVisitor = PyutPythonPegVisitor()
+            visitor.pyutClasses  = pyutClasses
+            visitor.parents      = parents
+            visitor.associations = Associations({})
+            visitor.visit(moduleParser.parse(fqFileName=fqFileName))
+
+        return pyutClasses, parents
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestPythonModuleSkimmer))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,175 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutplugins.ioplugins.python.PythonReverseEngineer import PythonReverseEngineer
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associates
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+
+#
+# Two packages that both define a Shape
+#
+TEST_PACKAGES: Dict[str, Dict[str, str]] = {
+    'alpha': {
+        'Shapes.py': (
+            'class Shape:\n'
+            '    pass\n'
+            '\n'
+            '\n'
+            'class Circle(Shape):\n'
+            '    pass\n'
+        ),
+    },
+    'beta': {
+        'Shapes.py': (
+            'class Shape:\n'
+            '    pass\n'
+        ),
+        'Drawing.py': (
+            'from enum import Enum\n'
+            '\n'
+            'from alpha.Shapes import Shape as AlphaShape\n'
+            'from .Shapes import Shape\n'
+            '\n'
+            '\n'
+            'class Square(Shape):\n'
+            '    pass\n'
+            '\n'
+            '\n'
+            'class Color(Enum):\n'
+            '    RED = 1\n'
+            '\n'
+            '\n'
+            'class Canvas:\n'
+            '    @property\n'
+            '    def shape(self) -> AlphaShape:\n'
+            '        return AlphaShape()\n'
+        ),
+    },
+}
+
+ALPHA_SHAPE: str = 'alpha.Shapes.Shape'
+BETA_SHAPE:  str = 'beta.Shapes.Shape'
+
+MODULE_COUNT: int = sum(len(modules) + 1 for modules in TEST_PACKAGES.values())      # Plus each package's __init__.py
+
+
+class TestPythonReverseEngineer(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory    = TemporaryDirectory()
+        self._rootPath:           Path                  = Path(self._temporaryDirectory.name)
+        self._progressReports:    List[Tuple[int, str]] = []
+
+        for packageName, modules in TEST_PACKAGES.items():
+            packagePath: Path = self._rootPath / packageName
+
+            packagePath.mkdir()
+            (packagePath / '__init__.py').write_text('')
+            for fileName, text in modules.items():
+                (packagePath / fileName).write_text(text)
+
+        self._reverseEngineer: PythonReverseEngineer = self._reverseEngineerPackages()
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testClasses(self):
+
+        pyutClasses: PyutClasses = self._reverseEngineer.pyutClasses
+
+        self.assertIn(ALPHA_SHAPE,   pyutClasses, 'The duplicated class should be qualified')
+        self.assertIn(BETA_SHAPE,    pyutClasses, 'The duplicated class should be qualified')
+        self.assertIn('Circle',      pyutClasses, 'A unique class keeps its name')
+        self.assertNotIn('Shape',    pyutClasses, 'Ambiguous')
+
+    def testParents(self):
+
+        parents: Parents = self._reverseEngineer.parents
+
+        self.assertEqual(['Circle'], parents[ALPHA_SHAPE], 'Wrong Shape')
+        self.assertEqual(['Square'], parents[BETA_SHAPE],  'Wrong Shape')
+        self.assertEqual(['Color'],  parents['Enum'],      'An unknown parent keeps its name')
+
+    def testAssociations(self):
+
+        associations: Associations = self._reverseEngineer.associations
+        associates:   Associates   = associations[PyutClassName('Canvas')]
+
+        self.assertEqual([ALPHA_SHAPE], [associate.associateName for associate in associates], 'Should be named like the classes')
+
+    def testLinksNamedLikeClasses(self):
+
+        pyutClasses: PyutClasses = self._reverseEngineer.pyutClasses
+        parents:     Parents     = self._reverseEngineer.parents
+
+        for parentName, children in parents.items():
+            if parentName != 'Enum':
+                self.assertIn(parentName, pyutClasses, 'Parent is not a class')
+            for childName in children:
+                self.assertIn(childName, pyutClasses, 'Child is not a class')
+
+    def testProgressCountsAcrossPackages(self):
+
+        pass1Counts: List[int] = [currentFileCount for currentFileCount, msg in self._progressReports if msg.startswith('Pass 1')]
+        pass2Counts: List[int] = [currentFileCount for currentFileCount, msg in self._progressReports if msg.startswith('Processing')]
+
+        self.assertEqual(list(range(1, MODULE_COUNT + 1)), pass1Counts, 'Pass 1 should count every module of every package')
+        self.assertEqual(list(range(1, MODULE_COUNT + 1)), pass2Counts, 'Pass 2 should start counting over')
+
+    def _reverseEngineerPackages(self) -> PythonReverseEngineer:
+
+        reverseEngineer: PythonReverseEngineer = PythonReverseEngineer()
+        packages:        Dict[str, List[str]]  = {str(self._rootPath / packageName): ['__init__.py'] + list(modules.keys()) for packageName, modules in TEST_PACKAGES.items()}
+
+        pyutClasses: PyutClasses = PyutClasses({})
+        for directoryName, files in packages.items():
+            pyutClasses = reverseEngineer.doPass1(directoryName=directoryName, files=files, progressCallback=self._progressCallback)
+        for directoryName, files in packages.items():
+            reverseEngineer.doPass2(directoryName=directoryName, files=files, pyutClasses=pyutClasses, progressCallback=self._progressCallback)
+
+        return reverseEngineer
+
+    def _progressCallback(self, currentFileCount: int, msg: str):
+        self.logger.debug(f'{currentFileCount} {msg}')
+        self._progressReports.append((currentFileCount, msg))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestPythonReverseEngineer))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
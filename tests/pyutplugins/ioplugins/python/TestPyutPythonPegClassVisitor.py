@@ -20,6 +20,7 @@ from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
 
 from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
 
+from pyutplugins.ioplugins.python.visitor.PyutBaseVisitor import TraversalPolicy
 from pyutplugins.ioplugins.python.visitor.PyutPythonPegClassVisitor import PyutPythonPegClassVisitor
 
 from tests.ProjectTestBase import ProjectTestBase
@@ -109,6 +110,32 @@ class TestPyutPythonPegClassVisitor(BaseTestPyutPythonPegVisitor):
         self.assertIn('Pages',    classNames, 'Missing `Pages` class name')
         self.assertIn('Chapters', classNames, 'Missing `Chapters` class name')
 
+    def testFullTraversalSynthesizesTheSameTypes(self):
+
+        tree:    PythonParser.File_inputContext = self._setupPegBasedParser('AssociationClasses.py')
+        visitor: PyutPythonPegClassVisitor      = PyutPythonPegClassVisitor()
+
+        visitor.traversalPolicy = TraversalPolicy.FULL
+        visitor.visit(tree)
+
+        pyutClasses: PyutClasses = visitor.pyutClasses
+        self.assertEqual(5, len(pyutClasses), 'The full traversal should find the same classes')
+        self.assertEqual(PyutStereotype.TYPE, pyutClasses[PyutClassName('Pages')].stereotype, 'Synthetic classes need to be stereotyped')
+
+    def testPrunedTraversalVisitsFewerNodes(self):
+
+        tree:          PythonParser.File_inputContext = self._setupPegBasedParser('AssociationClasses.py')
+        fullVisitor:   PyutPythonPegClassVisitor      = PyutPythonPegClassVisitor()
+        prunedVisitor: PyutPythonPegClassVisitor      = PyutPythonPegClassVisitor()
+
+        fullVisitor.traversalPolicy   = TraversalPolicy.FULL
+        prunedVisitor.traversalPolicy = TraversalPolicy.PRUNED
+        fullVisitor.visit(tree)
+        prunedVisitor.visit(tree)
+
+        self.assertEqual(fullVisitor.pyutClasses.keys(), prunedVisitor.pyutClasses.keys(), 'Pruning should not change the classes')
+        self.assertLess(prunedVisitor.visitedNodeCount, fullVisitor.visitedNodeCount, 'Pruning should visit fewer nodes')
+
     def testNonClassAssignmentIgnore(self):
 
         tree:    PythonParser.File_inputContext = self._setupPegBasedParser('NoContainingClassFile.py')
@@ -261,11 +261,13 @@ class TestPyutPythonPegVisitor(BaseTestPyutPythonPegVisitor):
         pyutMethods: PyutMethods = pyutClass.methods
 
         pyutMethodInit: PyutMethod = pyutMethods[0]
-        self.assertEqual(6, len(pyutMethodInit.sourceCode), 'Mismatch of source code on __init__')
+        self.assertEqual(4, len(pyutMethodInit.sourceCode), 'Mismatch of source code on __init__')
 
         pyutMethodPublicMethod: PyutMethod = pyutMethods[1]
 
         self.assertEqual(6, len(pyutMethodPublicMethod.sourceCode), 'Mismatch of source code on publicMethod')
+        self.assertEqual('def __init__(self):', pyutMethodInit.sourceCode[0], 'Each method should have its own source code')
+        self.assertEqual('    return ans', pyutMethodPublicMethod.sourceCode[-1], 'Trailing blank lines should be dropped')
 
     def _getSimpleDataClassFields(self) -> PyutFields:
 
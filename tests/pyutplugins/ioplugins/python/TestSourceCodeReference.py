@@ -0,0 +1,157 @@
+
+from typing import List
+from typing import cast
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from pickle import dumps
+from pickle import loads
+
+from shutil import copyfile
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.PyutMethod import PyutMethod
+
+from pyutplugins.ioplugins.python.PythonAstParser import AstModule
+from pyutplugins.ioplugins.python.PythonAstParser import PythonAstParser
+from pyutplugins.ioplugins.python.PythonModuleParser import PythonModuleParser
+from pyutplugins.ioplugins.python.SourceCodeReference import SourceCodeReference
+from pyutplugins.ioplugins.python.SourceCodeReference import SourceFiles
+
+from pyutplugins.ioplugins.python.pythonpegparser.PythonParser import PythonParser
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+from pyutplugins.ioplugins.python.visitor.PyutAstClassVisitor import PyutAstClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutAstVisitor import PyutAstVisitor
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegClassVisitor import PyutPythonPegClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PyutPythonPegVisitor
+
+from tests.ProjectTestBase import ProjectTestBase
+
+TEST_MODULE_NAME: str           = 'SimpleClassWithCode.py'
+TEST_CLASS_NAME:  PyutClassName = PyutClassName('SimpleClassWithCode')
+
+
+class TestSourceCodeReference(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+        fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(ProjectTestBase.RESOURCES_TEST_CLASSES_PACKAGE_NAME, TEST_MODULE_NAME)
+
+        self._modulePath: Path = Path(self._temporaryDirectory.name) / TEST_MODULE_NAME
+        copyfile(fqFileName, self._modulePath)
+
+    def tearDown(self):
+        super().tearDown()
+        SourceFiles().clear()
+        self._temporaryDirectory.cleanup()
+
+    def testCompactIsTheSameAsCopied(self):
+
+        copiedMethods:  List[PyutMethod] = self._pegMethods(compactSourceCode=False)
+        compactMethods: List[PyutMethod] = self._pegMethods(compactSourceCode=True)
+
+        for copiedMethod, compactMethod in zip(copiedMethods, compactMethods):
+            self.assertIsInstance(compactMethod.sourceCode, SourceCodeReference, 'Should refer to the module')
+            self.assertFalse(cast(SourceCodeReference, compactMethod.sourceCode).loaded, 'Should not be loaded until it is used')
+            self.assertEqual(copiedMethod.sourceCode, compactMethod.sourceCode, f'{compactMethod.name} source code')
+
+    def testAstCompactIsTheSameAsPeg(self):
+
+        pegMethods: List[PyutMethod] = self._pegMethods(compactSourceCode=False)
+        astMethods: List[PyutMethod] = self._astMethods(compactSourceCode=True)
+
+        for pegMethod, astMethod in zip(pegMethods, astMethods):
+            self.assertIsInstance(astMethod.sourceCode, SourceCodeReference, 'Should refer to the module')
+            self.assertEqual(pegMethod.sourceCode, astMethod.sourceCode, f'{astMethod.name} source code')
+
+    def testPickledReferenceIsNotLoaded(self):
+
+        sourceCode: SourceCodeReference = cast(SourceCodeReference, self._pegMethods(compactSourceCode=True)[0].sourceCode)
+        unpickled:  SourceCodeReference = loads(dumps(sourceCode))
+
+        self.assertIsInstance(unpickled, SourceCodeReference, 'Should still be a reference')
+        self.assertFalse(sourceCode.loaded, 'Pickling should not load the code')
+        self.assertFalse(unpickled.loaded, 'Unpickling should not load the code')
+        self.assertEqual(sourceCode, unpickled, 'Should refer to the same code')
+
+    def testChangedModuleHasNoSourceCode(self):
+
+        sourceCode: SourceCodeReference = cast(SourceCodeReference, self._pegMethods(compactSourceCode=True)[0].sourceCode)
+
+        with open(self._modulePath, 'a') as moduleFile:
+            moduleFile.write('\n# Changed after the import\n')
+
+        self.assertEqual(0, len(sourceCode), 'The module changed so its offsets are wrong')
+
+    def _pegMethods(self, compactSourceCode: bool) -> List[PyutMethod]:
+
+        moduleParser: PythonModuleParser             = PythonModuleParser()
+        tree:         PythonParser.File_inputContext = moduleParser.parse(fqFileName=str(self._modulePath))
+        classVisitor: PyutPythonPegClassVisitor      = PyutPythonPegClassVisitor()
+
+        classVisitor.visit(tree)
+
+        visitor: PyutPythonPegVisitor = PyutPythonPegVisitor()
+
+        visitor.pyutClasses       = classVisitor.pyutClasses
+        visitor.compactSourceCode = compactSourceCode
+        visitor.visit(tree)
+
+        return self._classMethods(pyutClasses=visitor.pyutClasses)
+
+    def _astMethods(self, compactSourceCode: bool) -> List[PyutMethod]:
+
+        astModule:    AstModule           = PythonAstParser().parse(fqFileName=str(self._modulePath))
+        classVisitor: PyutAstClassVisitor = PyutAstClassVisitor()
+
+        classVisitor.visitModule(astModule)
+
+        visitor: PyutAstVisitor = PyutAstVisitor()
+
+        visitor.pyutClasses       = classVisitor.pyutClasses
+        visitor.compactSourceCode = compactSourceCode
+        visitor.visitModule(astModule)
+
+        return self._classMethods(pyutClasses=visitor.pyutClasses)
+
+    def _classMethods(self, pyutClasses: PyutClasses) -> List[PyutMethod]:
+
+        pyutClass: PyutClass = pyutClasses[TEST_CLASS_NAME]
+        self.assertEqual(2, len(pyutClass.methods), 'Both methods should be found')
+
+        return pyutClass.methods
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSourceCodeReference))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
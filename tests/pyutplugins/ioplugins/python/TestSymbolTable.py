@@ -0,0 +1,211 @@
+
+from typing import Dict
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutplugins.ioplugins.python.PythonModuleParser import PythonModuleParser
+from pyutplugins.ioplugins.python.SymbolTable import NO_QUALIFIED_NAME
+from pyutplugins.ioplugins.python.SymbolTable import SymbolTable
+
+from pyutplugins.ioplugins.python.pythonpegparser.PythonParser import PythonParser
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associates
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Associations
+from pyutplugins.ioplugins.python.visitor.ParserTypes import Parents
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClassName
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegClassVisitor import PyutPythonPegClassVisitor
+from pyutplugins.ioplugins.python.visitor.PyutPythonPegVisitor import PyutPythonPegVisitor
+
+#
+# Two packages that both define a Shape
+#
+TEST_MODULES: Dict[str, str] = {
+    'alpha/__init__.py': '',
+    'alpha/Shapes.py': (
+        'class Shape:\n'
+        '    pass\n'
+        '\n'
+        '\n'
+        'class Circle(Shape):\n'
+        '    pass\n'
+    ),
+    'beta/__init__.py': '',
+    'beta/Shapes.py': (
+        'class Shape:\n'
+        '    pass\n'
+    ),
+    'beta/Drawing.py': (
+        'from enum import Enum\n'
+        '\n'
+        'from alpha.Shapes import Shape as AlphaShape\n'
+        'from . import Shapes\n'
+        'from .Shapes import Shape\n'
+        '\n'
+        '\n'
+        'class Square(Shape):\n'
+        '    pass\n'
+        '\n'
+        '\n'
+        'class Ellipse(AlphaShape):\n'
+        '    pass\n'
+        '\n'
+        '\n'
+        'class Canvas:\n'
+        '    @property\n'
+        '    def shape(self) -> AlphaShape:\n'
+        '        return AlphaShape()\n'
+    ),
+}
+
+ALPHA_SHAPES: str = 'alpha/Shapes.py'
+BETA_SHAPES:  str = 'beta/Shapes.py'
+DRAWING:      str = 'beta/Drawing.py'
+
+ALPHA_SHAPE: str = 'alpha.Shapes.Shape'
+BETA_SHAPE:  str = 'beta.Shapes.Shape'
+
+
+class TestSymbolTable(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._rootPath:           Path               = Path(self._temporaryDirectory.name)
+
+        for fileName, source in TEST_MODULES.items():
+            modulePath: Path = self._rootPath / fileName
+
+            modulePath.parent.mkdir(exist_ok=True)
+            modulePath.write_text(source)
+
+        self._symbolTable: SymbolTable                                = SymbolTable()
+        self._trees:       Dict[str, PythonParser.File_inputContext] = {}
+        for fileName in TEST_MODULES.keys():
+            self._addModule(fileName=fileName)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testModuleNames(self):
+
+        self.assertEqual('beta.Drawing', self._symbolTable.moduleName(fqFileName=self._fqFileName(DRAWING)), 'Should include the package')
+        self.assertEqual('beta', self._symbolTable.moduleName(fqFileName=self._fqFileName('beta/__init__.py')), 'A package is its own module')
+
+    def testSameNameInTwoPackages(self):
+
+        pyutClasses: PyutClasses = self._symbolTable.pyutClasses
+
+        self.assertIn(ALPHA_SHAPE, pyutClasses, 'A duplicate name should be qualified')
+        self.assertIn(BETA_SHAPE,  pyutClasses, 'A duplicate name should be qualified')
+        self.assertIn('Circle',    pyutClasses, 'A unique name should be bare')
+        self.assertIsNot(pyutClasses[PyutClassName(ALPHA_SHAPE)], pyutClasses[PyutClassName(BETA_SHAPE)], 'Should be different classes')
+
+    def testResolveOwnClass(self):
+
+        self.assertEqual(ALPHA_SHAPE, self._symbolTable.resolve(name='Shape', fqFileName=self._fqFileName(ALPHA_SHAPES)), 'Wrong Shape')
+
+    def testResolveImports(self):
+
+        fqFileName: str = self._fqFileName(DRAWING)
+
+        self.assertEqual(ALPHA_SHAPE, self._symbolTable.resolve(name='AlphaShape',   fqFileName=fqFileName), 'Wrong import as')
+        self.assertEqual(BETA_SHAPE,  self._symbolTable.resolve(name='Shape',        fqFileName=fqFileName), 'Wrong relative import')
+        self.assertEqual(BETA_SHAPE,  self._symbolTable.resolve(name='Shapes.Shape', fqFileName=fqFileName), 'Wrong module import')
+
+        self.assertEqual(NO_QUALIFIED_NAME, self._symbolTable.resolve(name='Enum', fqFileName=fqFileName), 'Not an imported class')
+
+    def testQualifyLinks(self):
+
+        fqFileName: str                  = self._fqFileName(DRAWING)
+        visitor:    PyutPythonPegVisitor = PyutPythonPegVisitor()
+        moduleView: PyutClasses          = self._symbolTable.moduleView(fqFileName=fqFileName, pyutClasses=self._symbolTable.bareClasses)
+
+        visitor.pyutClasses = moduleView
+        visitor.visit(self._trees[fqFileName])
+
+        parents:      Parents      = self._symbolTable.qualifyParents(fqFileName=fqFileName, parents=visitor.parents)
+        associations: Associations = self._symbolTable.qualifyAssociations(fqFileName=fqFileName, associations=visitor.associations)
+
+        self.assertEqual(['beta.Drawing.Square'],  parents[BETA_SHAPE],  'Square extends the relative import')
+        self.assertEqual(['beta.Drawing.Ellipse'], parents[ALPHA_SHAPE], 'Ellipse extends the import as')
+
+        associates: Associates = associations[PyutClassName('beta.Drawing.Canvas')]
+        self.assertEqual(ALPHA_SHAPE, associates[0].associateName, 'The property type is the import as')
+
+    def testModuleView(self):
+
+        fqFileName: str         = self._fqFileName(ALPHA_SHAPES)
+        moduleView: PyutClasses = self._symbolTable.moduleView(fqFileName=fqFileName, pyutClasses=self._symbolTable.bareClasses)
+
+        self.assertIsNot(self._symbolTable.bareClasses, moduleView, 'The shadowed module needs its own view')
+        self.assertIs(self._symbolTable.pyutClasses[PyutClassName(ALPHA_SHAPE)], moduleView[PyutClassName('Shape')], 'Should see its own Shape')
+
+        betaView: PyutClasses = self._symbolTable.moduleView(fqFileName=self._fqFileName(BETA_SHAPES), pyutClasses=self._symbolTable.bareClasses)
+        self.assertIs(self._symbolTable.bareClasses, betaView, 'The module added last is not shadowed')
+
+    def testRemoveModule(self):
+
+        self._symbolTable.removeModule(fqFileName=self._fqFileName(BETA_SHAPES))
+
+        pyutClasses: PyutClasses = self._symbolTable.pyutClasses
+
+        self.assertIn('Shape', pyutClasses, 'The remaining Shape is unique')
+        self.assertNotIn(BETA_SHAPE, pyutClasses, 'Should be removed')
+        self.assertIs(pyutClasses[PyutClassName('Shape')], self._symbolTable.bareClasses[PyutClassName('Shape')], 'The bare name should be the remaining Shape')
+
+    def testReplaceModule(self):
+
+        fqFileName: str = self._fqFileName(BETA_SHAPES)
+        classCount: int = len(self._symbolTable.pyutClasses)
+
+        self._addModule(fileName=BETA_SHAPES)
+
+        self.assertEqual(classCount, len(self._symbolTable.pyutClasses), 'Adding a module again should replace it')
+        self.assertEqual(BETA_SHAPE, self._symbolTable.resolve(name='Shape', fqFileName=fqFileName), 'Should still resolve')
+
+    def _addModule(self, fileName: str):
+
+        fqFileName:   str                            = self._fqFileName(fileName)
+        tree:         PythonParser.File_inputContext = PythonModuleParser().parse(fqFileName=fqFileName)
+        classVisitor: PyutPythonPegClassVisitor      = PyutPythonPegClassVisitor()
+
+        classVisitor.visit(tree)
+
+        self._trees[fqFileName] = tree
+        self._symbolTable.addModule(fqFileName=fqFileName, pyutClasses=classVisitor.pyutClasses, imports=classVisitor.imports)
+
+    def _fqFileName(self, fileName: str) -> str:
+        return str(self._rootPath / fileName)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSymbolTable))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,85 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyutplugins.ioplugins.python.PythonReverseEngineer import PythonReverseEngineer
+
+from pyutplugins.ioplugins.python.visitor.ParserTypes import PyutClasses
+
+from tests.benchmarks.SyntheticCorpus import CorpusLanguage
+from tests.benchmarks.SyntheticCorpus import CorpusParameters
+from tests.benchmarks.SyntheticCorpus import SyntheticCorpus
+
+#
+# Class0 <- Class1 <- Class2   Class3 <- Class4 <- Class5   ...
+#
+TEST_CORPUS_PARAMETERS: CorpusParameters = CorpusParameters(moduleCount=4, classesPerModule=3, methodsPerClass=2, inheritanceDepth=2, packageCount=2)
+
+
+class TestSyntheticCorpus(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo - Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._rootPath:           Path               = Path(self._temporaryDirectory.name)
+
+        corpus:     SyntheticCorpus = SyntheticCorpus(corpusParameters=TEST_CORPUS_PARAMETERS)
+        filePaths:  List[Path]      = corpus.write(directory=self._rootPath, language=CorpusLanguage.PYTHON)
+
+        self._reverseEngineer: PythonReverseEngineer = PythonReverseEngineer()
+        self._pyutClasses:     PyutClasses           = self._reverseEngineer.doParallelPass1(fqFileNames=[str(filePath) for filePath in filePaths],
+                                                                                             progressCallback=self._progressCallback)
+        self._reverseEngineer.doParallelPass2(fqFileNames=[str(filePath) for filePath in filePaths], pyutClasses=self._pyutClasses, progressCallback=self._progressCallback)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testClassCount(self):
+        self.assertEqual(TEST_CORPUS_PARAMETERS.classCount, len(self._pyutClasses), 'Every synthetic class should be found')
+
+    def testInheritanceAcrossModules(self):
+
+        self.assertEqual(['Class4'], self._reverseEngineer.parents['Class3'], 'The parent is in the previous module')
+        self.assertNotIn('Class2', self._reverseEngineer.parents, 'The chain should stop at the inheritance depth')
+
+    def testAssociations(self):
+
+        associateNames: List[str] = [associate.associateName for associate in self._reverseEngineer.associations['Class4']]
+
+        self.assertEqual(['Class3'], associateNames, 'Should be associated with the class before it')
+
+    def _progressCallback(self, currentFileCount: int, msg: str):
+        self.logger.debug(f'{currentFileCount} {msg}')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSyntheticCorpus))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
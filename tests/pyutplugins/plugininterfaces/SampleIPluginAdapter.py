@@ -102,6 +102,9 @@ class SampleIPluginAdapter(IPluginAdapter):
     def addShape(self, shape: OglObjectType):
         pass
 
+    def deleteShape(self, shape: OglObjectType):
+        pass
+
     def loadProject(self, pluginProject: PluginProject):
         pass
 
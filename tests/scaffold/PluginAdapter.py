@@ -88,6 +88,13 @@ class PluginAdapter(IPluginAdapter):
     def addShape(self, shape: OglObjectType):
         self._eventEngine.sendEvent(EventType.AddShape, shapeToAdd=shape)
 
+    @property
+    def canDeleteShapes(self) -> bool:
+        return True
+
+    def deleteShape(self, shape: OglObjectType):
+        self._eventEngine.sendEvent(EventType.DeleteShape, shapeToDelete=shape)
+
     def loadProject(self, pluginProject: PluginProject):
         """
         In the plugin scaffold test program, we support only single document projects
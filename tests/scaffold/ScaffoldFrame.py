@@ -42,14 +42,13 @@ from oglio.Types import OglProject
 from pyutplugins.PluginManager import PluginDetails
 from pyutplugins.PluginManager import PluginManager
 
+from pyutplugins.PluginRegistration import PluginRegistration
+
 from pyutplugins.plugintypes.PluginDataTypes import InputPluginMap
 from pyutplugins.plugintypes.PluginDataTypes import OutputPluginMap
 from pyutplugins.plugintypes.PluginDataTypes import PluginIDMap
 from pyutplugins.plugintypes.PluginDataTypes import PluginMapType
 
-from pyutplugins.plugininterfaces.IOPluginInterface import IOPluginInterface
-from pyutplugins.plugininterfaces.ToolPluginInterface import ToolPluginInterface
-
 from tests.scaffold.PluginAdapter import PluginAdapter
 from tests.scaffold.PyutDiagramType import PyutDiagramType
 from tests.scaffold.ScaffoldPreferencesDialog import ScaffoldPreferencesDialog
@@ -171,10 +170,9 @@ class ScaffoldFrame(Frame):
 
         for wxId in idMap:
 
-            clazz: type = idMap[wxId]
+            registration: PluginRegistration = idMap[wxId]
 
-            pluginInstance: ToolPluginInterface = clazz(None)
-            toolsMenu.Append(wxId, pluginInstance.menuTitle)
+            toolsMenu.Append(wxId, registration.menuTitle)
 
             self.Bind(EVT_MENU, self._onTools, id=wxId)
 
@@ -201,14 +199,13 @@ class ScaffoldFrame(Frame):
         subMenu: Menu = Menu()
 
         for wxId in pluginMap.pluginIdMap.keys():
-            clazz:          type = pluginMap.pluginIdMap[wxId]
-            pluginInstance: IOPluginInterface = clazz(None)
+            registration: PluginRegistration = pluginMap.pluginIdMap[wxId]
 
             if pluginMap.mapType == PluginMapType.INPUT_MAP:
-                pluginName: str = pluginInstance.inputFormat.formatName
+                pluginName: str = registration.inputFormat.formatName
                 subMenu = self.__makeSubMenuEntry(subMenu=subMenu, wxId=wxId, pluginName=pluginName, callback=self._onImport)
             elif pluginMap.mapType == PluginMapType.OUTPUT_MAP:
-                pluginName = pluginInstance.outputFormat.formatName
+                pluginName = registration.outputFormat.formatName
                 subMenu = self.__makeSubMenuEntry(subMenu=subMenu, wxId=wxId, pluginName=pluginName, callback=self._onExport)
             else:
                 assert False, 'Unknown Plugin Type'
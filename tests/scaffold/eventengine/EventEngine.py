@@ -29,6 +29,7 @@ from tests.scaffold.eventengine.Events import AddShapeEvent
 from tests.scaffold.eventengine.Events import CreateLinkEvent
 from tests.scaffold.eventengine.Events import DeSelectAllShapesEvent
 from tests.scaffold.eventengine.Events import DeleteLinkEvent
+from tests.scaffold.eventengine.Events import DeleteShapeEvent
 from tests.scaffold.eventengine.Events import ShowOrthogonalRoutingPointsEvent
 
 from tests.scaffold.eventengine.Events import EventType
@@ -56,6 +57,7 @@ OGL_PROJECT_PARAMETER:       str = 'oglProject'
 CALLBACK_PARAMETER:          str = 'callback'
 DIAGRAM_TYPE_PARAMETER:      str = 'diagramType'
 SHAPE_PARAMETER:             str = 'shapeToAdd'
+SHAPE_TO_DELETE_PARAMETER:   str = 'shapeToDelete'
 OGL_LINK_PARAMETER:          str = 'oglLink'
 LINK_TYPE_PARAMETER:         str = 'linkType'
 PATH_PARAMETER:              str = 'path'
@@ -120,6 +122,8 @@ class EventEngine(IEventEngine):
                 self._sendGetObjectBoundariesEvent(**kwargs)
             case EventType.DeleteLink:
                 self._sendDeleteLinkEvent(**kwargs)
+            case EventType.DeleteShape:
+                self._sendDeleteShapeEvent(**kwargs)
             case EventType.CreateLink:
                 self._sendCreateLinkEvent(**kwargs)
             case EventType.IndicatePluginModifiedProject:
@@ -199,6 +203,12 @@ class EventEngine(IEventEngine):
         event:   DeleteLinkEvent = DeleteLinkEvent(oglLink=oglLink)
         PostEvent(dest=self._listeningWindow, event=event)
 
+    def _sendDeleteShapeEvent(self, **kwargs):
+
+        shapeToDelete = kwargs[SHAPE_TO_DELETE_PARAMETER]
+        event:         DeleteShapeEvent = DeleteShapeEvent(shapeToDelete=shapeToDelete)
+        PostEvent(dest=self._listeningWindow, event=event)
+
     def _sendCreateLinkEvent(self, **kwargs):
         linkInformation: LinkInformation     = kwargs[LINK_INFORMATION_PARAMETER]
         callback:        CreatedLinkCallback = kwargs[CALLBACK_PARAMETER]
@@ -22,6 +22,7 @@ LoadOglProjectEvent,     EVENT_LOAD_OGL_PROJECT      = NewEvent()
 
 GetObjectBoundariesEvent, EVENT_GET_OBJECT_BOUNDARIES = NewEvent()
 DeleteLinkEvent,          EVENT_DELETE_LINK           = NewEvent()
+DeleteShapeEvent,         EVENT_DELETE_SHAPE          = NewEvent()
 CreateLinkEvent,          EVENT_CREATE_LINK           = NewEvent()
 
 RequestCurrentProjectEvent,         EVENT_REQUEST_CURRENT_PROJECT          = NewEvent()
@@ -47,6 +48,7 @@ class EventType(Enum):
     FrameInformation   = 'FrameInformation'
     LoadOglProject     = 'LoadOglProject'
     DeleteLink         = 'DeleteLink'
+    DeleteShape        = 'DeleteShape'
     CreateLink         = 'CreateLink'
 
     GetObjectBoundaries = 'GetObjectBoundaries'
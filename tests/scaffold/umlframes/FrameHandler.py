@@ -17,6 +17,7 @@ from ogl.OglClass import OglClass
 from ogl.OglInterface import OglInterface
 from ogl.OglLink import OglLink
 from ogl.OglLinkFactory import getOglLinkFactory
+from ogl.OglObject import OglObject
 from ogl.OglPosition import OglPosition
 from ogl.OglPosition import OglPositions
 
@@ -28,8 +29,10 @@ from pyutplugins.ExternalTypes import CreatedLinkCallback
 from pyutplugins.ExternalTypes import LinkInformation
 from tests.scaffold.eventengine.Events import CreateLinkEvent
 from tests.scaffold.eventengine.Events import DeleteLinkEvent
+from tests.scaffold.eventengine.Events import DeleteShapeEvent
 from tests.scaffold.eventengine.Events import EVENT_CREATE_LINK
 from tests.scaffold.eventengine.Events import EVENT_DELETE_LINK
+from tests.scaffold.eventengine.Events import EVENT_DELETE_SHAPE
 from tests.scaffold.eventengine.IEventEngine import IEventEngine
 
 
@@ -42,6 +45,7 @@ class FrameHandler:
 
         self._eventEngine.registerListener(EVENT_DELETE_LINK, self._onDeleteLink)
         self._eventEngine.registerListener(EVENT_CREATE_LINK, self._onCreateLink)
+        self._eventEngine.registerListener(EVENT_DELETE_SHAPE, self._onDeleteShape)
 
     def _onDeleteLink(self, event: DeleteLinkEvent):
 
@@ -55,6 +59,15 @@ class FrameHandler:
 
         oglLink.Detach()
 
+    def _onDeleteShape(self, event: DeleteShapeEvent):
+
+        oglObject: OglObject = event.shapeToDelete
+
+        for oglLink in list(oglObject.links):
+            self._onDeleteLink(DeleteLinkEvent(oglLink=oglLink))
+
+        oglObject.Detach()
+
     def _onCreateLink(self, event: CreateLinkEvent):
 
         linkInformation: LinkInformation     = event.linkInformation